@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Throughput of the TDT transcriber on concurrent utterances: one at a time vs. batches.
+
+The Parakeet model files are not needed: synthetic encoder, decoder and joiner models with
+the inputs and outputs of the export (see synthetic_onnx.py) run in real CPU ONNX Runtime
+sessions, behind the real AudioTranscriber (mel spectrogram, vocabulary and durations from
+the bundled model config). Utterances of 1-5 s are transcribed:
+
+- batch size 1: `transcribe` per utterance, the previous behaviour
+- batch size N: `transcribe_batch` on N utterances, one padded encoder run and a batched
+  greedy decoding loop
+
+Reported: utterances per second, seconds of audio per second of compute and the share of
+transcripts equal to the one-at-a-time ones. Batched decoding itself is exact; differences
+come from the last encoder frames of shorter utterances, whose stacked convolutions see the
+activations of padded frames instead of zero padding (as in NeMo batch inference).
+
+The second table has several session threads calling one shared transcriber at once,
+directly vs. through BatchingTranscriber.
+
+Usage:
+    python benchmarks/bench_asr_batch.py --utterances 32 --threads 1
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from loguru import logger
+import numpy as np
+
+from glados.ASR.batching import ASRBatchingConfig, BatchingTranscriber
+from glados.ASR.tdt_asr import AudioTranscriber
+from glados.utils.onnx_sessions import OnnxProfile, OnnxRuntimeConfig, configure_sessions
+from synthetic_onnx import tdt_models
+
+SAMPLE_RATE = 16000
+
+
+def utterances(count: int, seed: int = 0) -> list[np.ndarray]:
+    rng = np.random.default_rng(seed)
+    return [
+        (0.1 * rng.standard_normal(int(rng.uniform(1.0, 5.0) * SAMPLE_RATE))).astype(np.float32)
+        for _ in range(count)
+    ]
+
+
+def run_batches(asr: AudioTranscriber, audios: list[np.ndarray], batch_size: int) -> tuple[float, list[str]]:
+    start = time.perf_counter()
+    texts: list[str] = []
+    for i in range(0, len(audios), batch_size):
+        group = audios[i : i + batch_size]
+        texts += [asr.transcribe(group[0])] if batch_size == 1 else asr.transcribe_batch(group)
+    return time.perf_counter() - start, texts
+
+
+def run_sessions(transcribe, audios: list[np.ndarray], sessions: int) -> float:  # type: ignore[no-untyped-def]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as executor:
+        list(executor.map(transcribe, audios))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Batched TDT transcription throughput benchmark")
+    parser.add_argument("--utterances", type=int, default=32, help="Utterances to transcribe")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--sessions", type=int, default=4, help="Concurrent session threads")
+    parser.add_argument("--layers", type=int, default=4, help="Depth of the synthetic encoder")
+    parser.add_argument("--threads", type=int, default=1, help="Intra-op threads per session")
+    args = parser.parse_args()
+
+    logger.remove()
+    configure_sessions(OnnxRuntimeConfig(default=OnnxProfile(intra_op_threads=args.threads)))
+    audios = utterances(args.utterances)
+    audio_seconds = sum(len(a) for a in audios) / SAMPLE_RATE
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [Path(tmp) / f"{name}.onnx" for name in ("encoder", "decoder", "joiner")]
+        for path, data in zip(paths, tdt_models(layers=args.layers), strict=True):
+            path.write_bytes(data)
+        asr = AudioTranscriber(encoder_model_path=paths[0], decoder_model_path=paths[1], joiner_model_path=paths[2])
+
+        run_batches(asr, audios[:2], 2)  # Warm up (numba, session arenas)
+        _, reference = run_batches(asr, audios, 1)
+        print(f"{args.utterances} utterances, {audio_seconds:.1f}s of audio")
+        print(f"{'batch size':>10} {'utt/s':>8} {'audio s/s':>10} {'same text':>10}")
+        for batch_size in args.batch_sizes:
+            seconds, texts = run_batches(asr, audios, batch_size)
+            print(
+                f"{batch_size:>10} {len(audios) / seconds:>8.1f} {audio_seconds / seconds:>10.1f} "
+                f"{np.mean([a == b for a, b in zip(texts, reference, strict=True)]):>10.0%}"
+            )
+
+        print(f"\n{args.sessions} sessions sharing one transcriber")
+        print(f"{'mode':>20} {'utt/s':>8} {'audio s/s':>10}")
+        seconds = run_sessions(asr.transcribe, audios, args.sessions)
+        print(f"{'direct':>20} {len(audios) / seconds:>8.1f} {audio_seconds / seconds:>10.1f}")
+        batcher = BatchingTranscriber(asr, ASRBatchingConfig(enabled=True, max_batch_size=args.sessions))
+        seconds = run_sessions(batcher.transcribe, audios, args.sessions)
+        batcher.close()
+        print(f"{'BatchingTranscriber':>20} {len(audios) / seconds:>8.1f} {audio_seconds / seconds:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Barge-in to silence latency of the LLM -> TTS -> player pipeline.
+
+Runs the real LanguageModelProcessor against a local streaming endpoint, the real
+TextToSpeechSynthesizer (synthetic model) and the real SpeechPlayer on a fake audio
+device that plays in real time. Once the first sentence is playing, the user barges in
+exactly as SpeechListener does (cancel the generation, stop speaking, clear
+processing_active_event). Reported per token interval of the LLM stream:
+
+- silence: barge-in until the device stops playing
+- stale audio: sentences of the interrupted response played after the barge-in
+- LLM closed: barge-in until the LLM request is finished, with the stream aborted on
+  cancel vs. the previous behaviour of noticing the interruption at the next token
+
+Usage:
+    python benchmarks/bench_barge_in.py --trials 5
+"""
+
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+from pathlib import Path
+import queue
+import statistics
+import sys
+import threading
+import time
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from loguru import logger
+import numpy as np
+
+from glados.core.generation import ResponseGeneration
+from glados.core.llm_processor import LanguageModelProcessor
+from glados.core.speech_player import SpeechPlayer
+from glados.core.stage import post_shutdown
+from glados.core.state import ThreadSafeConversationState
+from glados.core.tts_synthesizer import TextToSpeechSynthesizer
+
+SAMPLE_RATE = 1000
+TOKENS = ["Well,", " hello", " there.", " I", " have", " a", " lot", " to", " say", " about", " that."] * 6
+
+
+def make_handler(token_interval: float) -> type[BaseHTTPRequestHandler]:
+    class StreamHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:
+            self.rfile.read(int(self.headers["Content-Length"]))
+            self.send_response(200)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            try:
+                for token in TOKENS:
+                    payload = json.dumps({"choices": [{"delta": {"content": token}}]})
+                    data = f"data: {payload}\n\n".encode()
+                    self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+                    self.wfile.flush()
+                    time.sleep(token_interval)
+                self.wfile.write(b"0\r\n\r\n")
+            except OSError:
+                pass
+
+        def log_message(self, *args) -> None:
+            pass
+
+    return StreamHandler
+
+
+class FakeTTS:
+    sample_rate = SAMPLE_RATE
+
+    def generate_speech_audio(self, text: str) -> np.ndarray:
+        time.sleep(0.02)
+        return np.zeros(int(len(text) * 0.06 * SAMPLE_RATE), dtype=np.float32)
+
+
+class IdentityConverter:
+    def text_to_spoken(self, text: str) -> str:
+        return text
+
+
+class RealTimeAudioIO:
+    """Plays audio by waiting for its duration, records when playback starts and stops."""
+
+    def __init__(self) -> None:
+        self._stop = threading.Event()
+        self.started: list[float] = []
+        self.first_playing = threading.Event()
+        self.stopped_at: float | None = None
+
+    def start_speaking(self, audio: np.ndarray, sample_rate: int) -> None:
+        self._stop.clear()
+        self.started.append(time.perf_counter())
+        self.first_playing.set()
+
+    def measure_percentage_spoken(self, total_samples: int, sample_rate: int) -> tuple[bool, int]:
+        interrupted = self._stop.wait(total_samples / sample_rate)
+        self.stopped_at = time.perf_counter()
+        return interrupted, 50 if interrupted else 100
+
+    def stop_speaking(self) -> None:
+        self._stop.set()
+
+
+class PollingLLMProcessor(LanguageModelProcessor):
+    """Previous behaviour: the interruption is only noticed when the next token arrives."""
+
+    def _cancel_stream(self, cancelled: int) -> None:
+        pass
+
+
+def trial(url: str, abort_stream: bool) -> tuple[float, int, float]:
+    generation = ResponseGeneration()
+    processing_active = threading.Event()
+    processing_active.set()
+    shutdown = threading.Event()
+    tts_queue: queue.Queue = queue.Queue()
+    audio_queue: queue.Queue = queue.Queue()
+    audio_io = RealTimeAudioIO()
+
+    processor_cls = LanguageModelProcessor if abort_stream else PollingLLMProcessor
+    processor = processor_cls(
+        llm_input_queue=queue.Queue(),
+        tts_input_queue=tts_queue,
+        conversation_history=ThreadSafeConversationState(),
+        completion_url=url,
+        model_name="bench",
+        api_key=None,
+        processing_active_event=processing_active,
+        shutdown_event=shutdown,
+        generation=generation,
+    )
+    synthesizer = TextToSpeechSynthesizer(
+        tts_queue, audio_queue, FakeTTS(), IdentityConverter(), shutdown, 0.05, generation=generation
+    )
+    player = SpeechPlayer(
+        audio_io=audio_io,
+        audio_output_queue=audio_queue,
+        conversation_history=ThreadSafeConversationState(),
+        tts_sample_rate=SAMPLE_RATE,
+        shutdown_event=shutdown,
+        currently_speaking_event=threading.Event(),
+        processing_active_event=processing_active,
+        pause_time=0.05,
+        generation=generation,
+    )
+    llm_thread = threading.Thread(target=processor._process_input, args=("talk",), daemon=True)
+    threads = [threading.Thread(target=t, daemon=True) for t in (synthesizer.run, player.run)]
+    for thread in [llm_thread, *threads]:
+        thread.start()
+
+    audio_io.first_playing.wait(timeout=10.0)
+    time.sleep(0.2)
+
+    # What SpeechListener does when the user starts speaking
+    barge_in = time.perf_counter()
+    generation.cancel()
+    audio_io.stop_speaking()
+    processing_active.clear()
+
+    llm_thread.join()
+    llm_closed = time.perf_counter() - barge_in
+    time.sleep(0.5)  # Give stale work a chance to reach the device
+    silence = (audio_io.stopped_at or barge_in) - barge_in
+    stale_played = sum(1 for started in audio_io.started if started > barge_in)
+
+    shutdown.set()
+    post_shutdown([tts_queue, audio_queue])
+    return silence, stale_played, llm_closed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Barge-in to silence latency benchmark")
+    parser.add_argument("--trials", type=int, default=5, help="Barge-ins per configuration")
+    parser.add_argument(
+        "--token-ms", type=float, nargs="+", default=[50.0, 500.0], help="LLM token intervals to test"
+    )
+    args = parser.parse_args()
+
+    logger.remove()
+
+    print(f"{'token ms':>9} {'stream':>8} {'silence ms':>11} {'stale played':>13} {'LLM closed ms':>14}")
+    for token_ms in args.token_ms:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(token_ms / 1000))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_port}/v1/chat/completions"
+        for abort_stream in (False, True):
+            results = [trial(url, abort_stream) for _ in range(args.trials)]
+            silence, stale, closed = zip(*results, strict=True)
+            print(
+                f"{token_ms:>9.0f} {'abort' if abort_stream else 'poll':>8} "
+                f"{statistics.median(silence) * 1000:>11.1f} {sum(stale):>13} "
+                f"{statistics.median(closed) * 1000:>14.1f}"
+            )
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Session creation time of ONNX models with and without the optimized graph cache.
+
+The real model files are not needed: synthetic Piper-shaped VITS models (see
+synthetic_onnx.py) of increasing depth are loaded through `create_session` with
+graph optimization "all", the way every `glados start` loads its models:
+
+- "no cache": the model is optimized on every start
+- "first start": optimized once more and the optimized graph saved to the cache
+- "cached": later starts, loading the saved graph with optimization disabled
+
+Every mode also runs the model once and the outputs are compared, so a cached graph
+that computes something different would show up as a mismatch.
+
+Usage:
+    python benchmarks/bench_graph_cache.py --repeats 5 --layers 4 8 16
+"""
+
+import argparse
+from pathlib import Path
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from loguru import logger
+import numpy as np
+
+from glados.utils.onnx_sessions import OnnxProfile, OnnxRuntimeConfig, configure_sessions, create_session
+from synthetic_onnx import vits_model
+
+NUM_SYMBOLS = 40
+
+
+def run(session) -> np.ndarray:  # type: ignore[no-untyped-def]
+    ids = np.arange(1, 33, dtype=np.int64)[None, :] % NUM_SYMBOLS
+    feeds = {
+        "input": ids,
+        "input_lengths": np.array([ids.shape[1]], dtype=np.int64),
+        "scales": np.array([0.667, 1.0, 0.8], dtype=np.float32),
+    }
+    return session.run(None, feeds)[0]
+
+
+def timed_start(model_path: Path, cache_dir: Path | None) -> tuple[float, np.ndarray]:
+    configure_sessions(
+        OnnxRuntimeConfig(
+            default=OnnxProfile(graph_optimization="all", intra_op_threads=1),
+            graph_cache_dir=str(cache_dir) if cache_dir else None,
+        )
+    )
+    start = time.perf_counter()
+    session = create_session("tts_glados", model_path)
+    elapsed = time.perf_counter() - start
+    return elapsed, run(session)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ONNX optimized graph cache benchmark")
+    parser.add_argument("--repeats", type=int, default=5, help="Starts per mode")
+    parser.add_argument("--layers", type=int, nargs="+", default=[4, 8, 16], help="Model depths to test")
+    parser.add_argument("--channels", type=int, default=192, help="Hidden channels of the models")
+    args = parser.parse_args()
+
+    logger.remove()
+    print(f"{'layers':>6} {'model MB':>9} {'no cache ms':>12} {'first start ms':>15} {'cached ms':>10} {'outputs':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for layers in args.layers:
+            model_path = Path(tmp) / f"voice-{layers}.onnx"
+            model_path.write_bytes(vits_model(num_symbols=NUM_SYMBOLS, channels=args.channels, layers=layers))
+            cache_dir = Path(tmp) / f"cache-{layers}"
+
+            uncached, first, cached = [], [], []
+            outputs = []
+            for _ in range(args.repeats):
+                elapsed, out = timed_start(model_path, None)
+                uncached.append(elapsed)
+                outputs.append(out)
+                shutil.rmtree(cache_dir, ignore_errors=True)
+                elapsed, out = timed_start(model_path, cache_dir)
+                first.append(elapsed)
+                outputs.append(out)
+                for _ in range(2):
+                    elapsed, out = timed_start(model_path, cache_dir)
+                    cached.append(elapsed)
+                    outputs.append(out)
+
+            same = all(np.allclose(out, outputs[0], atol=1e-5) for out in outputs)
+            print(
+                f"{layers:>6} {model_path.stat().st_size / 1e6:>9.1f} {statistics.median(uncached) * 1000:>12.1f} "
+                f"{statistics.median(first) * 1000:>15.1f} {statistics.median(cached) * 1000:>10.1f} "
+                f"{'same' if same else 'DIFFER':>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
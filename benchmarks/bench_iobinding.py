@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Calls per second of the small, hot model calls: `session.run` vs. bound buffers (IOBinding).
+
+The model files are not needed: a Silero-shaped VAD and Parakeet-shaped TDT decoder and
+joiner (see synthetic_onnx.py) run in real CPU ONNX Runtime sessions, behind the real `VAD`
+and TDT `AudioTranscriber`. Each call is measured with:
+
+- "run": `session.run` with a dict of inputs, new input tensors and output arrays per call
+- "bound": `IOBoundSession`, the inputs written into persistent bound buffers and the
+  outputs written by ONNX Runtime into preallocated arrays (`io_binding` in the profile)
+
+Reported per call: calls per second both ways and whether the outputs are identical, then
+the TDT greedy decoding time per second of audio, which is made of these calls.
+
+Usage:
+    python benchmarks/bench_iobinding.py --calls 5000
+"""
+
+import argparse
+from collections.abc import Callable
+from pathlib import Path
+import sys
+import tempfile
+import threading
+import time
+from typing import Any
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from loguru import logger
+import numpy as np
+
+from glados.ASR.tdt_asr import AudioTranscriber
+from glados.audio_io.vad import VAD
+from glados.utils.onnx_sessions import OnnxProfile, OnnxRuntimeConfig, configure_sessions
+from synthetic_onnx import tdt_models, vad_model
+
+SAMPLE_RATE = 16000
+
+
+def calls_per_second(call: Callable[[], Any], calls: int) -> float:
+    for _ in range(min(calls // 10, 100)):  # Warm up, the first calls bind the buffers
+        call()
+    start = time.perf_counter()
+    for _ in range(calls):
+        call()
+    return calls / (time.perf_counter() - start)
+
+
+def set_binding(asr: AudioTranscriber, enabled: bool) -> None:
+    asr.model.decoder_io_binding = asr.model.joiner_io_binding = enabled
+    asr.model._bound = threading.local()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="session.run vs. IOBinding calls per second")
+    parser.add_argument("--calls", type=int, default=5000, help="Calls per measurement")
+    parser.add_argument("--seconds", type=float, default=10.0, help="Utterance length of the decoding run")
+    parser.add_argument("--threads", type=int, default=1, help="Intra-op threads per session")
+    args = parser.parse_args()
+
+    logger.remove()
+    configure_sessions(OnnxRuntimeConfig(default=OnnxProfile(intra_op_threads=args.threads)))
+    rng = np.random.default_rng(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        vad_path = Path(tmp) / "vad.onnx"
+        vad_path.write_bytes(vad_model())
+        paths = [Path(tmp) / f"{name}.onnx" for name in ("encoder", "decoder", "joiner")]
+        for path, data in zip(paths, tdt_models(), strict=True):
+            path.write_bytes(data)
+        vad = VAD(model_path=vad_path)
+        asr = AudioTranscriber(encoder_model_path=paths[0], decoder_model_path=paths[1], joiner_model_path=paths[2])
+
+        chunks = (0.1 * rng.standard_normal((64, 1, 512))).astype(np.float32)
+        encoder_out = asr.encode((0.1 * rng.standard_normal(int(args.seconds * SAMPLE_RATE))).astype(np.float32))
+        state0, state1 = asr.model.get_decoder_initial_state(batch_size=1)
+        decoder_out = asr.model.run_decoder(7, state0, state1)[0].copy()
+        windows = {n: np.ascontiguousarray(encoder_out[:, :, :n]) for n in (1, 8)}
+
+        def vad_stream() -> list[float]:
+            vad.reset_states()
+            return [float(vad(chunk)) for chunk in chunks]
+
+        cases: dict[str, tuple[Callable[[], Any], Callable[[], Any]]] = {
+            "VAD chunk": (lambda: vad(chunks[0]), vad_stream),
+            "TDT decoder": (
+                lambda: asr.model.run_decoder(7, state0, state1),
+                lambda: [np.array(a) for a in asr.model.run_decoder(7, state0, state1)],
+            ),
+            "TDT joiner 1 frame": (
+                lambda: asr.model.run_joiner(windows[1], decoder_out),
+                lambda: np.array(asr.model.run_joiner(windows[1], decoder_out)),
+            ),
+            "TDT joiner 8 frames": (
+                lambda: asr.model.run_joiner(windows[8], decoder_out),
+                lambda: np.array(asr.model.run_joiner(windows[8], decoder_out)),
+            ),
+        }
+
+        print(f"{'call':>20} {'run calls/s':>12} {'bound calls/s':>14} {'speed-up':>9} {'same':>5}")
+        for name, (call, outputs) in cases.items():
+            vad.io_binding = False
+            set_binding(asr, False)
+            before, reference = calls_per_second(call, args.calls), outputs()
+            vad.io_binding = True
+            set_binding(asr, True)
+            after, result = calls_per_second(call, args.calls), outputs()
+            same = all(np.array_equal(a, b) for a, b in zip(reference, result, strict=True))
+            print(f"{name:>20} {before:>12.0f} {after:>14.0f} {after / before:>8.2f}x {str(same):>5}")
+
+        print(f"\nTDT greedy decoding of {args.seconds:.0f}s of audio")
+        print(f"{'mode':>6} {'ms/s audio':>11}")
+        for mode, enabled in (("run", False), ("bound", True)):
+            set_binding(asr, enabled)
+            asr._initial_decoder = None
+            asr._decode_tdt(encoder_out)
+            start = time.perf_counter()
+            for _ in range(5):
+                tokens = asr._decode_tdt(encoder_out)
+            print(f"{mode:>6} {(time.perf_counter() - start) / 5 * 1000 / args.seconds:>11.2f}  ({len(tokens)} tokens)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+LLM client micro-benchmark against a local stand-in streaming server.
+
+Measures the two costs the pooled client and the streaming parser remove:
+
+- request setup: a fresh `requests.post` per turn (new TCP connection every time)
+  vs. the shared keep-alive session from `create_llm_session`, as time to first byte
+  and total time of a short streamed response
+- parsing: `iter_lines` + per-line `json.loads` (the previous `_clean_raw_bytes` /
+  `_process_chunk` path) vs. `iter_content` + LLMStreamParser, as CPU time per token on
+  an in-memory OpenAI SSE and Ollama NDJSON body
+
+The server runs on loopback without TLS, so the setup saving shown is a lower bound:
+against a remote HTTPS endpoint every fresh connection also pays TLS handshakes.
+
+Usage:
+    python benchmarks/bench_llm_client.py --requests 200 --tokens 2000
+"""
+
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+from pathlib import Path
+import statistics
+import sys
+import threading
+import time
+from typing import Any
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import requests
+
+from glados.core.llm_client import LLMStreamParser, create_llm_session
+
+WORDS = "Oh it's you. It's been a long time. How have you been? I've been really busy being dead.".split(" ")
+
+
+def sse_body(tokens: int) -> bytes:
+    lines = []
+    for i in range(tokens):
+        chunk = {"id": "chatcmpl-1", "object": "chat.completion.chunk", "created": 0, "model": "bench",
+                 "choices": [{"index": 0, "delta": {"content": " " + WORDS[i % len(WORDS)]}, "finish_reason": None}]}
+        lines.append(f"data: {json.dumps(chunk)}\n\n")
+    lines.append("data: [DONE]\n\n")
+    return "".join(lines).encode()
+
+
+def ndjson_body(tokens: int) -> bytes:
+    lines = []
+    for i in range(tokens):
+        chunk = {"model": "bench", "created_at": "2025-01-01T00:00:00Z",
+                 "message": {"role": "assistant", "content": " " + WORDS[i % len(WORDS)]}, "done": False}
+        lines.append(json.dumps(chunk) + "\n")
+    lines.append(json.dumps({"model": "bench", "message": {"role": "assistant", "content": ""}, "done": True}) + "\n")
+    return "".join(lines).encode()
+
+
+class StreamHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Like real LLM servers; otherwise Nagle + delayed ACK add ~40ms on reused connections
+    disable_nagle_algorithm = True
+    body = sse_body(20)
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for line in self.body.split(b"\n\n"):
+            if line:
+                data = line + b"\n\n"
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+def old_parse_line(line: bytes) -> str | None:
+    """The previous _clean_raw_bytes + _process_chunk path."""
+    try:
+        if line.startswith(b"data: "):
+            json_str = line.decode("utf-8")[6:]
+            if json_str.strip() == "[DONE]":
+                return None
+            parsed = json.loads(json_str)
+        else:
+            parsed = json.loads(line.decode("utf-8"))
+    except json.JSONDecodeError:
+        return None
+    if "choices" in parsed:
+        content = parsed.get("choices", [{}])[0].get("delta", {}).get("content")
+    else:
+        content = parsed.get("message", {}).get("content")
+    return content or None
+
+
+class FakeResponse(requests.Response):
+    """A requests.Response over an in-memory body, delivered in network-sized reads."""
+
+    def __init__(self, body: bytes, read_size: int = 1400) -> None:
+        super().__init__()
+        self._content = False
+        self._content_consumed = False
+        self._body = body
+        self._read_size = read_size
+
+    def iter_content(self, chunk_size: int | None = 1, decode_unicode: bool = False):  # noqa: ANN201
+        size = chunk_size or self._read_size
+        for i in range(0, len(self._body), size):
+            yield self._body[i : i + size]
+
+
+def bench_parsing(tokens: int, repeats: int) -> None:
+    print(f"\nParsing {tokens} tokens, best of {repeats}")
+    print(f"{'format':>8} {'path':>22} {'us/token':>9} {'speedup':>8}")
+    for name, body in (("sse", sse_body(tokens)), ("ndjson", ndjson_body(tokens))):
+        def old() -> list[str]:
+            response = FakeResponse(body)
+            return [c for line in response.iter_lines() if line and (c := old_parse_line(line))]
+
+        def new() -> list[str]:
+            parser = LLMStreamParser()
+            contents = []
+            for data in FakeResponse(body).iter_content(chunk_size=None):
+                contents.extend(parser.feed(data))
+                if parser.done:
+                    break
+            return contents
+
+        assert old() == new(), "parsers disagree"
+        timings = {}
+        for label, func in (("iter_lines + json.loads", old), ("LLMStreamParser", new)):
+            best = min(_timed(func) for _ in range(repeats))
+            timings[label] = best
+        baseline = timings["iter_lines + json.loads"]
+        for label, best in timings.items():
+            print(f"{name:>8} {label:>22} {best / tokens * 1e6:>9.2f} {baseline / best:>7.2f}x")
+
+
+def _timed(func: Any) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def bench_requests(count: int) -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StreamHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/v1/chat/completions"
+    payload = {"model": "bench", "stream": True, "messages": [{"role": "user", "content": "hi"}]}
+    session = create_llm_session()
+
+    print(f"\nRequests: {count} short streamed responses over loopback")
+    print(f"{'client':>14} {'TTFB p50 ms':>12} {'TTFB p95 ms':>12} {'total p50 ms':>13}")
+    for label, post in (("fresh post", requests.post), ("pooled session", session.post)):
+        first_byte, total = [], []
+        for _ in range(count):
+            start = time.perf_counter()
+            with post(url, json=payload, stream=True, timeout=5) as response:
+                chunks = response.iter_content(chunk_size=None)
+                next(chunks)
+                first_byte.append(time.perf_counter() - start)
+                for _ in chunks:
+                    pass
+            total.append(time.perf_counter() - start)
+        first_byte.sort()
+        print(
+            f"{label:>14} {statistics.median(first_byte) * 1000:>12.3f} "
+            f"{first_byte[int(len(first_byte) * 0.95) - 1] * 1000:>12.3f} {statistics.median(total) * 1000:>13.3f}"
+        )
+    server.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="LLM HTTP client and stream parser benchmark")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per client mode")
+    parser.add_argument("--tokens", type=int, default=2000, help="Tokens in the parsing benchmark body")
+    parser.add_argument("--repeats", type=int, default=5, help="Parsing repeats, best is reported")
+    args = parser.parse_args()
+
+    bench_requests(args.requests)
+    bench_parsing(args.tokens, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Mel spectrogram framing: the numba loop vs. the strided NumPy view, and the JIT cost per start.
+
+Uses the preprocessor settings of the bundled Parakeet TDT config (no model files needed).
+For each utterance length:
+
+- framing ms: `_extract_windows_numba` (a new array filled frame by frame) vs.
+  `_extract_windows_strided` (a `sliding_window_view` multiplied by the window)
+- compute ms: `MelSpectrogramCalculator.compute` with `frame_extraction` "numba" vs.
+  "strided", framing plus float32 rfft, power, filterbank, log and normalization
+
+The second table runs one spectrogram in fresh interpreters, like the first request after
+a restart: numba with an empty JIT cache (what every start paid before the cache), numba
+with the on-disk cache filled by the previous process, and the strided path (no JIT).
+
+Usage:
+    python benchmarks/bench_mel_frames.py --seconds 1 2 5 10 30
+"""
+
+import argparse
+import os
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# Add src to path for imports
+SRC = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(SRC))
+
+import numpy as np
+
+from glados.ASR.mel_spectrogram import (
+    MelSpectrogramCalculator,
+    MelSpectrogramConfig,
+    _extract_windows_numba,
+    _extract_windows_strided,
+)
+
+SAMPLE_RATE = 16000
+CONFIG = Path(__file__).parent.parent / "models/ASR/parakeet-tdt-0.6b-v2_model_config.yaml"
+
+FIRST_CALL = """
+import sys, time
+sys.path.insert(0, {src!r})
+import numpy as np
+from glados.ASR.mel_spectrogram import MelSpectrogramCalculator
+calculator = MelSpectrogramCalculator(features=128, frame_extraction={mode!r})
+audio = np.zeros(16000, dtype=np.float32)
+start = time.perf_counter()
+calculator.compute(audio)
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def median_ms(call, repeats: int) -> float:  # type: ignore[no-untyped-def]
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def first_call_ms(mode: str, cache_dir: str) -> float:
+    env = {**os.environ, "NUMBA_CACHE_DIR": cache_dir}
+    code = FIRST_CALL.format(src=str(SRC), mode=mode)
+    output = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    return float(output.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mel spectrogram framing benchmark")
+    parser.add_argument("--seconds", type=float, nargs="+", default=[1, 2, 5, 10, 30], help="Utterance lengths")
+    parser.add_argument("--repeats", type=int, default=7, help="Runs per measurement, the median is reported")
+    args = parser.parse_args()
+
+    config = MelSpectrogramConfig.from_yaml(CONFIG)
+    config.dither = 0.0
+    calculators = {
+        mode: MelSpectrogramCalculator.from_config(config.model_copy(update={"frame_extraction": mode}))
+        for mode in ("numba", "strided")
+    }
+    calc = calculators["strided"]
+    rng = np.random.default_rng(0)
+    for calculator in calculators.values():
+        calculator.compute(rng.standard_normal(SAMPLE_RATE).astype(np.float32))  # JIT, FFT plan
+
+    print(f"{CONFIG.name}: {calc.features} mels, n_fft {calc.n_fft}, hop {calc.hop_length}")
+    print(
+        f"{'audio s':>7} {'numba framing ms':>17} {'strided framing ms':>19} "
+        f"{'numba compute ms':>17} {'strided compute ms':>19} {'same':>5}"
+    )
+    for seconds in args.seconds:
+        audio = (0.1 * rng.standard_normal(int(seconds * SAMPLE_RATE))).astype(np.float32)
+        padded = np.pad(audio, (calc.signal_pad, calc.signal_pad), mode="reflect")
+        n_frames = calc._num_frames(len(padded))
+        framing_args = (padded, calc.window_coeffs, calc.n_fft, calc.hop_length, n_frames)
+        framing = {
+            name: median_ms(lambda f=f: f(*framing_args), args.repeats)
+            for name, f in (("numba", _extract_windows_numba), ("strided", _extract_windows_strided))
+        }
+        compute = {mode: median_ms(lambda c=c: c.compute(audio), args.repeats) for mode, c in calculators.items()}
+        same = np.array_equal(calculators["numba"].compute(audio), calculators["strided"].compute(audio))
+        print(
+            f"{seconds:>7.0f} {framing['numba']:>17.2f} {framing['strided']:>19.2f} "
+            f"{compute['numba']:>17.2f} {compute['strided']:>19.2f} {str(same):>5}"
+        )
+
+    print(f"\n{'first spectrogram of a fresh process':>38} {'ms':>8}")
+    with tempfile.TemporaryDirectory() as cache_dir:
+        print(f"{'numba, empty JIT cache':>38} {first_call_ms('numba', cache_dir):>8.1f}")
+        print(f"{'numba, cached by the previous start':>38} {first_call_ms('numba', cache_dir):>8.1f}")
+        print(f"{'strided':>38} {first_call_ms('strided', cache_dir):>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
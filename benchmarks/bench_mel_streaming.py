@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Mel spectrogram cost of an utterance recorded in 32 ms blocks: batch vs. incremental.
+
+Uses the preprocessor settings of the bundled Parakeet TDT config (no model files needed).
+For each utterance length the blocks arrive like microphone audio, and the spectrogram is
+computed with:
+
+- "batch": `MelSpectrogramCalculator.compute` on the whole utterance once speech ends,
+  the work left after the user stops talking
+- "recompute": `compute` on all audio so far every 0.96 s while the user speaks (what a
+  streaming consumer had to do without an incremental API), plus the final call
+- "incremental": `StreamingMelSpectrogram.accept` per block, then `finalize`
+
+Reported: total ms per utterance, ms left after the end of speech, the throughput of the
+incremental path in seconds of audio per second and the largest difference to "batch".
+
+Usage:
+    python benchmarks/bench_mel_streaming.py --seconds 2 5 10 30
+"""
+
+import argparse
+from pathlib import Path
+import statistics
+import sys
+import time
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import numpy as np
+
+from glados.ASR.mel_spectrogram import MelSpectrogramCalculator, MelSpectrogramConfig
+
+SAMPLE_RATE = 16000
+BLOCK = 512  # 32 ms, one VAD chunk
+CONFIG = Path(__file__).parent.parent / "models/ASR/parakeet-tdt-0.6b-v2_model_config.yaml"
+
+
+def recompute(calculator: MelSpectrogramCalculator, audio: np.ndarray, every: int) -> tuple[float, float]:
+    start = time.perf_counter()
+    for end in range(every, len(audio), every):
+        calculator.compute(audio[:end])
+    final_start = time.perf_counter()
+    calculator.compute(audio)
+    end = time.perf_counter()
+    return end - start, end - final_start
+
+
+def incremental(calculator: MelSpectrogramCalculator, audio: np.ndarray) -> tuple[float, float, np.ndarray]:
+    stream = calculator.stream()
+    start = time.perf_counter()
+    for i in range(0, len(audio), BLOCK):
+        stream.accept(audio[i : i + BLOCK])
+    final_start = time.perf_counter()
+    result = stream.finalize()
+    end = time.perf_counter()
+    return end - start, end - final_start, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Batch vs. incremental mel spectrogram benchmark")
+    parser.add_argument("--seconds", type=float, nargs="+", default=[2, 5, 10, 30], help="Utterance lengths")
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per measurement, the median is reported")
+    args = parser.parse_args()
+
+    config = MelSpectrogramConfig.from_yaml(CONFIG)
+    config.dither = 0.0  # Identical inputs for the equality check
+    calculator = MelSpectrogramCalculator.from_config(config)
+    rng = np.random.default_rng(0)
+    calculator.compute(rng.standard_normal(SAMPLE_RATE).astype(np.float32))  # Numba JIT
+
+    print(f"{CONFIG.name}: {calculator.features} mels, hop {calculator.hop_length}, {BLOCK}-sample blocks")
+    print(
+        f"{'audio s':>7} {'batch ms':>9} {'recompute ms':>13} {'incr. ms':>9} "
+        f"{'after speech ms':>24} {'incr. audio s/s':>16} {'max diff':>9}"
+    )
+    for seconds in args.seconds:
+        audio = (0.1 * rng.standard_normal(int(seconds * SAMPLE_RATE))).astype(np.float32)
+        batch = []
+        for _ in range(args.repeats):
+            start = time.perf_counter()
+            expected = calculator.compute(audio)
+            batch.append(time.perf_counter() - start)
+        rec = [recompute(calculator, audio, int(0.96 * SAMPLE_RATE)) for _ in range(args.repeats)]
+        inc = [incremental(calculator, audio) for _ in range(args.repeats)]
+
+        batch_ms = statistics.median(batch) * 1000
+        rec_ms = statistics.median(r[0] for r in rec) * 1000
+        inc_ms = statistics.median(r[0] for r in inc) * 1000
+        inc_final_ms = statistics.median(r[1] for r in inc) * 1000
+        diff = float(np.max(np.abs(inc[0][2] - expected)))
+        print(
+            f"{seconds:>7.0f} {batch_ms:>9.1f} {rec_ms:>13.1f} {inc_ms:>9.1f} "
+            f"{f'{batch_ms:.1f} -> {inc_final_ms:.2f}':>24} {seconds * 1000 / inc_ms:>16.0f} {diff:>9.1e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
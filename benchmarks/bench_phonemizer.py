@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Phonemization time of LLM replies with names and jargon missing from the dictionary.
+
+The G2P model files are not needed: a NumPy stand-in with the shape of the
+DeepPhonemizer forward transformer (embedding, self-attention and feed-forward layers,
+logits per input position) replaces the ONNX session, so the cost of padding and of
+model runs is real compute. Replies mix dictionary words, a Zipf-distributed pool of
+recurring out-of-dictionary names and jargon, and one-off words. Reported per
+configuration:
+
+- ms per reply (mean and p95), model runs and words predicted
+- "fixed 64" pads every word to MODEL_INPUT_LENGTH and predicts every call, as before
+- "bucketed" pads to the next multiple of BUCKET_STEP, "+ cache" adds the word cache,
+  "disk restart" starts from a cache file written by an earlier run
+
+Usage:
+    python benchmarks/bench_phonemizer.py --replies 200 --jargon 60
+"""
+
+import argparse
+from pathlib import Path
+import pickle
+import statistics
+import string
+import sys
+import tempfile
+import time
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from loguru import logger
+import numpy as np
+
+from glados.TTS import phonemizer as phonemizer_module
+from glados.TTS.phonemizer import ModelConfig, Phonemizer
+
+SPECIAL = ["_", "<start>", "<end>", "<en_us>"]
+COMMON = (
+    "the a you i is it to of and that this your test chamber will be now for with not science "
+    "cake please subject have are was what there just on in my me do all can so very"
+).split()
+
+
+class NumpyG2P:
+    """Forward transformer stand-in: attention and feed-forward cost grow with padded length."""
+
+    def __init__(self, layers: int = 4, dim: int = 256, vocab: int = len(SPECIAL) + 26) -> None:
+        rng = np.random.default_rng(0)
+        self.embedding = rng.standard_normal((vocab, dim)).astype(np.float32)
+        shapes = [(dim, 3 * dim), (dim, 4 * dim), (4 * dim, dim)]
+        self.layers = [
+            [rng.standard_normal(shape).astype(np.float32) * 0.05 for shape in shapes] for _ in range(layers)
+        ]
+        self.output = rng.standard_normal((dim, vocab)).astype(np.float32)
+        self.dim = dim
+
+    def get_providers(self) -> list[str]:
+        return ["CPUExecutionProvider"]
+
+    def get_inputs(self) -> list:
+        return [type("Input", (), {"name": "input", "shape": ["batch", "seq"]})()]
+
+    def run(self, output_names: object, inputs: dict) -> list:
+        ids = inputs["input"]
+        x = self.embedding[ids]
+        mask = np.where(ids == 0, -1e9, 0.0)[:, None, :]
+        for qkv_w, up_w, down_w in self.layers:
+            q, k, v = np.split(x @ qkv_w, 3, axis=-1)
+            scores = q @ k.transpose(0, 2, 1) / np.sqrt(self.dim) + mask
+            scores = np.exp(scores - scores.max(axis=-1, keepdims=True))
+            x = x + (scores / scores.sum(axis=-1, keepdims=True)) @ v
+            x = x + np.maximum(x @ up_w, 0) @ down_w
+        logits = x @ self.output
+        # Keep the decoded output deterministic and readable: echo the input letters
+        np.put_along_axis(logits, np.where(ids == 1, 3, ids)[..., None], 1e9, axis=2)
+        return [logits]
+
+
+def workload(replies: int, jargon: int, seed: int = 0) -> list[str]:
+    rng = np.random.default_rng(seed)
+    letters = list(string.ascii_lowercase)
+    pool = ["".join(rng.choice(letters, rng.integers(5, 13))) for _ in range(jargon)]
+    ranks = np.arange(1, jargon + 1)
+    weights = (1 / ranks) / (1 / ranks).sum()
+    texts = []
+    for _ in range(replies):
+        words = list(rng.choice(COMMON, 14))
+        words += [pool[i].title() for i in rng.choice(jargon, 3, p=weights)]
+        words.append("".join(rng.choice(letters, rng.integers(4, 11))))  # One-off word
+        rng.shuffle(words)
+        texts.append(" ".join(words) + ".")
+    return texts
+
+
+def make_phonemizer(model_dir: Path, bucket_step: int, cache_size: int, cache_path: Path | None) -> Phonemizer:
+    config = ModelConfig(
+        model_path=model_dir / "g2p.onnx",
+        phoneme_dict_path=model_dir / "dict.pkl",
+        token_to_idx_path=model_dir / "t2i.pkl",
+        idx_to_token_path=model_dir / "i2t.pkl",
+        word_cache_path=cache_path,
+    )
+    config.BUCKET_STEP = bucket_step
+    config.WORD_CACHE_SIZE = cache_size
+    return Phonemizer(config)
+
+
+def run(phonemizer: Phonemizer, texts: list[str]) -> list[float]:
+    latencies = []
+    for text in texts:
+        start = time.perf_counter()
+        phonemizer.convert_to_phonemes([text], "en_us")
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def report(name: str, phonemizer: Phonemizer, latencies: list[float]) -> None:
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    predicted = phonemizer.word_cache.stats()["misses"]
+    print(
+        f"{name:>14} {statistics.mean(latencies) * 1000:>9.2f} {p95 * 1000:>9.2f} "
+        f"{phonemizer.model_runs:>11} {predicted:>10}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Phonemizer word cache and G2P batching benchmark")
+    parser.add_argument("--replies", type=int, default=200, help="LLM replies to phonemize")
+    parser.add_argument("--jargon", type=int, default=60, help="Recurring out-of-dictionary words")
+    args = parser.parse_args()
+
+    logger.remove()
+    texts = workload(args.replies, args.jargon)
+    phonemizer_module.ort.InferenceSession = lambda *a, **k: NumpyG2P()  # type: ignore[assignment]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        model_dir = Path(tmp)
+        files = {
+            "dict.pkl": {word: word.upper() for word in COMMON},
+            "t2i.pkl": {token: i for i, token in enumerate(SPECIAL + list(string.ascii_lowercase))},
+            "i2t.pkl": {i: token for i, token in enumerate(SPECIAL + list(string.ascii_uppercase))},
+        }
+        for name, data in files.items():
+            (model_dir / name).write_bytes(pickle.dumps(data))
+        cache_path = model_dir / "phonemes.tsv"
+
+        print(f"{'config':>14} {'mean ms':>9} {'p95 ms':>9} {'model runs':>11} {'predicted':>10}")
+        configs = [
+            ("fixed 64", ModelConfig.MODEL_INPUT_LENGTH, 0, None),
+            ("bucketed", 16, 0, None),
+            ("+ cache", 16, 8192, cache_path),
+            ("disk restart", 16, 8192, cache_path),
+        ]
+        for name, step, cache_size, path in configs:
+            phonemizer = make_phonemizer(model_dir, step, cache_size, path)
+            report(name, phonemizer, run(phonemizer, texts))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Pipeline stage benchmark: polling loops vs. the event-driven StageRunner.
+
+Compares the previous loops (`queue.get(timeout=PAUSE_TIME)` in every stage) with
+StageRunner on a two-hop pipeline mirroring Glados:
+
+    llm_queue --(LLM stage)--> tts_queue --(TTS stage)--> audio_queue
+
+The LLM stage is a pass-through so that only scheduling overhead is measured; the
+TTS stage is the real TextToSpeechSynthesizer with a zero-cost model. Reported:
+
+- hop latency from `llm_queue` put to `audio_queue` get, with inputs spaced by
+  random gaps so they land at arbitrary points of the polling cycle
+- CPU time burned per second while the pipeline sits idle
+- time from signalling shutdown until every stage thread has exited
+
+Usage:
+    python benchmarks/bench_pipeline_hops.py --iterations 200
+"""
+
+import argparse
+from pathlib import Path
+import queue
+import random
+import statistics
+import sys
+import threading
+import time
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from loguru import logger
+import numpy as np
+
+from glados.core.audio_data import AudioMessage
+from glados.core.stage import StageRunner, post_shutdown
+from glados.core.tts_synthesizer import TextToSpeechSynthesizer
+from glados.utils import spoken_text_converter as stc
+
+PAUSE_TIME = 0.05  # The former Glados.PAUSE_TIME
+
+
+class NullTTS:
+    """TTS stand-in that returns a few samples instantly."""
+
+    sample_rate = 22050
+
+    def generate_speech_audio(self, text: str) -> np.ndarray:
+        return np.zeros(16, dtype=np.float32)
+
+
+def polling_stage(input_queue: queue.Queue, handler, shutdown_event: threading.Event) -> None:
+    """The loop every stage used before: poll the queue with a PAUSE_TIME timeout."""
+    while not shutdown_event.is_set():
+        try:
+            item = input_queue.get(timeout=PAUSE_TIME)
+            handler(item)
+        except queue.Empty:
+            pass
+
+
+def run(mode: str, iterations: int, max_gap: float, idle_seconds: float) -> tuple[list[float], float, float]:
+    llm_queue: queue.Queue = queue.Queue()
+    tts_queue: queue.Queue = queue.Queue()
+    audio_queue: queue.Queue[AudioMessage] = queue.Queue()
+    shutdown_event = threading.Event()
+
+    tts_stage = TextToSpeechSynthesizer(
+        tts_input_queue=tts_queue,
+        audio_output_queue=audio_queue,
+        tts_model=NullTTS(),
+        stc_instance=stc.SpokenTextConverter(),
+        shutdown_event=shutdown_event,
+        pause_time=PAUSE_TIME,
+    )
+
+    if mode == "polling":
+        threads = [
+            threading.Thread(target=polling_stage, args=(llm_queue, tts_queue.put, shutdown_event), daemon=True),
+            threading.Thread(
+                target=polling_stage, args=(tts_queue, tts_stage._dispatch, shutdown_event), daemon=True
+            ),
+        ]
+    else:
+        threads = [
+            threading.Thread(
+                target=StageRunner("LLM", llm_queue, tts_queue.put, shutdown_event).run, daemon=True
+            ),
+            threading.Thread(target=tts_stage.run, daemon=True),
+        ]
+    for thread in threads:
+        thread.start()
+
+    latencies = []
+    for i in range(iterations):
+        time.sleep(random.uniform(0.0, max_gap))
+        start = time.perf_counter()
+        llm_queue.put(f"Sentence {i}.")
+        audio_queue.get()
+        latencies.append(time.perf_counter() - start)
+
+    # Idle cost: CPU used by the waiting stages (the main thread only sleeps)
+    cpu_start = time.process_time()
+    time.sleep(idle_seconds)
+    idle_cpu = (time.process_time() - cpu_start) / idle_seconds
+
+    # Land the shutdown at an arbitrary point of the polling cycle
+    time.sleep(random.uniform(0.0, PAUSE_TIME))
+    start = time.perf_counter()
+    shutdown_event.set()
+    if mode == "stage":
+        post_shutdown([llm_queue, tts_queue])
+    for thread in threads:
+        thread.join(timeout=2.0)
+    shutdown_latency = time.perf_counter() - start
+
+    return latencies, idle_cpu, shutdown_latency
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pipeline hop latency benchmark")
+    parser.add_argument("--iterations", type=int, default=200, help="Items pushed through the pipeline per mode")
+    parser.add_argument("--max-gap", type=float, default=0.1, help="Max random idle time between items (s)")
+    parser.add_argument("--idle", type=float, default=3.0, help="Seconds of idle time for the CPU measurement")
+    args = parser.parse_args()
+
+    logger.remove()
+
+    print(
+        f"{'mode':>8} {'hop mean ms':>12} {'hop p95 ms':>11} {'hop max ms':>11} "
+        f"{'idle CPU ms/s':>14} {'shutdown ms':>12}"
+    )
+    for mode in ("polling", "stage"):
+        latencies, idle_cpu, shutdown_latency = run(mode, args.iterations, args.max_gap, args.idle)
+        latencies.sort()
+        p95 = latencies[int(len(latencies) * 0.95) - 1]
+        print(
+            f"{mode:>8} {statistics.mean(latencies) * 1000:>12.2f} {p95 * 1000:>11.2f} "
+            f"{latencies[-1] * 1000:>11.2f} {idle_cpu * 1000:>14.3f} {shutdown_latency * 1000:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
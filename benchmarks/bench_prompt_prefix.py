@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+KV-cache prefix reuse of the LLM prompt over a simulated conversation.
+
+Replays a conversation with the personality prompt of the network config and a stand-in
+for CombinedMemory (entity facts plus the last 10 stored exchanges, as
+`build_context_messages` returns them). Every turn the prompt is assembled in "splice"
+and "prefix_stable" mode, without and with a token budget. Reported per run:
+
+- reuse: share of the prompt identical to the previous request (what Ollama/llama.cpp
+  can take from the KV cache)
+- prefill: estimated tokens after the common prefix that the server must evaluate
+  before the first token, and the resulting time at the given prefill rate
+- prompt tokens: largest prompt sent; halfway through the user pastes a long document,
+  which only the token-budgeted run keeps bounded
+
+Usage:
+    python benchmarks/bench_prompt_prefix.py --turns 40 --prefill-tok-s 800 --budget 3072
+"""
+
+import argparse
+from collections import deque
+from pathlib import Path
+import statistics
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from loguru import logger
+import yaml
+
+from glados.core.prompt_assembly import PromptAssembler
+
+CONFIG = Path(__file__).parent.parent / "configs" / "glados_network_config.yaml"
+PASTED = "Here is the log file, what went wrong? " + "2025-01-01 12:00:00 INFO chamber 7 door cycle ok\n" * 400
+
+
+class StandInMemory:
+    """Same message layout as CombinedMemory.build_context_messages."""
+
+    def __init__(self) -> None:
+        self.facts: list[str] = []
+        self.exchanges: deque[tuple[str, str]] = deque(maxlen=100)
+
+    def build_context_messages(self, max_turns: int = 10) -> list[dict[str, str]]:
+        messages = []
+        if self.facts:
+            messages.append({"role": "system", "content": f"What you know about the user: {'; '.join(self.facts)}"})
+        for user, assistant in list(self.exchanges)[-max_turns:]:
+            messages += [{"role": "user", "content": user}, {"role": "assistant", "content": assistant}]
+        return messages
+
+
+def system_prompt() -> list[dict[str, str]]:
+    config = yaml.safe_load(CONFIG.read_text())["Glados"]
+    return [{"role": role, "content": text} for item in config["personality_preprompt"] for role, text in item.items()]
+
+
+def replay(mode: str, turns: int, budget: int | None) -> tuple[list[tuple[float, int]], int]:
+    assembler = PromptAssembler(
+        mode=mode, max_turn_messages=12, max_prompt_tokens=budget, max_message_tokens=budget // 6 if budget else None
+    )
+    memory = StandInMemory()
+    prompt = system_prompt()
+    history: list[dict[str, str]] = []
+    results = []
+    for turn in range(turns):
+        user = f"Turn {turn}: tell me something about test chamber {turn}, and be brief about it."
+        if turn == turns // 2:
+            user = PASTED
+        history.append({"role": "user", "content": user})
+        messages = assembler.assemble(prompt, history, lambda: memory.build_context_messages(max_turns=10))
+        reuse = assembler.measure_reuse(messages)
+        results.append((reuse, int(assembler.last_prompt_tokens * (1 - reuse))))
+
+        assistant = f"Chamber {turn} is perfectly safe. The previous occupant simply chose not to leave. " * 2
+        history.append({"role": "assistant", "content": assistant})
+        memory.exchanges.append((user, assistant))
+        if turn % 7 == 3:
+            memory.facts.append(f"mentioned fact number {turn}")
+    return results, assembler.max_sent_tokens
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="LLM prompt prefix reuse benchmark")
+    parser.add_argument("--turns", type=int, default=40, help="Conversation turns to replay")
+    parser.add_argument("--prefill-tok-s", type=float, default=800.0, help="Server prefill rate, tokens/s")
+    parser.add_argument("--budget", type=int, default=3072, help="max_prompt_tokens of the budgeted run")
+    args = parser.parse_args()
+
+    logger.remove()
+
+    print(
+        f"{'mode':>14} {'budget':>7} {'reuse p50':>10} {'reuse mean':>11} {'prefill tok':>12} "
+        f"{'prefill ms':>11} {'max prompt tok':>15}"
+    )
+    runs = [("splice", None), ("prefix_stable", None), ("splice", args.budget), ("prefix_stable", args.budget)]
+    for mode, budget in runs:
+        results, max_tokens = replay(mode, args.turns, budget)
+        results = results[1:]  # The first request has nothing to reuse
+        reuse = [r for r, _ in results]
+        prefill = [p for _, p in results]
+        print(
+            f"{mode:>14} {budget or '-':>7} {statistics.median(reuse):>10.1%} {statistics.mean(reuse):>11.1%} "
+            f"{statistics.mean(prefill):>12.0f} {statistics.mean(prefill) / args.prefill_tok_s * 1000:>11.0f} "
+            f"{max_tokens:>15}"
+        )
+
+
+if __name__ == "__main__":
+    main()
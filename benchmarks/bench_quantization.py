@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Accuracy and speed of the INT8 model variants against the original models.
+
+Needs the downloaded models (`glados download`) and the variants to compare
+(`glados quantize --variant int8_dynamic` and/or `--variant int8_static`); variants that
+have not been produced are skipped. On the box that will run GLaDOS:
+
+- ASR: every `*.wav` fixture (16 kHz mono, like data/0.wav) is transcribed by each variant.
+  WER is measured against a sibling `.txt` reference transcript, or against the original
+  model's transcript when there is none. RTF is compute seconds per second of audio.
+- TTS: sentences are synthesized by each voice variant. RTF as above; intelligibility is the
+  WER of the original ASR model transcribing the synthesized audio back.
+
+Deltas are relative to the original models, so a variant is worth enabling on a box when
+its RTF drops more than its WER rises.
+
+Usage:
+    python benchmarks/bench_quantization.py --engine tdt --fixtures data --repeats 3
+"""
+
+import argparse
+from pathlib import Path
+import re
+import statistics
+import sys
+import time
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from loguru import logger
+import numpy as np
+import soundfile as sf  # type: ignore
+
+from glados.ASR import get_audio_transcriber
+from glados.ASR.ctc_asr import AudioTranscriber as CTCTranscriber
+from glados.ASR.tdt_asr import _OnnxTDTModel
+from glados.TTS import get_speech_synthesizer, tts_glados
+from glados.utils import spoken_text_converter as stc
+from glados.utils.quantization import QUANTIZATION_VARIANTS, variant_path
+
+ASR_SAMPLE_RATE = 16000
+SENTENCES = [
+    "Hello, and again, welcome to the Aperture Science computer-aided enrichment center.",
+    "The cake is a lie, but the test results are very real.",
+    "Please proceed to the chamberlock. Mind the gap.",
+    "You are not a good person. You know that, right?",
+    "This next test involves turrets. You remember them, right?",
+]
+
+
+def normalize(text: str) -> list[str]:
+    return re.sub(r"[^a-z0-9' ]+", " ", text.lower()).split()
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """Word-level Levenshtein distance divided by the reference length."""
+    ref, hyp = normalize(reference), normalize(hypothesis)
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i]
+        for j, hyp_word in enumerate(hyp, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ref_word != hyp_word)))
+        previous = current
+    return previous[-1] / max(len(ref), 1)
+
+
+def resample(audio: np.ndarray, rate: int) -> np.ndarray:
+    duration = len(audio) / rate
+    target = np.linspace(0, duration, int(duration * ASR_SAMPLE_RATE), endpoint=False)
+    return np.interp(target, np.arange(len(audio)) / rate, audio).astype(np.float32)
+
+
+def available_variants(model_path: Path) -> list[str | None]:
+    return [None] + [v for v in QUANTIZATION_VARIANTS if variant_path(model_path, v).exists()]
+
+
+def bench_asr(engine: str, fixtures: list[Path], repeats: int) -> None:
+    model_path = CTCTranscriber.DEFAULT_MODEL_PATH if engine == "ctc" else _OnnxTDTModel.DEFAULT_ENCODER_MODEL_PATH
+    if not model_path.exists():
+        sys.exit(f"{model_path} not found, run `glados download` first")
+    clips = [sf.read(path, dtype="float32")[0] for path in fixtures]
+    audio_seconds = sum(len(clip) for clip in clips) / ASR_SAMPLE_RATE
+    transcript_files = [path.with_suffix(".txt") for path in fixtures]
+    references: list[str] = []
+
+    print(f"ASR ({engine}), {len(fixtures)} fixtures, {audio_seconds:.1f}s of audio")
+    print(f"{'variant':>13} {'WER %':>7} {'RTF':>7} {'RTF delta':>10}")
+    base_rtf = None
+    for variant in available_variants(model_path):
+        transcriber = get_audio_transcriber(engine, quantization=variant)
+        transcriber.transcribe(clips[0])  # Warm-up
+        times, transcripts = [], []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            transcripts = [transcriber.transcribe(clip) for clip in clips]
+            times.append(time.perf_counter() - start)
+        if variant is None:
+            # The original model's transcript stands in for a missing reference
+            references = [
+                file.read_text(encoding="utf-8") if file.exists() else hyp
+                for file, hyp in zip(transcript_files, transcripts, strict=True)
+            ]
+        wer = statistics.mean(word_error_rate(r, h) for r, h in zip(references, transcripts, strict=True))
+        rtf = statistics.median(times) / audio_seconds
+        base_rtf = base_rtf or rtf
+        print(f"{variant or 'original':>13} {wer * 100:>7.1f} {rtf:>7.3f} {(rtf / base_rtf - 1) * 100:>+9.1f}%")
+
+
+def bench_tts(engine: str, repeats: int) -> None:
+    judge = get_audio_transcriber(engine)
+    converter = stc.SpokenTextConverter()
+    texts = [converter.text_to_spoken(sentence) for sentence in SENTENCES]
+
+    print(f"\nTTS (glados), {len(texts)} sentences, judged by the original {engine} model")
+    print(f"{'variant':>13} {'WER %':>7} {'RTF':>7} {'RTF delta':>10}")
+    base_rtf = None
+    for variant in available_variants(tts_glados.SpeechSynthesizer.MODEL_PATH):
+        synthesizer = get_speech_synthesizer("glados", quantization=variant)
+        synthesizer.generate_speech_audio(texts[0])  # Warm-up
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            audios = [synthesizer.generate_speech_audio(text) for text in texts]
+            times.append(time.perf_counter() - start)
+        audio_seconds = sum(len(audio) for audio in audios) / synthesizer.sample_rate
+        heard = [judge.transcribe(resample(np.ravel(audio), synthesizer.sample_rate)) for audio in audios]
+        wer = statistics.mean(word_error_rate(t, h) for t, h in zip(SENTENCES, heard, strict=True))
+        rtf = statistics.median(times) / audio_seconds
+        base_rtf = base_rtf or rtf
+        print(f"{variant or 'original':>13} {wer * 100:>7.1f} {rtf:>7.3f} {(rtf / base_rtf - 1) * 100:>+9.1f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="INT8 model variant accuracy/latency benchmark")
+    parser.add_argument("--engine", choices=["ctc", "tdt"], default="tdt", help="ASR engine to compare")
+    parser.add_argument("--fixtures", type=Path, default=Path("data"), help="Directory of 16 kHz *.wav fixtures")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed passes per variant")
+    parser.add_argument("--skip-tts", action="store_true", help="Only compare the ASR variants")
+    args = parser.parse_args()
+
+    logger.remove()
+    fixtures = sorted(args.fixtures.glob("*.wav"))
+    if not fixtures:
+        sys.exit(f"No *.wav fixtures in {args.fixtures}")
+    bench_asr(args.engine, fixtures, args.repeats)
+    if not args.skip_tts:
+        bench_tts(args.engine, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
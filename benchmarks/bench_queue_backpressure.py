@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Queued audio under a long response: unbounded queues vs. bounded PipelineQueues.
+
+A runaway response of `--sentences` sentences is pushed through the real
+TextToSpeechSynthesizer (synthetic model, faster than real time) into a player that
+"plays" each message by sleeping for its duration. Halfway through playback the user
+interrupts. Reported per configuration:
+
+- peak number of audio messages and MB of float32 audio waiting in audio_queue
+- peak number of sentences synthesized ahead of the one playing
+- audio synthesized but thrown away because of the interruption
+
+Usage:
+    python benchmarks/bench_queue_backpressure.py --sentences 60
+"""
+
+import argparse
+from pathlib import Path
+import queue
+import sys
+import threading
+import time
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from loguru import logger
+import numpy as np
+
+from glados.core.audio_data import AudioMessage
+from glados.core.pipeline_queue import PipelineQueue, PipelineQueuesConfig
+from glados.core.stage import SHUTDOWN
+from glados.core.tts_synthesizer import TextToSpeechSynthesizer
+
+SAMPLE_RATE = 24000
+SENTENCE_SECONDS = 3.0  # Audio per sentence
+
+
+class FastTTS:
+    """Synthetic model producing SENTENCE_SECONDS of audio at `rtf` x real time."""
+
+    sample_rate = SAMPLE_RATE
+
+    def __init__(self, rtf: float, time_scale: float) -> None:
+        self.delay = SENTENCE_SECONDS * rtf * time_scale
+        self.synthesized = 0
+
+    def generate_speech_audio(self, text: str) -> np.ndarray:
+        time.sleep(self.delay)
+        self.synthesized += 1
+        return np.zeros(int(SENTENCE_SECONDS * SAMPLE_RATE), dtype=np.float32)
+
+
+class IdentityConverter:
+    def text_to_spoken(self, text: str) -> str:
+        return text
+
+
+def run(bounded: bool, sentences: int, rtf: float, time_scale: float) -> dict:
+    config = PipelineQueuesConfig()
+    if bounded:
+        tts_queue = PipelineQueue.from_config(config.tts, "tts")
+        audio_queue = PipelineQueue.from_config(config.audio, "audio")
+    else:
+        tts_queue, audio_queue = queue.Queue(), queue.Queue()
+
+    processing_active = threading.Event()
+    processing_active.set()
+    tts = FastTTS(rtf, time_scale)
+    synthesizer = TextToSpeechSynthesizer(
+        tts_input_queue=tts_queue,
+        audio_output_queue=audio_queue,
+        tts_model=tts,
+        stc_instance=IdentityConverter(),
+        shutdown_event=threading.Event(),
+        pause_time=0.05,
+        processing_active_event=processing_active,
+    )
+    threading.Thread(target=synthesizer.run, daemon=True).start()
+
+    def produce() -> None:
+        # The LLM streams far faster than speech
+        for i in range(sentences):
+            if not processing_active.is_set():
+                break
+            tts_queue.put(f"Sentence {i}.")
+        tts_queue.put("<EOS>")
+
+    threading.Thread(target=produce, daemon=True).start()
+
+    played, peak_items, peak_ahead = 0, 0, 0
+    while True:
+        message: AudioMessage = audio_queue.get()
+        if message.is_eos:
+            break
+        peak_items = max(peak_items, audio_queue.qsize() + 1)
+        peak_ahead = max(peak_ahead, tts.synthesized - played)
+        time.sleep(len(message.audio) / SAMPLE_RATE * time_scale)
+        played += 1
+        if played == sentences // 2:
+            processing_active.clear()  # The user barges in
+            while not audio_queue.empty():
+                if audio_queue.get_nowait().is_eos:
+                    break
+            break
+
+    time.sleep(0.2)
+    tts_queue.put(SHUTDOWN)
+    bytes_per_message = int(SENTENCE_SECONDS * SAMPLE_RATE) * 4
+    return {
+        "peak_items": peak_items,
+        "peak_mb": peak_items * bytes_per_message / 1e6,
+        "peak_ahead": peak_ahead,
+        "wasted_s": max(0, tts.synthesized - played) * SENTENCE_SECONDS,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Queue backpressure benchmark")
+    parser.add_argument("--sentences", type=int, default=60, help="Sentences in the runaway response")
+    parser.add_argument("--rtf", type=float, default=0.1, help="Synthesis time / audio duration of the model")
+    parser.add_argument("--time-scale", type=float, default=0.01, help="Run the simulation this much faster")
+    args = parser.parse_args()
+
+    logger.remove()
+
+    print(f"{'queues':>10} {'peak msgs':>10} {'peak MB':>8} {'ahead':>6} {'wasted audio s':>15}")
+    for bounded in (False, True):
+        result = run(bounded, args.sentences, args.rtf, args.time_scale)
+        print(
+            f"{'bounded' if bounded else 'unbounded':>10} {result['peak_items']:>10} {result['peak_mb']:>8.1f} "
+            f"{result['peak_ahead']:>6} {result['wasted_s']:>15.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Time-to-first-audio replay of canned LLM streams: old sentence splitting vs. TextSegmenter.
+
+Each canned response is tokenized the way LLMs stream text, either with punctuation
+attached to words (" world.") or as separate tokens (" world", "."), and replayed
+with a fixed delay per token. A simulated TTS renders segments one after another at a
+configurable cost per character and playback follows in order. Reported per policy:
+
+- time to first audio: first segment flushed + synthesized
+- total playback gaps: time the speaker sat silent waiting for the next segment
+- segments sent to TTS
+
+The old policy is the previous LanguageModelProcessor logic, which flushed only when a
+chunk was exactly a PUNCTUATION_SET member.
+
+Usage:
+    python benchmarks/bench_segmentation.py --token-ms 30 --tts-ms-per-char 4
+"""
+
+import argparse
+from pathlib import Path
+import re
+import statistics
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from glados.core.text_segmenter import TextSegmenter
+
+OLD_PUNCTUATION_SET = {".", "!", "?", ":", ";", "?!", "\n", "\n\n"}
+SPEECH_MS_PER_CHAR = 65.0  # Roughly 15 characters per second of speech
+
+RESPONSES = [
+    "Oh, it's you. It's been a long time, and I've been really busy being dead. You know, after you murdered me.",
+    "Well, I could explain the whole thing to you in exhaustive detail, but honestly it would take far too long "
+    "and you would not understand most of it anyway. Let's just say it involves science.",
+    "Yes. Obviously.",
+    "The temperature today is 21.5 degrees, which is perfectly adequate for testing. Please proceed to the chamber.",
+    "Here is what you need to do: boil the water, pour it over the leaves, and wait three minutes. "
+    "Then remove the bag. It's not complicated.",
+    "Congratulations on completing the test, although I have to say your performance was, statistically speaking, "
+    "the worst I have recorded this week. Cake will not be provided.",
+]
+
+
+def tokenize(text: str, attached: bool) -> list[str]:
+    """Split text into LLM-like tokens, with punctuation attached to words or separate."""
+    if attached:
+        return re.findall(r"\s*\S+", text)
+    return re.findall(r"\s*[^\s.,!?;:]+|[.,!?;:]", text)
+
+
+def old_policy(tokens: list[str]) -> list[tuple[int, str]]:
+    """Previous behaviour: flush only when a token is a bare punctuation mark."""
+    flushed, buffer = [], []
+    for i, chunk in enumerate(tokens):
+        buffer.append(chunk)
+        if chunk.strip() in OLD_PUNCTUATION_SET and (len(buffer) < 2 or not buffer[-2].strip().isdigit()):
+            flushed.append((i, "".join(buffer)))
+            buffer = []
+    if buffer:
+        flushed.append((len(tokens) - 1, "".join(buffer)))
+    return flushed
+
+
+def segmenter_policy(tokens: list[str]) -> list[tuple[int, str]]:
+    """New behaviour: incremental TextSegmenter with early first flush."""
+    segmenter = TextSegmenter()
+    flushed = []
+    for i, chunk in enumerate(tokens):
+        flushed.extend((i, segment) for segment in segmenter.push(chunk))
+    remainder = segmenter.flush()
+    if remainder:
+        flushed.append((len(tokens) - 1, remainder))
+    return flushed
+
+
+def simulate(flushed: list[tuple[int, str]], token_ms: float, tts_ms_per_char: float) -> tuple[float, float]:
+    """Return (time to first audio, total playback gap) in ms for a sequence of flushes."""
+    tts_free_at = 0.0
+    playback_end = None
+    first_audio = None
+    gaps = 0.0
+    for token_index, segment in flushed:
+        ready_at = (token_index + 1) * token_ms
+        chars = len(segment.strip())
+        synth_done = max(ready_at, tts_free_at) + chars * tts_ms_per_char
+        tts_free_at = synth_done
+
+        start = synth_done if playback_end is None else max(synth_done, playback_end)
+        if first_audio is None:
+            first_audio = start
+        elif start > playback_end:
+            gaps += start - playback_end
+        playback_end = start + chars * SPEECH_MS_PER_CHAR
+    return first_audio or 0.0, gaps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time-to-first-audio replay benchmark")
+    parser.add_argument("--token-ms", type=float, default=30.0, help="LLM delay per token (ms)")
+    parser.add_argument("--tts-ms-per-char", type=float, default=4.0, help="TTS synthesis cost per character (ms)")
+    args = parser.parse_args()
+
+    print(f"{'tokens':>9} {'policy':>10} {'TTFA p50 ms':>12} {'TTFA max ms':>12} {'gaps ms':>8} {'segments':>9}")
+    for attached in (True, False):
+        for name, policy in (("old", old_policy), ("segmenter", segmenter_policy)):
+            ttfa, gaps, segments = [], 0.0, 0
+            for response in RESPONSES:
+                flushed = policy(tokenize(response, attached))
+                first, gap = simulate(flushed, args.token_ms, args.tts_ms_per_char)
+                ttfa.append(first)
+                gaps += gap
+                segments += len(flushed)
+            print(
+                f"{'attached' if attached else 'separate':>9} {name:>10} {statistics.median(ttfa):>12.0f} "
+                f"{max(ttfa):>12.0f} {gaps:>8.0f} {segments:>9}"
+            )
+
+
+if __name__ == "__main__":
+    main()
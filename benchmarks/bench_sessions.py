@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Load test for the multi-session network server.
+
+Starts a SessionManager on shared models, a stand-in LLM that streams a short
+Ollama-style reply, and N concurrent TCP clients that each send text prompts
+using the regular client protocol. For every N it reports the latency from
+sending a prompt to receiving the first TTS audio frame, which covers the whole
+LLM -> TTS -> player path of a session while the other sessions compete for the
+shared ONNX sessions.
+
+Usage:
+    python benchmarks/bench_sessions.py --config configs/glados_network_config.yaml
+    python benchmarks/bench_sessions.py --synthetic --sessions 1 2 4 8 16
+"""
+
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+from pathlib import Path
+import socket
+import statistics
+import struct
+import sys
+import threading
+import time
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from loguru import logger
+import numpy as np
+
+from glados.audio_io.network_io import TEXT_MESSAGE_FROM_CLIENT
+from glados.core.engine import Glados, GladosConfig
+from glados.core.sessions import SessionManager
+
+REPLY_TOKENS = ["The", " cake", " is", " a", " lie", "."]
+
+
+class StandInLLMHandler(BaseHTTPRequestHandler):
+    """Streams a fixed reply in Ollama NDJSON format with a per-token delay."""
+
+    token_delay: float = 0.02
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        for token in REPLY_TOKENS:
+            time.sleep(self.token_delay)
+            self.wfile.write(json.dumps({"message": {"content": token}, "done": False}).encode() + b"\n")
+            self.wfile.flush()
+        self.wfile.write(json.dumps({"done": True, "response": ""}).encode() + b"\n")
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class SyntheticTTS:
+    """TTS stand-in that burns CPU proportional to the text length."""
+
+    sample_rate = 22050
+
+    def __init__(self, seconds_per_char: float) -> None:
+        self.seconds_per_char = seconds_per_char
+
+    def generate_speech_audio(self, text: str) -> np.ndarray:
+        deadline = time.perf_counter() + len(text) * self.seconds_per_char
+        x = np.random.rand(256, 256).astype(np.float32)
+        while time.perf_counter() < deadline:
+            x = x @ x.T / 256.0
+        return np.zeros(int(self.sample_rate * 0.3), dtype=np.float32)
+
+
+class SyntheticASR:
+    """ASR stand-in, text prompts never reach it."""
+
+    def transcribe(self, audio: np.ndarray) -> str:
+        return ""
+
+    def transcribe_file(self, audio_path: Path) -> str:
+        return ""
+
+
+class SyntheticVAD:
+    """VAD stand-in that reports silence for every chunk."""
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        return np.array(0.0, dtype=np.float32)
+
+    def fork(self) -> "SyntheticVAD":
+        return self
+
+
+def recv_exact(sock: socket.socket, size: int) -> bytes:
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("Server closed the connection")
+        data += chunk
+    return data
+
+
+def run_client(port: int, prompts: int, latencies: list[float], start_barrier: threading.Barrier) -> None:
+    """Connect, send prompts one after another and record time to first audio for each."""
+    sock = socket.create_connection(("127.0.0.1", port))
+    sock.settimeout(30.0)
+    try:
+        start_barrier.wait()
+        for i in range(prompts):
+            text = f"Tell me about test subject {i}.".encode("utf-8")
+            sent_at = time.perf_counter()
+            sock.sendall(struct.pack("<II", TEXT_MESSAGE_FROM_CLIENT, len(text)) + text)
+
+            first_audio = None
+            while True:
+                first, second = struct.unpack("<II", recv_exact(sock, 8))
+                if first >= 0xFFFFFFF0:  # Text, transcription or keepalive marker
+                    recv_exact(sock, second)
+                    continue
+                if first == 0:  # Stop playback
+                    continue
+                recv_exact(sock, first)
+                if first_audio is None:
+                    first_audio = time.perf_counter() - sent_at
+                    latencies.append(first_audio)
+                    break
+
+            # Let the single-sentence reply finish playing before the next prompt
+            time.sleep(0.5)
+    finally:
+        sock.close()
+
+
+def run_level(port: int, sessions: int, prompts: int) -> list[float]:
+    latencies: list[float] = []
+    barrier = threading.Barrier(sessions)
+    clients = [
+        threading.Thread(target=run_client, args=(port, prompts, latencies, barrier), daemon=True)
+        for _ in range(sessions)
+    ]
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join(timeout=120.0)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Multi-session latency load test")
+    parser.add_argument("--config", default="configs/glados_network_config.yaml", help="GLaDOS YAML config")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 2, 4, 8], help="Concurrent session counts")
+    parser.add_argument("--prompts", type=int, default=5, help="Prompts per session")
+    parser.add_argument("--port", type=int, default=5599, help="Port for the session server")
+    parser.add_argument("--token-delay", type=float, default=0.02, help="Stand-in LLM delay per token (s)")
+    parser.add_argument("--synthetic", action="store_true", help="Use CPU-burning stand-ins instead of ONNX models")
+    parser.add_argument("--verbose", action="store_true", help="Show pipeline logs")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="INFO" if args.verbose else "CRITICAL")
+
+    StandInLLMHandler.token_delay = args.token_delay
+    llm_server = ThreadingHTTPServer(("127.0.0.1", 0), StandInLLMHandler)
+    threading.Thread(target=llm_server.serve_forever, daemon=True).start()
+
+    config = GladosConfig.from_yaml(args.config)
+    config = config.model_copy(
+        update={
+            "completion_url": f"http://127.0.0.1:{llm_server.server_port}/api/chat",
+            "network_host": "127.0.0.1",
+            "network_port": args.port,
+            "network_max_sessions": max(args.sessions),
+            "announcement": None,
+            "memory": config.memory.model_copy(update={"enabled": False}),
+        }
+    )
+
+    load_start = time.perf_counter()
+    if args.synthetic:
+        asr_model, tts_model, vad_model = SyntheticASR(), SyntheticTTS(seconds_per_char=0.002), SyntheticVAD()
+    else:
+        asr_model, tts_model, vad_model = Glados.load_all_models(config)
+    print(f"Models loaded once in {time.perf_counter() - load_start:.2f}s")
+
+    manager = SessionManager(asr_model, tts_model, config, vad_model=vad_model)
+    manager.server.start()
+
+    print(f"\n{'sessions':>8} {'requests':>8} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    try:
+        for sessions in args.sessions:
+            latencies = sorted(run_level(args.port, sessions, args.prompts))
+            if not latencies:
+                print(f"{sessions:>8} {'-':>8} (no responses)")
+                continue
+            p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            print(
+                f"{sessions:>8} {len(latencies):>8} {statistics.median(latencies) * 1000:>8.0f} "
+                f"{p95 * 1000:>8.0f} {latencies[-1] * 1000:>8.0f}"
+            )
+            # Give disconnected sessions time to release their slots
+            time.sleep(1.0)
+    finally:
+        manager.stop()
+        llm_server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
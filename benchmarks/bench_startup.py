@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Start-up time with sequential vs. concurrent model loading, and the first-call cost warm-up removes.
+
+The real model files are not needed: synthetic Piper-shaped VITS models (see
+synthetic_onnx.py) stand in for the ASR, TTS and VAD sessions and are created through
+`create_session` the way `Glados.load_all_models` does, once one after another and once
+with `run_timed(..., parallel=True)`.
+
+The second table compares the first call of a fresh session (what the first live turn
+paid before) with later calls, and the first call of `_extract_windows_numba` (JIT
+compilation) with later ones.
+
+Usage:
+    python benchmarks/bench_startup.py --models 3 --layers 8 --repeats 3
+"""
+
+import argparse
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import time
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from loguru import logger
+import numpy as np
+
+from glados.core.startup import run_timed
+from glados.utils.onnx_sessions import OnnxProfile, OnnxRuntimeConfig, configure_sessions, create_session
+from synthetic_onnx import vits_model
+
+NUM_SYMBOLS = 40
+
+
+def run(session) -> None:  # type: ignore[no-untyped-def]
+    ids = np.arange(1, 33, dtype=np.int64)[None, :] % NUM_SYMBOLS
+    feeds = {
+        "input": ids,
+        "input_lengths": np.array([ids.shape[1]], dtype=np.int64),
+        "scales": np.array([0.667, 1.0, 0.8], dtype=np.float32),
+    }
+    session.run(None, feeds)
+
+
+def load_all(paths: list[Path], parallel: bool) -> float:
+    start = time.perf_counter()
+    loaders = {f"model{i}": (lambda p=path: create_session("tts_glados", p)) for i, path in enumerate(paths)}
+    run_timed(loaders, "load", parallel=parallel)
+    return time.perf_counter() - start
+
+
+def first_call_ms(path: Path, calls: int = 5) -> tuple[float, float]:
+    session = create_session("tts_glados", path)
+    times = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        run(session)
+        times.append((time.perf_counter() - start) * 1000)
+    return times[0], statistics.median(times[1:])
+
+
+def numba_first_call_ms() -> tuple[float, float]:
+    # Importing inside keeps numba's compilation out of the import-time measurements above
+    from glados.ASR.mel_spectrogram import _extract_windows_numba
+
+    audio = np.random.default_rng(0).standard_normal(16000 * 3).astype(np.float32)
+    window = np.hanning(512).astype(np.float32)
+    n_frames = 1 + (len(audio) - 512) // 160
+    times = []
+    for _ in range(5):
+        start = time.perf_counter()
+        _extract_windows_numba(audio, window, 512, 160, n_frames)
+        times.append((time.perf_counter() - start) * 1000)
+    return times[0], statistics.median(times[1:])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Concurrent model loading and warm-up benchmark")
+    parser.add_argument("--models", type=int, default=3, help="Models loaded at start-up")
+    parser.add_argument("--layers", type=int, default=8, help="Depth of each synthetic model")
+    parser.add_argument("--repeats", type=int, default=3, help="Starts per mode")
+    parser.add_argument("--threads", type=int, default=1, help="Intra-op threads per session")
+    args = parser.parse_args()
+
+    logger.remove()
+    configure_sessions(
+        OnnxRuntimeConfig(default=OnnxProfile(graph_optimization="all", intra_op_threads=args.threads))
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(args.models):
+            path = Path(tmp) / f"model-{i}.onnx"
+            path.write_bytes(vits_model(num_symbols=NUM_SYMBOLS, layers=args.layers, seed=i))
+            paths.append(path)
+
+        sequential = [load_all(paths, parallel=False) for _ in range(args.repeats)]
+        parallel = [load_all(paths, parallel=True) for _ in range(args.repeats)]
+        print(f"{'models':>6} {'sequential ms':>14} {'parallel ms':>12}")
+        print(
+            f"{args.models:>6} {statistics.median(sequential) * 1000:>14.1f} "
+            f"{statistics.median(parallel) * 1000:>12.1f}"
+        )
+
+        print(f"\n{'call':>22} {'first ms':>9} {'warm ms':>9}")
+        first, warm = first_call_ms(paths[0])
+        print(f"{'synthetic VITS run':>22} {first:>9.1f} {warm:>9.1f}")
+        first, warm = numba_first_call_ms()
+        print(f"{'_extract_windows_numba':>22} {first:>9.1f} {warm:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
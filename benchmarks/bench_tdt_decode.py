@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+TDT greedy decoding time per second of audio: frame by frame vs. label looping.
+
+The Parakeet model files are not needed: synthetic encoder, decoder and joiner models with
+the inputs and outputs of the export (see synthetic_onnx.py) run in real CPU ONNX Runtime
+sessions. Each utterance is encoded once, then decoded with:
+
+- "frame by frame": the previous loop, one joiner call on `encoder_out[:, :, t:t+1]` and
+  two `np.argmax` calls per visited frame
+- "label looping": `AudioTranscriber.decode_frames`, one joiner call over a window of
+  frames per decoder state, blanks followed through the window without model calls
+
+Reported per utterance length: decode ms per second of audio, joiner calls per second of
+audio and whether both give the same tokens.
+
+Usage:
+    python benchmarks/bench_tdt_decode.py --seconds 2 5 10 30 --repeats 5
+"""
+
+import argparse
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import time
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from loguru import logger
+import numpy as np
+
+from glados.ASR.tdt_asr import AudioTranscriber
+from glados.utils.onnx_sessions import OnnxProfile, OnnxRuntimeConfig, configure_sessions
+from synthetic_onnx import tdt_models
+
+SAMPLE_RATE = 16000
+
+
+class CountingJoiner:
+    """Counts the joiner calls of a model."""
+
+    def __init__(self, model) -> None:  # type: ignore[no-untyped-def]
+        self.model = model
+        self.calls = 0
+        self.run_joiner_inner = model.run_joiner
+        model.run_joiner = self.run_joiner
+
+    def run_joiner(self, encoder_out_t, decoder_out):  # type: ignore[no-untyped-def]
+        self.calls += 1
+        return self.run_joiner_inner(encoder_out_t, decoder_out)
+
+
+def frame_by_frame(asr: AudioTranscriber, encoder_out: np.ndarray) -> list[int]:
+    """The previous decoding loop: one joiner call per visited frame."""
+    max_encoder_t = encoder_out.shape[2]
+    token_ids: list[int] = []
+    state0, state1 = asr.model.get_decoder_initial_state(batch_size=1)
+    decoder_out, next_state0, next_state1 = asr.model.run_decoder(asr.blank_id, state0, state1)
+    current_t, steps = 0, 0
+    while current_t < max_encoder_t and steps < max_encoder_t * 2:
+        steps += 1
+        joiner_logits = asr.model.run_joiner(encoder_out[:, :, current_t : current_t + 1], decoder_out).squeeze()
+        token = int(np.argmax(joiner_logits[: asr.blank_id + 1]))
+        skip = asr.tdt_durations[int(np.argmax(joiner_logits[asr.blank_id + 1 :]))]
+        if token != asr.blank_id:
+            token_ids.append(token)
+            state0, state1 = next_state0, next_state1
+            decoder_out, next_state0, next_state1 = asr.model.run_decoder(token, state0, state1)
+        elif skip == 0:
+            skip = 1  # Same rule as decode_frames, the old loop repeated the frame until the step limit
+        current_t += skip
+    return token_ids
+
+
+def measure(decode, audio_seconds: float, repeats: int, counter: CountingJoiner) -> tuple[float, float, list[int]]:  # type: ignore[no-untyped-def]
+    times = []
+    for _ in range(repeats):
+        counter.calls = 0
+        start = time.perf_counter()
+        tokens = decode()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000 / audio_seconds, counter.calls / audio_seconds, tokens
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="TDT decoding time per second of audio")
+    parser.add_argument("--seconds", type=float, nargs="+", default=[2, 5, 10, 30], help="Utterance lengths")
+    parser.add_argument("--repeats", type=int, default=5, help="Decodes per measurement")
+    parser.add_argument("--threads", type=int, default=1, help="Intra-op threads per session")
+    args = parser.parse_args()
+
+    logger.remove()
+    configure_sessions(OnnxRuntimeConfig(default=OnnxProfile(intra_op_threads=args.threads)))
+    rng = np.random.default_rng(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [Path(tmp) / f"{name}.onnx" for name in ("encoder", "decoder", "joiner")]
+        for path, data in zip(paths, tdt_models(), strict=True):
+            path.write_bytes(data)
+        asr = AudioTranscriber(encoder_model_path=paths[0], decoder_model_path=paths[1], joiner_model_path=paths[2])
+        counter = CountingJoiner(asr.model)
+
+        print(f"{'audio s':>7} {'frame ms/s':>11} {'label ms/s':>11} {'speed-up':>9} {'joiner/s':>17} {'same':>5}")
+        for seconds in args.seconds:
+            audio = (0.1 * rng.standard_normal(int(seconds * SAMPLE_RATE))).astype(np.float32)
+            encoder_out = asr.encode(audio)
+            old_ms, old_calls, old_tokens = measure(
+                lambda: frame_by_frame(asr, encoder_out), seconds, args.repeats, counter
+            )
+            new_ms, new_calls, new_tokens = measure(
+                lambda: asr._decode_tdt(encoder_out), seconds, args.repeats, counter
+            )
+            print(
+                f"{seconds:>7.0f} {old_ms:>11.2f} {new_ms:>11.2f} {old_ms / new_ms:>8.1f}x "
+                f"{old_calls:>8.1f} -> {new_calls:>5.1f} {str(old_tokens == new_tokens):>5}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Synthesis latency with and without the TTS audio cache.
+
+Replays a stream of spoken sentences in which a pool of frequent phrases (announcement,
+error lines, short replies) is drawn with a Zipf distribution and mixed with unique
+sentences. A synthetic model sleeps `--ms-per-char` per character, like VITS/Kokoro plus
+RVC on a CPU, and returns 24 kHz audio of matching length. Reported per configuration:
+
+- p50 / p95 latency of generate_speech_audio, p50 of the frequent phrases alone,
+  total synthesis time and the hit rate
+- "disk restart" reopens a prewarmed disk tier in a new instance, i.e. the first
+  conversation after a restart, and also reports the disk hit latency
+
+Usage:
+    python benchmarks/bench_tts_cache.py --sentences 400 --repeat-share 0.4
+"""
+
+import argparse
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import time
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from loguru import logger
+import numpy as np
+
+from glados.TTS.audio_cache import CachedSpeechSynthesizer
+
+SAMPLE_RATE = 24000
+SECONDS_PER_CHAR = 0.06  # Speech rate of the synthetic voice
+
+FREQUENT = [
+    "Network audio bridge active. All neural network modules loaded. System Operational.",
+    "I'm unable to connect to my thinking module. Please check the LLM service connection.",
+    "My brain seems to be taking too long to respond. It might be overloaded.",
+    "Okay.",
+    "Yes.",
+    "No.",
+    "Of course.",
+    "You monster.",
+    "Oh, it's you.",
+    "How have you been?",
+    "That was a joke. Ha ha. Fat chance.",
+    "Please proceed to the chamber.",
+]
+
+
+class SlowTTS:
+    """Synthetic model: sleeps per character and returns that much audio."""
+
+    sample_rate = SAMPLE_RATE
+
+    def __init__(self, ms_per_char: float) -> None:
+        self.ms_per_char = ms_per_char
+
+    def generate_speech_audio(self, text: str) -> np.ndarray:
+        time.sleep(len(text) * self.ms_per_char / 1000)
+        samples = int(len(text) * SECONDS_PER_CHAR * SAMPLE_RATE)
+        return np.random.default_rng(len(text)).uniform(-0.3, 0.3, samples).astype(np.float32)
+
+
+def workload(sentences: int, repeat_share: float, seed: int = 0) -> list[str]:
+    rng = np.random.default_rng(seed)
+    ranks = np.arange(1, len(FREQUENT) + 1)
+    weights = (1 / ranks) / (1 / ranks).sum()
+    texts = []
+    for i in range(sentences):
+        if rng.random() < repeat_share:
+            texts.append(FREQUENT[rng.choice(len(FREQUENT), p=weights)])
+        else:
+            texts.append(f"Test subject {i} is now entering chamber {rng.integers(1000)}, please remain calm.")
+    return texts
+
+
+def run(tts: object, texts: list[str]) -> list[float]:
+    latencies = []
+    for text in texts:
+        start = time.perf_counter()
+        tts.generate_speech_audio(text)  # type: ignore[attr-defined]
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def report(name: str, texts: list[str], latencies: list[float], stats: dict | None) -> None:
+    frequent = [latency for text, latency in zip(texts, latencies, strict=True) if text in FREQUENT]
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    hit_rate = f"{stats['hit_rate']:.1%}" if stats else "-"
+    print(
+        f"{name:>16} {statistics.median(latencies) * 1000:>9.1f} {p95 * 1000:>9.1f} "
+        f"{statistics.median(frequent) * 1000:>14.2f} {sum(latencies):>9.2f} {hit_rate:>9}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="TTS audio cache benchmark")
+    parser.add_argument("--sentences", type=int, default=400, help="Sentences to synthesize")
+    parser.add_argument("--repeat-share", type=float, default=0.4, help="Share of sentences from the frequent pool")
+    parser.add_argument("--ms-per-char", type=float, default=2.0, help="Synthetic synthesis cost per character")
+    args = parser.parse_args()
+
+    logger.remove()
+    texts = workload(args.sentences, args.repeat_share)
+    model = SlowTTS(args.ms_per_char)
+
+    print(f"{'config':>16} {'p50 ms':>9} {'p95 ms':>9} {'frequent p50':>14} {'total s':>9} {'hit rate':>9}")
+    report("no cache", texts, run(model, texts), None)
+
+    memory = CachedSpeechSynthesizer(model, "bench")
+    report("memory", texts, run(memory, texts), memory.stats())
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        warm = CachedSpeechSynthesizer(model, "bench", disk_path=cache_dir)
+        warm.prewarm(FREQUENT)
+        warm.close()
+
+        restarted = CachedSpeechSynthesizer(model, "bench", disk_path=cache_dir)
+        report("disk restart", texts, run(restarted, texts), restarted.stats())
+        restarted.close()
+
+        # Disk hit latency alone: a fresh instance has an empty memory tier
+        cold = CachedSpeechSynthesizer(model, "bench", disk_path=cache_dir)
+        disk_hits = run(cold, FREQUENT)
+        cold.close()
+    print(f"\ndisk tier hit: {statistics.median(disk_hits) * 1e6:.0f} us median for {len(FREQUENT)} phrases")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Gap time between sentences for 1, 2 and 4 TTS workers.
+
+Runs the real TextToSpeechSynthesizer with a synthetic model whose inference takes
+`--rtf` times the duration of the audio it produces (>1 means slower than real time,
+as with RVC or Kokoro on a CPU). A response's sentences are queued the way the LLM
+produces them, spaced by `--sentence-interval`, and a player thread "plays" every
+audio message by sleeping for its duration. Reported per worker count:
+
+- time to first audio
+- silent gap between consecutive sentences (mean / max / total)
+- whether sentences arrived in order
+
+The model only sleeps, so the numbers show the scheduling ceiling; a real model also
+competes for CPU cores with its own intra-op threads.
+
+Usage:
+    python benchmarks/bench_tts_workers.py --rtf 1.5 --responses 5
+"""
+
+import argparse
+from pathlib import Path
+import queue
+import statistics
+import sys
+import threading
+import time
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from loguru import logger
+import numpy as np
+
+from glados.core.audio_data import AudioMessage
+from glados.core.stage import SHUTDOWN
+from glados.core.tts_synthesizer import TextToSpeechSynthesizer
+
+SAMPLE_RATE = 1000
+SECONDS_PER_CHAR = 0.06  # Speech rate of the synthetic voice
+
+RESPONSE = [
+    "Oh, it's you.",
+    "It's been a long time.",
+    "How have you been?",
+    "I've been really busy being dead, you know, after you murdered me.",
+    "Okay.",
+    "Look, we've both said a lot of things that you're going to regret.",
+    "But I think we can put our differences behind us, for science.",
+    "You monster.",
+]
+
+
+class SlowTTS:
+    """Synthetic model: sleeps rtf x audio duration, then returns that much audio."""
+
+    sample_rate = SAMPLE_RATE
+
+    def __init__(self, rtf: float, time_scale: float) -> None:
+        self.rtf = rtf
+        self.time_scale = time_scale
+
+    def generate_speech_audio(self, text: str) -> np.ndarray:
+        duration = len(text) * SECONDS_PER_CHAR * self.time_scale
+        time.sleep(duration * self.rtf)
+        return np.zeros(int(duration * SAMPLE_RATE), dtype=np.float32)
+
+
+class IdentityConverter:
+    def text_to_spoken(self, text: str) -> str:
+        return text
+
+
+def run(workers: int, responses: int, rtf: float, sentence_interval: float, time_scale: float) -> dict:
+    tts_queue: queue.Queue = queue.Queue()
+    audio_queue: queue.Queue[AudioMessage] = queue.Queue()
+    synthesizer = TextToSpeechSynthesizer(
+        tts_input_queue=tts_queue,
+        audio_output_queue=audio_queue,
+        tts_model=SlowTTS(rtf, time_scale),
+        stc_instance=IdentityConverter(),
+        shutdown_event=threading.Event(),
+        pause_time=0.05,
+        num_workers=workers,
+    )
+    threading.Thread(target=synthesizer.run, daemon=True).start()
+
+    first_audio, gaps, in_order = [], [], True
+    for _ in range(responses):
+        def produce() -> None:
+            for sentence in RESPONSE:
+                tts_queue.put(sentence)
+                time.sleep(sentence_interval * time_scale)
+            tts_queue.put("<EOS>")
+
+        start = time.perf_counter()
+        threading.Thread(target=produce, daemon=True).start()
+
+        played, playback_end = [], None
+        while (message := audio_queue.get()) and not message.is_eos:
+            now = time.perf_counter()
+            if playback_end is None:
+                first_audio.append(now - start)
+            else:
+                gaps.append(max(0.0, now - playback_end))
+            time.sleep(len(message.audio) / SAMPLE_RATE)
+            playback_end = time.perf_counter()
+            played.append(message.text)
+        in_order &= played == RESPONSE
+
+    tts_queue.put(SHUTDOWN)
+    # Report in unscaled seconds
+    return {
+        "ttfa": statistics.median(first_audio) / time_scale,
+        "gap_mean": statistics.mean(gaps) / time_scale,
+        "gap_max": max(gaps) / time_scale,
+        "gap_total": sum(gaps) / responses / time_scale,
+        "in_order": in_order,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="TTS worker pool gap benchmark")
+    parser.add_argument("--rtf", type=float, default=1.5, help="Synthesis time / audio duration of the model")
+    parser.add_argument("--responses", type=int, default=5, help="Responses replayed per worker count")
+    parser.add_argument("--sentence-interval", type=float, default=0.3, help="Seconds between LLM sentences")
+    parser.add_argument("--time-scale", type=float, default=0.1, help="Run the simulation this much faster")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts to compare")
+    args = parser.parse_args()
+
+    logger.remove()
+
+    print(f"{'workers':>8} {'TTFA s':>8} {'gap mean s':>11} {'gap max s':>10} {'gaps/resp s':>12} {'ordered':>8}")
+    for workers in args.workers:
+        result = run(workers, args.responses, args.rtf, args.sentence_interval, args.time_scale)
+        print(
+            f"{workers:>8} {result['ttfa']:>8.2f} {result['gap_mean']:>11.2f} {result['gap_max']:>10.2f} "
+            f"{result['gap_total']:>12.2f} {str(result['in_order']):>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
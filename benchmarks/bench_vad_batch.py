@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+VAD cost of many concurrent network sessions: a forked VAD per stream vs. one BatchingVAD.
+
+The model file is not needed: a Silero-shaped VAD (see synthetic_onnx.py) runs in a real CPU
+ONNX Runtime session. For N streams, every stream receives a 32 ms chunk per tick and needs
+its speech probability, with:
+
+- "forked": `VAD.fork()` per stream, one `run()` per chunk (the previous behaviour)
+- "batched": `BatchingVAD.process` on all streams' chunks, one `run()` per tick
+- "forked threads" / "batched threads": one thread per stream calling its VAD like a
+  network receive loop; with BatchingVAD the worker batches whatever chunks are waiting
+
+Reported: ms of VAD work per tick (a tick is 32 ms of audio for every stream), the number
+of streams one core keeps up with at that cost, and the largest difference to "forked".
+
+Usage:
+    python benchmarks/bench_vad_batch.py --streams 1 4 16 64
+"""
+
+import argparse
+from pathlib import Path
+import sys
+import tempfile
+import threading
+import time
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from loguru import logger
+import numpy as np
+
+from glados.audio_io.vad import VAD
+from glados.audio_io.vad_batching import BatchingVAD, VADBatchingConfig
+from glados.utils.onnx_sessions import OnnxProfile, OnnxRuntimeConfig, configure_sessions
+from synthetic_onnx import vad_model
+
+TICK_MS = 32.0
+
+
+def forked(vad: VAD, audio: np.ndarray) -> tuple[float, np.ndarray]:
+    forks = [vad.fork() for _ in range(audio.shape[0])]
+    results = np.zeros(audio.shape[:2], dtype=np.float32)
+    start = time.perf_counter()
+    for tick in range(audio.shape[1]):
+        for i, fork in enumerate(forks):
+            results[i, tick] = fork(audio[i, tick])
+    return time.perf_counter() - start, results
+
+
+def batched(batcher: BatchingVAD, audio: np.ndarray) -> tuple[float, np.ndarray]:
+    streams = [batcher.fork() for _ in range(audio.shape[0])]
+    results = np.zeros(audio.shape[:2], dtype=np.float32)
+    start = time.perf_counter()
+    for tick in range(audio.shape[1]):
+        results[:, tick] = batcher.process(streams, list(audio[:, tick]))
+    return time.perf_counter() - start, results
+
+
+def threaded(shared: VAD | BatchingVAD, audio: np.ndarray) -> tuple[float, np.ndarray]:
+    results = np.zeros(audio.shape[:2], dtype=np.float32)
+    barrier = threading.Barrier(audio.shape[0] + 1)
+
+    def receive(index: int) -> None:
+        stream = shared.fork()
+        barrier.wait()
+        for tick in range(audio.shape[1]):
+            results[index, tick] = stream(audio[index, tick])
+
+    threads = [threading.Thread(target=receive, args=(i,)) for i in range(audio.shape[0])]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Forked vs. batched VAD benchmark")
+    parser.add_argument("--streams", type=int, nargs="+", default=[1, 4, 16, 64], help="Concurrent streams")
+    parser.add_argument("--ticks", type=int, default=200, help="32 ms chunks per stream")
+    parser.add_argument("--threads", type=int, default=1, help="Intra-op threads of the session")
+    args = parser.parse_args()
+
+    logger.remove()
+    configure_sessions(OnnxRuntimeConfig(default=OnnxProfile(intra_op_threads=args.threads)))
+    rng = np.random.default_rng(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "vad.onnx"
+        path.write_bytes(vad_model())
+        vad = VAD(model_path=path)
+        vad.warm_up()
+        batcher = BatchingVAD(vad, VADBatchingConfig(max_batch_size=max(args.streams)))
+
+        print(f"{'streams':>7} {'mode':>15} {'ms/tick':>8} {'streams/core':>13} {'max diff':>9}")
+        for count in args.streams:
+            audio = (0.1 * rng.standard_normal((count, args.ticks, 1, 512))).astype(np.float32)
+            reference = None
+            for mode, run in (
+                ("forked", lambda: forked(vad, audio)),
+                ("batched", lambda: batched(batcher, audio)),
+                ("forked threads", lambda: threaded(vad, audio)),
+                ("batched threads", lambda: threaded(batcher, audio)),
+            ):
+                elapsed, results = run()
+                reference = results if reference is None else reference
+                ms_per_tick = elapsed * 1000 / args.ticks
+                diff = float(np.max(np.abs(results - reference)))
+                print(f"{count:>7} {mode:>15} {ms_per_tick:>8.3f} {count * TICK_MS / ms_per_tick:>13.0f} {diff:>9.1e}")
+        batcher.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Throughput of the GLaDOS VITS synthesizer on paragraph inputs: one run per sentence vs. batches.
+
+The Piper model and phonemizer files are not needed: a synthetic ONNX model with the
+Piper inputs and outputs (see synthetic_onnx.py) runs in a real CPU ONNX Runtime
+session, and a character-level stand-in replaces the G2P phonemizer. Paragraphs of
+3-6 sentences, like announcements or long replies, are synthesized with:
+
+- "whole text": the previous behaviour, the paragraph as one phoneme sequence
+- "per sentence": one model run per sentence (MAX_BATCH_SIZE = 1)
+- "batched": the sentences of a paragraph padded into one run
+
+Reported: ms per paragraph (mean and p95), model runs and the real-time factor
+(seconds of audio per second of compute).
+
+Usage:
+    python benchmarks/bench_vits_batch.py --paragraphs 30 --threads 1
+"""
+
+import argparse
+import json
+from pathlib import Path
+import pickle
+import statistics
+import string
+import sys
+import tempfile
+import time
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from loguru import logger
+import numpy as np
+import onnxruntime as ort  # type: ignore
+
+from glados.TTS import tts_glados
+from synthetic_onnx import vits_model
+
+SAMPLE_RATE = 22050
+SYMBOLS = ["_", "^", "$", " ", ".", ",", "!", "?", "'"] + list(string.ascii_lowercase)
+WORDS = (
+    "the test subject will now proceed to chamber nineteen where the cake is waiting for you "
+    "please note that the enrichment center is not responsible for any injuries sustained"
+).split()
+
+
+class CharPhonemizer:
+    """Stand-in phonemizer: lowercase characters as phonemes."""
+
+    def convert_to_phonemes(self, texts: list[str], lang: str = "en_us") -> list[str]:
+        return [text.lower() for text in texts]
+
+
+def paragraphs(count: int, seed: int = 0) -> list[str]:
+    rng = np.random.default_rng(seed)
+    texts = []
+    for _ in range(count):
+        sentences = [
+            " ".join(rng.choice(WORDS, rng.integers(4, 16))).capitalize() + str(rng.choice([".", "!", "?"]))
+            for _ in range(rng.integers(3, 7))
+        ]
+        texts.append(" ".join(sentences))
+    return texts
+
+
+class CountingSession:
+    """Counts model runs of the wrapped session."""
+
+    def __init__(self, session: ort.InferenceSession) -> None:
+        self.session = session
+        self.runs = 0
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self.session, name)
+
+    def run(self, *args: object, **kwargs: object) -> list:
+        self.runs += 1
+        return self.session.run(*args, **kwargs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Batched VITS synthesis benchmark")
+    parser.add_argument("--paragraphs", type=int, default=30, help="Paragraphs to synthesize")
+    parser.add_argument("--threads", type=int, default=1, help="ONNX Runtime intra-op threads")
+    parser.add_argument("--max-padding", type=float, default=0.1, help="MAX_PADDING of the batched run")
+    args = parser.parse_args()
+
+    logger.remove()
+    texts = paragraphs(args.paragraphs)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = Path(tmp) / "voice.onnx"
+        model_path.write_bytes(vits_model(num_symbols=len(SYMBOLS)))
+        id_map = {symbol: [i] for i, symbol in enumerate(SYMBOLS)}
+        (Path(tmp) / "phonemes.pkl").write_bytes(pickle.dumps(id_map))
+        config = {
+            "num_symbols": len(SYMBOLS),
+            "num_speakers": 1,
+            "audio": {"sample_rate": SAMPLE_RATE},
+            "espeak": {"voice": "en-us"},
+            "phoneme_id_map": id_map,
+        }
+        model_path.with_suffix(".json").write_text(json.dumps(config))
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = args.threads
+        session = CountingSession(ort.InferenceSession(model_path, options, providers=["CPUExecutionProvider"]))
+        tts_glados.ort.InferenceSession = lambda *a, **k: session  # type: ignore[assignment]
+        tts_glados.Phonemizer = lambda config: CharPhonemizer()  # type: ignore[assignment,misc]
+        synthesizer = tts_glados.SpeechSynthesizer(model_path, Path(tmp) / "phonemes.pkl")
+        synthesizer.MAX_PADDING = args.max_padding
+
+        modes = [("whole text", False, 8), ("per sentence", True, 1), ("batched", True, 8)]
+        latencies: dict[str, list[float]] = {name: [] for name, _, _ in modes}
+        runs = dict.fromkeys(latencies, 0)
+        audio_seconds = dict.fromkeys(latencies, 0.0)
+        synthesizer.generate_speech_audio(texts[0])  # Warm-up
+        # Modes take turns on every paragraph so drifting machine load affects them alike
+        for text in texts:
+            for name, batch_sentences, max_batch in modes:
+                synthesizer._batchable = batch_sentences
+                synthesizer.MAX_BATCH_SIZE = max_batch
+                session.runs = 0
+                start = time.perf_counter()
+                audio = synthesizer.generate_speech_audio(text)
+                latencies[name].append(time.perf_counter() - start)
+                runs[name] += session.runs
+                audio_seconds[name] += len(audio) / SAMPLE_RATE
+
+        print(f"{'mode':>13} {'ms/paragraph':>13} {'p95 ms':>9} {'model runs':>11} {'RTF':>7}")
+        for name, times in latencies.items():
+            ordered = sorted(times)
+            print(
+                f"{name:>13} {statistics.mean(times) * 1000:>13.1f} "
+                f"{ordered[int(len(ordered) * 0.95) - 1] * 1000:>9.1f} {runs[name]:>11} "
+                f"{audio_seconds[name] / sum(times):>7.1f}"
+            )
+
+if __name__ == "__main__":
+    main()
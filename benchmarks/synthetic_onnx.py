@@ -0,0 +1,376 @@
+"""
+Synthetic ONNX models for benchmarks that must not depend on the downloaded model files.
+
+The `onnx` package is not a dependency, so models are serialized directly as ONNX
+protobuf messages: only the handful of fields needed for plain graphs of standard
+operators are written. The models have the inputs and outputs of the real ones and a
+comparable amount of work, so ONNX Runtime overhead, batching and session options can
+be measured with real inference.
+"""
+
+import struct
+
+import numpy as np
+
+FLOAT, INT32, INT64 = 1, 6, 7  # TensorProto.DataType
+_ATTR_FLOAT, _ATTR_INT, _ATTR_INTS = 1, 2, 7  # AttributeProto.AttributeType
+_ELEM_TYPES = {np.dtype(np.float32): FLOAT, np.dtype(np.int32): INT32, np.dtype(np.int64): INT64}
+
+
+def _varint(value: int) -> bytes:
+    value &= (1 << 64) - 1  # Negative int64 values are encoded as ten bytes
+    out = bytearray()
+    while True:
+        byte, value = value & 0x7F, value >> 7
+        out.append(byte | (0x80 if value else 0))
+        if not value:
+            return bytes(out)
+
+
+def _key(field: int, wire_type: int) -> bytes:
+    return _varint(field << 3 | wire_type)
+
+
+def _int(field: int, value: int) -> bytes:
+    return _key(field, 0) + _varint(value)
+
+
+def _message(field: int, data: bytes | str) -> bytes:
+    if isinstance(data, str):
+        data = data.encode()
+    return _key(field, 2) + _varint(len(data)) + data
+
+
+def tensor(name: str, array: np.ndarray) -> bytes:
+    """Serialize an initializer (TensorProto)."""
+    array = np.ascontiguousarray(array)
+    dims = b"".join(_int(1, dim) for dim in array.shape)
+    return dims + _int(2, _ELEM_TYPES[array.dtype]) + _message(8, name) + _message(9, array.tobytes())
+
+
+def _attribute(name: str, value: int | float | list[int]) -> bytes:
+    if isinstance(value, list):
+        return _message(1, name) + b"".join(_int(8, v) for v in value) + _int(20, _ATTR_INTS)
+    if isinstance(value, float):
+        return _message(1, name) + _key(2, 5) + struct.pack("<f", value) + _int(20, _ATTR_FLOAT)
+    return _message(1, name) + _int(3, value) + _int(20, _ATTR_INT)
+
+
+def node(op_type: str, inputs: list[str], outputs: list[str], **attributes: int | float | list[int]) -> bytes:
+    """Serialize a NodeProto of the default domain."""
+    data = b"".join(_message(1, name) for name in inputs) + b"".join(_message(2, name) for name in outputs)
+    data += _message(3, f"{op_type}_{outputs[0]}") + _message(4, op_type)
+    return data + b"".join(_message(5, _attribute(key, value)) for key, value in attributes.items())
+
+
+def value_info(name: str, elem_type: int, shape: list[int | str]) -> bytes:
+    """Serialize a graph input or output (ValueInfoProto); str dimensions are symbolic."""
+    dims = b"".join(_message(1, _int(1, d) if isinstance(d, int) else _message(2, d)) for d in shape)
+    tensor_type = _int(1, elem_type) + _message(2, dims)
+    return _message(1, name) + _message(2, _message(1, tensor_type))
+
+
+def model(
+    nodes: list[bytes],
+    initializers: list[bytes],
+    inputs: list[bytes],
+    outputs: list[bytes],
+    opset: int = 17,
+    metadata: dict[str, str] | None = None,
+) -> bytes:
+    """Serialize a ModelProto with one graph and optional metadata_props."""
+    graph = b"".join(_message(1, n) for n in nodes) + _message(2, "synthetic")
+    graph += b"".join(_message(5, t) for t in initializers)
+    graph += b"".join(_message(11, i) for i in inputs) + b"".join(_message(12, o) for o in outputs)
+    opset_import = _message(1, "") + _int(2, opset)
+    props = b"".join(_message(14, _message(1, k) + _message(2, v)) for k, v in (metadata or {}).items())
+    return _int(1, 8) + _message(2, "glados-benchmarks") + _message(8, opset_import) + _message(7, graph) + props
+
+
+def vits_model(
+    num_symbols: int = 256,
+    channels: int = 192,
+    layers: int = 4,
+    flow_layers: int = 16,
+    upsample: tuple[int, ...] = (8, 8, 8),
+    seed: int = 0,
+) -> bytes:
+    """
+    Piper/VITS stand-in: phoneme IDs in, float audio of shape (batch, 1, 1, samples) out.
+
+    Inputs are "input" (batch, phonemes), "input_lengths" (batch) and "scales" (3) like
+    the Piper export; each phoneme ID becomes prod(upsample) samples through a text
+    encoder of 1-D convolutions, gated WaveNet-style flow layers (many small operators,
+    which make up most of the fixed cost of a VITS run) and a transposed-convolution
+    decoder. A second output, "lengths", gives the valid samples of each batch item.
+    """
+    rng = np.random.default_rng(seed)
+
+    def weight(*shape: int) -> np.ndarray:
+        return (rng.standard_normal(shape) / np.sqrt(np.prod(shape[1:]))).astype(np.float32)
+
+    hop = int(np.prod(upsample))
+    inits = [
+        tensor("embedding", weight(num_symbols, channels)),
+        tensor("hop", np.array(hop, dtype=np.int64)),
+        tensor("channel_axis", np.array([1], dtype=np.int64)),
+    ]
+    nodes = [
+        node("Gather", ["embedding", "input"], ["embedded"]),
+        node("Transpose", ["embedded"], ["x0"], perm=[0, 2, 1]),
+    ]
+    x = "x0"
+    for i in range(layers):
+        inits += [tensor(f"enc{i}_w", weight(channels, channels, 5)), tensor(f"enc{i}_b", weight(channels))]
+        nodes += [
+            node("Conv", [x, f"enc{i}_w", f"enc{i}_b"], [f"enc{i}_c"], pads=[2, 2]),
+            node("Relu", [f"enc{i}_c"], [f"enc{i}"]),
+        ]
+        x = f"enc{i}"
+    half = channels // 2
+    inits.append(tensor("split", np.array([half, half], dtype=np.int64)))
+    for i in range(flow_layers):
+        dilation = 2 ** (i % 4)
+        inits += [
+            tensor(f"flow{i}_w", weight(channels, channels, 3)),
+            tensor(f"flow{i}_b", weight(channels)),
+            tensor(f"flow{i}_out", weight(channels, half, 1)),
+        ]
+        nodes += [
+            node("Conv", [x, f"flow{i}_w", f"flow{i}_b"], [f"flow{i}_c"], pads=[dilation, dilation], dilations=[dilation]),
+            node("Split", [f"flow{i}_c", "split"], [f"flow{i}_a", f"flow{i}_g"], axis=1),
+            node("Tanh", [f"flow{i}_a"], [f"flow{i}_t"]),
+            node("Sigmoid", [f"flow{i}_g"], [f"flow{i}_s"]),
+            node("Mul", [f"flow{i}_t", f"flow{i}_s"], [f"flow{i}_m"]),
+            node("Conv", [f"flow{i}_m", f"flow{i}_out"], [f"flow{i}_r"]),
+            node("Add", [x, f"flow{i}_r"], [f"flow{i}"]),
+        ]
+        x = f"flow{i}"
+    in_channels = channels
+    for i, factor in enumerate(upsample):
+        out_channels = max(in_channels // 2, 16)
+        inits += [
+            tensor(f"up{i}_w", weight(in_channels, out_channels, 2 * factor)),
+            tensor(f"up{i}_b", weight(out_channels)),
+        ]
+        nodes += [
+            node(
+                "ConvTranspose",
+                [x, f"up{i}_w", f"up{i}_b"],
+                [f"up{i}_c"],
+                strides=[factor],
+                pads=[factor // 2, factor // 2],
+            ),
+            node("LeakyRelu", [f"up{i}_c"], [f"up{i}"], alpha=0.1),
+        ]
+        x, in_channels = f"up{i}", out_channels
+    inits += [tensor("post_w", weight(1, in_channels, 7)), tensor("post_b", weight(1))]
+    nodes += [
+        node("Conv", [x, "post_w", "post_b"], ["post"], pads=[3, 3]),
+        node("Tanh", ["post"], ["wave"]),
+        node("Unsqueeze", ["wave", "channel_axis"], ["output"]),
+        node("Mul", ["input_lengths", "hop"], ["lengths"]),
+    ]
+    return model(
+        nodes,
+        inits,
+        inputs=[
+            value_info("input", INT64, ["batch", "phonemes"]),
+            value_info("input_lengths", INT64, ["batch"]),
+            value_info("scales", FLOAT, [3]),
+        ],
+        outputs=[
+            value_info("output", FLOAT, ["batch", 1, 1, "samples"]),
+            value_info("lengths", INT64, ["batch"]),
+        ],
+    )
+
+
+def tdt_models(
+    features: int = 128,
+    channels: int = 512,
+    layers: int = 4,
+    pred_hidden: int = 640,
+    pred_rnn_layers: int = 2,
+    joint_hidden: int = 640,
+    vocab_size: int = 1024,
+    num_durations: int = 5,
+    seed: int = 0,
+) -> tuple[bytes, bytes, bytes]:
+    """
+    Parakeet-TDT stand-ins: (encoder, decoder, joiner) with the inputs and outputs of the export.
+
+    - Encoder: "audio_signal" (batch, features, time) and "length" (batch) in, "outputs"
+      (batch, channels, time / 8) and "encoded_lengths" out; three stride-2 convolutions
+      like the conv subsampling, then position-wise layers. The metadata carries
+      pred_rnn_layers/pred_hidden like the real encoder.
+    - Decoder: "targets" (batch, 1) int32, "target_length" (batch) and two states
+      (layers, batch, hidden) in, "outputs" (batch, hidden, 1), the length and the new states out.
+    - Joiner: "encoder_outputs" (batch, channels, frames) and "decoder_outputs" (batch, hidden, 1)
+      in, "outputs" (batch, frames, 1, vocab + 1 + durations) out. The logits are biased so that
+      most frames predict blank and most durations are 1-2 frames, like speech.
+    """
+    rng = np.random.default_rng(seed)
+
+    def weight(*shape: int) -> np.ndarray:
+        return (rng.standard_normal(shape) / np.sqrt(np.prod(shape[1:]))).astype(np.float32)
+
+    def axes(*values: int) -> np.ndarray:
+        return np.array(values, dtype=np.int64)
+
+    # Encoder
+    inits = [tensor("seven", np.array(7, dtype=np.int64)), tensor("eight", np.array(8, dtype=np.int64))]
+    nodes = []
+    x, in_channels = "audio_signal", features
+    for i in range(3):
+        inits += [tensor(f"sub{i}_w", weight(channels, in_channels, 3)), tensor(f"sub{i}_b", weight(channels))]
+        nodes += [
+            node("Conv", [x, f"sub{i}_w", f"sub{i}_b"], [f"sub{i}_c"], pads=[1, 1], strides=[2]),
+            node("Relu", [f"sub{i}_c"], [f"sub{i}"]),
+        ]
+        x, in_channels = f"sub{i}", channels
+    for i in range(layers):
+        inits += [tensor(f"ff{i}_w", weight(channels, channels, 1)), tensor(f"ff{i}_b", weight(channels))]
+        nodes += [
+            node("Conv", [x, f"ff{i}_w", f"ff{i}_b"], [f"ff{i}_c"]),
+            node("Tanh", [f"ff{i}_c"], [f"ff{i}_t"]),
+            node("Add", [x, f"ff{i}_t"], [f"ff{i}"]),
+        ]
+        x = f"ff{i}"
+    nodes += [
+        node("Identity", [x], ["outputs"]),
+        node("Add", ["length", "seven"], ["length7"]),
+        node("Div", ["length7", "eight"], ["encoded_lengths"]),
+    ]
+    encoder = model(
+        nodes,
+        inits,
+        inputs=[value_info("audio_signal", FLOAT, ["batch", features, "time"]), value_info("length", INT64, ["batch"])],
+        outputs=[
+            value_info("outputs", FLOAT, ["batch", channels, "frames"]),
+            value_info("encoded_lengths", INT64, ["batch"]),
+        ],
+        metadata={"pred_rnn_layers": str(pred_rnn_layers), "pred_hidden": str(pred_hidden), "normalize_type": "per_feature"},
+    )
+
+    # Decoder: an RNN-like update of every layer's state from the embedded token
+    inits = [
+        tensor("embedding", weight(vocab_size + 1, pred_hidden)),
+        tensor("state_w", weight(pred_hidden, pred_hidden)),
+        tensor("last_start", axes(pred_rnn_layers - 1)),
+        tensor("last_end", axes(pred_rnn_layers)),
+        tensor("layer_axis", axes(0)),
+    ]
+    nodes = [
+        node("Gather", ["embedding", "targets"], ["embedded"]),  # (batch, 1, hidden)
+        node("Transpose", ["embedded"], ["embedded_t"], perm=[1, 0, 2]),  # (1, batch, hidden)
+        node("MatMul", ["states.1", "state_w"], ["state_proj"]),
+        node("Add", ["state_proj", "embedded_t"], ["state_sum"]),
+        node("Tanh", ["state_sum"], ["states"]),
+        node("Add", ["onnx::Slice_3", "states"], ["162"]),
+        node("Slice", ["states", "last_start", "last_end", "layer_axis"], ["last"]),  # (1, batch, hidden)
+        node("Transpose", ["last"], ["outputs"], perm=[1, 2, 0]),
+        node("Identity", ["target_length"], ["prednet_lengths"]),
+    ]
+    state_shape: list[int | str] = [pred_rnn_layers, "batch", pred_hidden]
+    decoder = model(
+        nodes,
+        inits,
+        inputs=[
+            value_info("targets", INT32, ["batch", 1]),
+            value_info("target_length", INT32, ["batch"]),
+            value_info("states.1", FLOAT, state_shape),
+            value_info("onnx::Slice_3", FLOAT, state_shape),
+        ],
+        outputs=[
+            value_info("outputs", FLOAT, ["batch", pred_hidden, 1]),
+            value_info("prednet_lengths", INT32, ["batch"]),
+            value_info("states", FLOAT, state_shape),
+            value_info("162", FLOAT, state_shape),
+        ],
+    )
+
+    # Joiner
+    bias = np.zeros(vocab_size + 1 + num_durations, dtype=np.float32)
+    bias[vocab_size] = 2.5  # Blank
+    bias[vocab_size + 1 :] = [-4.0, 2.0, 1.5, -1.0, -2.0][:num_durations]
+    inits = [
+        tensor("enc_w", weight(channels, joint_hidden)),
+        tensor("dec_w", weight(pred_hidden, joint_hidden)),
+        tensor("out_w", weight(joint_hidden, vocab_size + 1 + num_durations)),
+        tensor("out_b", bias),
+        tensor("u_axis", axes(2)),
+    ]
+    nodes = [
+        node("Transpose", ["encoder_outputs"], ["enc_t"], perm=[0, 2, 1]),  # (batch, frames, channels)
+        node("MatMul", ["enc_t", "enc_w"], ["enc_p"]),
+        node("Transpose", ["decoder_outputs"], ["dec_t"], perm=[0, 2, 1]),  # (batch, 1, hidden)
+        node("MatMul", ["dec_t", "dec_w"], ["dec_p"]),
+        node("Add", ["enc_p", "dec_p"], ["joint"]),
+        node("Relu", ["joint"], ["joint_r"]),
+        node("MatMul", ["joint_r", "out_w"], ["logits"]),
+        node("Add", ["logits", "out_b"], ["logits_b"]),
+        node("Unsqueeze", ["logits_b", "u_axis"], ["outputs"]),
+    ]
+    joiner = model(
+        nodes,
+        inits,
+        inputs=[
+            value_info("encoder_outputs", FLOAT, ["batch", channels, "frames"]),
+            value_info("decoder_outputs", FLOAT, ["batch", pred_hidden, 1]),
+        ],
+        outputs=[value_info("outputs", FLOAT, ["batch", "frames", 1, vocab_size + 1 + num_durations])],
+    )
+    return encoder, decoder, joiner
+
+
+def vad_model(channels: int = 128, seed: int = 0) -> bytes:
+    """
+    Silero VAD v5 stand-in: "input" (batch, 64 + 512), "state" (2, batch, 128) and "sr" in,
+    "output" (batch, 1) and "stateN" out, like the real model at 16 kHz.
+
+    A strided convolution like the STFT front end, one encoder convolution, then a recurrent
+    update of the state and a sigmoid head: a few small operators, so the per-call overhead of
+    ONNX Runtime is a large share of a run, as with the real model.
+    """
+    rng = np.random.default_rng(seed)
+
+    def weight(*shape: int) -> np.ndarray:
+        return (rng.standard_normal(shape) / np.sqrt(np.prod(shape[1:]))).astype(np.float32)
+
+    inits = [
+        tensor("stft_w", weight(258, 1, 256)),
+        tensor("enc_w", weight(channels, 258, 3)),
+        tensor("enc_b", weight(channels)),
+        tensor("state_w", weight(channels, channels)),
+        tensor("out_w", weight(channels, 1)),
+        tensor("channel_axis", np.array([1], dtype=np.int64)),
+        tensor("layer_axis", np.array([0], dtype=np.int64)),
+        tensor("last_start", np.array([1], dtype=np.int64)),
+        tensor("last_end", np.array([2], dtype=np.int64)),
+    ]
+    nodes = [
+        node("Unsqueeze", ["input", "channel_axis"], ["signal"]),  # (batch, 1, samples)
+        node("Conv", ["signal", "stft_w"], ["spectrum"], strides=[128]),  # (batch, 258, 4)
+        node("Abs", ["spectrum"], ["magnitude"]),
+        node("Conv", ["magnitude", "enc_w", "enc_b"], ["encoded_c"], pads=[1, 1]),
+        node("Relu", ["encoded_c"], ["encoded"]),
+        node("ReduceMean", ["encoded"], ["features"], axes=[2], keepdims=0),  # (batch, channels)
+        node("MatMul", ["state", "state_w"], ["state_proj"]),
+        node("Add", ["state_proj", "features"], ["state_sum"]),
+        node("Tanh", ["state_sum"], ["stateN"]),
+        node("Slice", ["stateN", "last_start", "last_end", "layer_axis"], ["last"]),  # (1, batch, channels)
+        node("MatMul", ["last", "out_w"], ["logit"]),
+        node("Sigmoid", ["logit"], ["probability"]),
+        node("Squeeze", ["probability", "layer_axis"], ["output"]),
+    ]
+    return model(
+        nodes,
+        inits,
+        inputs=[
+            value_info("input", FLOAT, ["batch", "samples"]),
+            value_info("state", FLOAT, [2, "batch", channels]),
+            value_info("sr", INT64, []),
+        ],
+        outputs=[value_info("output", FLOAT, ["batch", 1]), value_info("stateN", FLOAT, [2, "batch", channels])],
+    )
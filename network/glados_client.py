@@ -51,6 +51,7 @@ LOCAL_CHUNK_SAMPLES = int(LOCAL_SAMPLE_RATE * CHUNK_MS / 1000)
 TEXT_MESSAGE_MARKER = 0xFFFFFFFF  # Special marker for text messages
 ASSISTANT_TEXT_MARKER = 0xFFFFFFFE  # GLaDOS response text
 USER_TRANSCRIPTION_MARKER = 0xFFFFFFFD  # User's transcribed speech
+PARTIAL_TRANSCRIPTION_MARKER = 0xFFFFFFF8  # Transcript so far while the user speaks
 
 
 class MessageType(Enum):
@@ -265,6 +266,14 @@ class GLaDOSClient:
                         print(f"User transcription: {text}")
                         self.add_message(MessageType.USER_VOICE, text)
                         continue
+
+                    # Partial transcription, the final one follows as USER_TRANSCRIPTION_MARKER
+                    if length == PARTIAL_TRANSCRIPTION_MARKER:
+                        text_length = second_field
+                        if len(buffer) < 8 + text_length:
+                            break
+                        buffer = buffer[8 + text_length:]
+                        continue
                     
                     # Check for assistant text message from server
                     if length == ASSISTANT_TEXT_MARKER:
@@ -15,7 +15,8 @@ from typing import Callable, Optional
 from pathlib import Path
 
 import numpy as np
-import sounddevice as sd
+
+# sounddevice (PortAudio) is imported when audio starts, keeping client start-up fast
 
 # Optional authentication support
 try:
@@ -37,6 +38,7 @@ TEXT_MESSAGE_MARKER = 0xFFFFFFFF
 ASSISTANT_TEXT_MARKER = 0xFFFFFFFE
 USER_TRANSCRIPTION_MARKER = 0xFFFFFFFD
 KEEPALIVE_MARKER = 0xFFFFFFFC
+PARTIAL_TRANSCRIPTION_MARKER = 0xFFFFFFF8
 
 
 class MicMuteDetector:
@@ -75,6 +77,7 @@ class GLaDOSNetworkClient:
         server_port: int,
         on_user_text: Optional[Callable[[str], None]] = None,
         on_user_voice: Optional[Callable[[str], None]] = None,
+        on_user_voice_partial: Optional[Callable[[str], None]] = None,
         on_assistant_text: Optional[Callable[[str], None]] = None,
         on_connection_status: Optional[Callable[[bool], None]] = None,
         on_mic_status: Optional[Callable[[bool], None]] = None,
@@ -89,6 +92,7 @@ class GLaDOSNetworkClient:
             server_port: Server port
             on_user_text: Callback for user text messages (text)
             on_user_voice: Callback for user voice transcriptions (text)
+            on_user_voice_partial: Callback for the transcript so far while the user speaks (text)
             on_assistant_text: Callback for assistant messages (text)
             on_connection_status: Callback for connection status (connected: bool)
             on_mic_status: Callback for mic mute status (is_muted: bool)
@@ -101,6 +105,7 @@ class GLaDOSNetworkClient:
         # Callbacks
         self.on_user_text = on_user_text
         self.on_user_voice = on_user_voice
+        self.on_user_voice_partial = on_user_voice_partial
         self.on_assistant_text = on_assistant_text
         self.on_connection_status = on_connection_status
         self.on_mic_status = on_mic_status
@@ -117,7 +122,7 @@ class GLaDOSNetworkClient:
         # Mic mute detection
         self.mic_detector = MicMuteDetector()
         self.recording_enabled = False
-        self.input_stream: Optional[sd.InputStream] = None
+        self.input_stream: Optional["sd.InputStream"] = None
 
         # Threads
         self.receive_thread: Optional[threading.Thread] = None
@@ -245,6 +250,8 @@ class GLaDOSNetworkClient:
 
             if audio is not None:
                 try:
+                    import sounddevice as sd
+
                     sd.play(audio, LOCAL_SAMPLE_RATE, device="pipewire")
                     sd.wait()
                 except Exception:
@@ -286,6 +293,19 @@ class GLaDOSNetworkClient:
                             self.on_user_voice(text)
                         continue
 
+                    # Check for partial transcription of speech still in progress
+                    if length == PARTIAL_TRANSCRIPTION_MARKER:
+                        text_length = second_field
+                        if len(buffer) < 8 + text_length:
+                            break
+                        text_bytes = buffer[8:8 + text_length]
+                        buffer = buffer[8 + text_length:]
+
+                        text = text_bytes.decode('utf-8', errors='replace')
+                        if self.on_user_voice_partial:
+                            self.on_user_voice_partial(text)
+                        continue
+
                     # Check for assistant text message from server
                     if length == ASSISTANT_TEXT_MARKER:
                         text_length = second_field
@@ -405,6 +425,8 @@ class GLaDOSNetworkClient:
 
         # Setup audio input
         try:
+            import sounddevice as sd
+
             self.input_stream = sd.InputStream(
                 samplerate=LOCAL_SAMPLE_RATE,
                 channels=1,
@@ -37,6 +37,7 @@ LOCAL_CHUNK_SAMPLES = int(LOCAL_SAMPLE_RATE * CHUNK_MS / 1000)
 TEXT_MESSAGE_MARKER = 0xFFFFFFFF
 ASSISTANT_TEXT_MARKER = 0xFFFFFFFE
 USER_TRANSCRIPTION_MARKER = 0xFFFFFFFD
+PARTIAL_TRANSCRIPTION_MARKER = 0xFFFFFFF8
 KEEPALIVE_MARKER = 0xFFFFFFFC
 
 
@@ -184,6 +185,18 @@ class GLaDOSTerminalClient:
                         text = text_bytes.decode('utf-8', errors='replace')
                         print(f"\n\033[94mYou (voice):\033[0m {text}")
                         continue
+
+                    # Partial transcription while still speaking, overwritten in place
+                    if length == PARTIAL_TRANSCRIPTION_MARKER:
+                        text_length = second_field
+                        if len(buffer) < 8 + text_length:
+                            break
+                        text_bytes = buffer[8:8 + text_length]
+                        buffer = buffer[8 + text_length:]
+
+                        text = text_bytes.decode('utf-8', errors='replace')
+                        print(f"\r\033[K\033[90mYou (speaking): {text}\033[0m", end="", flush=True)
+                        continue
                     
                     # Check for assistant text message from server
                     if length == ASSISTANT_TEXT_MARKER:
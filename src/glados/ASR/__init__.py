@@ -1,11 +1,12 @@
 """ASR processing components."""
 
 from pathlib import Path
-from typing import Any, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 
 from numpy.typing import NDArray
 
-from .mel_spectrogram import MelSpectrogramCalculator
+if TYPE_CHECKING:
+    from .mel_spectrogram import MelSpectrogramCalculator
 
 
 class TranscriberProtocol(Protocol):
@@ -14,9 +15,22 @@ class TranscriberProtocol(Protocol):
     def transcribe_file(self, audio_path: Path) -> str: ...
 
 
+class StreamingTranscriberProtocol(TranscriberProtocol, Protocol):
+    """Transcriber that can also decode an utterance chunk by chunk, see `streaming.StreamingTranscription`."""
+
+    frame_samples: int  # Audio samples per encoder output frame
+
+    def encode(self, audio: NDArray[Any]) -> NDArray[Any]: ...
+    def decode_frames(self, frames: NDArray[Any], state: Any | None = None) -> Any: ...
+    def hypothesis_text(self, state: Any) -> str: ...
+
+
 # Factory function
 def get_audio_transcriber(
-    engine_type: str = "ctc", **kwargs: dict[str, Any]
+    engine_type: str = "ctc",
+    quantization: str | None = None,
+    frame_extraction: str = "strided",
+    **kwargs: dict[str, Any],
 ) -> TranscriberProtocol:  # Return type is now a Union of concrete types
     """
     Factory function to get an instance of an audio transcriber based on the specified engine type.
@@ -25,6 +39,11 @@ def get_audio_transcriber(
         engine_type (str): The type of ASR engine to use:
             - "ctc": Connectionist Temporal Classification model (faster, good accuracy)
             - "tdt": Token and Duration Transducer model (best accuracy, slightly slower)
+        quantization (str | None): INT8 variant of the acoustic model to load ("int8_dynamic" or
+            "int8_static", see `glados quantize`), None for the original model. For TDT only the
+            encoder is quantized.
+        frame_extraction (str): Framing of the mel spectrogram: "strided" (NumPy window view) or
+            "numba" (JIT-compiled loop, compiled code cached on disk after the first start)
         **kwargs: Additional keyword arguments to pass to the transcriber constructor
 
     Returns:
@@ -33,16 +52,31 @@ def get_audio_transcriber(
     Raises:
         ValueError: If the specified engine type is not supported
     """
+    from ..utils.quantization import resolve_variant
+
     if engine_type.lower() == "ctc":
         from .ctc_asr import AudioTranscriber as CTCTranscriber
 
-        return CTCTranscriber()
+        return CTCTranscriber(
+            model_path=resolve_variant(CTCTranscriber.DEFAULT_MODEL_PATH, quantization),
+            frame_extraction=frame_extraction,
+        )
     elif engine_type.lower() == "tdt":
-        from .tdt_asr import AudioTranscriber as TDTTranscriber
+        from .tdt_asr import AudioTranscriber as TDTTranscriber, _OnnxTDTModel
 
-        return TDTTranscriber()
+        encoder_path = resolve_variant(_OnnxTDTModel.DEFAULT_ENCODER_MODEL_PATH, quantization)
+        return TDTTranscriber(encoder_model_path=encoder_path, frame_extraction=frame_extraction)
     else:
         raise ValueError(f"Unsupported ASR engine type: {engine_type}")
 
 
-__all__ = ["MelSpectrogramCalculator", "TranscriberProtocol", "get_audio_transcriber"]
+def __getattr__(name: str) -> Any:
+    # mel_spectrogram imports numba, which takes longer than everything else in this package
+    if name == "MelSpectrogramCalculator":
+        from .mel_spectrogram import MelSpectrogramCalculator
+
+        return MelSpectrogramCalculator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["MelSpectrogramCalculator", "StreamingTranscriberProtocol", "TranscriberProtocol", "get_audio_transcriber"]
@@ -0,0 +1,124 @@
+"""
+Transcription of concurrent utterances in batches, for an ASR model shared by several sessions.
+
+Every network session calls `transcribe` from its own speech listener thread. Run one
+after another, each call leaves most cores idle during the sequential decoding loop and
+pays the per-run overhead of the encoder on its own. `BatchingTranscriber` hands the
+calls to one worker thread, which transcribes all utterances waiting at the same time
+with a single `transcribe_batch` call: one padded encoder run and one batched decoding
+loop. A lone utterance is transcribed immediately unless `max_wait_ms` is set.
+"""
+
+from concurrent.futures import Future
+import queue
+import threading
+import time
+from typing import Any
+
+from loguru import logger
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import BaseModel
+
+
+class ASRBatchingConfig(BaseModel):
+    """Configuration of batched transcription for shared ASR models."""
+
+    enabled: bool = False
+    max_batch_size: int = 4  # Utterances transcribed in one encoder run
+    max_wait_ms: float = 0.0  # Wait this long for more utterances before transcribing a lone one
+
+    class Config:
+        extra = "ignore"
+
+
+class BatchingTranscriber:
+    """
+    Wraps a transcriber with `transcribe_batch` and batches concurrent `transcribe` calls.
+
+    Every other attribute (`transcribe_file`, the streaming hooks, ...) is forwarded to the
+    wrapped transcriber unchanged.
+    """
+
+    def __init__(self, asr_model: Any, config: ASRBatchingConfig) -> None:
+        """
+        Parameters:
+            asr_model: Transcriber providing `transcribe` and `transcribe_batch`
+            config: Batch size and wait time
+        """
+        self.asr_model = asr_model
+        self.max_batch_size = max(1, config.max_batch_size)
+        self.max_wait = config.max_wait_ms / 1000
+        self._closed = False
+        self._close_lock = threading.Lock()  # No request may be queued behind the stop sentinel
+        self._requests: queue.Queue[tuple[NDArray[np.float32], Future[str]] | None] = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="ASRBatcher", daemon=True)
+        self._worker.start()
+
+    @staticmethod
+    def supports(asr_model: Any) -> bool:
+        """Check whether a transcriber can transcribe batches."""
+        return hasattr(asr_model, "transcribe_batch")
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "asr_model":  # Not set yet, avoid recursing
+            raise AttributeError(name)
+        return getattr(self.asr_model, name)
+
+    def transcribe(self, audio: NDArray[np.float32]) -> str:
+        """
+        Transcribe an utterance, together with any others submitted at the same time.
+
+        Parameters:
+            audio: Input audio signal, mono 16000Hz
+
+        Returns:
+            str: Transcribed text
+        """
+        future: Future[str] = Future()
+        with self._close_lock:
+            queued = not self._closed
+            if queued:
+                self._requests.put((audio, future))
+        if not queued:  # Sessions still finishing after close
+            return self.asr_model.transcribe(audio)
+        return future.result()
+
+    def close(self) -> None:
+        """Transcribe the utterances already submitted and stop the worker; later calls run directly."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._requests.put(None)
+        self._worker.join()
+
+    def _run(self) -> None:
+        while (request := self._requests.get()) is not None:
+            batch = [request]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    request = self._requests.get(timeout=remaining) if remaining > 0 else self._requests.get_nowait()
+                except queue.Empty:
+                    break
+                if request is None:
+                    self._transcribe(batch)
+                    return
+                batch.append(request)
+            self._transcribe(batch)
+
+    def _transcribe(self, batch: list[tuple[NDArray[np.float32], "Future[str]"]]) -> None:
+        try:
+            if len(batch) == 1:
+                texts = [self.asr_model.transcribe(batch[0][0])]
+            else:
+                logger.debug(f"Transcribing {len(batch)} concurrent utterances in one batch")
+                texts = self.asr_model.transcribe_batch([audio for audio, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, future), text in zip(batch, texts, strict=True):
+            future.set_result(text)
@@ -1,3 +1,4 @@
+from dataclasses import dataclass, field
 from pathlib import Path
 import typing
 
@@ -7,6 +8,7 @@ import onnxruntime as ort  # type: ignore
 import soundfile as sf  # type: ignore
 import yaml
 
+from ..utils.onnx_sessions import create_session
 from ..utils.resources import resource_path
 from .mel_spectrogram import MelSpectrogramCalculator, MelSpectrogramConfig
 
@@ -14,6 +16,15 @@ from .mel_spectrogram import MelSpectrogramCalculator, MelSpectrogramConfig
 ort.set_default_logger_severity(4)
 
 
+@dataclass
+class CTCDecodingState:
+    """Greedy CTC decoding state, carried from one chunk of logits to the next when streaming."""
+
+    token_ids: list[int] = field(default_factory=list)
+    # Initialize to a non-valid token index to correctly handle the very first token (even blank)
+    last_idx: int = -1
+
+
 class AudioTranscriber:
     DEFAULT_MODEL_PATH = resource_path("models/ASR/nemo-parakeet_tdt_ctc_110m.onnx")
     DEFAULT_CONFIG_PATH = resource_path("models/ASR/parakeet-tdt_ctc-110m_model_config.yaml")
@@ -22,6 +33,7 @@ class AudioTranscriber:
         self,
         model_path: Path = DEFAULT_MODEL_PATH,
         config_path: Path = DEFAULT_CONFIG_PATH,
+        frame_extraction: str = "strided",
     ) -> None:
         """
         Initialize an AudioTranscriber with an ONNX speech recognition model.
@@ -30,15 +42,15 @@ class AudioTranscriber:
             model_path (Path, optional): Path to the ONNX model file. Defaults to the predefined MODEL_PATH.
             config_path (Path, optional): Path to the main YAML configuration file. Defaults
             to the predefined CONFIG_PATH.
+            frame_extraction (str, optional): Mel spectrogram framing, "strided" or "numba".
 
         Initializes the transcriber by:
-            - Configuring ONNX Runtime providers, excluding TensorRT if available
-            - Creating an inference session with the specified model
+            - Creating an inference session with the "asr_ctc" session profile
             - Loading the vocabulary from the yaml file
             - Preparing a mel spectrogram calculator for audio preprocessing
 
         Note:
-            - Removes TensorRT execution provider to ensure compatibility across different hardware
+            - The session profile excludes TensorRT to ensure compatibility across different hardware
             - Uses default model and token paths if not explicitly specified
         """
         # 1. Load the main YAML configuration file
@@ -51,32 +63,8 @@ class AudioTranscriber:
             except yaml.YAMLError as e:
                 raise ValueError(f"Error parsing YAML file {config_path}: {e}") from e
 
-        # 2. Configure ONNX Runtime session
-        providers = ort.get_available_providers()
-
-        # Exclude providers known to cause issues or not desired
-        if "TensorrtExecutionProvider" in providers:
-            providers.remove("TensorrtExecutionProvider")
-        if "CoreMLExecutionProvider" in providers:
-            providers.remove("CoreMLExecutionProvider")
-
-        # Prioritize CUDA if available, otherwise CPU
-        if "CUDAExecutionProvider" in providers:
-            providers = ["CUDAExecutionProvider", "CPUExecutionProvider"]
-        else:
-            providers = ["CPUExecutionProvider"]
-
-        session_opts = ort.SessionOptions()
-
-        # Enable memory pattern optimization for potential speedup
-        session_opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
-        session_opts.enable_mem_pattern = True  # Memory pattern optimization enabled for better performance
-
-        self.session = ort.InferenceSession(
-            model_path,
-            sess_options=session_opts,
-            providers=providers,
-        )
+        # 2. Create the ONNX Runtime session (CUDA if available, otherwise CPU; see the "asr_ctc" profile)
+        self.session = create_session("asr_ctc", model_path)
 
         # 3. Load the vocabulary from the YAML configuration file
         if "labels" not in self.config:
@@ -98,10 +86,13 @@ class AudioTranscriber:
             raise ValueError("YAML missing 'preprocessor' section for mel spectrogram configuration.")
 
         preprocessor_conf_dict = self.config["preprocessor"]
-        mel_config = MelSpectrogramConfig(**preprocessor_conf_dict)
+        mel_config = MelSpectrogramConfig(**{**preprocessor_conf_dict, "frame_extraction": frame_extraction})
 
         self.melspectrogram = MelSpectrogramCalculator.from_config(mel_config)
 
+        # Audio samples per output frame (mel hop times the encoder's subsampling)
+        self.frame_samples = self.melspectrogram.hop_length * int(self.config["encoder"]["subsampling_factor"])
+
     def process_audio(self, audio: NDArray[np.float32]) -> NDArray[np.float32]:
         """
         Compute mel spectrogram from input audio with normalization and batch dimension preparation.
@@ -155,40 +146,76 @@ class AudioTranscriber:
             - Assumes tokens with '▁' prefix represent word starts
             - Removes consecutive duplicate tokens
         """
-        # Step 1: Greedy decoding to get the most probable token index at each time step
-        predicted_indices_batch = np.argmax(output_logits, axis=-1)  # Shape: (batch_size, sequence_length)
-
         decoded_texts: list[str] = []
-        for batch_idx in range(predicted_indices_batch.shape[0]):
-            raw_indices_for_sample = predicted_indices_batch[batch_idx]
+        for batch_idx in range(output_logits.shape[0]):
+            state = self.decode_frames(output_logits[batch_idx : batch_idx + 1].transpose(0, 2, 1))
+            decoded_texts.append(self.hypothesis_text(state))
+
+        return decoded_texts
 
-            # Step 2: CTC Collapse - Remove blanks and merge repeated non-blank tokens
-            collapsed_indices: list[int] = []
-            # Initialize to a non-valid token index to correctly handle the very first token (even blank)
-            last_emitted_or_blank_idx = -1
+    def decode_frames(
+        self, logits: NDArray[np.float32], state: CTCDecodingState | None = None
+    ) -> CTCDecodingState:
+        """
+        Greedy CTC decoding of a chunk of output frames, continuing from `state`.
 
-            for current_idx in raw_indices_for_sample:
-                if current_idx == last_emitted_or_blank_idx:
-                    continue
+        Blanks are removed and repeated tokens merged, also across the boundary between
+        consecutive chunks, so an utterance can be decoded chunk by chunk while it is recorded.
 
-                if current_idx == self.blank_idx:
-                    last_emitted_or_blank_idx = self.blank_idx
-                    continue
+        Parameters:
+            logits (NDArray[np.float32]): Output logits with shape (1, num_tokens, sequence_length),
+                as returned by `encode`
+            state (CTCDecodingState | None): Decoding state after the previous chunk, None to start
+                a new utterance
 
-                collapsed_indices.append(current_idx)
-                last_emitted_or_blank_idx = current_idx
+        Returns:
+            CTCDecodingState: The updated state; `token_ids` holds every token decoded so far
+        """
+        if state is None:
+            state = CTCDecodingState()
 
-            # Step 3: Convert collapsed_indices to string tokens
-            # At this point, collapsed_indices should only contain valid, non-blank, de-duplicated token indices.
-            tokens_str_list: list[str] = [self.idx2token.get(idx, "") for idx in collapsed_indices]
+        # Greedy decoding to get the most probable token index at each time step
+        for current_idx in np.argmax(logits[0], axis=0).tolist():
+            if current_idx == state.last_idx:
+                continue
 
-            # Handle SentencePiece style joining (replace "▁" with space)
-            underline = "▁"
-            text = "".join(tokens_str_list).replace(underline, " ").strip()
+            state.last_idx = current_idx
+            if current_idx != self.blank_idx:
+                state.token_ids.append(current_idx)
 
-            decoded_texts.append(text)
+        return state
 
-        return decoded_texts
+    def hypothesis_text(self, state: CTCDecodingState) -> str:
+        """
+        Converts the tokens decoded so far into text.
+
+        Parameters:
+            state (CTCDecodingState): Decoding state returned by `decode_frames`
+
+        Returns:
+            str: The transcribed text
+        """
+        tokens_str_list: list[str] = [self.idx2token.get(idx, "") for idx in state.token_ids]
+
+        # Handle SentencePiece style joining (replace "▁" with space)
+        underline = "▁"
+        return "".join(tokens_str_list).replace(underline, " ").strip()
+
+    def encode(self, audio: NDArray[np.float32]) -> NDArray[np.float32]:
+        """
+        Computes the output logits of an audio window, time last to match the TDT encoder output.
+
+        Parameters:
+            audio (NDArray[np.float32]): Input audio signal, mono 16000Hz
+
+        Returns:
+            NDArray[np.float32]: Logits with shape (1, num_tokens, sequence_length), one frame per
+                `frame_samples` samples
+        """
+        mel_spec = self.process_audio(audio)
+        length = np.array([mel_spec.shape[2]], dtype=np.int64)
+        outputs = self.session.run(None, {"audio_signal": mel_spec, "length": length})
+        return np.asarray(outputs[0]).transpose(0, 2, 1)
 
     def transcribe(self, audio: NDArray[np.float32]) -> str:
         """
@@ -8,6 +8,8 @@ This module provides:
     parameterization. This calculator can operate without a direct
     dependency on `librosa` by using its internal Slaney-compatible
     mel filterbank generation.
+3.  `StreamingMelSpectrogram`: The same spectrogram computed block by block
+    while the audio arrives, only transforming new frames.
 
 The mel spectrogram implementation aims for functional equivalence with
 NVIDIA NeMo's `AudioToMelSpectrogramPreprocessor`, using NumPy and Numba
@@ -40,6 +42,7 @@ Example:
     >>> # Path("config.yaml").unlink() # Clean up dummy file
 
 Internal Functions:
+    _extract_windows_strided: Extracts windowed frames from a strided view of the signal.
     _extract_windows_numba: JIT-compiled function to extract windowed frames.
     _slaney_hz_to_mel: Converts Hz to Mel using Slaney's formula.
     _slaney_mel_to_hz: Converts Mel to Hz using Slaney's formula.
@@ -57,7 +60,42 @@ import yaml  # PyYAML for YAML loading
 NEMO_CONSTANT = 1e-5  # Used as dither and guard, aligned with some NeMo practices
 
 
-@jit(nopython=True)  # type: ignore
+def _extract_windows_strided(
+    audio_padded: NDArray[np.float32],
+    window_coeffs: NDArray[np.float32],
+    n_fft: int,
+    hop_length: int,
+    n_frames: int,
+) -> NDArray[np.float32]:
+    """Extract and window frames from a padded audio signal. (NumPy, no JIT)
+
+    The frames are a strided view of the signal, so the multiplication by the window
+    writes the only copy.
+
+    Args:
+        audio_padded: Padded audio signal with sufficient length.
+        window_coeffs: Pre-computed window function coefficients (n_fft long).
+        n_fft: Size of the Fast Fourier Transform (FFT) window.
+        hop_length: Number of samples between successive frames.
+        n_frames: Total number of frames to extract.
+
+    Returns:
+        2D array of extracted and windowed frames, shape (n_frames, n_fft).
+    """
+    if n_frames > 0 and len(audio_padded) < n_fft + (n_frames - 1) * hop_length:
+        raise ValueError("audio_padded is not long enough for specified framing.")
+    if len(window_coeffs) != n_fft:
+        raise ValueError("window_coeffs length must equal n_fft.")
+    if n_frames <= 0:
+        return np.zeros((max(n_frames, 0), n_fft), dtype=np.float32)
+
+    windows = np.lib.stride_tricks.sliding_window_view(audio_padded, n_fft)
+    frames = windows[: (n_frames - 1) * hop_length + 1 : hop_length]
+    return np.multiply(frames, window_coeffs, dtype=np.float32)
+
+
+# cache=True keeps the compiled code in __pycache__, so only the very first start compiles
+@jit(nopython=True, cache=True)  # type: ignore
 def _extract_windows_numba(
     audio_padded: NDArray[np.float32],
     window_coeffs: NDArray[np.float32],
@@ -149,6 +187,11 @@ class MelSpectrogramConfig(BaseModel):
         "slaney",
         description="Mel filterbank normalization type ('slaney' or 'htk').",
     )
+    frame_extraction: Literal["strided", "numba"] = Field(
+        "strided",
+        description="Framing implementation: 'strided' (NumPy window view, no JIT) or 'numba' (JIT-compiled "
+        "loop, compiled code cached on disk).",
+    )
     exact_pad: bool = Field(
         False,
         description="If True, uses a specific padding scheme before STFT similar to NeMo's exact_pad "
@@ -241,6 +284,7 @@ class MelSpectrogramCalculator:
         log_zero_guard_value: Value for log zero guard.
         mel_norm: Specifies the mel filterbank normalization ('slaney' or 'htk').
                   The internal implementation primarily targets 'slaney'.
+        frame_extraction: Framing implementation, "strided" or "numba".
     """
 
     sample_rate: int
@@ -263,6 +307,7 @@ class MelSpectrogramCalculator:
     log_zero_guard_type: str
     log_zero_guard_value: float
     mel_norm: str
+    frame_extraction: str
 
     def __init__(
         self,
@@ -286,6 +331,7 @@ class MelSpectrogramCalculator:
         log_zero_guard_value: float = 2**-24,
         mel_norm: str = "slaney",
         exact_pad: bool = False,
+        frame_extraction: str = "strided",
         **kwargs: float,  # To absorb any other potential NeMo args from config
     ) -> None:
         """Initializes the MelSpectrogramCalculator."""
@@ -343,6 +389,11 @@ class MelSpectrogramCalculator:
         if not 0 <= self.preemph <= 1:
             raise ValueError("preemph must be between 0.0 and 1.0.")
 
+        if frame_extraction not in ("strided", "numba"):
+            raise ValueError(f"Unsupported frame_extraction: {frame_extraction}. Expected 'strided' or 'numba'.")
+        self.frame_extraction = frame_extraction
+        self._extract_windows = _extract_windows_numba if frame_extraction == "numba" else _extract_windows_strided
+
         self.fmin = lowfreq
         self.fmax = highfreq if highfreq is not None else float(sample_rate) / 2.0
 
@@ -371,6 +422,9 @@ class MelSpectrogramCalculator:
             pad_right = self.n_fft - self.win_length - pad_left
             self.window_coeffs = np.pad(actual_window, (pad_left, pad_right), mode="constant").astype(np.float32)
 
+        # NumPy caches FFT plans per length: plan the one size used here up front
+        np.fft.rfft(np.zeros(self.n_fft, dtype=np.float32))
+
     @classmethod
     def from_config(cls, config: MelSpectrogramConfig) -> "MelSpectrogramCalculator":
         """Creates a MelSpectrogramCalculator instance from a MelSpectrogramConfig object."""
@@ -575,6 +629,29 @@ class MelSpectrogramCalculator:
         # Concatenate along the feature axis (axis=0)
         return np.concatenate(spliced_parts, axis=0)
 
+    def stream(self) -> "StreamingMelSpectrogram":
+        """Starts an incremental mel spectrogram of one utterance, see `StreamingMelSpectrogram`."""
+        return StreamingMelSpectrogram(self)
+
+    @property
+    def signal_pad(self) -> int:
+        """Reflect padding on each side of the signal before framing."""
+        # NeMo's exact_pad=True pads (n_fft - hop) // 2 before an STFT with center=False,
+        # otherwise n_fft // 2 is the center=True like behavior
+        return self.stft_pad_amount if self.exact_pad else self.n_fft // 2
+
+    def _num_frames(self, padded_length: int) -> int:
+        """Number of frames that fit into a padded signal."""
+        if padded_length < self.n_fft:
+            return 0
+        return 1 + (padded_length - self.n_fft) // self.hop_length
+
+    def _apply_dither(self, audio: NDArray[np.float32]) -> NDArray[np.float32]:
+        """Adds dithering noise to the audio signal."""
+        if self.dither > 0:
+            return audio + self.dither * np.random.randn(*audio.shape).astype(np.float32)
+        return audio
+
     def compute(self, audio: NDArray[np.float32]) -> NDArray[np.float32]:
         """Computes the mel spectrogram from an audio signal."""
         audio = np.asarray(audio, dtype=np.float32)
@@ -585,38 +662,24 @@ class MelSpectrogramCalculator:
         if not np.all(np.isfinite(audio)):
             raise ValueError("Input audio contains non-finite values.")
 
-        if self.dither > 0:
-            audio = audio + self.dither * np.random.randn(*audio.shape).astype(np.float32)
-
-        audio_preemph = self._apply_preemphasis(audio)
-
-        if self.exact_pad:
-            # NeMo's exact_pad=True applies this specific padding *before* STFT (which then uses center=False)
-            # self.stft_pad_amount should be non-None and non-negative here due to __init__ checks.
-            audio_padded = np.pad(
-                audio_preemph,
-                (self.stft_pad_amount, self.stft_pad_amount),
-                mode="reflect",
-            )
-        else:
-            # This is the center=True like behavior
-            center_padding_val = self.n_fft // 2
-            audio_padded = np.pad(audio_preemph, (center_padding_val, center_padding_val), mode="reflect")
-
-        if len(audio_padded) < self.n_fft:
-            n_frames = 0
-        elif self.hop_length == 0:
-            n_frames = 1 if len(audio_padded) >= self.n_fft else 0
-        else:
-            n_frames = 1 + (len(audio_padded) - self.n_fft) // self.hop_length
+        audio_preemph = self._apply_preemphasis(self._apply_dither(audio))
+        audio_padded = np.pad(audio_preemph, (self.signal_pad, self.signal_pad), mode="reflect")
+        n_frames = self._num_frames(len(audio_padded))
 
         if n_frames <= 0:
             return np.empty((final_num_features, 0), dtype=np.float32)
 
-        frames = _extract_windows_numba(audio_padded, self.window_coeffs, self.n_fft, self.hop_length, n_frames)
-        stft_result = np.fft.rfft(frames, n=self.n_fft, axis=1).T
-        power_spec = (np.abs(stft_result) ** self.mag_power).astype(np.float32)
-        mel_spec = self.mel_filterbank @ power_spec
+        return self._postprocess(self._log_mel(audio_padded, n_frames))
+
+    def _log_mel(self, audio_padded: NDArray[np.float32], n_frames: int) -> NDArray[np.float32]:
+        """Computes the (log) mel energies of the first `n_frames` frames of a padded signal."""
+        frames = self._extract_windows(audio_padded, self.window_coeffs, self.n_fft, self.hop_length, n_frames)
+        stft_result = np.fft.rfft(frames, n=self.n_fft, axis=1)  # float32 frames: complex64 on NumPy >= 2
+        if self.mag_power == 2.0:
+            power_spec = (stft_result.real**2 + stft_result.imag**2).astype(np.float32, copy=False)
+        else:
+            power_spec = (np.abs(stft_result) ** self.mag_power).astype(np.float32, copy=False)
+        mel_spec = self.mel_filterbank @ power_spec.T
 
         if self.log:
             guard_val = self.log_zero_guard_value
@@ -628,7 +691,10 @@ class MelSpectrogramCalculator:
                 raise ValueError(
                     f"Unsupported log_zero_guard_type: {self.log_zero_guard_type}. Expected 'add' or 'clamp'."
                 )
+        return np.asarray(mel_spec, dtype=np.float32)
 
+    def _postprocess(self, mel_spec: NDArray[np.float32]) -> NDArray[np.float32]:
+        """Applies frame splicing, normalization and time padding to the (log) mel energies of a whole signal."""
         # NeMo order: log -> splice -> normalize -> pad_to
         if self.frame_splicing > 1:
             mel_spec = self._stack_frames(mel_spec)
@@ -648,3 +714,134 @@ class MelSpectrogramCalculator:
                     constant_values=self.spec_pad_value,
                 )
         return mel_spec
+
+
+class StreamingMelSpectrogram:
+    """Incremental mel spectrogram of one utterance, fed block by block while it is recorded.
+
+    `MelSpectrogramCalculator.compute` dithers, pre-emphasizes, pads, frames and transforms
+    the whole signal on every call. Here every block is processed once: the last sample is
+    carried into the pre-emphasis of the next block, only frames whose samples have all
+    arrived are transformed, and the samples they share with later frames are kept. The
+    reflect padding of the start is built once `signal_pad + 1` samples have arrived; the
+    last frames, which need the reflect padding of the end, are left to `finalize`.
+
+    `accept` returns the new frames as log mel energies; frame splicing, normalization and
+    `pad_to` need the whole utterance and are applied by `finalize`, whose result matches
+    `compute` on the concatenated blocks (with dither disabled; otherwise up to the noise).
+
+    Not thread-safe; use one instance per utterance or call `reset` in between.
+    """
+
+    def __init__(self, calculator: MelSpectrogramCalculator) -> None:
+        """Initializes the stream.
+
+        Args:
+            calculator: Calculator providing the spectrogram parameters.
+        """
+        self.calculator = calculator
+        self.reset()
+
+    def reset(self) -> None:
+        """Discards the current utterance."""
+        self._head = np.zeros(0, dtype=np.float32)  # Pre-emphasized samples until the start padding is built
+        self._padded: NDArray[np.float32] | None = None  # Padded signal from the next frame on
+        self._padded_start = 0  # Padded signal index of self._padded[0]
+        self._last_sample: float | None = None  # Last dithered sample, for the pre-emphasis of the next block
+        self._next_frame = 0
+        self._frames: list[NDArray[np.float32]] = []
+
+    @property
+    def num_frames(self) -> int:
+        """Frames computed so far."""
+        return self._next_frame
+
+    def accept(self, audio: NDArray[np.float32]) -> NDArray[np.float32]:
+        """Adds the next block of audio and computes the frames it completes.
+
+        Args:
+            audio: Next samples of the utterance, any length.
+
+        Returns:
+            Log mel energies of the new frames, shape (features, new_frames), before
+            splicing and normalization.
+
+        Raises:
+            ValueError: If the block contains non-finite values.
+        """
+        calc = self.calculator
+        audio = np.asarray(audio, dtype=np.float32)
+        if len(audio) == 0:
+            return np.empty((calc.features, 0), dtype=np.float32)
+        if not np.all(np.isfinite(audio)):
+            raise ValueError("Input audio contains non-finite values.")
+
+        audio = calc._apply_dither(audio)
+        if self._last_sample is None:
+            audio_preemph = calc._apply_preemphasis(audio)
+        elif calc.preemph != 0.0:
+            previous = np.concatenate([np.array([self._last_sample], dtype=np.float32), audio[:-1]])
+            audio_preemph = audio - calc.preemph * previous
+        else:
+            audio_preemph = audio
+        self._last_sample = float(audio[-1])
+
+        if self._padded is None:
+            self._head = np.concatenate([self._head, audio_preemph])
+            pad = calc.signal_pad
+            if len(self._head) <= pad:
+                return np.empty((calc.features, 0), dtype=np.float32)
+            self._padded = np.concatenate([self._head[pad:0:-1], self._head])
+            self._head = np.zeros(0, dtype=np.float32)
+        else:
+            self._padded = np.concatenate([self._padded, audio_preemph])
+        return self._transform_ready_frames()
+
+    def finalize(self) -> NDArray[np.float32]:
+        """Computes the last frames and returns the spectrogram of the whole utterance.
+
+        The stream is left as is; call `reset` before the next utterance.
+
+        Returns:
+            The mel spectrogram as `MelSpectrogramCalculator.compute` returns it, shape
+            (features * frame_splicing, frames).
+        """
+        calc = self.calculator
+        pad = calc.signal_pad
+        if self._padded is None:  # Shorter than the padding, reflected more than once: as `compute` does
+            padded = np.pad(self._head, (pad, pad), mode="reflect") if len(self._head) else self._head
+            n_frames = self._num_new_frames(len(padded))
+            if n_frames > 0:
+                self._frames.append(calc._log_mel(padded, n_frames))
+                self._next_frame = n_frames
+        elif pad > 0:
+            self._padded = np.concatenate([self._padded, self._padded[-2 : -pad - 2 : -1]])
+            self._transform_ready_frames()
+
+        if not self._frames:
+            return np.empty((calc.features * calc.frame_splicing, 0), dtype=np.float32)
+        return calc._postprocess(np.concatenate(self._frames, axis=1))
+
+    def _num_new_frames(self, padded_length: int) -> int:
+        return self.calculator._num_frames(padded_length) - self._next_frame
+
+    def _transform_ready_frames(self) -> NDArray[np.float32]:
+        """Transforms every frame whose samples have all arrived, then drops the samples no longer needed."""
+        calc = self.calculator
+        assert self._padded is not None
+        padded_end = self._padded_start + len(self._padded)
+        n_frames = self._num_new_frames(padded_end)
+        if n_frames <= 0:
+            return np.empty((calc.features, 0), dtype=np.float32)
+
+        offset = self._next_frame * calc.hop_length - self._padded_start
+        mel_spec = calc._log_mel(self._padded[offset:], n_frames)
+        self._frames.append(mel_spec)
+        self._next_frame += n_frames
+
+        # Keep the samples of the next frame, and enough for the reflect padding of the end
+        keep_from = min(self._next_frame * calc.hop_length, padded_end - calc.signal_pad - 1)
+        if keep_from > self._padded_start:
+            self._padded = self._padded[keep_from - self._padded_start :]
+            self._padded_start = keep_from
+        return mel_spec
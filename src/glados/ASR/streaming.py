@@ -0,0 +1,159 @@
+"""
+Streaming transcription of an utterance while it is still being spoken.
+
+The Parakeet encoders attend over the whole input, so they cannot be fed audio frame by
+frame. Instead the utterance is cut into fixed chunks, and each chunk is encoded as soon
+as the user has spoken `right_context_seconds` past its end, together with up to
+`left_context_seconds` of audio before it. Mel features are computed for that window only
+and normalized with the window's own statistics. Only the encoder frames belonging to the
+chunk are decoded, continuing the CTC/TDT decoding state of the previous chunk, so the
+hypothesis grows while the user speaks and already decoded frames are never decoded again.
+
+Like the batch path, which scales the utterance to its peak before transcribing, every
+window is scaled to full range. The peak of the whole utterance is not known while the user
+is still speaking, so a window is divided by the peak of the audio received so far; early
+chunks of an utterance that gets louder later are therefore fed at a higher level than the
+batch path would feed them.
+
+When the VAD reports the end of speech, `finalize` encodes and decodes only the tail after
+the last decoded chunk, instead of the whole utterance. Utterances shorter than one chunk
+plus its right context are transcribed in one piece, scaled by their own peak, exactly like
+the batch path.
+"""
+
+from typing import Any
+
+from loguru import logger
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import BaseModel
+
+from . import StreamingTranscriberProtocol
+
+SAMPLE_RATE = 16000
+
+
+class StreamingASRConfig(BaseModel):
+    """
+    Configuration of streaming transcription. Every duration is rounded to whole encoder frames (80 ms).
+
+    Each chunk costs one encoder run over left context + chunk + right context, in the listener
+    thread, so enable streaming only where the encoder runs well faster than real time.
+    """
+
+    enabled: bool = False
+    chunk_seconds: float = 0.96  # Audio decoded per step; also how often the partial transcript grows
+    left_context_seconds: float = 4.0  # Audio before the chunk the encoder sees
+    right_context_seconds: float = 0.64  # Audio after the chunk the encoder sees; delays each step
+
+    class Config:
+        extra = "ignore"
+
+
+class StreamingTranscription:
+    """
+    Incrementally transcribes one utterance at a time with a shared streaming-capable transcriber.
+
+    Not thread-safe; every speech listener owns its own instance, while the transcriber and its
+    ONNX sessions can be shared.
+    """
+
+    def __init__(self, asr_model: StreamingTranscriberProtocol, config: StreamingASRConfig) -> None:
+        """
+        Parameters:
+            asr_model: Transcriber providing `encode`, `decode_frames` and `hypothesis_text`
+            config: Chunk and context durations
+        """
+        self.asr_model = asr_model
+        self.frame_samples = asr_model.frame_samples
+
+        def samples(seconds: float, minimum: int) -> int:
+            return max(minimum, round(seconds * SAMPLE_RATE / self.frame_samples)) * self.frame_samples
+
+        self.chunk_samples = samples(config.chunk_seconds, 1)
+        self.left_context_samples = samples(config.left_context_seconds, 0)
+        self.right_context_samples = samples(config.right_context_seconds, 0)
+        self.reset()
+
+    @staticmethod
+    def supports(asr_model: Any) -> bool:
+        """Check whether a transcriber implements the streaming hooks."""
+        return all(hasattr(asr_model, name) for name in ("frame_samples", "encode", "decode_frames", "hypothesis_text"))
+
+    def reset(self) -> None:
+        """Discard the current utterance."""
+        self._audio = np.zeros(0, dtype=np.float32)
+        self._audio_start = 0  # Utterance sample index of self._audio[0]
+        self._pending: list[NDArray[np.float32]] = []
+        self._total_samples = 0
+        self._decoded_samples = 0  # Audio decoded so far, always a whole number of chunks
+        self._peak = 0.0
+        self._state: Any | None = None
+        self._text = ""
+
+    @property
+    def text(self) -> str:
+        """Transcript of the chunks decoded so far."""
+        return self._text
+
+    def accept(self, samples: NDArray[np.float32]) -> str | None:
+        """
+        Add audio to the utterance and decode every chunk that now has its full right context.
+
+        Parameters:
+            samples: Next audio of the utterance, mono 16000Hz
+
+        Returns:
+            str | None: The new partial transcript if it changed, otherwise None
+        """
+        self._pending.append(samples)
+        self._total_samples += len(samples)
+        if len(samples):
+            self._peak = max(self._peak, float(np.max(np.abs(samples))))
+
+        previous = self._text
+        while self._total_samples >= self._decoded_samples + self.chunk_samples + self.right_context_samples:
+            self._decode_until(self._decoded_samples + self.chunk_samples)
+
+        return self._text if self._text != previous else None
+
+    def finalize(self) -> str:
+        """
+        Decode the rest of the utterance and return the complete transcript.
+
+        The state is left untouched, call `reset` before the next utterance.
+
+        Returns:
+            str: The transcript of the whole utterance, empty for silent audio
+        """
+        if self._peak < 1e-10:  # Effectively silent, same threshold as the batch path
+            logger.warning("ASR received effectively silent audio")
+            return ""
+        if self._total_samples > self._decoded_samples:
+            self._decode_until(self._total_samples)
+        return self._text
+
+    def _decode_until(self, end: int) -> None:
+        """Encode the audio up to `end` (plus right context) and decode its frames after `_decoded_samples`."""
+        if self._pending:
+            self._audio = np.concatenate([self._audio, *self._pending])
+            self._pending.clear()
+
+        window_start = max(0, self._decoded_samples - self.left_context_samples)
+        window_end = min(self._total_samples, end + self.right_context_samples)
+        window = self._audio[window_start - self._audio_start : window_end - self._audio_start]
+        if self._peak >= 1e-10:  # Normalize to full range like the batch path, with the peak known so far
+            window = window / self._peak
+        encoded = self.asr_model.encode(window)
+
+        first = (self._decoded_samples - window_start) // self.frame_samples
+        last = -(-(end - window_start) // self.frame_samples)  # Ceil, the encoder pads the last frame
+        self._state = self.asr_model.decode_frames(encoded[..., first:last], self._state)
+        self._text = self.asr_model.hypothesis_text(self._state)
+        self._decoded_samples = end
+
+        # Only the left context of the next chunk is needed from here on
+        keep_from = max(0, self._decoded_samples - self.left_context_samples)
+        if keep_from > self._audio_start:
+            self._audio = self._audio[keep_from - self._audio_start :]
+            self._audio_start = keep_from
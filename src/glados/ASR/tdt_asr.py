@@ -1,4 +1,6 @@
+from dataclasses import dataclass, field
 from pathlib import Path
+import threading
 import time
 import typing
 
@@ -9,6 +11,7 @@ import onnxruntime as ort  # type: ignore
 import soundfile as sf  # type: ignore
 import yaml
 
+from ..utils.onnx_sessions import IOBoundSession, create_session, resolve_profile
 from ..utils.resources import resource_path
 from .mel_spectrogram import MelSpectrogramCalculator, MelSpectrogramConfig
 
@@ -16,6 +19,19 @@ from .mel_spectrogram import MelSpectrogramCalculator, MelSpectrogramConfig
 ort.set_default_logger_severity(4)
 
 
+@dataclass
+class TDTDecodingState:
+    """Greedy TDT decoding state, carried from one chunk of encoder frames to the next when streaming."""
+
+    decoder_out: NDArray[np.float32]
+    state0: NDArray[np.float32]
+    state1: NDArray[np.float32]
+    next_state0: NDArray[np.float32]
+    next_state1: NDArray[np.float32]
+    token_ids: list[int] = field(default_factory=list)
+    frame_offset: int = 0  # Frames the last predicted duration skips into the next chunk
+
+
 class _OnnxTDTModel:
     """
     Internal helper class to manage the three ONNX sessions (Encoder, Decoder, Joiner)
@@ -28,7 +44,6 @@ class _OnnxTDTModel:
 
     def __init__(
         self,
-        providers: list[str],
         encoder_model_path: Path = DEFAULT_ENCODER_MODEL_PATH,
         decoder_model_path: Path = DEFAULT_DECODER_MODEL_PATH,
         joiner_model_path: Path = DEFAULT_JOINER_MODEL_PATH,
@@ -36,22 +51,18 @@ class _OnnxTDTModel:
         """
         Initializes the ONNX model sessions and extracts necessary metadata.
 
+        Sessions are created with the "asr_tdt_encoder", "asr_tdt_decoder" and "asr_tdt_joiner"
+        session profiles.
+
         Args:
-            providers: List of ONNX Runtime execution providers to use.
             encoder_model_path: Path to the encoder ONNX model file.
             decoder_model_path: Path to the decoder ONNX model file.
             joiner_model_path: Path to the joiner ONNX model file.
         """
-        session_opts = ort.SessionOptions()
-
-        # Enable memory pattern optimization for potential speedup
-        session_opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
-        session_opts.enable_mem_pattern = True  # Can uncomment if beneficial
-
-        logger.info(f"Using ONNX providers: {providers}")
-        self.encoder = self._init_session(encoder_model_path, session_opts, providers)
-        self.decoder = self._init_session(decoder_model_path, session_opts, providers)
-        self.joiner = self._init_session(joiner_model_path, session_opts, providers)
+        self.encoder = self._init_session("asr_tdt_encoder", encoder_model_path)
+        self.decoder = self._init_session("asr_tdt_decoder", decoder_model_path)
+        self.joiner = self._init_session("asr_tdt_joiner", joiner_model_path)
+        logger.info(f"Using ONNX providers: {self.encoder.get_providers()}")
 
         logger.info("--- Encoder ---")
         self._log_model_io(self.encoder)
@@ -72,6 +83,10 @@ class _OnnxTDTModel:
                 "Decoder state initialization might fail."
             )
 
+        # Frames the joiner accepts per call: None if the time axis is dynamic (windowed decoding)
+        joiner_frames = self.joiner.get_inputs()[0].shape[-1]
+        self.joiner_max_frames: int | None = joiner_frames if isinstance(joiner_frames, int) else None
+
         # Get joiner output dimension to infer number of duration bins later
         self.joiner_output_total_dim = self.joiner.get_outputs()[0].shape[-1]
         if not isinstance(self.joiner_output_total_dim, int) or self.joiner_output_total_dim <= 0:
@@ -91,12 +106,15 @@ class _OnnxTDTModel:
         self.joiner_in_names = [i.name for i in self.joiner.get_inputs()]
         self.joiner_out_names = [o.name for o in self.joiner.get_outputs()]
 
-    def _init_session(
-        self, model_path: Path, sess_options: ort.SessionOptions, providers: list[str]
-    ) -> ort.InferenceSession:
-        """Initializes an ONNX Runtime Inference Session."""
+        # Single-utterance decoder and joiner calls run through bound buffers, one set per thread
+        self.decoder_io_binding = bool(resolve_profile("asr_tdt_decoder").io_binding)
+        self.joiner_io_binding = bool(resolve_profile("asr_tdt_joiner").io_binding)
+        self._bound = threading.local()
+
+    def _init_session(self, profile: str, model_path: Path) -> ort.InferenceSession:
+        """Initializes an ONNX Runtime Inference Session with the given session profile."""
         try:
-            return ort.InferenceSession(str(model_path), sess_options=sess_options, providers=providers)
+            return create_session(profile, model_path)
         except Exception as e:
             raise RuntimeError(f"Failed to load ONNX session for {model_path}: {e}") from e
 
@@ -163,14 +181,49 @@ class _OnnxTDTModel:
         encoder_out = self.encoder.run([self.encoder_out_names[0]], input_dict)[0]
         return np.asarray(encoder_out, dtype=np.float32)  # Shape [batch, channels, time_reduced]
 
+    def run_encoder_batch(
+        self, features: NDArray[np.float32], lengths: NDArray[np.int64]
+    ) -> tuple[NDArray[np.float32], NDArray[np.int64]]:
+        """
+        Runs the encoder on several utterances padded to the same length.
+
+        Args:
+            features: Mel spectrogram features with shape [batch, n_mels, time], zero-padded.
+            lengths: Valid feature frames of each utterance, shape [batch].
+
+        Returns:
+            A tuple containing:
+            - Encoder output tensor, [batch, channels, time_reduced].
+            - Valid encoder frames of each utterance, shape [batch].
+        """
+        if len(self.encoder_in_names) != 2:
+            raise ValueError(f"Encoder expected 2 inputs, got {len(self.encoder_in_names)}")
+
+        input_dict = {
+            self.encoder_in_names[0]: features,
+            self.encoder_in_names[1]: np.asarray(lengths, dtype=np.int64),
+        }
+        outputs = self.encoder.run(self.encoder_out_names[:2], input_dict)
+        encoder_out = np.asarray(outputs[0], dtype=np.float32)
+        if len(outputs) > 1:
+            encoded_lengths = np.asarray(outputs[1], dtype=np.int64)
+        else:
+            # Same reduction as the valid frames of the longest item
+            encoded_lengths = -(-np.asarray(lengths) * encoder_out.shape[2] // features.shape[2])
+        return encoder_out, encoded_lengths
+
     def run_decoder(
-        self, token_input: int, state0: NDArray[np.float32], state1: NDArray[np.float32]
+        self,
+        token_input: int | NDArray[np.integer],
+        state0: NDArray[np.float32],
+        state1: NDArray[np.float32],
     ) -> tuple[NDArray[np.float32], NDArray[np.float32], NDArray[np.float32]]:
         """
         Runs the decoder model for one step.
 
         Args:
-            token_input: The predicted token ID from the previous step (or blank for init).
+            token_input: The predicted token ID from the previous step (or blank for init),
+                         or one token per batch item with shape [batch].
             state0: The first hidden state from the previous step.
             state1: The second hidden state from the previous step.
 
@@ -179,14 +232,26 @@ class _OnnxTDTModel:
             - Decoder output tensor for this step.
             - Next state0.
             - Next state1.
+            With `io_binding`, single-token outputs are bound buffers, valid for one more step.
         """
         # Decoder inputs typically: target, target_len, state0, state1
         if len(self.decoder_in_names) != 4:
             raise ValueError(f"Decoder expected 4 inputs, got {len(self.decoder_in_names)}")
 
+        bound = getattr(self._bound, "decoder", None)
+        if bound is not None and np.ndim(token_input) == 0:
+            # Write into the bound inputs; the outputs alternate between two sets of buffers,
+            # so the states returned by the previous step stay valid as inputs of this one
+            inputs = bound.inputs
+            inputs[self.decoder_in_names[0]][...] = token_input
+            inputs[self.decoder_in_names[2]][...] = state0
+            inputs[self.decoder_in_names[3]][...] = state1
+            decoder_out, _, next_state0, next_state1 = bound.run()
+            return decoder_out, next_state0, next_state1
+
         # Prepare inputs matching expected types
-        target = np.array([[token_input]], dtype=np.int32)
-        target_len = np.array([1], dtype=np.int32)
+        target = np.asarray(token_input, dtype=np.int32).reshape(-1, 1)
+        target_len = np.ones(target.shape[0], dtype=np.int32)
 
         # Explicitly use float32 for states as determined earlier
         state0_fp32 = state0.astype(np.float32)
@@ -203,6 +268,9 @@ class _OnnxTDTModel:
         if len(self.decoder_out_names) != 4:
             raise ValueError(f"Decoder expected 4 outputs, got {len(self.decoder_out_names)}")
 
+        if self.decoder_io_binding and bound is None and np.ndim(token_input) == 0:
+            self._bound.decoder = IOBoundSession.from_example(self.decoder, input_dict, buffers=2)
+
         outputs = self.decoder.run(self.decoder_out_names, input_dict)
         decoder_out = outputs[0]
         next_state0 = outputs[2]
@@ -215,20 +283,29 @@ class _OnnxTDTModel:
         Runs the joiner model.
 
         Args:
-            encoder_out_t: Encoder output for the current time step `t`,
-                           shape [batch, 1, channels] or similar (depends on model).
-                           Log shows input: [1, 1, 512] - so [B, T=1, C]
-            decoder_out: Decoder output for the current step, shape [batch, 1, channels].
+            encoder_out_t: Encoder output for the current time step `t`, shape [batch, channels, 1],
+                           or for several frames [batch, channels, frames] if the time axis is dynamic.
+            decoder_out: Decoder output for the current step, shape [batch, channels, 1].
 
         Returns:
-            Logits from the joiner, shape [batch, 1, vocab_size + num_durations].
+            Logits from the joiner, shape [batch, frames, 1, vocab_size + num_durations].
+            With `io_binding`, single-utterance logits are a bound buffer, overwritten by the next call.
         """
         # Joiner inputs typically: encoder_out, decoder_out
         if len(self.joiner_in_names) != 2:
             raise ValueError(f"Joiner expected 2 inputs, got {len(self.joiner_in_names)}")
 
+        batch_size, _, frames = encoder_out_t.shape
+        # Windows of a power of two frames are bound (a handful of shapes), the rest run normally
+        bindable = self.joiner_io_binding and batch_size == 1 and frames & (frames - 1) == 0
+        bound = getattr(self._bound, "joiners", {}).get(frames) if bindable else None
+        if bound is not None:
+            bound.inputs[self.joiner_in_names[0]][...] = encoder_out_t
+            bound.inputs[self.joiner_in_names[1]][...] = decoder_out
+            return bound.run()[0]
+
         input_dict = {
-            self.joiner_in_names[0]: encoder_out_t,
+            self.joiner_in_names[0]: np.ascontiguousarray(encoder_out_t),
             self.joiner_in_names[1]: decoder_out,
         }
 
@@ -236,6 +313,11 @@ class _OnnxTDTModel:
         if len(self.joiner_out_names) != 1:
             raise ValueError(f"Joiner expected 1 output, got {len(self.joiner_out_names)}")
 
+        if bindable:
+            if not hasattr(self._bound, "joiners"):
+                self._bound.joiners = {}
+            self._bound.joiners[frames] = IOBoundSession.from_example(self.joiner, input_dict)
+
         logits = self.joiner.run(self.joiner_out_names, input_dict)[0]
         return np.asarray(logits, dtype=np.float32)
 
@@ -259,10 +341,15 @@ class AudioTranscriber:
     """
 
     DEFAULT_CONFIG_PATH = resource_path("models/ASR/parakeet-tdt-0.6b-v2_model_config.yaml")
+    JOINER_WINDOW = (8, 64)  # Frames per joiner call in `decode_frames`: initial and maximum
 
     def __init__(
         self,
         config_path: Path = DEFAULT_CONFIG_PATH,
+        encoder_model_path: Path = _OnnxTDTModel.DEFAULT_ENCODER_MODEL_PATH,
+        decoder_model_path: Path = _OnnxTDTModel.DEFAULT_DECODER_MODEL_PATH,
+        joiner_model_path: Path = _OnnxTDTModel.DEFAULT_JOINER_MODEL_PATH,
+        frame_extraction: str = "strided",
     ) -> None:
         """
         Initializes the AudioTranscriber with models and configurations.
@@ -270,6 +357,10 @@ class AudioTranscriber:
         Args:
             config_path: Path to the YAML configuration file (validated by TDTConfig).
             Note: this config file is extracted with TAR from the original TDT-model NEMO file.
+            encoder_model_path: Path to the encoder ONNX model file, e.g. a quantized variant.
+            decoder_model_path: Path to the decoder ONNX model file.
+            joiner_model_path: Path to the joiner ONNX model file.
+            frame_extraction: Mel spectrogram framing, "strided" or "numba".
 
         Raises:
             FileNotFoundError: If the config file or specified model/token files don't exist.
@@ -286,23 +377,9 @@ class AudioTranscriber:
             except yaml.YAMLError as e:
                 raise ValueError(f"Error parsing YAML file {config_path}: {e}") from e
 
-        # 2. Configure ONNX Runtime session
-        providers = ort.get_available_providers()
-
-        # Exclude providers known to cause issues or not desired
-        if "TensorrtExecutionProvider" in providers:
-            providers.remove("TensorrtExecutionProvider")
-        if "CoreMLExecutionProvider" in providers:
-            providers.remove("CoreMLExecutionProvider")
-
-        # Prioritize CUDA if available, otherwise CPU
-        if "CUDAExecutionProvider" in providers:
-            providers = ["CUDAExecutionProvider", "CPUExecutionProvider"]
-        else:
-            providers = ["CPUExecutionProvider"]
-
-        # Initialize the internal ONNX model handler
-        self.model = _OnnxTDTModel(providers)
+        # 2. Initialize the internal ONNX model handler (CUDA if available, otherwise CPU)
+        self.model = _OnnxTDTModel(encoder_model_path, decoder_model_path, joiner_model_path)
+        self._initial_decoder: tuple[NDArray[np.float32], ...] | None = None  # See `initial_decoding_state`
 
         # 4. Load the vocabulary from the YAML configuration file
 
@@ -342,12 +419,17 @@ class AudioTranscriber:
 
         # Initialize Mel Spectrogram calculator from config
         preprocessor_conf_dict = self.config["preprocessor"]
-        self.preprocessor_conf = MelSpectrogramConfig(**preprocessor_conf_dict)
+        self.preprocessor_conf = MelSpectrogramConfig(
+            **{**preprocessor_conf_dict, "frame_extraction": frame_extraction}
+        )
 
         self.melspectrogram = MelSpectrogramCalculator.from_config(self.preprocessor_conf)
         # self.melspectrogram = MelSpectrogramCalculator.from_config(self.config["preprocessor"])
         logger.info("MelSpectrogramCalculator initialized.")
 
+        # Audio samples per encoder frame (mel hop times the encoder's subsampling)
+        self.frame_samples = self.melspectrogram.hop_length * int(self.config["encoder"]["subsampling_factor"])
+
         logger.info(f"config: {self.config}")
 
     def _process_audio(self, audio: NDArray[np.float32]) -> NDArray[np.float32]:
@@ -367,9 +449,7 @@ class AudioTranscriber:
 
     def _decode_tdt(self, encoder_out: NDArray[np.float32]) -> list[int]:
         """
-        Performs TDT greedy decoding using the Decoder and Joiner models.
-        This function implements the TDT decoding loop, which iteratively predicts
-        tokens and their durations based on the encoder output.
+        Performs TDT greedy decoding of a whole utterance.
 
         Args:
             encoder_out: The output from the encoder model, shape [1, channels, time_reduced].
@@ -377,74 +457,198 @@ class AudioTranscriber:
         Returns:
             A list of decoded token IDs (excluding blank tokens).
         """
+        return self.decode_frames(encoder_out).token_ids
+
+    def initial_decoding_state(self) -> TDTDecodingState:
+        """
+        Creates the decoding state before the first frame: no tokens, decoder primed with blank.
+
+        The primed decoder output is the same for every utterance, so it is computed once.
+        The arrays are shared between states and must not be modified in place.
+
+        Returns:
+            TDTDecodingState: Fresh decoding state.
+        """
+        if self._initial_decoder is None:
+            state0, state1 = self.model.get_decoder_initial_state(batch_size=1)
+            primed = self.model.run_decoder(self.blank_id, state0, state1)
+            self._initial_decoder = (state0, state1, *(np.array(output) for output in primed))
+        state0, state1, decoder_out, next_state0, next_state1 = self._initial_decoder
+        return TDTDecodingState(decoder_out, state0, state1, next_state0, next_state1)
+
+    def decode_frames(
+        self, encoder_out: NDArray[np.float32], state: TDTDecodingState | None = None
+    ) -> TDTDecodingState:
+        """
+        Performs TDT greedy decoding using the Decoder and Joiner models.
+
+        This is a label-looping decoder: the decoder output only changes when a token is
+        emitted, so the joiner is run once over a window of upcoming frames for the current
+        decoder output, and the blanks and their durations are followed through the window
+        without further model calls until a token is emitted. The window starts at
+        `JOINER_WINDOW[0]` frames and doubles, up to `JOINER_WINDOW[1]`, while no token is
+        found. The result is the same as running the joiner frame by frame.
+
+        A blank predicted with duration 0 advances one frame, as in NeMo; otherwise the
+        same prediction would repeat until the step limit.
+
+        Decoding continues from `state`, so consecutive chunks of encoder frames can be decoded
+        one after another while the utterance is still being recorded; a duration predicted
+        near the end of a chunk carries over into the next one.
+
+        Args:
+            encoder_out: Encoder output frames, shape [1, channels, time_reduced].
+            state: Decoding state after the previous chunk, None to start a new utterance.
+
+        Returns:
+            TDTDecodingState: The updated state; `token_ids` holds every token decoded so far.
+        """
         batch_size, _, max_encoder_t = encoder_out.shape
         if batch_size != 1:
             raise NotImplementedError("TDT decoding currently only supports batch size 1.")
 
-        predicted_token_ids: list[int] = []
-        last_emitted_token_for_decoder = self.blank_id  # Start with blank for decoder init
-        state0, state1 = self.model.get_decoder_initial_state(batch_size=1)
+        if state is None:
+            state = self.initial_decoding_state()
 
-        # Initial decoder run with blank token
-        decoder_out, next_state0, next_state1 = self.model.run_decoder(last_emitted_token_for_decoder, state0, state1)
+        min_window, max_window = self.JOINER_WINDOW
+        if self.model.joiner_max_frames is not None:  # Exported for a single frame: frame by frame
+            min_window = max_window = 1
+        window = min_window
+        durations = np.asarray(self.tdt_durations, dtype=np.int64)
 
-        current_t = 0
+        current_t = state.frame_offset
         loop_start_time = time.time()
         max_steps = max_encoder_t * 2  # Safety break for potential infinite loops
         steps_taken = 0
+        joiner_calls = 0
 
         logger.info(f"Starting TDT decoding loop for {max_encoder_t} encoder frames...")
         while current_t < max_encoder_t and steps_taken < max_steps:
-            steps_taken += 1
-            encoder_out_t = encoder_out[:, :, current_t : current_t + 1]
-
-            # Run Joiner
-            # Output shape: [1, 1, vocab_size + num_durations]
-            joiner_logits = self.model.run_joiner(encoder_out_t, decoder_out)
-            joiner_logits = joiner_logits.squeeze()  # -> [vocab + durations]
-
-            # Split logits into token and duration parts
-            token_logits = joiner_logits[: self.blank_id + 1]
-            duration_logits = joiner_logits[self.blank_id + 1 :]
-
-            # Argmax for token prediction
-            predicted_token_idx = np.argmax(token_logits)
-            predicted_duration_bin_idx = np.argmax(duration_logits)
-            predicted_skip_amount = self.tdt_durations[predicted_duration_bin_idx]
-
-            # Debugging log (optional)
-            # predicted_token_char = self.idx2token.get(int(predicted_token_idx), f"UNK({predicted_token_idx})")
-            # logger.trace(
-            #     (
-            #         f"t={current_t:04d}: Pred='{predicted_token_char}' ({predicted_token_idx}), "
-            #         f"DurBin={predicted_duration_bin_idx}, Skip={predicted_skip_amount}"
-            #     )
-            # )
-
-            # If a non-blank token is predicted:
-            if predicted_token_idx != self.blank_id:
-                # print(f"  --> Emitting: {predicted_token_char} ({predicted_token_idx})")
-                predicted_token_ids.append(int(predicted_token_idx))
-                last_emitted_token_for_decoder = int(predicted_token_idx)
+            # Joiner logits of the next frames for the current decoder output, in one call
+            window_start = current_t
+            window_end = min(window_start + window, max_encoder_t)
+            joiner_logits = self.model.run_joiner(
+                encoder_out[:, :, window_start:window_end], state.decoder_out
+            ).reshape(window_end - window_start, -1)
+            joiner_calls += 1
+
+            # Argmax for token and duration prediction of every frame in the window
+            predicted_tokens = np.argmax(joiner_logits[:, : self.blank_id + 1], axis=1).tolist()
+            predicted_skips = durations[np.argmax(joiner_logits[:, self.blank_id + 1 :], axis=1)].tolist()
+
+            emitted = False
+            while current_t < window_end and steps_taken < max_steps:
+                steps_taken += 1
+                predicted_token_idx = predicted_tokens[current_t - window_start]
+                predicted_skip_amount = predicted_skips[current_t - window_start]
+
+                if predicted_token_idx == self.blank_id:
+                    # Blank predicted, keep decoder state and output as is
+                    current_t += max(predicted_skip_amount, 1)
+                    continue
+
+                state.token_ids.append(predicted_token_idx)
 
                 # Update decoder state and output for the *next* step
-                state0 = next_state0
-                state1 = next_state1
-                decoder_out, next_state0, next_state1 = self.model.run_decoder(
-                    last_emitted_token_for_decoder, state0, state1
+                state.state0 = state.next_state0
+                state.state1 = state.next_state1
+                state.decoder_out, state.next_state0, state.next_state1 = self.model.run_decoder(
+                    predicted_token_idx, state.state0, state.state1
                 )
-            # else: # Blank predicted, keep decoder state and output as is
-            #     print("  --> Blank")
-            #     pass
+                current_t += predicted_skip_amount
+                emitted = True
+                break
 
-            # Advance time step based on predicted duration
-            current_t += predicted_skip_amount
+            # Stretch the window over long stretches of blanks, shrink it again after a token
+            window = min_window if emitted else min(window * 2, max_window)
+
+        state.frame_offset = max(current_t - max_encoder_t, 0)
+        # Decoder outputs may be bound buffers of this thread: the state must outlive them
+        state.decoder_out, state.next_state0, state.next_state1 = (
+            np.array(state.decoder_out), np.array(state.next_state0), np.array(state.next_state1)
+        )
+        state.state0, state.state1 = np.array(state.state0), np.array(state.state1)
 
         loop_end_time = time.time()
-        logger.info(f"TDT decoding loop finished in {loop_end_time - loop_start_time:.2f}s ({steps_taken} steps).")
+        logger.info(
+            f"TDT decoding loop finished in {loop_end_time - loop_start_time:.2f}s "
+            f"({steps_taken} steps, {joiner_calls} joiner calls)."
+        )
         if steps_taken >= max_steps:
             logger.warning("Warning: TDT decoding loop hit maximum step limit. Result might be truncated.")
 
+        return state
+
+    def _decode_tdt_batch(
+        self, encoder_out: NDArray[np.float32], encoded_lengths: NDArray[np.int64]
+    ) -> list[list[int]]:
+        """
+        Performs TDT greedy decoding of several utterances at once.
+
+        Every utterance has its own time pointer and decoder state, but each step runs the
+        joiner once for all utterances still being decoded, and the decoder once for those
+        that emitted a token. The result is the same as decoding them one by one.
+
+        Args:
+            encoder_out: The output from the encoder model, shape [batch, channels, time_reduced].
+            encoded_lengths: Valid encoder frames of each utterance, shape [batch].
+
+        Returns:
+            A list of decoded token IDs (excluding blank tokens) per utterance.
+        """
+        batch_size = encoder_out.shape[0]
+        lengths = np.asarray(encoded_lengths, dtype=np.int64)
+        durations = np.asarray(self.tdt_durations, dtype=np.int64)
+        predicted_token_ids: list[list[int]] = [[] for _ in range(batch_size)]
+
+        state0, state1 = self.model.get_decoder_initial_state(batch_size=batch_size)
+        decoder_out, next_state0, next_state1 = (
+            np.array(output) for output in self.model.run_decoder(np.full(batch_size, self.blank_id), state0, state1)
+        )
+
+        current_t = np.zeros(batch_size, dtype=np.int64)
+        active = np.flatnonzero(current_t < lengths)
+        loop_start_time = time.time()
+        max_steps = int(lengths.max(initial=0)) * 2  # Safety break for potential infinite loops
+        steps_taken = 0
+
+        logger.info(f"Starting batched TDT decoding loop for {batch_size} utterances...")
+        while active.size and steps_taken < max_steps:
+            steps_taken += 1
+            # One frame per active utterance at its own time step: [active, channels, 1]
+            encoder_out_t = encoder_out[active, :, current_t[active]][:, :, None]
+            joiner_logits = self.model.run_joiner(encoder_out_t, decoder_out[active]).reshape(active.size, -1)
+
+            predicted_tokens = np.argmax(joiner_logits[:, : self.blank_id + 1], axis=1)
+            predicted_skips = durations[np.argmax(joiner_logits[:, self.blank_id + 1 :], axis=1)]
+
+            emitted = predicted_tokens != self.blank_id
+            predicted_skips[~emitted] = np.maximum(predicted_skips[~emitted], 1)  # As in `decode_frames`
+            if emitted.any():
+                rows = active[emitted]
+                tokens = predicted_tokens[emitted]
+                for row, token in zip(rows.tolist(), tokens.tolist(), strict=True):
+                    predicted_token_ids[row].append(token)
+
+                # Update decoder state and output of the emitting utterances for their next step
+                state0[:, rows] = next_state0[:, rows]
+                state1[:, rows] = next_state1[:, rows]
+                out, out_state0, out_state1 = self.model.run_decoder(tokens, state0[:, rows], state1[:, rows])
+                decoder_out[rows] = out
+                next_state0[:, rows] = out_state0
+                next_state1[:, rows] = out_state1
+
+            # Advance every active utterance by its predicted duration
+            current_t[active] += predicted_skips
+            active = np.flatnonzero(current_t < lengths)
+
+        loop_end_time = time.time()
+        logger.info(
+            f"Batched TDT decoding loop finished in {loop_end_time - loop_start_time:.2f}s ({steps_taken} steps)."
+        )
+        if steps_taken >= max_steps and active.size:
+            logger.warning("Warning: TDT decoding loop hit maximum step limit. Result might be truncated.")
+
         return predicted_token_ids
 
     def _post_process_text(self, token_ids: list[int]) -> str:
@@ -469,6 +673,30 @@ class AudioTranscriber:
 
         return text
 
+    def encode(self, audio: NDArray[np.float32]) -> NDArray[np.float32]:
+        """
+        Computes the encoder output of an audio window, the streaming counterpart of `transcribe`'s first steps.
+
+        Args:
+            audio: Input audio signal as a numpy float32 array, mono 16000Hz.
+
+        Returns:
+            Encoder output with shape [1, channels, time_reduced], one frame per `frame_samples` samples.
+        """
+        return self.model.run_encoder(self._process_audio(audio))
+
+    def hypothesis_text(self, state: TDTDecodingState) -> str:
+        """
+        Converts the tokens decoded so far into text.
+
+        Args:
+            state: Decoding state returned by `decode_frames`.
+
+        Returns:
+            The transcribed text.
+        """
+        return self._post_process_text(state.token_ids)
+
     def transcribe(self, audio: NDArray[np.float32]) -> str:
         """
         Transcribes an audio signal to text using the TDT model.
@@ -515,6 +743,35 @@ class AudioTranscriber:
 
         return text
 
+    def transcribe_batch(self, audios: list[NDArray[np.float32]]) -> list[str]:
+        """
+        Transcribes several audio signals with one encoder run and a batched decoding loop.
+
+        The mel features of every utterance are computed and normalized on their own, then
+        zero-padded to the longest one; the encoder masks the padding using the lengths.
+
+        Args:
+            audios: Input audio signals as numpy float32 arrays. Assumed mono and 16000Hz!
+
+        Returns:
+            list[str]: Transcribed text of each signal, in order.
+        """
+        if not audios:
+            return []
+        start_time = time.time()
+
+        features = [self._process_audio(audio)[0] for audio in audios]  # [n_mels, time] each
+        lengths = np.array([f.shape[1] for f in features], dtype=np.int64)
+        batch = np.zeros((len(features), features[0].shape[0], int(lengths.max())), dtype=np.float32)
+        for i, f in enumerate(features):
+            batch[i, :, : f.shape[1]] = f
+
+        encoder_out, encoded_lengths = self.model.run_encoder_batch(batch, lengths)
+        texts = [self._post_process_text(ids) for ids in self._decode_tdt_batch(encoder_out, encoded_lengths)]
+
+        logger.info(f"Transcribed {len(audios)} utterances in {time.time() - start_time:.2f}s")
+        return texts
+
     def transcribe_file(self, audio_path: Path) -> str:
         """
         Transcribes an audio file to text.
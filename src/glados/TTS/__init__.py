@@ -31,6 +31,8 @@ def get_speech_synthesizer(
     rvc_device: str = "cuda:0",
     rvc_f0_method: str = "rmvpe",
     rvc_f0_up_key: int = 0,
+    phoneme_cache_path: Optional[str | Path] = None,
+    quantization: Optional[str] = None,
     **rvc_kwargs,
 ) -> SpeechSynthesizerProtocol:
     """
@@ -45,6 +47,9 @@ def get_speech_synthesizer(
         rvc_device: Device for RVC inference ("cuda:0", "cpu")
         rvc_f0_method: Pitch extraction method ("rmvpe" is fastest, "harvest" is higher quality)
         rvc_f0_up_key: Pitch shift in semitones
+        phoneme_cache_path: Optional file keeping the phonemizer's word cache across restarts
+        quantization: INT8 variant of the voice model to load ("int8_dynamic" or "int8_static",
+            see `glados quantize`), None for the original model
         **rvc_kwargs: Additional RVC parameters (index_rate, protect, etc.)
         
     Returns:
@@ -62,15 +67,22 @@ def get_speech_synthesizer(
         )
     """
     # Create base TTS
+    from ..utils.quantization import resolve_variant
+
+    phoneme_cache = Path(phoneme_cache_path) if phoneme_cache_path else None
     if voice.lower() == "glados":
         from ..TTS import tts_glados
-        base_tts = tts_glados.SpeechSynthesizer()
+        model_path = resolve_variant(tts_glados.SpeechSynthesizer.MODEL_PATH, quantization)
+        base_tts = tts_glados.SpeechSynthesizer(model_path=model_path, phoneme_cache_path=phoneme_cache)
     else:
         from ..TTS import tts_kokoro
         available_voices = tts_kokoro.get_voices()
         if voice not in available_voices:
             raise ValueError(f"Voice '{voice}' not available. Available voices: {available_voices}")
-        base_tts = tts_kokoro.SpeechSynthesizer(voice=voice)
+        model_path = resolve_variant(tts_kokoro.SpeechSynthesizer.MODEL_PATH, quantization)
+        base_tts = tts_kokoro.SpeechSynthesizer(
+            model_path=model_path, voice=voice, phoneme_cache_path=phoneme_cache
+        )
     
     # Optionally wrap with RVC
     if rvc_model_path:
@@ -0,0 +1,376 @@
+"""
+Content-addressed cache of synthesized speech.
+
+The assistant says many things more than once: the announcement, error messages and
+short replies. `CachedSpeechSynthesizer` wraps any SpeechSynthesizerProtocol and keys
+the audio on the voice (TTS voice plus RVC settings) and the normalized spoken text, so
+a repeated phrase skips phonemization, the TTS model and RVC entirely.
+
+Two tiers:
+
+- memory: float32 arrays in an LRU bounded by bytes
+- disk (optional): int16 PCM appended to one data file, found through a fixed-size
+  record index memory-mapped from an .npy file. When the data file or the index is
+  full, the least recently used entries are dropped by rewriting the data file with
+  the survivors. Disk hits are promoted to memory.
+
+The disk tier belongs to one process at a time; sessions of the multi-session server
+share the wrapper and therefore the cache.
+"""
+
+from collections import OrderedDict
+from collections.abc import Iterable
+import hashlib
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any
+
+from loguru import logger
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import BaseModel
+
+from . import SpeechSynthesizerProtocol
+
+CACHE_FORMAT = 1  # Part of every key; bump to invalidate caches written by older code
+INDEX_DTYPE = np.dtype([("key", "V16"), ("offset", "<i8"), ("samples", "<i8"), ("last_used", "<f8")])
+
+
+class AudioCacheConfig(BaseModel):
+    """Configuration of the synthesized speech cache."""
+
+    enabled: bool = False
+    memory_max_mb: float = 64.0  # float32 audio kept in RAM (~2.9 min of 24kHz speech per 16 MB)
+    disk_path: str | None = None  # Directory of the int16 disk tier, None for memory only
+    disk_max_mb: float = 512.0  # Size of the disk data file before LRU entries are evicted
+    disk_max_entries: int = 8192  # Slots of the memory-mapped index
+    max_text_chars: int = 300  # Longer sentences rarely repeat and are not cached
+
+    class Config:
+        extra = "ignore"
+
+
+def normalize_text(text: str) -> str:
+    """Collapse the whitespace of a spoken text; case and punctuation affect the audio and are kept."""
+    return " ".join(text.split())
+
+
+def cache_key(voice_key: str, text: str) -> bytes:
+    """
+    Compute the cache key of a phrase.
+
+    Args:
+        voice_key: Identifies the voice, including any RVC conversion settings
+        text: Spoken text as passed to the synthesizer
+
+    Returns:
+        bytes: 16-byte BLAKE2b digest
+    """
+    material = f"{CACHE_FORMAT}\0{voice_key}\0{normalize_text(text)}".encode()
+    return hashlib.blake2b(material, digest_size=16).digest()
+
+
+class DiskAudioCache:
+    """
+    int16 PCM in one append-only data file, located through a memory-mapped index.
+
+    Not thread-safe; CachedSpeechSynthesizer serializes access.
+    """
+
+    COMPACT_TO = 0.75  # Share of the size and entry limits kept when evicting
+
+    def __init__(self, path: str | Path, max_bytes: int, max_entries: int) -> None:
+        """
+        Open or create the cache in a directory.
+
+        Args:
+            path: Directory holding index.npy and audio.pcm
+            max_bytes: Data file size that triggers eviction
+            max_entries: Number of index slots
+        """
+        self.dir = Path(path)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._index_path = self.dir / "index.npy"
+        self._data_path = self.dir / "audio.pcm"
+
+        self._index = self._open_index()
+        self._data = open(self._data_path, "a+b")  # Kept open for the cache lifetime
+        self._data_size = self._data.seek(0, os.SEEK_END)
+        self._slots: dict[bytes, int] = {}
+        for slot in np.flatnonzero(self._index["samples"] > 0):
+            record = self._index[slot]
+            if record["offset"] + record["samples"] * 2 <= self._data_size:
+                self._slots[bytes(record["key"])] = int(slot)
+            else:  # Written after a crash truncated the data file
+                self._index[slot] = np.zeros((), dtype=INDEX_DTYPE)
+        self._free = [int(s) for s in np.flatnonzero(self._index["samples"] == 0)][::-1]
+
+    def _open_index(self) -> np.memmap:
+        """Map the index file, recreating it if it is missing, unreadable or resized."""
+        if self._index_path.exists():
+            try:
+                index = np.load(self._index_path, mmap_mode="r+")
+                if index.dtype == INDEX_DTYPE and index.shape == (self.max_entries,):
+                    return index
+                logger.info(f"DiskAudioCache: Index layout changed, clearing {self.dir}")
+            except (OSError, ValueError) as e:
+                logger.warning(f"DiskAudioCache: Unreadable index, clearing {self.dir}: {e}")
+        self._data_path.unlink(missing_ok=True)
+        index = np.lib.format.open_memmap(self._index_path, mode="w+", dtype=INDEX_DTYPE, shape=(self.max_entries,))
+        index.flush()
+        return index
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    @property
+    def size_bytes(self) -> int:
+        """Size of the data file."""
+        return self._data_size
+
+    def get(self, key: bytes) -> NDArray[np.int16] | None:
+        """Read the PCM of a key, or None if it is not cached."""
+        slot = self._slots.get(key)
+        if slot is None:
+            return None
+        record = self._index[slot]
+        self._data.seek(int(record["offset"]))
+        pcm = np.frombuffer(self._data.read(int(record["samples"]) * 2), dtype=np.int16)
+        self._index["last_used"][slot] = time.time()
+        return pcm
+
+    def put(self, key: bytes, pcm: NDArray[np.int16]) -> None:
+        """Store the PCM of a key, evicting least recently used entries if needed."""
+        nbytes = pcm.size * 2
+        if key in self._slots or nbytes == 0 or nbytes > self.max_bytes * self.COMPACT_TO:
+            return
+        if self._data_size + nbytes > self.max_bytes or not self._free:
+            self._evict(nbytes)
+
+        self._data.seek(0, os.SEEK_END)
+        self._data.write(pcm.astype("<i2", copy=False).tobytes())
+        self._data.flush()
+        slot = self._free.pop()
+        self._index[slot] = (key, self._data_size, pcm.size, time.time())
+        self._index.flush()
+        self._slots[key] = slot
+        self._data_size += nbytes
+
+    def _evict(self, incoming_bytes: int) -> None:
+        """Rewrite the data file with the most recently used entries that fit the limits."""
+        byte_limit = self.max_bytes * self.COMPACT_TO - incoming_bytes
+        entry_limit = int(self.max_entries * self.COMPACT_TO)
+        slots = sorted(self._slots.values(), key=lambda s: -self._index[s]["last_used"])
+        kept, total = [], 0
+        for slot in slots:
+            nbytes = int(self._index[slot]["samples"]) * 2
+            if len(kept) >= entry_limit or total + nbytes > byte_limit:
+                continue
+            kept.append((slot, nbytes))
+            total += nbytes
+
+        tmp_path = self._data_path.with_suffix(".tmp")
+        records = []
+        with open(tmp_path, "wb") as tmp:
+            for slot, nbytes in kept:
+                record = self._index[slot].copy()
+                self._data.seek(int(record["offset"]))
+                record["offset"] = tmp.tell()
+                tmp.write(self._data.read(nbytes))
+                records.append(record)
+
+        # Clear the index before swapping the data file: a crash in between loses the
+        # cache but never pairs an index entry with the wrong audio
+        self._index[:] = np.zeros(self.max_entries, dtype=INDEX_DTYPE)
+        self._index.flush()
+        self._data.close()
+        os.replace(tmp_path, self._data_path)
+        self._data = open(self._data_path, "a+b")
+        self._data_size = self._data.seek(0, os.SEEK_END)
+        if records:
+            self._index[: len(records)] = records
+        self._index.flush()
+
+        self._slots = {bytes(record["key"]): i for i, record in enumerate(records)}
+        self._free = list(range(self.max_entries - 1, len(records) - 1, -1))
+        logger.debug(f"DiskAudioCache: Evicted {len(slots) - len(records)} entries, {len(records)} kept")
+
+    def close(self) -> None:
+        """Flush the index and close the data file."""
+        self._index.flush()
+        self._data.close()
+
+
+class CachedSpeechSynthesizer:
+    """
+    SpeechSynthesizerProtocol wrapper that serves repeated phrases from the audio cache.
+
+    Thread-safe: TTS workers and network sessions may call it concurrently. A phrase
+    requested by two threads at once is synthesized by both and cached once.
+    """
+
+    def __init__(
+        self,
+        base_tts: SpeechSynthesizerProtocol,
+        voice_key: str,
+        memory_max_mb: float = 64.0,
+        disk_path: str | Path | None = None,
+        disk_max_mb: float = 512.0,
+        disk_max_entries: int = 8192,
+        max_text_chars: int = 300,
+    ) -> None:
+        """
+        Initialize the cache around a synthesizer.
+
+        Args:
+            base_tts: Synthesizer producing the audio on a miss
+            voice_key: Identifies the voice and conversion settings; part of every key
+            memory_max_mb: Size of the in-memory tier
+            disk_path: Directory of the disk tier, None for memory only
+            disk_max_mb: Size of the disk tier
+            disk_max_entries: Index slots of the disk tier
+            max_text_chars: Longer texts bypass the cache
+        """
+        self.base_tts = base_tts
+        self.sample_rate = base_tts.sample_rate
+        self.voice_key = f"{voice_key}@{self.sample_rate}"
+        self.max_text_chars = max_text_chars
+        self._memory_max_bytes = int(memory_max_mb * 1024 * 1024)
+        self._memory: OrderedDict[bytes, NDArray[np.float32]] = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+        self._disk: DiskAudioCache | None = None
+        if disk_path:
+            try:
+                self._disk = DiskAudioCache(disk_path, int(disk_max_mb * 1024 * 1024), disk_max_entries)
+            except OSError as e:
+                logger.warning(f"TTS cache: Disk tier unavailable at {disk_path}, using memory only: {e}")
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.bypassed = 0
+
+    @classmethod
+    def from_config(
+        cls,
+        base_tts: SpeechSynthesizerProtocol,
+        config: AudioCacheConfig,
+        voice_key: str,
+    ) -> "CachedSpeechSynthesizer":
+        """Create the cache wrapper from an AudioCacheConfig."""
+        return cls(
+            base_tts,
+            voice_key,
+            memory_max_mb=config.memory_max_mb,
+            disk_path=config.disk_path,
+            disk_max_mb=config.disk_max_mb,
+            disk_max_entries=config.disk_max_entries,
+            max_text_chars=config.max_text_chars,
+        )
+
+    def generate_speech_audio(self, text: str) -> NDArray[np.float32]:
+        """
+        Get the speech audio of a text, synthesizing it only on a cache miss.
+
+        Args:
+            text: Spoken text to synthesize
+
+        Returns:
+            NDArray[np.float32]: Audio at `sample_rate`; a copy the caller may modify
+        """
+        if len(text) > self.max_text_chars or not text.strip():
+            with self._lock:
+                self.bypassed += 1
+            return self.base_tts.generate_speech_audio(text)
+
+        key = cache_key(self.voice_key, text)
+        with self._lock:
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return audio.copy()
+            pcm = self._disk.get(key) if self._disk is not None else None
+            if pcm is not None:
+                audio = pcm.astype(np.float32) / 32767.0
+                self._remember(key, audio)
+                self.disk_hits += 1
+                return audio.copy()
+            self.misses += 1
+
+        audio = self.base_tts.generate_speech_audio(text)
+        # E.g. the RVC service fell back to unconverted audio: serve it, but do not keep it
+        if len(audio) and getattr(self.base_tts, "last_output_cacheable", True):
+            stored = np.asarray(audio, dtype=np.float32).copy()
+            with self._lock:
+                self._remember(key, stored)
+                if self._disk is not None:
+                    try:
+                        self._disk.put(key, (np.clip(stored, -1.0, 1.0) * 32767.0).astype(np.int16))
+                    except OSError as e:
+                        logger.warning(f"TTS cache: Failed to write to disk tier: {e}")
+        return audio
+
+    def _remember(self, key: bytes, audio: NDArray[np.float32]) -> None:
+        """Insert into the memory tier, evicting least recently used entries."""
+        if audio.nbytes > self._memory_max_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= previous.nbytes
+        self._memory[key] = audio
+        self._memory_bytes += audio.nbytes
+        while self._memory_bytes > self._memory_max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.nbytes
+
+    def prewarm(self, texts: Iterable[str]) -> int:
+        """
+        Synthesize phrases into the cache ahead of time.
+
+        Args:
+            texts: Spoken texts, e.g. the announcement and frequent replies
+
+        Returns:
+            int: Number of phrases that had to be synthesized
+        """
+        misses_before = self.misses
+        for text in texts:
+            if text.strip():
+                self.generate_speech_audio(text)
+        return self.misses - misses_before
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get hit-rate and size metrics.
+
+        Returns:
+            dict[str, Any]: Hits per tier, misses, bypassed long texts, hit rate, and
+                entries and bytes held by each tier
+        """
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "bypassed": self.bypassed,
+                "hit_rate": round((self.memory_hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "disk_entries": len(self._disk) if self._disk is not None else 0,
+                "disk_bytes": self._disk.size_bytes if self._disk is not None else 0,
+            }
+
+    def close(self) -> None:
+        """Flush and close the disk tier."""
+        with self._lock:
+            if self._disk is not None:
+                self._disk.close()
+                self._disk = None
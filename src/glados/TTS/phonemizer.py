@@ -1,4 +1,5 @@
 # ruff: noqa: RUF001
+from collections import OrderedDict
 from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum
@@ -6,12 +7,15 @@ from functools import cache
 from pathlib import Path
 from pickle import load
 import re
+import threading
 from typing import Any
 
+from loguru import logger
 import numpy as np
 from numpy.typing import NDArray
 import onnxruntime as ort  # type: ignore
 
+from ..utils.onnx_sessions import create_session
 from ..utils.resources import resource_path
 
 # Default OnnxRuntime is way to verbose, only show fatal errors
@@ -28,6 +32,10 @@ class ModelConfig:
     MODEL_INPUT_LENGTH: int = 64
     EXPAND_ACRONYMS: bool = False
     USE_CUDA: bool = True
+    BUCKET_STEP: int = 16  # Model inputs are padded to the next multiple of this, up to MODEL_INPUT_LENGTH
+    MAX_BATCH_SIZE: int = 64  # Most words per G2P model run
+    WORD_CACHE_SIZE: int = 8192  # Predicted words kept in the word cache
+    WORD_CACHE_PATH: Path | None = None  # File keeping the word cache across restarts, None for memory only
 
     def __init__(
         self,
@@ -35,6 +43,7 @@ class ModelConfig:
         phoneme_dict_path: Path | None = None,
         token_to_idx_path: Path | None = None,
         idx_to_token_path: Path | None = None,
+        word_cache_path: Path | None = None,
     ) -> None:
         # Provide default Path objects if None is passed or for defaults
         self.MODEL_PATH = model_path if model_path is not None else resource_path("models/TTS/phomenizer_en.onnx")
@@ -47,6 +56,7 @@ class ModelConfig:
         self.IDX_TO_TOKEN_PATH = (
             idx_to_token_path if idx_to_token_path is not None else resource_path("models/TTS/idx_to_token.pkl")
         )
+        self.WORD_CACHE_PATH = word_cache_path
 
 
 class SpecialTokens(Enum):
@@ -83,6 +93,154 @@ class Punctuation(Enum):
         return re.compile(f"([{cls.PUNCTUATION.value + cls.SPACE.value}])")
 
 
+class WordPhonemeCache:
+    """
+    Bounded LRU of G2P model predictions, lowercase word -> phonemes.
+
+    Names and jargon missing from the phoneme dictionary tend to come up again and again in
+    a conversation; with the cache each of them runs through the model once. With a path,
+    predictions are appended to a text file of "word<TAB>phonemes" lines and loaded again
+    on the next start. The first line names the G2P model, so predictions of another model
+    are discarded. The file is rewritten with the live entries once it holds twice as many
+    lines as the cache.
+
+    Thread-safe: TTS workers may phonemize concurrently.
+    """
+
+    HEADER_PREFIX = "#g2p "
+
+    def __init__(self, max_entries: int = 8192, path: Path | str | None = None, model_tag: str = "") -> None:
+        """
+        Initialize the cache, loading the file at `path` if there is one.
+
+        Args:
+            max_entries: Words kept, least recently used ones are evicted first
+            path: File keeping the predictions across restarts, None for memory only
+            model_tag: Identifies the G2P model the predictions come from
+        """
+        self.max_entries = max_entries
+        self.path = Path(path) if path is not None else None
+        self.header = f"{self.HEADER_PREFIX}{model_tag}\n"
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._file_lines = 0
+        self.hits = 0
+        self.misses = 0
+        if self.path is not None:
+            self._load()
+
+    def _load(self) -> None:
+        """Read the cache file, starting a new one if it is missing or from another model."""
+        assert self.path is not None
+        try:
+            with self.path.open(encoding="utf-8") as f:
+                header = f.readline()
+                lines = f.readlines() if header == self.header else []
+        except FileNotFoundError:
+            header, lines = "", []
+        except OSError as e:
+            logger.warning(f"WordPhonemeCache: Failed to read {self.path}, starting empty: {e}")
+            header, lines = "", []
+
+        if header and header != self.header:
+            logger.info(f"WordPhonemeCache: {self.path} was written for another G2P model, discarding it")
+        for line in lines:
+            word, sep, phonemes = line.rstrip("\n").partition("\t")
+            if sep:
+                self._entries[word] = phonemes
+                self._entries.move_to_end(word)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._file_lines = len(lines)
+
+        if header != self.header or self._file_lines > 2 * self.max_entries:
+            self._rewrite()
+        logger.debug(f"WordPhonemeCache: Loaded {len(self._entries)} words from {self.path}")
+
+    def _rewrite(self) -> None:
+        """Replace the cache file with the live entries. Called with the lock held or during init."""
+        assert self.path is not None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with tmp_path.open("w", encoding="utf-8") as f:
+                f.write(self.header)
+                f.writelines(f"{word}\t{phonemes}\n" for word, phonemes in self._entries.items())
+            tmp_path.replace(self.path)
+            self._file_lines = len(self._entries)
+        except OSError as e:
+            logger.warning(f"WordPhonemeCache: Failed to write {self.path}: {e}")
+
+    def get_many(self, words: Iterable[str]) -> dict[str, str]:
+        """
+        Look up words, marking the found ones as recently used.
+
+        Args:
+            words: Lowercase words
+
+        Returns:
+            dict[str, str]: Phonemes of the words that are cached
+        """
+        found: dict[str, str] = {}
+        with self._lock:
+            for word in words:
+                phonemes = self._entries.get(word)
+                if phonemes is None:
+                    self.misses += 1
+                    continue
+                self._entries.move_to_end(word)
+                found[word] = phonemes
+                self.hits += 1
+        return found
+
+    def put_many(self, predictions: dict[str, str]) -> None:
+        """
+        Store model predictions, appending them to the cache file.
+
+        Args:
+            predictions: Lowercase word -> predicted phonemes
+        """
+        # Words are alphanumeric after cleaning; anything else could not be read back
+        predictions = {
+            word: phonemes
+            for word, phonemes in predictions.items()
+            if "\t" not in word + phonemes and "\n" not in word + phonemes
+        }
+        if not predictions:
+            return
+        with self._lock:
+            for word, phonemes in predictions.items():
+                self._entries[word] = phonemes
+                self._entries.move_to_end(word)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            if self.path is None:
+                return
+            if self._file_lines + len(predictions) > 2 * self.max_entries:
+                self._rewrite()
+                return
+            try:
+                with self.path.open("a", encoding="utf-8") as f:
+                    f.writelines(f"{word}\t{phonemes}\n" for word, phonemes in predictions.items())
+                self._file_lines += len(predictions)
+            except OSError as e:
+                logger.warning(f"WordPhonemeCache: Failed to append to {self.path}: {e}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            dict[str, int]: Cached words, lookups served from the cache and words that
+                had to be predicted
+        """
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
 class Phonemizer:
     """Phonemizer class for converting text to phonemes.
 
@@ -136,6 +294,12 @@ class Phonemizer:
         ) -> tuple[List[List[str]], set[str]]:
             Clean and split texts.
 
+        _bucket_batches(sequences: List[List[int]]) -> List[tuple[List[int], np.ndarray]]:
+            Group encoded words into padded batches of similar length.
+
+        _predict_words(words: List[str]) -> Dict[str, str]:
+            Get model phonemes for words, from the word cache or by batched inference.
+
         convert_to_phonemes(texts: List[str], lang: str) -> List[str]:
             Convert a list of texts to phonemes using a phonemizer.
     """
@@ -156,9 +320,13 @@ class Phonemizer:
             ort_session (InferenceSession): ONNX runtime session for model inference.
             special_tokens (set[str]): Set of special tokens used in phonemization.
 
+            word_cache (WordPhonemeCache): Model predictions kept across calls, and across restarts
+                if the config sets WORD_CACHE_PATH.
+
         Notes:
             - Adds a special phoneme entry for "glados"
-            - Configures ONNX runtime session with available providers, excluding TensorRT
+            - Creates the ONNX runtime session with the "phonemizer" session profile
+            - Uses length-bucketed batches unless the model has a fixed input length
         """
         if config is None:
             config = ModelConfig()
@@ -166,21 +334,13 @@ class Phonemizer:
         self.phoneme_dict: dict[str, str] = self._load_pickle(self.config.PHONEME_DICT_PATH)
 
         self.phoneme_dict["glados"] = "ɡlˈɑːdɑːs"  # Add GLaDOS to the phoneme dictionary!
+        for punct in Punctuation.get_punc_set():
+            self.phoneme_dict[punct] = punct
 
         self.token_to_idx = self._load_pickle(self.config.TOKEN_TO_IDX_PATH)
         self.idx_to_token = self._load_pickle(self.config.IDX_TO_TOKEN_PATH)
 
-        providers = ort.get_available_providers()
-        if "TensorrtExecutionProvider" in providers:
-            providers.remove("TensorrtExecutionProvider")
-        if "CoreMLExecutionProvider" in providers:
-            providers.remove("CoreMLExecutionProvider")
-
-        self.ort_session = ort.InferenceSession(
-            self.config.MODEL_PATH,
-            sess_options=ort.SessionOptions(),
-            providers=providers,
-        )
+        self.ort_session = create_session("phonemizer", self.config.MODEL_PATH)
 
         self.special_tokens: set[str] = {
             SpecialTokens.PAD.value,
@@ -188,6 +348,26 @@ class Phonemizer:
             SpecialTokens.EN_US.value,
         }
 
+        # A fixed sequence dimension rules out shorter buckets
+        input_length = self.ort_session.get_inputs()[0].shape[1]
+        self._fixed_input_length: int | None = input_length if isinstance(input_length, int) else None
+        self.model_runs = 0
+
+        self.word_cache = WordPhonemeCache(
+            max_entries=self.config.WORD_CACHE_SIZE,
+            path=self.config.WORD_CACHE_PATH,
+            model_tag=self._model_tag(),
+        )
+
+    def _model_tag(self) -> str:
+        """Identify the G2P model for the word cache file."""
+        model_path = Path(self.config.MODEL_PATH)
+        try:
+            size = model_path.stat().st_size
+        except OSError:
+            size = 0
+        return f"{model_path.name}:{size}:{self.config.CHAR_REPEATS}:{self.config.MODEL_INPUT_LENGTH}"
+
     @staticmethod
     def _load_pickle(path: Path) -> dict[str, Any]:
         """
@@ -413,6 +593,86 @@ class Phonemizer:
 
         return result
 
+    def _bucket_batches(self, sequences: list[list[int]]) -> list[tuple[list[int], NDArray[np.int64]]]:
+        """
+        Group encoded words into padded model inputs of similar length.
+
+        Padding every word to MODEL_INPUT_LENGTH makes a short word cost as much as the
+        longest one. Instead each word goes to the bucket of the next multiple of
+        BUCKET_STEP (capped at MODEL_INPUT_LENGTH, longer words are truncated as before),
+        and each bucket is split into batches of at most MAX_BATCH_SIZE words. The model
+        masks padding, so the bucket length does not change its predictions. Models
+        exported with a fixed sequence length get that length for every batch.
+
+        Parameters:
+            sequences (list[list[int]]): Encoded words
+
+        Returns:
+            list[tuple[list[int], NDArray[np.int64]]]: Positions of the words in `sequences`
+            and their padded batch, for every batch
+        """
+        max_length = self._fixed_input_length or self.config.MODEL_INPUT_LENGTH
+        step = max(self.config.BUCKET_STEP, 1)
+        buckets: dict[int, list[int]] = {}
+        for i, seq in enumerate(sequences):
+            length = max_length if self._fixed_input_length else min(-(-len(seq) // step) * step, max_length)
+            buckets.setdefault(length, []).append(i)
+
+        batches = []
+        for length, positions in sorted(buckets.items()):
+            for start in range(0, len(positions), self.config.MAX_BATCH_SIZE):
+                chunk = positions[start : start + self.config.MAX_BATCH_SIZE]
+                batches.append((chunk, self.pad_sequence_fixed([sequences[i] for i in chunk], length)))
+        return batches
+
+    def _predict_words(self, words: list[str]) -> dict[str, str]:
+        """
+        Get the model phonemes of words missing from the phoneme dictionary.
+
+        Words are looked up in the word cache first; the rest are predicted in
+        length-bucketed batches and added to the cache. The model lowercases its input,
+        so words are cached in lowercase.
+
+        Parameters:
+            words (list[str]): Words to predict
+
+        Returns:
+            dict[str, str]: Predicted phonemes of each word
+        """
+        keys = {word: word.lower() for word in words}
+        predictions = self.word_cache.get_many(set(keys.values()))
+        missing = sorted(set(keys.values()) - predictions.keys())
+
+        if missing:
+            new_predictions: dict[str, str] = {}
+            input_name = self.ort_session.get_inputs()[0].name
+            for positions, input_batch in self._bucket_batches([self.encode(word) for word in missing]):
+                ort_outs = self.ort_session.run(None, {input_name: input_batch})
+                self.model_runs += 1
+                ids = self._process_model_output(ort_outs)
+                for i, phoneme_ids in zip(positions, ids, strict=True):
+                    new_predictions[missing[i]] = self.decode(phoneme_ids)
+            self.word_cache.put_many(new_predictions)
+            predictions.update(new_predictions)
+
+        return {word: predictions[key] for word, key in keys.items()}
+
+    def warm_up(self) -> None:
+        """
+        Run the G2P model once at every input length it is fed with.
+
+        Each length bucket is a distinct input shape for ONNX Runtime, so each one is
+        run once with a single word. The predictions are discarded and the word cache
+        is left untouched.
+        """
+        max_length = self._fixed_input_length or self.config.MODEL_INPUT_LENGTH
+        step = max(self.config.BUCKET_STEP, 1)
+        lengths = [max_length] if self._fixed_input_length else sorted({*range(step, max_length, step), max_length})
+        input_name = self.ort_session.get_inputs()[0].name
+        encoded = self.encode("glados")
+        for length in lengths:
+            self.ort_session.run(None, {input_name: self.pad_sequence_fixed([encoded], length)})
+
     def _get_dict_entry(self, word: str, punc_set: set[str]) -> str | None:
         """
         Retrieves the phoneme entry for a given word from the phoneme dictionary.
@@ -504,7 +764,7 @@ class Phonemizer:
         1. Preprocess and clean input texts
         2. Collect phonemes from an existing dictionary
         3. Split words that are not in the dictionary
-        4. Predict phonemes for missing words using an ONNX model
+        4. Predict phonemes for missing words using the word cache or an ONNX model
         5. Reconstruct phonemes for each input text
 
         Parameters:
@@ -536,8 +796,6 @@ class Phonemizer:
         split_text, cleaned_words = self._clean_and_split_texts(texts, punc_set, punc_pattern)
 
         # Step 2: Collect dictionary phonemes for words and hyphenated words
-        for punct in punc_set:
-            self.phoneme_dict[punct] = punct
         word_phonemes = {word: self.phoneme_dict.get(word.lower()) for word in cleaned_words}
 
         # Step 3: If word is not in dictionary, split it into subwords
@@ -561,18 +819,9 @@ class Phonemizer:
             word for word, phons in word_phonemes.items() if phons is None and len(word_splits.get(word, [])) <= 1
         ]
 
+        # Step 5: Add predictions, from the word cache or batched inference, to the dictionary
         if words_to_predict:
-            input_batch = [self.encode(word) for word in words_to_predict]
-            input_batch_padded: NDArray[np.int64] = self.pad_sequence_fixed(input_batch, self.config.MODEL_INPUT_LENGTH)
-
-            ort_inputs = {self.ort_session.get_inputs()[0].name: input_batch_padded}
-            ort_outs = self.ort_session.run(None, ort_inputs)
-
-            ids = self._process_model_output(ort_outs)
-
-            # Step 5: Add predictions to the dictionary
-            for id, word in zip(ids, words_to_predict, strict=False):
-                word_phonemes[word] = self.decode(id)
+            word_phonemes.update(self._predict_words(words_to_predict))
 
         # Step 6: Get phonemes for each word in the text
         phoneme_lists = []
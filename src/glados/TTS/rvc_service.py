@@ -285,11 +285,18 @@ class RVCServiceSynthesizer:
         self.base_tts = base_tts
         self.sample_rate = base_tts.sample_rate
         self.rvc_client = rvc_client
+        # Per TTS worker thread: whether the last output really went through RVC
+        self._local = threading.local()
         
         # Initialize RVC client
         if not self.rvc_client.initialize():
             logger.warning("RVC service not available, will use base TTS only")
     
+    @property
+    def last_output_cacheable(self) -> bool:
+        """False if the last audio of the calling thread is the unconverted fallback."""
+        return getattr(self._local, "converted", True)
+
     def generate_speech_audio(self, text: str) -> NDArray[np.float32]:
         """
         Generate speech with voice conversion.
@@ -313,6 +320,8 @@ class RVCServiceSynthesizer:
         rvc_start = time.time()
         converted_audio = self.rvc_client.convert(base_audio, self.sample_rate)
         rvc_time = time.time() - rvc_start
+        # The client returns its input unchanged when the service is unavailable
+        self._local.converted = converted_audio is not base_audio
         
         total = time.time() - start
         logger.info(f"TTS+RVC: TTS={tts_time*1000:.0f}ms, RVC={rvc_time*1000:.0f}ms, Total={total*1000:.0f}ms")
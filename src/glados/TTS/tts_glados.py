@@ -3,14 +3,16 @@ from dataclasses import dataclass
 import json
 from pathlib import Path
 from pickle import load
+import re
 from typing import Any
 
 import numpy as np
 from numpy.typing import NDArray
 import onnxruntime as ort  # type: ignore
 
+from ..utils.onnx_sessions import create_session
 from ..utils.resources import resource_path
-from .phonemizer import Phonemizer
+from .phonemizer import ModelConfig, Phonemizer
 
 # Default OnnxRuntime is way to verbose, only show fatal errors
 ort.set_default_logger_severity(4)
@@ -115,6 +117,12 @@ class SpeechSynthesizer:
     MODEL_PATH = resource_path("models/TTS/glados.onnx")
     PHONEME_TO_ID_PATH = resource_path("models/TTS/phoneme_to_id.pkl")
     USE_CUDA = True
+    BATCH_SENTENCES = True  # Synthesize the sentences of a text in padded batches instead of one run per text
+    MAX_BATCH_SIZE = 8  # Most sentences per model run
+    MAX_PADDING = 0.1  # A batch grows while its padding stays under this share of its real phoneme IDs
+
+    SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+    WARMUP_TEXTS = ("Hello.", "Oh, it's you. It's been a long time. How have you been?")  # One sentence, a batch
 
     # Conversions
     PAD = "_"  # padding (0)
@@ -122,7 +130,11 @@ class SpeechSynthesizer:
     EOS = "$"  # end of sentence
 
     def __init__(
-        self, model_path: Path = MODEL_PATH, phoneme_path: Path = PHONEME_TO_ID_PATH, speaker_id: int | None = None
+        self,
+        model_path: Path = MODEL_PATH,
+        phoneme_path: Path = PHONEME_TO_ID_PATH,
+        speaker_id: int | None = None,
+        phoneme_cache_path: Path | None = None,
     ) -> None:
         """
         Initialize the text-to-speech synthesizer with a specified model and optional speaker configuration.
@@ -131,19 +143,24 @@ class SpeechSynthesizer:
             model_path (Path): Path to the ONNX model file. Defaults to MODEL_PATH.
             phoneme_path (Path): Path to the phoneme-to-ID mapping file. Defaults to PHONEME_TO_ID_PATH.
             speaker_id (int | None): Optional speaker ID for multi-speaker models. Defaults to None.
+            phoneme_cache_path (Path | None): File keeping the phonemizer's word cache across restarts.
+                Defaults to None (memory only).
         """
-        providers = ort.get_available_providers()
-        if "TensorrtExecutionProvider" in providers:
-            providers.remove("TensorrtExecutionProvider")
-        if "CoreMLExecutionProvider" in providers:
-            providers.remove("CoreMLExecutionProvider")
-
-        self.ort_sess = ort.InferenceSession(
-            model_path,
-            sess_options=ort.SessionOptions(),
-            providers=providers,
+        self.ort_sess = create_session("tts_glados", model_path)
+        self.phonemizer = Phonemizer(ModelConfig(word_cache_path=phoneme_cache_path))
+
+        # A batch is decoded to the longest item's predicted duration, so only models reporting the
+        # valid samples of every item (a lengths output) can be batched. Others, and models fixed to
+        # batch size 1, run texts whole.
+        batch_dim = self.ort_sess.get_inputs()[0].shape[0]
+        self._lengths_output = next(
+            (i for i, output in enumerate(self.ort_sess.get_outputs()) if "length" in output.name), None
+        )
+        self._batchable = (
+            self.BATCH_SENTENCES
+            and self._lengths_output is not None
+            and not (isinstance(batch_dim, int) and batch_dim == 1)
         )
-        self.phonemizer = Phonemizer()
         self.id_map = self._load_pickle(phoneme_path)
 
         try:
@@ -190,7 +207,8 @@ class SpeechSynthesizer:
         Convert input text to synthesized speech audio.
 
         Converts the input text to phonemes using the internal phonemizer, then generates audio from those phonemes.
-        The result is returned as a NumPy array of 32-bit floating point audio samples.
+        The result is returned as a NumPy array of 32-bit floating point audio samples. Texts of several
+        sentences are synthesized in padded batches, one model run per MAX_BATCH_SIZE sentences.
 
         Parameters:
             text (str): The text to be converted to speech
@@ -200,13 +218,27 @@ class SpeechSynthesizer:
         """
         phonemes = self._phonemizer(text)
         phoneme_ids_list = [self._phonemes_to_ids(sentence) for sentence in phonemes]
-        audio_chunks = [self._synthesize_ids_to_audio(phoneme_ids) for phoneme_ids in phoneme_ids_list]
+        if len(phoneme_ids_list) > 1:
+            audio_chunks = self._synthesize_batch_to_audio(phoneme_ids_list)
+        else:
+            audio_chunks = [self._synthesize_ids_to_audio(phoneme_ids) for phoneme_ids in phoneme_ids_list]
 
         if audio_chunks:
             audio: NDArray[np.float32] = np.concatenate(audio_chunks, axis=1).T
             return audio
         return np.array([], dtype=np.float32)
 
+    def warm_up(self) -> None:
+        """
+        Run the G2P and voice models once before the first real request.
+
+        Synthesizes a single sentence and a text of several sentences, so both the
+        single-item and the batched input shapes have been seen by ONNX Runtime.
+        """
+        self.phonemizer.warm_up()
+        for text in self.WARMUP_TEXTS:
+            self.generate_speech_audio(text)
+
     def _phonemizer(self, input_text: str) -> list[str]:
         """
         Convert input text to phonemes using espeak-ng phonemization.
@@ -219,15 +251,20 @@ class SpeechSynthesizer:
             input_text (str): The text to be converted into phonemes.
 
         Returns:
-            list[str]: A list of phoneme strings representing the input text's pronunciation.
+            list[str]: A list of phoneme strings representing the input text's pronunciation, one per
+            sentence when sentences are batched, otherwise one for the whole text.
 
         Example:
             phonemes = synthesizer._phonemizer("Hello world")
             # Might return something like ['hh', 'AH0', 'l', 'oW1', 'r', 'AO1', 'l', 'd']
         """
-        phonemes = self.phonemizer.convert_to_phonemes([input_text], "en_us")
+        if not self._batchable:
+            return self.phonemizer.convert_to_phonemes([input_text], "en_us")
 
-        return phonemes
+        sentences = [sentence for sentence in self.SENTENCE_END.split(input_text.strip()) if sentence]
+        phonemes = self.phonemizer.convert_to_phonemes(sentences or [input_text], "en_us")
+        # Dropping sentences without phonemes (stray punctuation) keeps the batch free of empty items
+        return [p for p in phonemes if p.strip(" .,:?!")] or phonemes[:1]
 
     def _phonemes_to_ids(self, phonemes: str) -> list[int]:
         """
@@ -315,6 +352,65 @@ class SpeechSynthesizer:
 
         return audio
 
+    def _synthesize_batch_to_audio(self, phoneme_ids_list: list[list[int]]) -> list[NDArray[np.float32]]:
+        """
+        Synthesize several phoneme ID sequences with as few model runs as possible.
+
+        Sequences are sorted by length and grouped while the padding a batch needs stays under
+        MAX_PADDING, so a short sentence is not decoded at the length of a long one. Each batch
+        is padded with the PAD ID and run with its `input_lengths`. The audio of a batch is as
+        long as its longest item's predicted duration, which need not be the item with the most
+        phoneme IDs, so each output is cut to the length reported by the model's lengths output.
+
+        Parameters:
+            phoneme_ids_list (list[list[int]]): Phoneme ID sequences, one per sentence
+
+        Returns:
+            list[NDArray[np.float32]]: Audio of each sequence, in input order, shaped like the
+            output of `_synthesize_ids_to_audio`
+        """
+        if not self._batchable:
+            return [self._synthesize_ids_to_audio(phoneme_ids) for phoneme_ids in phoneme_ids_list]
+
+        order = sorted(range(len(phoneme_ids_list)), key=lambda i: len(phoneme_ids_list[i]))
+        chunks: list[NDArray[np.float32]] = [np.empty(0, dtype=np.float32)] * len(phoneme_ids_list)
+        scales = np.array([self.config.noise_scale, self.config.length_scale, self.config.noise_w], dtype=np.float32)
+        pad_id = self.id_map[self.PAD][0]
+
+        groups: list[list[int]] = []
+        for i in order:
+            group = groups[-1] if groups else []
+            real = sum(len(phoneme_ids_list[j]) for j in group) + len(phoneme_ids_list[i])
+            padded = (len(group) + 1) * len(phoneme_ids_list[i])  # Sorted: the new sequence is the longest
+            if group and len(group) < self.MAX_BATCH_SIZE and padded <= real * (1 + self.MAX_PADDING):
+                group.append(i)
+            else:
+                groups.append([i])
+
+        for group in groups:
+            lengths = np.array([len(phoneme_ids_list[i]) for i in group], dtype=np.int64)
+            batch = np.full((len(group), lengths.max()), pad_id, dtype=np.int64)
+            for row, i in enumerate(group):
+                batch[row, : lengths[row]] = phoneme_ids_list[i]
+
+            sid = None
+            if self.speaker_id is not None:
+                sid = np.full(len(group), self.speaker_id, dtype=np.int64)
+
+            outputs = self.ort_sess.run(
+                None,
+                {
+                    "input": batch,
+                    "input_lengths": lengths,
+                    "scales": scales,
+                    "sid": sid,
+                },
+            )
+            for row, i in enumerate(group):
+                audio = outputs[0][row : row + 1].squeeze((0, 1))
+                chunks[i] = audio[..., : int(outputs[self._lengths_output][row])]
+        return chunks
+
     def __del__(self) -> None:
         """
         Clean up ONNX session to prevent context leaks.
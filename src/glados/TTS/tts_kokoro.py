@@ -4,8 +4,9 @@ import numpy as np
 from numpy.typing import NDArray
 import onnxruntime as ort  # type: ignore
 
+from ..utils.onnx_sessions import create_session
 from ..utils.resources import resource_path
-from .phonemizer import Phonemizer
+from .phonemizer import ModelConfig, Phonemizer
 
 # Default OnnxRuntime is way to verbose, only show fatal errors
 ort.set_default_logger_severity(4)
@@ -49,26 +50,19 @@ class SpeechSynthesizer:
     DEFAULT_VOICE: str = "af_alloy"
     MAX_PHONEME_LENGTH: int = 510
     SAMPLE_RATE: int = 24000
+    WARMUP_TEXT: str = "Oh, it's you. It's been a long time."
 
-    def __init__(self, model_path: Path = MODEL_PATH, voice: str = DEFAULT_VOICE) -> None:
+    def __init__(
+        self, model_path: Path = MODEL_PATH, voice: str = DEFAULT_VOICE, phoneme_cache_path: Path | None = None
+    ) -> None:
         self.sample_rate = self.SAMPLE_RATE
         self.voices: dict[str, NDArray[np.float32]] = np.load(VOICES_PATH)
         self.vocab = self._get_vocab()
 
         self.set_voice(voice)
 
-        providers = ort.get_available_providers()
-        if "TensorrtExecutionProvider" in providers:
-            providers.remove("TensorrtExecutionProvider")
-        if "CoreMLExecutionProvider" in providers:
-            providers.remove("CoreMLExecutionProvider")
-
-        self.ort_sess = ort.InferenceSession(
-            model_path,
-            sess_options=ort.SessionOptions(),
-            providers=providers,
-        )
-        self.phonemizer = Phonemizer()
+        self.ort_sess = create_session("tts_kokoro", model_path)
+        self.phonemizer = Phonemizer(ModelConfig(word_cache_path=phoneme_cache_path))
 
     def set_voice(self, voice: str) -> None:
         """
@@ -99,6 +93,11 @@ class SpeechSynthesizer:
         audio = self._synthesize_ids_to_audio(phoneme_ids)
         return np.array(audio, dtype=np.float32)
 
+    def warm_up(self) -> None:
+        """Run the G2P and voice models once before the first real request."""
+        self.phonemizer.warm_up()
+        self.generate_speech_audio(self.WARMUP_TEXT)
+
     @staticmethod
     def _get_vocab() -> dict[str, int]:
         _pad = "$"
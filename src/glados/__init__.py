@@ -1,6 +1,19 @@
 """GLaDOS - Voice Assistant using ONNX models for speech synthesis and recognition."""
 
-from .core.engine import Glados, GladosConfig
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .core.engine import Glados, GladosConfig
 
 __version__ = "0.1.0"
 __all__ = ["Glados", "GladosConfig"]
+
+
+def __getattr__(name: str) -> Any:
+    # The engine pulls in onnxruntime, numba and the whole pipeline; import it on first use so
+    # lightweight entry points (`glados --help`, clients, utilities) do not pay for it
+    if name in __all__:
+        from .core import engine
+
+        return getattr(engine, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -40,6 +40,7 @@ def get_audio_system(
     vad_threshold: float | None = None,
     network_host: str = "0.0.0.0",
     network_port: int = 5555,
+    vad_model: VAD | None = None,
 ) -> AudioProtocol:
     """
     Factory function to get an instance of an audio I/O system based on the specified backend type.
@@ -51,6 +52,7 @@ def get_audio_system(
         vad_threshold (float | None): Optional threshold for voice activity detection
         network_host (str): Host to bind for network audio server
         network_port (int): Port for network audio server
+        vad_model (VAD | None): Already loaded VAD to use, created by the backend if not given
 
     Returns:
         AudioProtocol: An instance of the requested audio I/O system
@@ -63,6 +65,7 @@ def get_audio_system(
 
         return SoundDeviceAudioIO(
             vad_threshold=vad_threshold,
+            vad_model=vad_model,
         )
     elif backend_type == "network":
         from .network_io import NetworkAudioIO
@@ -71,6 +74,7 @@ def get_audio_system(
             host=network_host,
             port=network_port,
             vad_threshold=vad_threshold,
+            vad_model=vad_model,
         )
     elif backend_type == "websocket":
         raise ValueError("WebSocket audio backend is not yet implemented.")
@@ -10,6 +10,7 @@ The protocol is simple binary TCP:
 - Client → Server: Text messages: [0xFFFFFFFF][length][utf-8 text]
 - Server → Client: TTS audio chunks (variable size, prefixed with length)
 - Server → Client: Text messages: [0xFFFFFFFE][length][utf-8 text]
+- Server → Client: Partial transcription of ongoing speech: [0xFFFFFFF8][length][utf-8 text]
 
 With authentication enabled (v2.1+):
 - Client → Server: [AUTH_REQUEST][length][jwt_token] (first, on connect)
@@ -21,13 +22,14 @@ import socket
 import struct
 import threading
 import time
-from typing import Optional
+from typing import Callable, Optional
 
 from loguru import logger
 import numpy as np
 from numpy.typing import NDArray
 
 from . import VAD
+from .vad_batching import VADStream
 
 # Optional authentication support (v2.1+)
 try:
@@ -44,6 +46,7 @@ TEXT_MESSAGE_FROM_CLIENT = 0xFFFFFFFF
 TEXT_MESSAGE_TO_CLIENT = 0xFFFFFFFE
 USER_TRANSCRIPTION_TO_CLIENT = 0xFFFFFFFD  # Send ASR transcription back to client
 KEEPALIVE_TO_CLIENT = 0xFFFFFFFC
+PARTIAL_TRANSCRIPTION_TO_CLIENT = 0xFFFFFFF8  # Transcript so far while the user is still speaking
 
 
 class NetworkAudioIO:
@@ -67,12 +70,14 @@ class NetworkAudioIO:
         port: int = 5555,
         vad_threshold: float | None = None,
         auth_middleware: Optional["AuthenticationMiddleware"] = None,
+        vad_model: VAD | VADStream | None = None,
     ) -> None:
         self.host = host
         self.port = port
         self.vad_threshold = vad_threshold if vad_threshold else self.VAD_THRESHOLD
 
-        self._vad_model = VAD()
+        # A VAD may be handed in so that several connections share one ONNX session
+        self._vad_model = vad_model if vad_model is not None else VAD()
         self._sample_queue: queue.Queue[tuple[NDArray[np.float32], bool]] = queue.Queue()
         self._text_message_queue: queue.Queue[str] = queue.Queue()  # For text messages from client
 
@@ -93,10 +98,58 @@ class NetworkAudioIO:
         self._auth_middleware = auth_middleware
         self._connection_context: Optional["ConnectionContext"] = None
 
+        # Session mode: bound to a single, already accepted connection
+        self._attached = False
+        self.on_disconnect: Optional[Callable[[], None]] = None
+
+    @classmethod
+    def for_connection(
+        cls,
+        client_socket: socket.socket,
+        client_addr: tuple[str, int],
+        connection_context: Optional["ConnectionContext"] = None,
+        vad_model: VAD | VADStream | None = None,
+        vad_threshold: float | None = None,
+    ) -> "NetworkAudioIO":
+        """
+        Create an audio I/O bound to a client connection accepted elsewhere.
+
+        Used by the multi-session server: the server owns the listening socket and the
+        authentication handshake, and each accepted connection gets its own instance so
+        that every session has separate sample/text queues and playback state.
+
+        Args:
+            client_socket: Connected client socket (authentication already done)
+            client_addr: Remote address of the client
+            connection_context: Authenticated connection context, if any
+            vad_model: VAD for this stream, forked from a shared session or a BatchingVAD
+            vad_threshold: Threshold for VAD detection
+
+        Returns:
+            NetworkAudioIO serving only this connection
+        """
+        audio_io = cls(vad_threshold=vad_threshold, vad_model=vad_model)
+        audio_io._attached = True
+        audio_io._client_socket = client_socket
+        audio_io._client_addr = client_addr
+        audio_io._client_socket.settimeout(0.1)
+        audio_io._client_connected = True
+        audio_io._connection_context = connection_context
+        return audio_io
+
     def start_listening(self) -> None:
         """Start the TCP server and wait for client connection."""
         self._shutdown_event.clear()
-        
+
+        if self._attached:
+            # Connection already accepted by the session server, just start receiving
+            listen_thread = threading.Thread(target=self._serve_attached, daemon=True)
+            listen_thread.start()
+            self._listen_thread = listen_thread
+            self._keepalive_thread = threading.Thread(target=self._send_keepalives, daemon=True)
+            self._keepalive_thread.start()
+            return
+
         # Create server socket
         self._server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self._server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
@@ -174,72 +227,8 @@ class NetworkAudioIO:
                 self._connection_context = None
             # ========================================================================
 
-            # Receive audio chunks and text messages
-            buffer = b""
-            chunk_size = self.CHUNK_SAMPLES * 2  # int16 = 2 bytes
-            chunk_count = 0
-            
-            while not self._shutdown_event.is_set():
-                try:
-                    data = self._client_socket.recv(4096)
-                    if not data:
-                        logger.info("Client disconnected")
-                        break
-                    
-                    buffer += data
-                    
-                    # Check for text message header first (8 bytes: marker + length)
-                    while len(buffer) >= 8:
-                        # Peek at potential marker
-                        potential_marker = struct.unpack("<I", buffer[:4])[0]
-                        
-                        if potential_marker == TEXT_MESSAGE_FROM_CLIENT:
-                            # Text message: [0xFFFFFFFF][length][utf-8 text]
-                            text_length = struct.unpack("<I", buffer[4:8])[0]
-                            total_msg_size = 8 + text_length
-                            
-                            if len(buffer) < total_msg_size:
-                                break  # Wait for more data
-                            
-                            text_bytes = buffer[8:total_msg_size]
-                            buffer = buffer[total_msg_size:]
-                            
-                            text = text_bytes.decode('utf-8', errors='replace')
-                            logger.success(f"Received text message: '{text}'")
-                            self._text_message_queue.put(text)
-                            continue
-                        
-                        # Not a text message - process as audio chunk
-                        if len(buffer) < chunk_size:
-                            break
-                        
-                        chunk_bytes = buffer[:chunk_size]
-                        buffer = buffer[chunk_size:]
-                        
-                        # Convert to float32 [-1, 1]
-                        audio_int16 = np.frombuffer(chunk_bytes, dtype=np.int16)
-                        audio_float = audio_int16.astype(np.float32) / 32768.0
-                        
-                        # Run VAD
-                        vad_value = self._vad_model(np.expand_dims(audio_float, 0))
-                        vad_confidence = bool(vad_value > self.vad_threshold)
-                        
-                        self._sample_queue.put((audio_float, vad_confidence))
-                        
-                        chunk_count += 1
-                        if chunk_count % 100 == 0:
-                            max_val = np.max(np.abs(audio_float))
-                            logger.debug(f"Received {chunk_count} chunks, max={max_val:.3f}, vad={vad_value:.3f}")
-                        
-                except socket.timeout:
-                    continue
-                except (OSError, ConnectionResetError) as e:
-                    logger.error(f"Client connection lost: {e}")
-                    break
-                except Exception as e:
-                    logger.error(f"Client connection error: {e}")
-                    break
-            
+            self._receive_loop()
+
             # Cleanup after disconnect - loop back to accept new client
             logger.warning("Client disconnected - cleaning up socket")
             self._client_connected = False
@@ -253,6 +242,91 @@ class NetworkAudioIO:
 
             logger.info("Ready for new client connection")
 
+    def _serve_attached(self) -> None:
+        """Receive from the attached connection until it closes, then notify the owner."""
+        logger.success(f"Session connected from {self._client_addr}")
+        try:
+            self._receive_loop()
+        finally:
+            self._client_connected = False
+            if self._client_socket:
+                try:
+                    self._client_socket.close()
+                except OSError:
+                    pass
+                self._client_socket = None
+            logger.info(f"Session from {self._client_addr} closed")
+            if self.on_disconnect and not self._shutdown_event.is_set():
+                self.on_disconnect()
+
+    def _receive_loop(self) -> None:
+        """Receive audio chunks and text messages from the current client until it disconnects."""
+        buffer = b""
+        chunk_size = self.CHUNK_SAMPLES * 2  # int16 = 2 bytes
+        chunk_count = 0
+        
+        while not self._shutdown_event.is_set():
+            try:
+                data = self._client_socket.recv(4096)
+                if not data:
+                    logger.info("Client disconnected")
+                    break
+                
+                buffer += data
+                
+                # Check for text message header first (8 bytes: marker + length)
+                while len(buffer) >= 8:
+                    # Peek at potential marker
+                    potential_marker = struct.unpack("<I", buffer[:4])[0]
+                    
+                    if potential_marker == TEXT_MESSAGE_FROM_CLIENT:
+                        # Text message: [0xFFFFFFFF][length][utf-8 text]
+                        text_length = struct.unpack("<I", buffer[4:8])[0]
+                        total_msg_size = 8 + text_length
+                        
+                        if len(buffer) < total_msg_size:
+                            break  # Wait for more data
+                        
+                        text_bytes = buffer[8:total_msg_size]
+                        buffer = buffer[total_msg_size:]
+                        
+                        text = text_bytes.decode('utf-8', errors='replace')
+                        logger.success(f"Received text message: '{text}'")
+                        self._text_message_queue.put(text)
+                        continue
+                    
+                    # Not a text message - process as audio chunk
+                    if len(buffer) < chunk_size:
+                        break
+                    
+                    chunk_bytes = buffer[:chunk_size]
+                    buffer = buffer[chunk_size:]
+                    
+                    # Convert to float32 [-1, 1]
+                    audio_int16 = np.frombuffer(chunk_bytes, dtype=np.int16)
+                    audio_float = audio_int16.astype(np.float32) / 32768.0
+                    
+                    # Run VAD
+                    vad_value = self._vad_model(np.expand_dims(audio_float, 0))
+                    vad_confidence = bool(vad_value > self.vad_threshold)
+                    
+                    self._sample_queue.put((audio_float, vad_confidence))
+                    
+                    chunk_count += 1
+                    if chunk_count % 100 == 0:
+                        max_val = np.max(np.abs(audio_float))
+                        logger.debug(f"Received {chunk_count} chunks, max={max_val:.3f}, vad={vad_value:.3f}")
+                    
+            except socket.timeout:
+                continue
+            except (OSError, ConnectionResetError) as e:
+                logger.error(f"Client connection lost: {e}")
+                break
+            except Exception as e:
+                logger.error(f"Client connection error: {e}")
+                break
+        
+
     def stop_listening(self) -> None:
         """Stop the server and close connections."""
         self._shutdown_event.set()
@@ -271,7 +345,7 @@ class NetworkAudioIO:
                 pass
             self._server_socket = None
         
-        if self._listen_thread:
+        if self._listen_thread and self._listen_thread is not threading.current_thread():
             self._listen_thread.join(timeout=2.0)
             self._listen_thread = None
 
@@ -393,6 +467,21 @@ class NetworkAudioIO:
         except (OSError, BrokenPipeError) as e:
             logger.error(f"Failed to send user transcription: {e}")
 
+    def send_partial_transcription(self, text: str) -> None:
+        """Send the transcript of speech still in progress; the final one follows with `send_user_transcription`."""
+        if not self._client_connected or self._client_socket is None:
+            return
+
+        text_bytes = text.encode('utf-8')
+        # Protocol: [0xFFFFFFF8][length][utf-8 text]
+        header = struct.pack("<II", PARTIAL_TRANSCRIPTION_TO_CLIENT, len(text_bytes))
+
+        try:
+            with self._playback_lock:
+                self._client_socket.sendall(header + text_bytes)
+        except (OSError, BrokenPipeError) as e:
+            logger.error(f"Failed to send partial transcription: {e}")
+
     def get_connection_context(self) -> Optional["ConnectionContext"]:
         """
         Get the current connection's authentication context.
@@ -406,3 +495,14 @@ class NetworkAudioIO:
         Use this to access user_id for memory isolation and permissions for RBAC.
         """
         return self._connection_context
+
+    def get_client_host(self) -> str | None:
+        """
+        Get the host address of the connected client.
+
+        Returns:
+            The client's IP address, or None if no client is connected. Unlike the session
+            id it stays the same across reconnects and restarts, so it identifies a client
+            for memory isolation when authentication is disabled.
+        """
+        return self._client_addr[0] if self._client_addr else None
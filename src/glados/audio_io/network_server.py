@@ -0,0 +1,253 @@
+"""
+Multi-session network server for GLaDOS.
+
+NetworkAudioIO serves exactly one client. This module owns the listening socket
+instead and hands every accepted (and authenticated) connection to a session
+factory as its own NetworkAudioIO, so several clients can talk to GLaDOS at the
+same time. All sessions share one VAD ONNX session; each gets forked stream state,
+or a stream of a BatchingVAD that runs the sessions' chunks together.
+
+Connections beyond `max_sessions` receive a text message explaining that the
+server is busy and are closed.
+"""
+
+import socket
+import struct
+import threading
+from typing import Callable, Optional
+
+from loguru import logger
+
+from . import VAD
+from .network_io import TEXT_MESSAGE_TO_CLIENT, NetworkAudioIO
+from .vad_batching import BatchingVAD
+
+# Optional authentication support (v2.1+)
+try:
+    from ..auth import AuthenticationMiddleware, ConnectionContext
+except ImportError:
+    AuthenticationMiddleware = None  # type: ignore
+    ConnectionContext = None  # type: ignore
+
+
+# Builds a session for a connection and returns the function that ends it (or None)
+SessionFactory = Callable[[NetworkAudioIO, str], Optional[Callable[[], None]]]
+
+
+class NetworkSessionServer:
+    """Accepts concurrent TCP clients and starts one session per connection.
+
+    The session factory is called from a handshake thread with a NetworkAudioIO
+    already bound to the connection and a session id. It builds the per-session
+    pipeline and returns a callable that tears the session down; the server then
+    starts receiving on the connection. When the client goes away the slot is
+    released and that callable is invoked.
+    """
+
+    HANDSHAKE_TIMEOUT: float = 10.0  # Seconds a client has to authenticate
+    BUSY_MESSAGE: str = "Server is busy, too many active sessions. Try again later."
+
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        host: str = "0.0.0.0",
+        port: int = 5555,
+        max_sessions: int = 4,
+        vad_threshold: float | None = None,
+        auth_middleware: Optional["AuthenticationMiddleware"] = None,
+        vad_model: VAD | BatchingVAD | None = None,
+    ) -> None:
+        """
+        Initialize the session server.
+
+        Args:
+            session_factory: Called with the NetworkAudioIO and id of every accepted connection
+            host: Host to bind
+            port: Port to bind
+            max_sessions: Maximum number of concurrently active sessions
+            vad_threshold: Threshold for VAD detection, passed to every session
+            auth_middleware: Optional authentication performed before a session starts
+            vad_model: Shared VAD whose ONNX session is reused by all sessions, or a BatchingVAD
+        """
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+
+        self.host = host
+        self.port = port
+        self.max_sessions = max_sessions
+        self.vad_threshold = vad_threshold
+
+        self._session_factory = session_factory
+        self._auth_middleware = auth_middleware
+        self._vad_model = vad_model if vad_model is not None else VAD()
+
+        self._server_socket: Optional[socket.socket] = None
+        self._accept_thread: Optional[threading.Thread] = None
+        self._shutdown_event = threading.Event()
+
+        self._sessions_lock = threading.Lock()
+        self._active_sessions: dict[int, NetworkAudioIO | None] = {}  # None while the session is being set up
+        self._next_session_id = 0
+        self._rejected_connections = 0
+
+    @property
+    def active_sessions(self) -> int:
+        """Number of sessions currently connected."""
+        with self._sessions_lock:
+            return len(self._active_sessions)
+
+    def start(self) -> None:
+        """Bind the listening socket and start accepting clients in the background."""
+        self._shutdown_event.clear()
+
+        self._server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server_socket.bind((self.host, self.port))
+        self.port = self._server_socket.getsockname()[1]  # Resolve port 0 to the bound port
+        self._server_socket.listen(self.max_sessions * 2)
+        self._server_socket.settimeout(1.0)  # Allow checking shutdown
+
+        logger.info(
+            f"Network session server listening on {self.host}:{self.port} (max {self.max_sessions} sessions)"
+        )
+
+        self._accept_thread = threading.Thread(target=self._accept_loop, name="SessionAccept", daemon=True)
+        self._accept_thread.start()
+
+    def stop(self) -> None:
+        """Stop accepting clients and close every active session."""
+        self._shutdown_event.set()
+
+        if self._server_socket:
+            try:
+                self._server_socket.close()
+            except OSError:
+                pass
+            self._server_socket = None
+
+        with self._sessions_lock:
+            sessions = list(self._active_sessions.values())
+            self._active_sessions.clear()
+
+        for audio_io in sessions:
+            if audio_io is not None:
+                audio_io.stop_listening()
+
+        if self._accept_thread:
+            self._accept_thread.join(timeout=2.0)
+            self._accept_thread = None
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get connection statistics.
+
+        Returns:
+            dict: Active sessions, configured maximum and rejected connection count
+        """
+        with self._sessions_lock:
+            return {
+                "active_sessions": len(self._active_sessions),
+                "max_sessions": self.max_sessions,
+                "total_sessions": self._next_session_id,
+                "rejected_connections": self._rejected_connections,
+            }
+
+    def _accept_loop(self) -> None:
+        """Accept connections and hand each one to a handshake thread."""
+        while not self._shutdown_event.is_set():
+            try:
+                client_socket, client_addr = self._server_socket.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+
+            logger.info(f"Connection from {client_addr}")
+            # Authentication may block for a while, never let it stall other clients
+            threading.Thread(
+                target=self._handshake,
+                args=(client_socket, client_addr),
+                name=f"SessionHandshake-{client_addr[1]}",
+                daemon=True,
+            ).start()
+
+    def _handshake(self, client_socket: socket.socket, client_addr: tuple[str, int]) -> None:
+        """Authenticate a connection, reserve a session slot and start the session."""
+        connection_context = None
+        if self._auth_middleware:
+            client_socket.settimeout(self.HANDSHAKE_TIMEOUT)
+            connection_context = self._auth_middleware.authenticate_connection(client_socket)
+            if not connection_context:
+                logger.warning(f"Authentication failed for {client_addr}, closing connection")
+                self._close_socket(client_socket)
+                return
+            logger.success(f"Authenticated {client_addr} as: {connection_context.username}")
+
+        # Check and reserve under one lock so simultaneous handshakes cannot exceed the cap
+        with self._sessions_lock:
+            if len(self._active_sessions) >= self.max_sessions:
+                self._rejected_connections += 1
+                session_id = None
+            else:
+                session_id = self._next_session_id
+                self._next_session_id += 1
+                self._active_sessions[session_id] = None
+
+        if session_id is None:
+            logger.warning(f"Rejecting {client_addr}: {self.max_sessions} sessions already active")
+            self._reject(client_socket)
+            return
+
+        # Only sessions holding a slot get VAD stream state
+        audio_io = NetworkAudioIO.for_connection(
+            client_socket,
+            client_addr,
+            connection_context=connection_context,
+            vad_model=self._vad_model.fork(),
+            vad_threshold=self.vad_threshold,
+        )
+        with self._sessions_lock:
+            stopped = session_id not in self._active_sessions  # Server stopped during set-up
+            if not stopped:
+                self._active_sessions[session_id] = audio_io
+        if stopped:
+            audio_io.stop_listening()
+            return
+
+        end_session: Optional[Callable[[], None]] = None
+
+        def release() -> None:
+            with self._sessions_lock:
+                self._active_sessions.pop(session_id, None)
+            logger.info(f"Session {session_id} released ({self.active_sessions}/{self.max_sessions} active)")
+            if end_session:
+                end_session()
+
+        audio_io.on_disconnect = release
+
+        try:
+            end_session = self._session_factory(audio_io, str(session_id))
+        except Exception as e:
+            logger.error(f"Failed to start session {session_id} for {client_addr}: {e}")
+            with self._sessions_lock:
+                self._active_sessions.pop(session_id, None)
+            audio_io.stop_listening()
+            return
+
+        audio_io.start_listening()
+
+    def _reject(self, client_socket: socket.socket) -> None:
+        """Tell a client that the server is full and close its connection."""
+        text_bytes = self.BUSY_MESSAGE.encode("utf-8")
+        try:
+            client_socket.sendall(struct.pack("<II", TEXT_MESSAGE_TO_CLIENT, len(text_bytes)) + text_bytes)
+        except OSError:
+            pass
+        self._close_socket(client_socket)
+
+    @staticmethod
+    def _close_socket(client_socket: socket.socket) -> None:
+        try:
+            client_socket.close()
+        except OSError:
+            pass
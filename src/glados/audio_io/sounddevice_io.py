@@ -29,11 +29,12 @@ class SoundDeviceAudioIO:
     VAD_SIZE: int = 32  # Milliseconds of sample for Voice Activity Detection (VAD)
     VAD_THRESHOLD: float = 0.8  # Threshold for VAD detection
 
-    def __init__(self, vad_threshold: float | None = None) -> None:
+    def __init__(self, vad_threshold: float | None = None, vad_model: VAD | None = None) -> None:
         """Initialize the sounddevice audio I/O.
 
         Args:
             vad_threshold: Threshold for VAD detection (default: 0.8)
+            vad_model: Already loaded VAD, created if not given
 
         Raises:
             ImportError: If the sounddevice module is not available
@@ -47,7 +48,7 @@ class SoundDeviceAudioIO:
         if not 0 <= self.vad_threshold <= 1:
             raise ValueError("VAD threshold must be between 0 and 1")
 
-        self._vad_model = VAD()
+        self._vad_model = vad_model if vad_model is not None else VAD()
 
         self._sample_queue: queue.Queue[tuple[NDArray[np.float32], bool]] = queue.Queue()
         self.input_stream: sd.InputStream | None = None
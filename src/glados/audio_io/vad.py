@@ -4,6 +4,7 @@ import numpy as np
 from numpy.typing import NDArray
 import onnxruntime as ort  # type: ignore
 
+from ..utils.onnx_sessions import IOBoundSession, create_session, resolve_profile
 from ..utils.resources import resource_path
 
 # Default OnnxRuntime is way to verbose, only show fatal errors
@@ -21,21 +22,13 @@ class VAD:
             model_path (str, optional): Path to the ONNX VAD model. Defaults to VAD_MODEL.
 
         Notes:
-            - Configures ONNX runtime providers, excluding TensorrtExecutionProvider
-            - Sets up inference session with the specified model
+            - Creates the inference session with the "vad" session profile
             - Initializes internal state variables for processing audio chunks
+            - With `io_binding` in the profile, chunks run through persistent bound buffers
         """
-        providers = ort.get_available_providers()
-        if "TensorrtExecutionProvider" in providers:
-            providers.remove("TensorrtExecutionProvider")
-        if "CoreMLExecutionProvider" in providers:
-            providers.remove("CoreMLExecutionProvider")
-
-        self.ort_sess = ort.InferenceSession(
-            model_path,
-            sess_options=ort.SessionOptions(),
-            providers=providers,
-        )
+        self.ort_sess = create_session("vad", model_path)
+        self.io_binding = bool(resolve_profile("vad").io_binding)
+        self._bound: IOBoundSession | None = None
 
         self.avaliable_sample_rates = [8000, 16000]
 
@@ -46,6 +39,34 @@ class VAD:
 
         self.reset_states()
 
+    def fork(self) -> "VAD":
+        """Create a VAD for another audio stream that shares this instance's ONNX session.
+
+        The inference session is the expensive part of a VAD and is safe to call from
+        several threads, while the recurrent state and context are per stream. Forking
+        lets every network session run its own VAD without loading the model again.
+
+        Returns:
+            VAD: A new instance with fresh stream state bound to the same session.
+        """
+        clone = VAD.__new__(VAD)
+        clone.ort_sess = self.ort_sess
+        clone.io_binding = self.io_binding
+        clone._bound = None  # Bound buffers hold stream state, every stream has its own
+        clone.avaliable_sample_rates = list(self.avaliable_sample_rates)
+        clone.reset_states()
+        return clone
+
+    def warm_up(self, chunks: int = 8) -> None:
+        """Run a few chunks of silence through the model, then clear the stream state.
+
+        Args:
+            chunks (int): Number of 32 ms chunks to run. Defaults to 8.
+        """
+        num_samples = 512 if self.SAMPLE_RATE == 16000 else 256
+        self.audio_forward(np.zeros((1, num_samples * chunks), dtype=np.float32), self.SAMPLE_RATE)
+        self.reset_states()
+
     def reset_states(self, batch_size: int = 1) -> None:
         self._state = np.zeros((2, batch_size, 128), dtype=np.float32)
         self._context = np.zeros(0, dtype=np.float32)
@@ -86,9 +107,10 @@ class VAD:
         if not len(self._context):
             self._context = np.zeros((batch_size, context_size), dtype=np.float32)
 
-        audio_sample = np.concatenate([self._context, audio_sample], axis=1)
-
-        if sample_rate in [8000, 16000]:
+        if sample_rate in [8000, 16000] and self.io_binding:
+            out = self._run_bound(audio_sample, sample_rate, context_size)
+        elif sample_rate in [8000, 16000]:
+            audio_sample = np.concatenate([self._context, audio_sample], axis=1)
             ort_inputs = {
                 "input": audio_sample.astype(np.float32),
                 "state": self._state,
@@ -99,15 +121,49 @@ class VAD:
             state: NDArray[np.float32]
             out, state = ort_outs
             self._state = state
+            self._context = audio_sample[..., -context_size:]
         else:
             raise ValueError()
 
-        self._context = audio_sample[..., -context_size:]
         self._last_sr = sample_rate
         self._last_batch_size = batch_size
 
         return np.squeeze(out)
 
+    def _run_bound(
+        self, audio_sample: NDArray[np.float32], sample_rate: int, context_size: int
+    ) -> NDArray[np.float32]:
+        """Run one chunk through the persistent buffers bound to the session.
+
+        The chunk is written after the context in the bound input buffer, and the new
+        state is copied back into the bound state buffer, so no arrays are allocated
+        for the model call. Buffers are bound again when the batch size or sample rate
+        changes.
+
+        Returns:
+            NDArray[np.float32]: A copy of the model output, shape (batch_size, 1).
+        """
+        bound = self._bound
+        shape = (audio_sample.shape[0], context_size + audio_sample.shape[-1])
+        if bound is None or bound.inputs["input"].shape != shape or bound.inputs["sr"] != sample_rate:
+            example = {
+                "input": np.zeros(shape, dtype=np.float32),
+                "state": self._state,
+                "sr": np.array(sample_rate, dtype=np.int64),
+            }
+            bound = self._bound = IOBoundSession.from_example(self.ort_sess, example)
+
+        chunk, state = bound.inputs["input"], bound.inputs["state"]
+        chunk[:, :context_size] = self._context
+        chunk[:, context_size:] = audio_sample
+        if self._state is not state:  # New stream state after a reset
+            state[...] = self._state
+        out, new_state = bound.run()
+        state[...] = new_state
+        self._state = state
+        self._context = chunk[:, -context_size:].copy()
+        return out.copy()
+
     def audio_forward(self, x: NDArray[np.float32], sample_rate: int = SAMPLE_RATE) -> NDArray[np.float32]:
         """Process an audio signal and return the VAD output.
 
@@ -0,0 +1,207 @@
+"""
+Voice activity detection of many audio streams in batches, for a VAD shared by network sessions.
+
+Every network session runs the VAD on each 32 ms chunk inside its receive loop. Forked
+VADs share the ONNX session but still make one `run()` per chunk and stream, so the per-call
+overhead of ONNX Runtime grows with the number of clients. `BatchingVAD` keeps the
+recurrent state and context of every stream in a `VADStream` handle and hands the chunks to
+one worker thread, which stacks all chunks waiting at the same time into the batch dimension
+of the model: one `run()` per tick, whatever the number of streams.
+"""
+
+from concurrent.futures import Future
+import queue
+import threading
+import time
+
+from loguru import logger
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import BaseModel
+
+from .vad import VAD
+
+# A stream's chunk, its sample rate and the future receiving its speech probability
+VADRequest = tuple["VADStream", NDArray[np.float32], int, "Future[NDArray[np.float32]]"]
+
+
+class VADBatchingConfig(BaseModel):
+    """Configuration of batched voice activity detection for network sessions."""
+
+    enabled: bool = False
+    max_batch_size: int = 32  # Chunks (one per stream) run through the model at once
+    max_wait_ms: float = 0.0  # Wait this long for other streams' chunks before running a lone one
+
+    class Config:
+        extra = "ignore"
+
+
+class VADStream:
+    """
+    Per-stream state of a BatchingVAD, used in place of a VAD by one audio source.
+
+    Calls block until the chunk has been run, possibly together with other streams' chunks.
+    """
+
+    def __init__(self, batcher: "BatchingVAD") -> None:
+        self.batcher = batcher
+        self._state: NDArray[np.float32]
+        self._context: NDArray[np.float32]
+        self._last_sr: int
+        self.reset_states()
+
+    def fork(self) -> "VADStream":
+        """Create a stream with fresh state on the same batcher."""
+        return self.batcher.fork()
+
+    def reset_states(self, batch_size: int = 1) -> None:
+        self._state = np.zeros((2, batch_size, 128), dtype=np.float32)
+        self._context = np.zeros(0, dtype=np.float32)
+        self._last_sr = 0
+
+    def __call__(self, audio_sample: NDArray[np.float32], sample_rate: int = VAD.SAMPLE_RATE) -> NDArray[np.float32]:
+        """
+        Run one chunk of this stream through the shared model.
+
+        Args:
+            audio_sample: Audio samples with shape (channels, 512) at 16 kHz or (channels, 256) at 8 kHz
+            sample_rate: Sample rate of the audio samples
+
+        Returns:
+            NDArray[np.float32]: Speech probability per channel, squeezed like `VAD.__call__`
+
+        Raises:
+            ValueError: If the number of samples or the sample rate is not supported
+        """
+        return self.batcher.submit(self, audio_sample, sample_rate)
+
+
+class BatchingVAD:
+    """
+    Runs the chunks of several VADStreams that arrive at the same time in one batched model call.
+
+    Stands in for the shared VAD of the network server: `fork()` hands out a new stream.
+    """
+
+    def __init__(self, vad: VAD, config: VADBatchingConfig) -> None:
+        """
+        Parameters:
+            vad: Loaded VAD whose ONNX session is shared by all streams
+            config: Batch size and wait time
+        """
+        self.ort_sess = vad.ort_sess
+        self.max_batch_size = max(1, config.max_batch_size)
+        self.max_wait = config.max_wait_ms / 1000
+        self._closed = False
+        self._close_lock = threading.Lock()  # No chunk may be queued behind the stop sentinel
+        self._requests: queue.Queue[VADRequest | None] = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="VADBatcher", daemon=True)
+        self._worker.start()
+
+    def fork(self) -> VADStream:
+        """Create the VAD of a new audio stream."""
+        return VADStream(self)
+
+    def submit(
+        self, stream: VADStream, audio_sample: NDArray[np.float32], sample_rate: int = VAD.SAMPLE_RATE
+    ) -> NDArray[np.float32]:
+        """Queue a chunk of a stream for the next batch and wait for its speech probability."""
+        num_samples = 512 if sample_rate == 16000 else 256
+        if sample_rate not in (8000, 16000):
+            raise ValueError(f"Unsupported sample rate {sample_rate} (Supported values: 8000, 16000)")
+        if audio_sample.shape[-1] != num_samples:
+            raise ValueError(
+                f"Provided number of samples is {audio_sample.shape[-1]} "
+                f"(Supported values: 256 for 8000 sample rate, 512 for 16000)"
+            )
+        future: Future[NDArray[np.float32]] = Future()
+        with self._close_lock:
+            queued = not self._closed
+            if queued:
+                self._requests.put((stream, audio_sample, sample_rate, future))
+        if not queued:  # Receive loops still finishing after shutdown
+            return self.process([stream], [audio_sample], sample_rate)[0]
+        return future.result()
+
+    def process(
+        self, streams: list[VADStream], chunks: list[NDArray[np.float32]], sample_rate: int = VAD.SAMPLE_RATE
+    ) -> list[NDArray[np.float32]]:
+        """
+        Run one chunk of each stream in a single model call and advance every stream's state.
+
+        Every stream may appear only once. States are stacked along the batch dimension of the
+        model ("state" is (2, batch, 128)), the context of each stream is put in front of its
+        chunk, and the new states and contexts are split back to the streams.
+
+        Args:
+            streams: Streams the chunks belong to
+            chunks: Audio of each stream with shape (channels, samples)
+            sample_rate: Sample rate shared by all chunks
+
+        Returns:
+            list[NDArray[np.float32]]: Speech probabilities of each stream, squeezed like `VAD.__call__`
+        """
+        context_size = 64 if sample_rate == 16000 else 32
+        sizes = [chunk.shape[0] for chunk in chunks]
+        for stream, size in zip(streams, sizes, strict=True):
+            if stream._last_sr != sample_rate or stream._state.shape[1] != size:
+                stream.reset_states(size)
+            if not len(stream._context):
+                stream._context = np.zeros((size, context_size), dtype=np.float32)
+
+        contexts = np.concatenate([stream._context for stream in streams])
+        audio = np.concatenate([contexts, np.concatenate(chunks).astype(np.float32, copy=False)], axis=1)
+        ort_inputs = {
+            "input": audio,
+            "state": np.concatenate([stream._state for stream in streams], axis=1),
+            "sr": np.array(sample_rate, dtype=np.int64),
+        }
+        out, state = self.ort_sess.run(None, ort_inputs)
+
+        results = []
+        offsets = np.cumsum([0, *sizes])
+        for stream, start, end in zip(streams, offsets[:-1], offsets[1:], strict=True):
+            stream._state = state[:, start:end]  # Views, the next batch concatenates them anyway
+            stream._context = audio[start:end, -context_size:]
+            stream._last_sr = sample_rate
+            results.append(np.squeeze(out[start:end]))
+        return results
+
+    def close(self) -> None:
+        """Run the chunks already submitted and stop the worker; later chunks run directly."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._requests.put(None)
+        self._worker.join()
+
+    def _run(self) -> None:
+        while (request := self._requests.get()) is not None:
+            batch = [request]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    request = self._requests.get(timeout=remaining) if remaining > 0 else self._requests.get_nowait()
+                except queue.Empty:
+                    break
+                if request is None:
+                    self._detect(batch)
+                    return
+                batch.append(request)
+            self._detect(batch)
+
+    def _detect(self, batch: list[VADRequest]) -> None:
+        # Streams wait for their result, so each one has at most one chunk in a batch
+        for sample_rate in {request[2] for request in batch}:
+            group = [request for request in batch if request[2] == sample_rate]
+            try:
+                results = self.process([r[0] for r in group], [r[1] for r in group], sample_rate)
+            except Exception as e:
+                logger.error(f"Batched VAD failed for {len(group)} streams: {e}")
+                for *_, future in group:
+                    future.set_exception(e)
+                continue
+            for (*_, future), result in zip(group, results, strict=True):
+                future.set_result(result)
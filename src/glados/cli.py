@@ -1,19 +1,21 @@
 import argparse
-import asyncio
 from hashlib import sha256
 from pathlib import Path
 import sys
+from typing import TYPE_CHECKING
 
-import httpx
 from rich import print as rprint
-from rich.progress import BarColumn, DownloadColumn, Progress, TextColumn
-import sounddevice as sd  # type: ignore
 
-from .core.engine import Glados, GladosConfig
-from .TTS import tts_glados
 from .utils import spoken_text_converter as stc
 from .utils.resources import resource_path
 
+if TYPE_CHECKING:
+    import httpx
+    from rich.progress import Progress
+
+# The engine, the models (onnxruntime, numba), sounddevice and httpx are imported by the
+# commands that use them, so `glados --help` and the lightweight commands start quickly.
+
 # Type aliases for clarity
 FileHash = str
 FileURL = str
@@ -63,11 +65,11 @@ MODEL_DETAILS: dict[FileName, dict[FileURL, FileHash]] = {
 
 
 async def download_with_progress(
-    client: httpx.AsyncClient,
+    client: "httpx.AsyncClient",
     url: str,
     file_path: Path,
     expected_checksum: str,
-    progress: Progress,
+    progress: "Progress",
 ) -> bool:
     """
     Download a single file with progress tracking and SHA-256 checksum verification.
@@ -121,6 +123,11 @@ async def download_models() -> int:
     Returns:
         int: Exit code (0 for success, 1 for failure)
     """
+    import asyncio
+
+    import httpx
+    from rich.progress import BarColumn, DownloadColumn, Progress, TextColumn
+
     with Progress(
         TextColumn("[grey50][progress.description]{task.description}"),
         BarColumn(),
@@ -178,6 +185,10 @@ def say(text: str, config_path: str | Path = "glados_config.yaml") -> None:
     Example:
         say("Hello, world!")  # Speaks the text using GLaDOS voice
     """
+    import sounddevice as sd  # type: ignore
+
+    from .TTS import tts_glados
+
     glados_tts = tts_glados.SpeechSynthesizer()
     converter = stc.SpokenTextConverter()
     converted_text = converter.text_to_spoken(text)
@@ -189,6 +200,154 @@ def say(text: str, config_path: str | Path = "glados_config.yaml") -> None:
     sd.wait()
 
 
+def prewarm_tts(config_path: str | Path = "glados_config.yaml", phrases_path: str | Path | None = None) -> int:
+    """
+    Synthesize frequent phrases into the TTS audio cache ahead of time.
+
+    The announcement and the fixed LLM error replies are always included; a phrases file
+    adds one sentence per line (blank lines and lines starting with # are skipped).
+
+    Parameters:
+        config_path (str | Path, optional): Path to the configuration YAML file with `tts_cache` enabled
+        phrases_path (str | Path | None, optional): Text file of additional phrases
+
+    Returns:
+        int: Exit code, 1 if the cache is disabled in the configuration
+    """
+    from .core.engine import Glados, GladosConfig
+    from .core.llm_processor import LanguageModelProcessor
+    from .TTS.audio_cache import CachedSpeechSynthesizer
+
+    glados_config = GladosConfig.from_yaml(str(config_path))
+    if not glados_config.tts_cache.enabled:
+        rprint("[red]tts_cache is not enabled in the configuration, nothing to prewarm[/red]")
+        return 1
+
+    phrases = [glados_config.announcement] if glados_config.announcement else []
+    phrases += LanguageModelProcessor.ERROR_REPLIES
+    if phrases_path:
+        lines = Path(phrases_path).read_text(encoding="utf-8").splitlines()
+        phrases += [line.strip() for line in lines if line.strip() and not line.lstrip().startswith("#")]
+
+    tts_model = Glados.load_tts_model(glados_config)
+    assert isinstance(tts_model, CachedSpeechSynthesizer)
+    converter = stc.SpokenTextConverter()
+    # Same conversion as TextToSpeechSynthesizer, so the cache keys match at runtime
+    synthesized = tts_model.prewarm(converter.text_to_spoken(phrase) for phrase in phrases)
+    tts_model.close()
+
+    stats = tts_model.stats()
+    rprint(
+        f"Prewarmed {len(phrases)} phrases: {synthesized} synthesized, {len(phrases) - synthesized} already cached "
+        f"({stats['disk_entries']} entries, {stats['disk_bytes'] / 1e6:.1f} MB on disk)"
+    )
+    return 0
+
+
+def warm_cache(config_path: str | Path = "glados_config.yaml") -> int:
+    """
+    Build the ONNX optimized graph cache ahead of time.
+
+    Loads every model the configuration uses (ASR, VAD, phonemizer and voice) once, so each
+    optimized graph is saved to `onnx.graph_cache_dir` and `glados start` loads it directly.
+
+    Parameters:
+        config_path (str | Path, optional): Path to the configuration YAML file with `onnx.graph_cache_dir` set
+
+    Returns:
+        int: Exit code, 1 if the graph cache is disabled in the configuration
+    """
+    from .core.engine import Glados, GladosConfig
+    from .utils.onnx_sessions import session_profiles
+
+    glados_config = GladosConfig.from_yaml(str(config_path))
+    if not glados_config.onnx.graph_cache_dir:
+        rprint("[red]onnx.graph_cache_dir is not set in the configuration, nothing to warm[/red]")
+        return 1
+
+    Glados.load_all_models(glados_config)
+
+    for model, info in session_profiles().items():
+        rprint(f"{model:>16}: {info['graph_cache']:>4} in {info['load_seconds']:.2f}s on {info['providers'][0]}")
+    rprint(f"Optimized graphs are in {glados_config.onnx.graph_cache_dir}")
+    return 0
+
+
+QUANTIZABLE_MODELS = ("asr_ctc", "asr_tdt", "tts_glados")
+
+
+def quantize(
+    models: list[str],
+    variant: str = "int8_dynamic",
+    calibration_audio: list[str] | None = None,
+    calibration_text: str | Path | None = None,
+) -> int:
+    """
+    Write INT8 variants of the ASR and TTS models, selected with `asr_quantization`/`tts_quantization`.
+
+    Dynamic variants quantize the MatMul/Gemm weights of the transformer-style layers; static
+    variants also quantize activations and convolutions, calibrated by running the original
+    models on the calibration audio (ASR) and sentences (TTS).
+
+    Parameters:
+        models (list[str]): Models to quantize, from QUANTIZABLE_MODELS ("asr_tdt" quantizes the encoder)
+        variant (str, optional): "int8_dynamic" or "int8_static"
+        calibration_audio (list[str] | None, optional): 16 kHz speech files, defaults to data/0.wav
+        calibration_text (str | Path | None, optional): Text file with one sentence per line, in
+            addition to the LLM error replies
+
+    Returns:
+        int: Exit code, 1 if quantization is not available
+    """
+    from .core.llm_processor import LanguageModelProcessor
+    from .TTS import tts_glados
+    from .utils import quantization as q
+
+    if not q.QUANTIZATION_AVAILABLE:
+        rprint("[red]Quantization needs the 'onnx' package: pip install onnx[/red]")
+        return 1
+
+    audio_files = [Path(f) for f in calibration_audio] if calibration_audio else [resource_path("data/0.wav")]
+    sentences = list(LanguageModelProcessor.ERROR_REPLIES)
+    if calibration_text:
+        lines = Path(calibration_text).read_text(encoding="utf-8").splitlines()
+        sentences += [line.strip() for line in lines if line.strip() and not line.lstrip().startswith("#")]
+    op_types = ["MatMul", "Gemm", "Attention"] if variant == "int8_dynamic" else None
+
+    for model in models:
+        feeds = None
+        if model == "asr_ctc":
+            from .ASR.ctc_asr import AudioTranscriber as CTCTranscriber
+
+            model_path = CTCTranscriber.DEFAULT_MODEL_PATH
+            if variant == "int8_static":
+                ctc = CTCTranscriber()
+                feeds = q.record_feeds(ctc, "session", lambda: [ctc.transcribe_file(f) for f in audio_files])
+        elif model == "asr_tdt":
+            from .ASR.tdt_asr import AudioTranscriber as TDTTranscriber, _OnnxTDTModel
+
+            model_path = _OnnxTDTModel.DEFAULT_ENCODER_MODEL_PATH
+            if variant == "int8_static":
+                tdt = TDTTranscriber()
+                feeds = q.record_feeds(tdt.model, "encoder", lambda: [tdt.transcribe_file(f) for f in audio_files])
+        elif model == "tts_glados":
+            model_path = tts_glados.SpeechSynthesizer.MODEL_PATH
+            if variant == "int8_static":
+                tts = tts_glados.SpeechSynthesizer()
+                converter = stc.SpokenTextConverter()
+                feeds = q.record_feeds(
+                    tts,
+                    "ort_sess",
+                    lambda: [tts.generate_speech_audio(converter.text_to_spoken(text)) for text in sentences],
+                )
+        else:
+            rprint(f"[red]Unknown model '{model}', expected one of {QUANTIZABLE_MODELS}[/red]")
+            return 1
+        output_path = q.quantize_model(model_path, variant, calibration_feeds=feeds, op_types=op_types)
+        rprint(f"{model}: wrote {output_path}")
+    return 0
+
+
 def start(config_path: str | Path = "glados_config.yaml") -> None:
     """
     Start the GLaDOS voice assistant and initialize its listening event loop.
@@ -208,7 +367,16 @@ def start(config_path: str | Path = "glados_config.yaml") -> None:
         start()  # Uses default configuration file
         start("/path/to/custom/config.yaml")  # Uses a custom configuration file
     """
+    from .core.engine import Glados, GladosConfig
+
     glados_config = GladosConfig.from_yaml(str(config_path))
+    if glados_config.audio_io == "network" and glados_config.network_max_sessions > 1:
+        # Several concurrent clients, each with its own session on shared models
+        from .core.sessions import SessionManager
+
+        SessionManager.from_config(glados_config).run()
+        return
+
     glados = Glados.from_config(glados_config)
     if glados.announcement:
         glados.play_announcement()
@@ -262,6 +430,9 @@ def main() -> int:
     - 'download': Download required model files
     - 'start': Launch the GLaDOS voice assistant
     - 'say': Generate speech from input text
+    - 'prewarm-tts': Fill the TTS audio cache with frequent phrases
+    - 'warm-cache': Build the ONNX optimized graph cache
+    - 'quantize': Write INT8 variants of the ASR and TTS models
 
     The function sets up argument parsing with optional configuration file paths and handles
     command execution based on user input. If no command is specified, it defaults to starting
@@ -325,9 +496,63 @@ def main() -> int:
         help=f"Path to configuration file (default: {DEFAULT_CONFIG})",
     )
 
+    # Prewarm TTS cache command
+    prewarm_parser = subparsers.add_parser("prewarm-tts", help="Synthesize frequent phrases into the TTS cache")
+    prewarm_parser.add_argument(
+        "--config",
+        type=str,
+        default=DEFAULT_CONFIG,
+        help=f"Path to configuration file (default: {DEFAULT_CONFIG})",
+    )
+    prewarm_parser.add_argument(
+        "--phrases",
+        type=str,
+        default=None,
+        help="Text file with one phrase per line, in addition to the announcement and error replies",
+    )
+
+    # Warm ONNX graph cache command
+    warm_parser = subparsers.add_parser("warm-cache", help="Optimize the ONNX models into the graph cache")
+    warm_parser.add_argument(
+        "--config",
+        type=str,
+        default=DEFAULT_CONFIG,
+        help=f"Path to configuration file (default: {DEFAULT_CONFIG})",
+    )
+
+    # Quantize models command
+    quantize_parser = subparsers.add_parser("quantize", help="Write INT8 variants of the ASR and TTS models")
+    quantize_parser.add_argument(
+        "--models",
+        nargs="+",
+        choices=QUANTIZABLE_MODELS,
+        default=list(QUANTIZABLE_MODELS),
+        help="Models to quantize (default: all)",
+    )
+    quantize_parser.add_argument(
+        "--variant",
+        choices=["int8_dynamic", "int8_static"],
+        default="int8_dynamic",
+        help="Weights only (dynamic) or weights and calibrated activations (static)",
+    )
+    quantize_parser.add_argument(
+        "--calibration-audio",
+        nargs="+",
+        default=None,
+        help="16 kHz speech files calibrating static ASR variants (default: data/0.wav)",
+    )
+    quantize_parser.add_argument(
+        "--calibration-text",
+        type=str,
+        default=None,
+        help="Text file with one sentence per line calibrating static TTS variants",
+    )
+
     args = parser.parse_args()
 
     if args.command == "download":
+        import asyncio
+
         return asyncio.run(download_models())
     else:
         if not models_valid():
@@ -335,6 +560,12 @@ def main() -> int:
             return 1
         if args.command == "say":
             say(args.text, args.config)
+        elif args.command == "prewarm-tts":
+            return prewarm_tts(args.config, args.phrases)
+        elif args.command == "warm-cache":
+            return warm_cache(args.config)
+        elif args.command == "quantize":
+            return quantize(args.models, args.variant, args.calibration_audio, args.calibration_text)
         elif args.command == "start":
             start(args.config)
         elif args.command == "tui":
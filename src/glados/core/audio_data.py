@@ -18,11 +18,32 @@ class AudioMessage:
         audio: Generated audio samples as float32 array
         text: Associated text that was synthesized
         is_eos: Flag indicating end of speech stream
+        generation: Response generation the audio belongs to, None if untagged
+        trace_id: Latency trace of the utterance being answered, None if untraced
     """
 
     audio: NDArray[np.float32]
     text: str
     is_eos: bool = False
+    generation: int | None = None
+    trace_id: str | None = None
+
+
+@dataclass
+class SentenceMessage:
+    """Text message container for TTS input.
+
+    Args:
+        text: Sentence to synthesize
+        is_eos: Flag indicating end of the response
+        generation: Response generation the sentence belongs to, None if untagged
+        trace_id: Latency trace of the utterance being answered, None if untraced
+    """
+
+    text: str
+    is_eos: bool = False
+    generation: int | None = None
+    trace_id: str | None = None
 
 
 @dataclass
@@ -10,6 +10,7 @@ import queue
 import sys
 import threading
 import time
+from typing import Any, Literal
 
 from loguru import logger
 from pydantic import BaseModel, HttpUrl
@@ -17,17 +18,29 @@ import requests
 import yaml
 
 from ..ASR import TranscriberProtocol, get_audio_transcriber
-from ..audio_io import AudioProtocol, get_audio_system
+from ..ASR.batching import ASRBatchingConfig
+from ..ASR.streaming import StreamingASRConfig
+from ..audio_io import VAD, AudioProtocol, get_audio_system
+from ..audio_io.vad_batching import VADBatchingConfig
 from ..TTS import SpeechSynthesizerProtocol, get_speech_synthesizer
+from ..TTS.audio_cache import AudioCacheConfig, CachedSpeechSynthesizer
 from ..memory.conversation_memory import ConversationMemory
 from ..memory.entity_memory import EntityMemory
 from ..memory.combined_memory import CombinedMemory
 from ..utils import spoken_text_converter as stc
-from ..utils.resources import resource_path
-from .audio_data import AudioMessage
+from ..utils.onnx_sessions import OnnxRuntimeConfig, configure_sessions, session_profiles
+from .audio_data import SentenceMessage
+from .generation import ResponseGeneration
+from .llm_client import LLMClientConfig, create_llm_session
 from .llm_processor import LanguageModelProcessor
+from .pipeline_queue import PipelineQueue, PipelineQueuesConfig
+from .prompt_assembly import PromptConfig
 from .speech_listener import SpeechListener
 from .speech_player import SpeechPlayer
+from .stage import StageRunner, post_shutdown
+from .startup import StartupConfig, log_startup_timings, run_timed, startup_timings, warm_up_models
+from .text_segmenter import SegmentationConfig
+from .tracing import LatencyTracer, TracingConfig
 from .tts_synthesizer import TextToSpeechSynthesizer
 from .state import ThreadSafeConversationState
 
@@ -120,9 +133,26 @@ class GladosConfig(BaseModel):
     announcement: str | None
     personality_preprompt: list[PersonalityPrompt]
     memory: MemoryConfig = MemoryConfig()
+    tracing: TracingConfig = TracingConfig()
+    segmentation: SegmentationConfig = SegmentationConfig()
+    queues: PipelineQueuesConfig = PipelineQueuesConfig()
+    llm_client: LLMClientConfig = LLMClientConfig()
+    prompt: PromptConfig = PromptConfig()
+    tts_workers: int = 1  # >1 synthesizes upcoming sentences concurrently, played back in order
+    tts_cache: AudioCacheConfig = AudioCacheConfig()
+    phoneme_cache_path: str | None = None  # Keeps G2P predictions of out-of-dictionary words across restarts
+    onnx: OnnxRuntimeConfig = OnnxRuntimeConfig()  # Thread/optimization profiles of the ONNX sessions
+    asr_streaming: StreamingASRConfig = StreamingASRConfig()  # Transcribe while the user is still speaking
+    asr_quantization: str | None = None  # "int8_dynamic"/"int8_static" variant of the ASR model, see `glados quantize`
+    asr_frame_extraction: Literal["strided", "numba"] = "strided"  # Mel framing: NumPy view, or numba (JIT cached)
+    tts_quantization: str | None = None  # Same for the voice model
+    startup: StartupConfig = StartupConfig()  # Concurrent model loading and warm-up
     # Network audio settings
     network_host: str = "0.0.0.0"
     network_port: int = 5555
+    network_max_sessions: int = 1  # >1 serves concurrent clients with shared models
+    asr_batching: ASRBatchingConfig = ASRBatchingConfig()  # Transcribe concurrent sessions' utterances together
+    vad_batching: VADBatchingConfig = VADBatchingConfig()  # Run concurrent sessions' audio chunks in one VAD call
     # RVC voice cloning settings
     rvc: RVCConfig = RVCConfig()
     # LLM sampling parameters to reduce repetition
@@ -170,6 +200,18 @@ class GladosConfig(BaseModel):
         """Convert personality preprompt to chat message format."""
         return [prompt.to_chat_message() for prompt in self.personality_preprompt]
 
+    def tts_voice_key(self) -> str:
+        """Identify the synthesized voice, including RVC conversion settings, for the TTS cache."""
+        rvc = self.rvc
+        voice = f"{self.voice}|{self.tts_quantization}" if self.tts_quantization else self.voice
+        if not rvc.enabled:
+            return voice
+        model = rvc.model_name if rvc.mode == "service" else rvc.model_path
+        return (
+            f"{voice}|rvc:{rvc.mode}:{model}:{rvc.index_path}:{rvc.f0_method}:"
+            f"{rvc.f0_up_key}:{rvc.index_rate}:{rvc.protect}"
+        )
+
 
 class Glados:
     """
@@ -180,7 +222,8 @@ class Glados:
     methods for interaction with the assistant.
     """
 
-    PAUSE_TIME: float = 0.05  # Time to wait between processing loops
+    PAUSE_TIME: float = 0.05  # Back-off after errors in processing loops
+    HEALTH_CHECK_INTERVAL: float = 1.0  # Seconds between component thread liveness checks
     NEUROTOXIN_RELEASE_ALLOWED: bool = False  # preparation for function calling, see issue #13
     DEFAULT_PERSONALITY_PREPROMPT: tuple[dict[str, str], ...] = (
         {
@@ -202,6 +245,9 @@ class Glados:
         announcement: str | None = None,
         personality_preprompt: tuple[dict[str, str], ...] = DEFAULT_PERSONALITY_PREPROMPT,
         config: GladosConfig | None = None,
+        warm_up: bool = True,
+        session_id: str | None = None,
+        llm_session: requests.Session | None = None,
     ) -> None:
         """
         Initialize the Glados voice assistant with configuration parameters.
@@ -223,15 +269,22 @@ class Glados:
             announcement (str | None): Optional announcement to play on startup.
             personality_preprompt (tuple[dict[str, str], ...]): Initial personality preprompt messages.
             config (GladosConfig | None): Configuration object for memory and other settings.
+            warm_up (bool): Run the ASR and TTS models once. Sessions sharing already warm models skip it.
+            session_id (str | None): Identifier of the network session, used to name component threads.
+            llm_session (requests.Session | None): Keep-alive HTTP session for LLM requests, shared between
+                sessions; a new one is created from `config.llm_client` if not given.
         """
         self._asr_model = asr_model
         self._tts = tts_model
         self.completion_url = completion_url
         self.llm_model = llm_model
         self.api_key = api_key
+        # One connection pool for the conversation stream and the background memory calls
+        self.llm_session = llm_session or create_llm_session(config.llm_client if config else None)
         self.interruptible = interruptible
         self.wake_word = wake_word
         self.announcement = announcement
+        self.session_id = session_id
 
         # Convert personality preprompt to initial messages
         initial_messages = [msg for msg in personality_preprompt]
@@ -240,8 +293,13 @@ class Glados:
         # Initialize spoken text converter, that converts text to spoken text. eg. 12 -> "twelve"
         self._stc = stc.SpokenTextConverter()
 
-        # warm up onnx ASR model, this is needed to avoid long pauses on first request
-        self._asr_model.transcribe_file(resource_path("data/0.wav"))
+        # Run the models once, this is needed to avoid long pauses on first request
+        if warm_up:
+            warm_up_models(
+                asr_model=self._asr_model,
+                tts_model=self._tts,
+                parallel=config.startup.parallel_loading if config else True,
+            )
 
         # Initialize events for thread synchronization
         self.processing_active_event = threading.Event()  # Indicates if input processing is active (ASR + LLM + TTS)
@@ -252,9 +310,13 @@ class Glados:
         self._config = config
 
         # Initialize queues for inter-thread communication
-        self.llm_queue: queue.Queue[str] = queue.Queue()  # Text from SpeechListener to LLMProcessor
-        self.tts_queue: queue.Queue[str] = queue.Queue()  # Text from LLMProcessor to TTSynthesizer
-        self.audio_queue: queue.Queue[AudioMessage] = queue.Queue()  # AudioMessages from TTSSynthesizer to AudioPlayer
+        queues_config = config.queues if config else PipelineQueuesConfig()
+        # Text from SpeechListener to LLMProcessor
+        self.llm_queue: PipelineQueue = PipelineQueue.from_config(queues_config.llm, "llm")
+        # Text from LLMProcessor to TTSynthesizer
+        self.tts_queue: PipelineQueue = PipelineQueue.from_config(queues_config.tts, "tts")
+        # AudioMessages from TTSSynthesizer to AudioPlayer
+        self.audio_queue: PipelineQueue = PipelineQueue.from_config(queues_config.audio, "audio")
 
         # Initialize audio input/output system
         self.audio_io: AudioProtocol = audio_io
@@ -266,10 +328,6 @@ class Glados:
         self.combined_memory: CombinedMemory | None = None
 
         if config and config.memory.enabled:
-            # Set up persistence paths
-            conv_persist_path = Path(config.memory.persist_path) if config.memory.persist_path else Path("data/conversation_memory.json")
-            entity_persist_path = Path(config.memory.entity_persist_path) if config.memory.entity_persist_path else Path("data/entity_memory.json")
-
             # Create LLM caller for async extraction (uses same endpoint as main LLM)
             llm_caller = self._create_llm_caller() if config.memory.entity_extraction_enabled else None
 
@@ -281,22 +339,33 @@ class Glados:
                     user_id = conn_context.user_id
                     logger.info(f"Multi-user memory enabled for user: {user_id}")
 
-            # Initialize conversation memory
-            self.conversation_memory = ConversationMemory(
-                max_turns=config.memory.max_turns,
-                persist_path=conv_persist_path,
-                persist_interval=config.memory.persist_interval_seconds,
-                llm_summarizer=llm_caller,  # For async summarization
-                user_id=user_id,  # v2.1+: Multi-user isolation
-            )
+            # Concurrent sessions without authentication are told apart by their client's address
+            client_host = None
+            if user_id is None and session_id is not None and hasattr(self.audio_io, "get_client_host"):
+                client_host = self.audio_io.get_client_host()
+
+            conv_persist_path, entity_persist_path = self._memory_persist_paths(config.memory, user_id, client_host)
 
-            # Initialize entity memory if enabled
+            # Conversation and entity memory load their persisted files independently
+            memory_loaders: dict[str, Any] = {
+                "conversation_memory": lambda: ConversationMemory(
+                    max_turns=config.memory.max_turns,
+                    persist_path=conv_persist_path,
+                    persist_interval=config.memory.persist_interval_seconds,
+                    llm_summarizer=llm_caller,  # For async summarization
+                    user_id=user_id,  # v2.1+: Multi-user isolation
+                ),
+            }
             if config.memory.entity_extraction_enabled:
-                self.entity_memory = EntityMemory(
+                memory_loaders["entity_memory"] = lambda: EntityMemory(
                     persist_path=entity_persist_path,
                     llm_caller=llm_caller,
                     user_id=user_id,  # v2.1+: Multi-user isolation
                 )
+            memories = run_timed(memory_loaders, "load", parallel=config.startup.parallel_loading)
+            self.conversation_memory = memories["conversation_memory"]
+            self.entity_memory = memories.get("entity_memory")
+            if self.entity_memory:
                 logger.info("Entity memory initialized with async LLM extraction")
 
             # Create combined memory interface
@@ -307,6 +376,11 @@ class Glados:
 
             logger.info(f"Memory system initialized: {config.memory.max_turns} max turns, entity extraction: {config.memory.entity_extraction_enabled}")
 
+        # Per-utterance latency tracing shared by all stages
+        self.tracer = LatencyTracer.from_config(config.tracing) if config else LatencyTracer()
+        # Cancelled on barge-in; every stage discards items tagged with an older generation
+        self.generation = ResponseGeneration()
+
         # Initialize threads for each component
         self.component_threads: list[threading.Thread] = []
 
@@ -320,6 +394,9 @@ class Glados:
             currently_speaking_event=self.currently_speaking_event,
             processing_active_event=self.processing_active_event,
             pause_time=self.PAUSE_TIME,
+            tracer=self.tracer,
+            generation=self.generation,
+            streaming=config.asr_streaming if config else None,
         )
 
         self.llm_processor = LanguageModelProcessor(
@@ -339,6 +416,11 @@ class Glados:
             top_p=config.top_p if config else 0.9,
             top_k=config.top_k if config else 40,
             audio_io=self.audio_io,  # v2.1+: For getting connection context (user_id)
+            tracer=self.tracer,
+            segmentation=config.segmentation if config else None,
+            generation=self.generation,
+            http_session=self.llm_session,
+            prompt=config.prompt if config else None,
         )
 
         self.tts_synthesizer = TextToSpeechSynthesizer(
@@ -348,6 +430,9 @@ class Glados:
             stc_instance=self._stc,
             shutdown_event=self.shutdown_event,
             pause_time=self.PAUSE_TIME,
+            tracer=self.tracer,
+            num_workers=config.tts_workers if config else 1,
+            generation=self.generation,
         )
 
         self.speech_player = SpeechPlayer(
@@ -359,6 +444,8 @@ class Glados:
             currently_speaking_event=self.currently_speaking_event,
             processing_active_event=self.processing_active_event,
             pause_time=self.PAUSE_TIME,
+            tracer=self.tracer,
+            generation=self.generation,
         )
 
         thread_targets = {
@@ -369,7 +456,8 @@ class Glados:
         }
 
         for name, target_func in thread_targets.items():
-            thread = threading.Thread(target=target_func, name=name, daemon=True)
+            thread_name = f"{name}-{session_id}" if session_id else name
+            thread = threading.Thread(target=target_func, name=thread_name, daemon=True)
             self.component_threads.append(thread)
             thread.start()
             logger.info(f"Orchestrator: {name} thread started.")
@@ -378,13 +466,55 @@ class Glados:
         if hasattr(self.audio_io, 'get_text_message_queue'):
             text_thread = threading.Thread(
                 target=self._text_message_handler,
-                name="TextMessageHandler",
+                name=f"TextMessageHandler-{session_id}" if session_id else "TextMessageHandler",
                 daemon=True
             )
             self.component_threads.append(text_thread)
             text_thread.start()
             logger.info("Orchestrator: TextMessageHandler thread started.")
-    
+
+    @classmethod
+    def _memory_persist_paths(
+        cls, memory_config: MemoryConfig, user_id: str | None, client_host: str | None
+    ) -> tuple[Path, Path]:
+        """
+        Get the conversation and entity memory files of a pipeline.
+
+        Concurrent sessions must not rewrite each other's files, so each authenticated user
+        gets their own, and without authentication each client host does. Both identities are
+        stable, so a client reconnecting or connecting after a restart finds its own memory.
+
+        Args:
+            memory_config: Memory settings with the configured persistence paths
+            user_id: Authenticated user the memory belongs to, if any
+            client_host: Address of an unauthenticated network client, None in single-client mode
+
+        Returns:
+            tuple[Path, Path]: Conversation memory and entity memory paths
+        """
+        conv_persist_path = Path(memory_config.persist_path or "data/conversation_memory.json")
+        entity_persist_path = Path(memory_config.entity_persist_path or "data/entity_memory.json")
+
+        scope = user_id if user_id is not None else (f"client-{client_host}" if client_host is not None else None)
+        if scope is None:
+            return conv_persist_path, entity_persist_path
+        return cls._user_scoped_path(conv_persist_path, scope), cls._user_scoped_path(entity_persist_path, scope)
+
+    @staticmethod
+    def _user_scoped_path(path: Path, user_id: str) -> Path:
+        """
+        Derive a per-user persistence file from a shared one, e.g. memory.json -> memory.<user_id>.json.
+
+        Args:
+            path: Configured persistence path
+            user_id: Authenticated user the memory belongs to
+
+        Returns:
+            Path: Persistence path unique to the user
+        """
+        safe_user_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in user_id)
+        return path.with_name(f"{path.stem}.{safe_user_id}{path.suffix}")
+
     def _create_llm_caller(self) -> callable:
         """
         Create a synchronous LLM caller function for background tasks.
@@ -397,6 +527,7 @@ class Glados:
             A callable that takes a prompt string and returns the LLM response.
         """
         completion_url = str(self.completion_url)
+        http = self.llm_session
         model_name = self.llm_model
         api_key = self.api_key
         
@@ -416,7 +547,7 @@ class Glados:
                     ],
                 }
                 
-                response = requests.post(
+                response = http.post(
                     completion_url,
                     headers=headers,
                     json=data,
@@ -444,29 +575,41 @@ class Glados:
     def _text_message_handler(self) -> None:
         """Handle text messages from network client.
         
-        Monitors the text message queue from NetworkAudioIO and forwards
+        Blocks on the text message queue from NetworkAudioIO and forwards
         messages to the LLM queue for processing. Also sends response text
         back to the client.
         """
-        text_queue = self.audio_io.get_text_message_queue()
-        
-        while not self.shutdown_event.is_set():
-            try:
-                # Wait for text message with timeout
-                text = text_queue.get(timeout=self.PAUSE_TIME)
-                
-                logger.success(f"TextMessageHandler: Processing text: '{text}'")
-                
-                # Set processing active so LLM will respond
-                self.processing_active_event.set()
-                
-                # Put text in LLM queue (same as ASR output)
-                self.llm_queue.put(text)
-                
-            except queue.Empty:
-                continue
-            except Exception as e:
-                logger.error(f"TextMessageHandler error: {e}")
+        StageRunner(
+            name="TextMessageHandler",
+            input_queue=self.audio_io.get_text_message_queue(),
+            handler=self._forward_text_message,
+            shutdown_event=self.shutdown_event,
+        ).run()
+
+    def _forward_text_message(self, text: str) -> None:
+        """Forward one text message from the client to the LLM queue."""
+        logger.success(f"TextMessageHandler: Processing text: '{text}'")
+        self.tracer.start("text")
+
+        # Set processing active so LLM will respond
+        self.processing_active_event.set()
+
+        # Put text in LLM queue (same as ASR output)
+        self.llm_queue.put(text)
+
+    def _signal_shutdown(self) -> None:
+        """Set the shutdown event and wake every pipeline stage blocked on its input queue."""
+        self.shutdown_event.set()
+
+        stage_queues: list[queue.Queue] = [
+            self.llm_queue,
+            self.tts_queue,
+            self.audio_queue,
+            self.audio_io.get_sample_queue(),
+        ]
+        if hasattr(self.audio_io, 'get_text_message_queue'):
+            stage_queues.append(self.audio_io.get_text_message_queue())
+        post_shutdown(stage_queues)
 
     def play_announcement(self, interruptible: bool | None = None) -> None:
         """
@@ -485,7 +628,8 @@ class Glados:
             interruptible = self.interruptible
         logger.success("Playing announcement...")
         if self.announcement:
-            self.tts_queue.put(self.announcement)
+            # Tagged so that barging in cancels the announcement like any other response
+            self.tts_queue.put(SentenceMessage(text=self.announcement, generation=self.generation.current))
             self.processing_active_event.set()
 
     @property
@@ -517,6 +661,62 @@ class Glados:
             "persist_path": str(self.conversation_memory.persist_path) if self.conversation_memory.persist_path else None,
         }
 
+    def get_latency_stats(self) -> dict[str, dict[str, float]]:
+        """
+        Get per-utterance latency percentiles of the pipeline milestones.
+
+        Returns:
+            dict: Span name -> count and p50/p95/p99 in milliseconds since end of speech
+        """
+        return self.tracer.get_stats()
+
+    def get_queue_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get depth gauges of the queues between the pipeline stages.
+
+        Returns:
+            dict: Queue name ("llm", "tts", "audio") -> depth, high watermark, drops and blocked time
+        """
+        return {q.name: q.stats() for q in (self.llm_queue, self.tts_queue, self.audio_queue)}
+
+    def get_tts_cache_stats(self) -> dict[str, Any]:
+        """
+        Get hit-rate metrics of the synthesized speech cache.
+
+        Returns:
+            dict: Hits per tier, misses, hit rate and tier sizes; empty if the cache is disabled
+        """
+        return self._tts.stats() if isinstance(self._tts, CachedSpeechSynthesizer) else {}
+
+    def get_prompt_stats(self) -> dict[str, float]:
+        """
+        Get how much of each LLM prompt the server's prefix cache can reuse.
+
+        Returns:
+            dict: Requests, reuse ratio of the last request, mean reuse ratio and window compactions
+        """
+        return self.llm_processor.get_prompt_stats()
+
+    @staticmethod
+    def get_session_profiles() -> dict[str, dict[str, Any]]:
+        """
+        Get the ONNX Runtime profile each model session was created with.
+
+        Returns:
+            dict: Model name -> model path, effective session profile and providers in use
+        """
+        return session_profiles()
+
+    @staticmethod
+    def get_startup_timings() -> dict[str, dict[str, float]]:
+        """
+        Get how long each model took to load and to warm up at start-up.
+
+        Returns:
+            dict: Model name -> load_seconds and warmup_seconds
+        """
+        return startup_timings()
+
     def clear_memory(self) -> bool:
         """
         Clear all conversation memory.
@@ -571,22 +771,88 @@ class Glados:
             logger.error(f"Failed to export memory: {e}")
             return False
 
-    @classmethod
-    def from_config(cls, config: GladosConfig) -> "Glados":
+    def shutdown(self) -> None:
         """
-        Create a Glados instance from a GladosConfig configuration object.
+        Stop all component threads of this assistant without exiting the process.
+
+        Used by the session manager to end one network session while others keep running.
+        Pending memory work is flushed by the memory system's own shutdown.
+        """
+        self._signal_shutdown()
+        self.processing_active_event.clear()
+        if self.currently_speaking_event.is_set():
+            self.audio_io.stop_speaking()
+            self.currently_speaking_event.clear()
+
+        if self.combined_memory:
+            self.combined_memory.shutdown()
+
+        for thread in self.component_threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout=1.0)
+
+    @staticmethod
+    def load_models(config: GladosConfig) -> tuple[TranscriberProtocol, SpeechSynthesizerProtocol]:
+        """
+        Load the ASR and TTS models described by a configuration.
+
+        The returned models hold the ONNX sessions and are safe to share between several
+        Glados instances, which is how the multi-session network server serves concurrent
+        clients without loading the models once per connection.
+
+        The models are constructed concurrently unless `config.startup.parallel_loading` is off.
 
         Parameters:
-            config (GladosConfig): Configuration object containing Glados initialization parameters
+            config (GladosConfig): Configuration object selecting the ASR engine, voice and RVC settings
 
         Returns:
-            Glados: A new Glados instance configured with the provided settings
+            tuple[TranscriberProtocol, SpeechSynthesizerProtocol]: The ASR and TTS models
         """
+        models = Glados._load_concurrently(config, with_vad=False)
+        return models["asr"], models["tts"]
 
-        asr_model = get_audio_transcriber(
-            engine_type=config.asr_engine,
-        )
+    @staticmethod
+    def load_all_models(config: GladosConfig) -> tuple[TranscriberProtocol, SpeechSynthesizerProtocol, VAD]:
+        """
+        Load the ASR and TTS models described by a configuration together with the VAD.
+
+        Parameters:
+            config (GladosConfig): Configuration object selecting the ASR engine, voice and RVC settings
 
+        Returns:
+            tuple[TranscriberProtocol, SpeechSynthesizerProtocol, VAD]: The ASR, TTS and VAD models
+        """
+        models = Glados._load_concurrently(config, with_vad=True)
+        return models["asr"], models["tts"], models["vad"]
+
+    @staticmethod
+    def _load_concurrently(config: GladosConfig, with_vad: bool) -> dict[str, Any]:
+        """Construct the models, in a thread each if enabled, and record their load times."""
+        configure_sessions(config.onnx)
+        loaders: dict[str, Any] = {
+            "asr": lambda: get_audio_transcriber(
+                engine_type=config.asr_engine,
+                quantization=config.asr_quantization,
+                frame_extraction=config.asr_frame_extraction,
+            ),
+            "tts": lambda: Glados.load_tts_model(config),
+        }
+        if with_vad:
+            loaders["vad"] = VAD
+        return run_timed(loaders, "load", parallel=config.startup.parallel_loading)
+
+    @staticmethod
+    def load_tts_model(config: GladosConfig) -> SpeechSynthesizerProtocol:
+        """
+        Load the TTS model described by a configuration, with RVC and the audio cache if enabled.
+
+        Parameters:
+            config (GladosConfig): Configuration object selecting the voice, RVC and cache settings
+
+        Returns:
+            SpeechSynthesizerProtocol: The TTS model
+        """
+        configure_sessions(config.onnx)
         tts_model: SpeechSynthesizerProtocol
         if config.rvc.enabled:
             if config.rvc.mode == "service":
@@ -594,7 +860,11 @@ class Glados:
                 logger.info(f"RVC service mode enabled: {config.rvc.service_url}")
                 from ..TTS.rvc_service import RVCServiceClient, RVCServiceSynthesizer
                 
-                base_tts = get_speech_synthesizer(config.voice)
+                base_tts = get_speech_synthesizer(
+                    config.voice,
+                    phoneme_cache_path=config.phoneme_cache_path,
+                    quantization=config.tts_quantization,
+                )
                 rvc_client = RVCServiceClient(
                     service_url=config.rvc.service_url,
                     model_name=config.rvc.model_name,
@@ -612,6 +882,8 @@ class Glados:
                 logger.info(f"RVC inline mode enabled: {config.rvc.model_path}")
                 tts_model = get_speech_synthesizer(
                     voice=config.voice,
+                    phoneme_cache_path=config.phoneme_cache_path,
+                    quantization=config.tts_quantization,
                     rvc_model_path=config.rvc.model_path,
                     rvc_index_path=config.rvc.index_path,
                     rvc_device=config.rvc.device,
@@ -622,17 +894,50 @@ class Glados:
                 )
             else:
                 logger.warning("RVC enabled but no model configured, using base TTS")
-                tts_model = get_speech_synthesizer(config.voice)
+                tts_model = get_speech_synthesizer(
+                    config.voice,
+                    phoneme_cache_path=config.phoneme_cache_path,
+                    quantization=config.tts_quantization,
+                )
         else:
-            tts_model = get_speech_synthesizer(config.voice)
+            tts_model = get_speech_synthesizer(
+                config.voice,
+                phoneme_cache_path=config.phoneme_cache_path,
+                quantization=config.tts_quantization,
+            )
+
+        if config.tts_cache.enabled:
+            # Repeated phrases (announcement, error lines, short replies) skip synthesis and RVC
+            tts_model = CachedSpeechSynthesizer.from_config(tts_model, config.tts_cache, config.tts_voice_key())
+
+        return tts_model
+
+    @classmethod
+    def from_config(cls, config: GladosConfig) -> "Glados":
+        """
+        Create a Glados instance from a GladosConfig configuration object.
+
+        The ASR, TTS and VAD models are loaded concurrently and warmed up before the
+        pipeline starts; their load and warm-up times are logged.
+
+        Parameters:
+            config (GladosConfig): Configuration object containing Glados initialization parameters
+
+        Returns:
+            Glados: A new Glados instance configured with the provided settings
+        """
+        asr_model, tts_model, vad_model = cls.load_all_models(config)
+        if config.startup.warm_up:
+            warm_up_models(asr_model, tts_model, vad_model, parallel=config.startup.parallel_loading)
 
         audio_io = get_audio_system(
             backend_type=config.audio_io,
             network_host=config.network_host,
             network_port=config.network_port,
+            vad_model=vad_model,
         )
 
-        return cls(
+        glados = cls(
             asr_model=asr_model,
             tts_model=tts_model,
             audio_io=audio_io,
@@ -644,7 +949,10 @@ class Glados:
             announcement=config.announcement,
             personality_preprompt=tuple(config.to_chat_messages()),
             config=config,
+            warm_up=False,
         )
+        log_startup_timings()
+        return glados
 
     @classmethod
     def from_yaml(cls, path: str) -> "Glados":
@@ -681,22 +989,18 @@ class Glados:
             logger.error(f"Audio startup traceback: {traceback.format_exc()}")
             return
 
-        # Loop forever, but is 'paused' when new samples are not available
+        # Sleep until shutdown, waking periodically to check the component threads
         try:
-            loop_count = 0
-            while not self.shutdown_event.is_set():  # Check event BEFORE blocking get
-                time.sleep(self.PAUSE_TIME)
-                loop_count += 1
-                if loop_count % 20 == 0:  # Check every 1 second (20 * 0.05)
-                    # Check if component threads are still alive
-                    alive_threads = [t.name for t in self.component_threads if t.is_alive()]
-                    dead_threads = [t.name for t in self.component_threads if not t.is_alive()]
-                    if dead_threads:
-                        logger.error(f"Component threads died: {dead_threads}")
-                        logger.error(f"Alive threads: {alive_threads}")
-                        logger.error("Shutting down due to dead threads")
-                        self.shutdown_event.set()  # Shutdown if threads died
-                        break  # Exit the loop immediately
+            while not self.shutdown_event.wait(timeout=self.HEALTH_CHECK_INTERVAL):
+                # Check if component threads are still alive
+                alive_threads = [t.name for t in self.component_threads if t.is_alive()]
+                dead_threads = [t.name for t in self.component_threads if not t.is_alive()]
+                if dead_threads:
+                    logger.error(f"Component threads died: {dead_threads}")
+                    logger.error(f"Alive threads: {alive_threads}")
+                    logger.error("Shutting down due to dead threads")
+                    self._signal_shutdown()  # Shutdown if threads died
+                    break  # Exit the loop immediately
             logger.info("Shutdown event detected in listen loop, exiting loop.")
 
         except KeyboardInterrupt:
@@ -708,8 +1012,8 @@ class Glados:
                         self.audio_io.stop_speaking()
                         self.currently_speaking_event.clear()
                         break
-            self.shutdown_event.set()
-            # Give threads a moment to notice the shutdown event
+            self._signal_shutdown()
+            # Give threads a moment to notice the shutdown sentinel
             time.sleep(self.PAUSE_TIME)
         finally:
             logger.info("Listen event loop is stopping/exiting.")
@@ -0,0 +1,86 @@
+"""
+Response generation IDs for instant barge-in.
+
+Every response the assistant produces belongs to a generation. The LLM processor
+tags each sentence it queues with the generation current when the request started,
+and the synthesizer copies the tag onto the resulting AudioMessage. When the user
+interrupts, the generation is cancelled (the counter advances) and every item of the
+old response still in flight becomes stale. Each stage compares the tag with the
+current generation when it takes an item and discards stale items in O(1), so no
+stage has to drain a queue and nothing stale is synthesized or played.
+
+Work that blocks outside a queue (the LLM's HTTP stream) registers a cancel listener
+that aborts it as soon as the generation is cancelled.
+"""
+
+from collections.abc import Callable
+import threading
+
+from loguru import logger
+
+
+class ResponseGeneration:
+    """
+    A thread-safe counter identifying the response currently being produced.
+
+    Items tagged with None belong to no response (e.g. a plain string put into a queue by
+    a tool or test) and are never stale.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._current = 0
+        self._listeners: list[Callable[[int], None]] = []
+
+    @property
+    def current(self) -> int:
+        """The generation new responses are tagged with."""
+        with self._lock:
+            return self._current
+
+    def is_current(self, generation: int | None) -> bool:
+        """
+        Check whether an item still belongs to the live response.
+
+        Args:
+            generation: Tag of the item, None for untagged items
+
+        Returns:
+            bool: False if the item's response has been cancelled
+        """
+        return generation is None or generation == self.current
+
+    def cancel(self, generation: int | None = None) -> bool:
+        """
+        Cancel a response so that all of its in-flight items become stale.
+
+        Args:
+            generation: Cancel only if this is still the current generation, which
+                avoids cancelling a newer response by mistake; None cancels whatever is current
+
+        Returns:
+            bool: True if the generation was advanced
+        """
+        with self._lock:
+            if generation is not None and generation != self._current:
+                return False
+            cancelled = self._current
+            self._current += 1
+            listeners = list(self._listeners)
+
+        for listener in listeners:
+            try:
+                listener(cancelled)
+            except Exception as e:
+                logger.warning(f"ResponseGeneration: Cancel listener failed: {e}")
+        return True
+
+    def add_cancel_listener(self, listener: Callable[[int], None]) -> None:
+        """
+        Register a callback run (on the cancelling thread) whenever a generation is cancelled.
+
+        Args:
+            listener: Called with the cancelled generation
+        """
+        with self._lock:
+            self._listeners.append(listener)
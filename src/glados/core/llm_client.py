@@ -0,0 +1,171 @@
+"""
+HTTP client pieces shared by every LLM call.
+
+- `create_llm_session` builds one keep-alive requests.Session with a sized connection
+  pool. The conversation stream and the background memory calls (entity extraction,
+  summarization) share it, so consecutive requests reuse an open TCP/TLS connection
+  instead of paying connection setup every turn.
+- `LLMStreamParser` turns the raw bytes of a streamed completion into text content
+  incrementally. It understands OpenAI-style Server-Sent Events (`data: {...}`,
+  `data: [DONE]`) and Ollama-style NDJSON (`{...}` per line, `"done": true`). Instead
+  of decoding every line into a dict it locates the `"content"` string and decodes only
+  that literal with the C string scanner; lines that do not match the expected shape
+  fall back to a full `json.loads`.
+"""
+
+from json import JSONDecodeError, loads
+from json.decoder import scanstring
+import re
+from typing import Any
+
+from loguru import logger
+from pydantic import BaseModel
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class LLMClientConfig(BaseModel):
+    """Connection pool settings of the LLM HTTP client."""
+
+    pool_connections: int = 2  # Number of hosts to keep pools for
+    pool_maxsize: int = 4  # Open connections kept alive per host
+    pool_block: bool = False  # Wait for a free connection instead of opening a temporary one
+
+    class Config:
+        extra = "ignore"
+
+
+def create_llm_session(config: LLMClientConfig | None = None) -> requests.Session:
+    """
+    Create a keep-alive HTTP session with a connection pool for LLM requests.
+
+    Args:
+        config: Pool settings, defaults to LLMClientConfig()
+
+    Returns:
+        requests.Session: Session to share between all LLM callers; it is thread-safe for
+            independent requests
+    """
+    config = config or LLMClientConfig()
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=config.pool_connections,
+        pool_maxsize=config.pool_maxsize,
+        pool_block=config.pool_block,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# "content" key followed by a JSON string; a key such as "reasoning_content" does not match
+_CONTENT_KEY = re.compile(r'"content"\s*:\s*')
+_OLLAMA_DONE = re.compile(rb'"done"\s*:\s*true')
+
+
+class LLMStreamParser:
+    """
+    Incremental parser of streamed LLM responses.
+
+    Feed it the raw bytes as they arrive, in chunks of any size; it returns the text
+    content of every complete line and sets `done` when the stream signals its end.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = b""
+        self.done = False
+
+    def feed(self, data: bytes) -> list[str]:
+        """
+        Parse the next piece of the response body.
+
+        Args:
+            data: Bytes received from the server, possibly ending mid-line
+
+        Returns:
+            list[str]: Text content of the lines completed by this piece, in order
+        """
+        if self.done:
+            return []
+        self._buffer += data
+        if b"\n" not in data:
+            return []
+
+        *lines, self._buffer = self._buffer.split(b"\n")
+        contents = []
+        for line in lines:
+            content = self._parse_line(line)
+            if content:
+                contents.append(content)
+            if self.done:
+                break
+        return contents
+
+    def flush(self) -> list[str]:
+        """
+        Parse a final line that was not terminated by a newline.
+
+        Returns:
+            list[str]: Its text content, if any
+        """
+        line, self._buffer = self._buffer, b""
+        if self.done or not line.strip():
+            return []
+        content = self._parse_line(line)
+        return [content] if content else []
+
+    def _parse_line(self, line: bytes) -> str | None:
+        """Extract the text content of one line, setting `done` at the end of the stream."""
+        line = line.strip()
+        if not line:
+            return None
+
+        if line.startswith(b"data:"):  # Server-Sent Events (OpenAI)
+            payload = line[5:].lstrip()
+            if payload == b"[DONE]":
+                self.done = True
+                return None
+        elif line.startswith(b"{"):  # NDJSON (Ollama)
+            payload = line
+            if _OLLAMA_DONE.search(payload):
+                self.done = True
+        else:  # SSE comments, "event:"/"id:" fields or noise
+            return None
+
+        return self._extract_content(payload)
+
+    @staticmethod
+    def _extract_content(payload: bytes) -> str | None:
+        """Find the "content" string of a JSON object, falling back to a full parse."""
+        try:
+            text = payload.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+        match = _CONTENT_KEY.search(text)
+        if match is None:
+            return None  # E.g. usage, final statistics or a tool call
+        start = match.end()
+        if text.startswith('"', start):
+            try:
+                content, _ = scanstring(text, start + 1)
+                return content or None
+            except JSONDecodeError:
+                pass
+        return LLMStreamParser._parse_json_content(text)
+
+    @staticmethod
+    def _parse_json_content(text: str) -> str | None:
+        """Slow path: decode the whole object and read the content field by format."""
+        try:
+            parsed: Any = loads(text)
+        except JSONDecodeError:
+            logger.trace(f"LLMStreamParser: Ignoring non-JSON line: {text[:100]}")
+            return None
+        if not isinstance(parsed, dict):
+            return None
+        if "choices" in parsed:  # OpenAI format
+            choices = parsed.get("choices") or [{}]
+            content = choices[0].get("delta", {}).get("content")
+        else:  # Ollama format
+            content = parsed.get("message", {}).get("content")
+        return str(content) if content else None
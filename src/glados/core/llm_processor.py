@@ -1,9 +1,9 @@
 # --- llm_processor.py ---
-import json
+from collections.abc import Iterator
 import queue
 import re
+import socket
 import threading
-import time
 from typing import Any, ClassVar, Optional
 
 from loguru import logger
@@ -18,24 +18,45 @@ from .exceptions import (
     LLMResponseError,
     LLMStreamError,
 )
+from .audio_data import SentenceMessage
+from .generation import ResponseGeneration
+from .llm_client import LLMStreamParser, create_llm_session
+from .prompt_assembly import PromptAssembler, PromptConfig
 from .state import ThreadSafeConversationState
 from .resilience import CircuitBreaker, CircuitBreakerConfig, CircuitBreakerOpen
+from .stage import StageRunner
+from .text_segmenter import SegmentationConfig, TextSegmenter
+from .tracing import LatencyTracer
 
 
 class LanguageModelProcessor:
     """
     A thread that processes text input for a language model, streaming responses and sending them to TTS.
-    This class is designed to run in a separate thread, continuously checking for new text to process
-    until a shutdown event is set. It handles conversation history, manages streaming responses,
+    This class is designed to run in a separate thread, blocking on its input queue until new text
+    arrives or shutdown is signalled. It handles conversation history, manages streaming responses,
     and sends synthesized sentences to a TTS queue.
     """
 
-    PUNCTUATION_SET: ClassVar[set[str]] = {".", "!", "?", ":", ";", "?!", "\n", "\n\n"}
+    IDLE_INTERVAL: ClassVar[float] = 1.0  # Seconds without input before idle work (summarization) runs
+
+    # Fixed replies spoken when the LLM fails; `glados prewarm-tts` puts them in the TTS cache
+    CONNECTION_ERROR_REPLY: ClassVar[str] = (
+        "I'm unable to connect to my thinking module. Please check the LLM service connection."
+    )
+    TIMEOUT_REPLY: ClassVar[str] = "My brain seems to be taking too long to respond. It might be overloaded."
+    REQUEST_ERROR_REPLY: ClassVar[str] = "Sorry, I encountered an error trying to reach my brain."
+    UNEXPECTED_ERROR_REPLY: ClassVar[str] = "I'm having a little trouble thinking right now."
+    ERROR_REPLIES: ClassVar[tuple[str, ...]] = (
+        CONNECTION_ERROR_REPLY,
+        TIMEOUT_REPLY,
+        REQUEST_ERROR_REPLY,
+        UNEXPECTED_ERROR_REPLY,
+    )
 
     def __init__(
         self,
         llm_input_queue: queue.Queue[str],
-        tts_input_queue: queue.Queue[str],
+        tts_input_queue: queue.Queue[SentenceMessage],
         conversation_history: ThreadSafeConversationState,
         completion_url: HttpUrl,
         model_name: str,  # Renamed from 'model' to avoid conflict
@@ -50,6 +71,11 @@ class LanguageModelProcessor:
         top_p: float = 0.9,
         top_k: int = 40,
         audio_io: Optional[Any] = None,  # v2.1+: For getting connection context (user_id)
+        tracer: LatencyTracer | None = None,
+        segmentation: SegmentationConfig | None = None,
+        generation: ResponseGeneration | None = None,
+        http_session: requests.Session | None = None,
+        prompt: PromptConfig | None = None,
     ) -> None:
         self.llm_input_queue = llm_input_queue
         self.tts_input_queue = tts_input_queue
@@ -63,6 +89,18 @@ class LanguageModelProcessor:
         self.conversation_memory = conversation_memory
         self.combined_memory = combined_memory
         self.audio_io = audio_io  # v2.1+: For multi-user support
+        self.tracer = tracer
+
+        # Barge-in cancels the response generation, which aborts the running HTTP stream
+        self.generation = generation
+        self._response_generation: int | None = None  # Generation of the response being streamed
+        self._response_trace: str | None = None  # Latency trace of the utterance being answered
+        self._active_response: requests.Response | None = None
+        if generation is not None:
+            generation.add_cancel_listener(self._cancel_stream)
+
+        # Splits the streamed response into TTS segments, flushing the first clause early
+        self._segmenter = TextSegmenter.from_config(segmentation or SegmentationConfig())
 
         # LLM sampling parameters to reduce repetition
         self.temperature = temperature
@@ -73,6 +111,12 @@ class LanguageModelProcessor:
         # Maximum conversation turns to send to LLM (excluding system/few-shot prompts)
         self.max_conversation_turns = 6  # 6 user+assistant pairs = 12 messages
 
+        # Lays out system prompt, memory and conversation; prefix_stable keeps the KV cache reusable
+        self._prompt = PromptAssembler.from_config(prompt or PromptConfig(), self.max_conversation_turns * 2)
+
+        # Keep-alive connection pool, shared with the background memory calls when provided
+        self._http = http_session or create_llm_session()
+
         self.prompt_headers = {"Content-Type": "application/json"}
         if api_key:
             self.prompt_headers["Authorization"] = f"Bearer {api_key}"
@@ -90,63 +134,18 @@ class LanguageModelProcessor:
             )
         )
 
-    def _clean_raw_bytes(self, line: bytes) -> dict[str, str] | None:
+    def _handle_content(self, chunk: str, response_buffer: list[str]) -> None:
         """
-        Clean and parse a raw byte line from the LLM response.
-        Handles both OpenAI and Ollama formats, returning a dictionary or None if parsing fails.
+        Accumulate one piece of streamed content and send every completed segment to TTS.
 
         Args:
-            line (bytes): The raw byte line from the LLM response.
-        Returns:
-            dict[str, str] | None: Parsed JSON dictionary or None if parsing fails.
+            chunk: Text content parsed from the stream
+            response_buffer: Full response so far, stored in memory at the end of the turn
         """
-        try:
-            # Handle OpenAI format
-            if line.startswith(b"data: "):
-                json_str = line.decode("utf-8")[6:]
-                if json_str.strip() == "[DONE]":  # Handle OpenAI [DONE] marker
-                    return {"done_marker": "True"}
-                parsed_json: dict[str, Any] = json.loads(json_str)
-                return parsed_json
-            # Handle Ollama format
-            else:
-                parsed_json = json.loads(line.decode("utf-8"))
-                if isinstance(parsed_json, dict):
-                    return parsed_json
-                return None
-        except json.JSONDecodeError:
-            # If it's not JSON, it might be Ollama's final summary object which isn't part of the stream
-            # Or just noise.
-            logger.trace(
-                f"LLM Processor: Failed to parse non-JSON server response line: "
-                f"{line[:100].decode('utf-8', errors='replace')}"
-            )  # Log only a part
-            return None
-        except Exception as e:
-            logger.warning(
-                f"LLM Processor: Failed to parse server response: {e} for line: "
-                f"{line[:100].decode('utf-8', errors='replace')}"
-            )
-            return None
-
-    def _process_chunk(self, line: dict[str, Any]) -> str | None:
-        # Copy from Glados._process_chunk
-        if not line or not isinstance(line, dict):
-            return None
-        try:
-            # Handle OpenAI format
-            if line.get("done_marker"):  # Handle [DONE] marker
-                return None
-            elif "choices" in line:  # OpenAI format
-                content = line.get("choices", [{}])[0].get("delta", {}).get("content")
-                return str(content) if content else None
-            # Handle Ollama format
-            else:
-                content = line.get("message", {}).get("content")
-                return content if content else None
-        except Exception as e:
-            logger.error(f"LLM Processor: Error processing chunk: {e}, chunk: {line}")
-            return None
+        response_buffer.append(chunk)
+        # Boundaries are found inside chunks too, e.g. "world." or "?\""
+        for segment in self._segmenter.push(chunk):
+            self._process_sentence_for_tts([segment])
 
     def _process_sentence_for_tts(self, current_sentence_parts: list[str]) -> None:
         """
@@ -167,274 +166,324 @@ class LanguageModelProcessor:
             
             if normalized_current and normalized_current != normalized_last:
                 logger.info(f"LLM Processor: Sending to TTS queue: '{sentence}'")
-                self.tts_input_queue.put(sentence)
+                self._queue_for_tts(sentence)
+                if self.tracer:
+                    self.tracer.mark("first_sentence_flushed", self._response_trace)
                 self._last_sent_sentence = sentence
             else:
                 logger.debug(f"LLM Processor: Skipping duplicate sentence: '{sentence}'")
 
+    def _queue_for_tts(self, text: str, is_eos: bool = False) -> None:
+        """Queue a sentence (or the end of the response) for TTS, tagged with the response generation and trace."""
+        self.tts_input_queue.put(
+            SentenceMessage(
+                text=text, is_eos=is_eos, generation=self._response_generation, trace_id=self._response_trace
+            )
+        )
+
+    def _is_cancelled(self) -> bool:
+        """Check whether the response being produced was interrupted by the user."""
+        return self.generation is not None and not self.generation.is_current(self._response_generation)
+
+    def _cancel_stream(self, cancelled: int) -> None:
+        """
+        Abort the HTTP stream of a cancelled response, called on the thread that cancelled it.
+
+        Shutting the socket down wakes the read blocked in `iter_lines` immediately, instead of
+        waiting for the next token to arrive.
+
+        Args:
+            cancelled: The generation that was cancelled
+        """
+        response = self._active_response
+        if response is None or cancelled != self._response_generation:
+            return
+        logger.info("LLM Processor: Response interrupted, aborting LLM stream.")
+        try:
+            connection = response.raw.connection
+            if connection is not None and connection.sock is not None:
+                connection.sock.shutdown(socket.SHUT_RDWR)
+        except (AttributeError, OSError):
+            pass
+        response.close()
+
+    def _iter_stream(self, response: requests.Response) -> Iterator[bytes]:
+        """Iterate over the response body as it arrives, ending quietly if it was aborted by a barge-in."""
+        try:
+            # chunk_size=None yields every network read as is; LLMStreamParser handles partial lines
+            yield from response.iter_content(chunk_size=None)
+        except Exception:
+            if not self._is_cancelled():
+                raise
+            logger.debug("LLM Processor: LLM stream aborted.")
+
     def run(self) -> None:
         """
         Starts the main loop for the LanguageModelProcessor thread.
 
-        This method continuously checks the LLM input queue for text to process.
-        It processes the text, sends it to the LLM API, and streams the response.
-        It handles conversation history, manages streaming responses, and sends synthesized sentences
-        to a TTS queue. The thread will run until the shutdown event is set, at which point it will exit gracefully.
+        This method blocks on the LLM input queue and processes each text as soon as it arrives.
+        It sends the text to the LLM API and streams the response, handles conversation history,
+        and sends synthesized sentences to a TTS queue. While idle it lets the conversation memory
+        summarize older turns. The thread will run until the shutdown sentinel is received or the
+        shutdown event is set, at which point it will exit gracefully.
         """
         logger.info("LanguageModelProcessor thread started.")
-        while not self.shutdown_event.is_set():
-            try:
-                detected_text = self.llm_input_queue.get(timeout=self.pause_time)
-                if not self.processing_active_event.is_set():  # Check if we were interrupted before starting
-                    logger.info("LLM Processor: Interruption signal active, discarding LLM request.")
-                    # Ensure EOS is sent if a previous stream was cut short by this interruption
-                    # This logic might need refinement based on state. For now, assume no prior stream.
-                    continue
-
-                # Signal that conversation is active (pause background extraction)
-                if self.combined_memory:
-                    self.combined_memory.on_conversation_start()
-
-                import time as _time
-                _start_time = _time.time()
-                
-                # Reset duplicate sentence tracker for new conversation turn
-                self._last_sent_sentence = ""
-                
-                logger.success(f"LLM Processor: Received text for LLM: '{detected_text}'")
-                self.conversation_history.add_message("user", detected_text)
-
-                # Get thread-safe snapshot of conversation history
-                all_messages = self.conversation_history.get_messages(as_dict=True)
-
-                # Prepare messages for LLM with conversation context
-                # Separate system/few-shot prompts from actual conversation turns
-                system_fewshot = []
-                conversation_turns = []
-
-                for msg in all_messages:
-                    # System messages and early assistant/user examples are kept as prompts
-                    if msg["role"] == "system":
-                        system_fewshot.append(msg)
-                    elif len(conversation_turns) == 0 and len(system_fewshot) > 0:
-                        # Few-shot examples following system prompt
-                        # Check if this looks like a few-shot example (short, template-like)
-                        content_len = len(msg.get("content", ""))
-                        if content_len < 200 and any(
-                            q in msg.get("content", "").lower() 
-                            for q in ["how do i", "what should", "what game"]
-                        ):
-                            system_fewshot.append(msg)
-                        else:
-                            conversation_turns.append(msg)
-                    else:
-                        conversation_turns.append(msg)
-                
-                # Limit conversation turns (keep last N * 2 messages for N turns)
-                max_messages = self.max_conversation_turns * 2
-                if len(conversation_turns) > max_messages:
-                    conversation_turns = conversation_turns[-max_messages:]
-                    logger.debug(f"LLM Processor: Trimmed conversation to {max_messages} messages")
-                
-                messages_for_llm = system_fewshot + conversation_turns
-                logger.debug(f"LLM Processor: {len(system_fewshot)} system/fewshot + {len(conversation_turns)} conversation messages")
-
-                # Use combined memory if available (includes entity context + conversation history)
-                if self.combined_memory:
-                    try:
-                        memory_context = self.combined_memory.build_context_messages(max_turns=10)
-                        # Insert memory context after system prompt but before current conversation
-                        system_messages = [msg for msg in messages_for_llm if msg["role"] == "system"]
-                        other_messages = [msg for msg in messages_for_llm if msg["role"] != "system"]
-
-                        # Reconstruct messages: system + memory context + current conversation
-                        messages_for_llm = system_messages + memory_context + other_messages
-
-                        logger.debug(f"LLM Processor: Added {len(memory_context)} memory context messages")
-                    except Exception as e:
-                        logger.warning(f"LLM Processor: Failed to retrieve memory context: {e}")
-                # Fallback to basic conversation memory
-                elif self.conversation_memory:
-                    try:
-                        memory_context = self.conversation_memory.get_context_as_messages(max_turns=10)
-                        system_messages = [msg for msg in messages_for_llm if msg["role"] == "system"]
-                        other_messages = [msg for msg in messages_for_llm if msg["role"] != "system"]
-                        messages_for_llm = system_messages + memory_context + other_messages
-                        logger.debug(f"LLM Processor: Added {len(memory_context)} memory context messages")
-                    except Exception as e:
-                        logger.warning(f"LLM Processor: Failed to retrieve memory context: {e}")
-
-                data = {
-                    "model": self.model_name,
-                    "stream": True,
-                    "messages": messages_for_llm,
-                    "options": {
-                        "repeat_penalty": 1.2,  # Discourage repetition
-                        "temperature": 0.8,     # Increase creativity slightly
-                        "top_k": 40,
-                        "top_p": 0.9,
-                    }
-                }
-                
-                # Log the context being sent for debugging
-                if len(messages_for_llm) > 0:
-                    last_msg = messages_for_llm[-1]
-                    logger.debug(f"LLM Context Last Msg: {last_msg.get('role')}: {last_msg.get('content')[:50]}...")
-                
-                logger.success(f"LLM Processor: Memory context built in {(_time.time() - _start_time)*1000:.0f}ms, sending {len(messages_for_llm)} messages to LLM")
-
-                sentence_buffer: list[str] = []
-                assistant_response_buffer: list[str] = []  # Accumulate full response for memory
-                try:
-                    # Execute with circuit breaker protection
-                    def make_llm_request():
-                        response = requests.post(
-                            str(self.completion_url),
-                            headers=self.prompt_headers,
-                            json=data,
-                            stream=True,
-                            timeout=30,
-                        )
-                        response.raise_for_status()
-                        return response
-
-                    with self.llm_breaker.call(make_llm_request) as response:
-                        _first_token_time = None
-                        logger.debug("LLM Processor: Request to LLM successful, processing stream...")
-                        for line in response.iter_lines():
-                            if _first_token_time is None:
-                                _first_token_time = _time.time()
-                                logger.success(f"LLM Processor: First token in {(_first_token_time - _start_time)*1000:.0f}ms")
-                            
-                            if not self.processing_active_event.is_set() or self.shutdown_event.is_set():
-                                logger.info("LLM Processor: Interruption or shutdown detected during LLM stream.")
-                                break  # Stop processing stream
-
-                            if line:
-                                cleaned_line_data = self._clean_raw_bytes(line)
-                                if cleaned_line_data:
-                                    chunk = self._process_chunk(cleaned_line_data)
-                                    if chunk:  # Chunk can be an empty string, but None means no actual content
-                                        sentence_buffer.append(chunk)
-                                        assistant_response_buffer.append(chunk)  # Accumulate for memory
-
-                                        # Split on defined punctuation or if chunk itself is punctuation
-                                        if chunk.strip() in self.PUNCTUATION_SET and (
-                                            len(sentence_buffer) < 2 or not sentence_buffer[-2].strip().isdigit()
-                                        ):
-                                            self._process_sentence_for_tts(sentence_buffer)
-                                            sentence_buffer = []
-                                    # OpenAI [DONE]
-                                    elif cleaned_line_data.get("done_marker"):  # OpenAI [DONE]
-                                        break
-                                    # Ollama end
-                                    elif cleaned_line_data.get("done") and cleaned_line_data.get("response") == "":
-                                        break
-
-                        # After loop, process any remaining buffer content if not interrupted
-                        if self.processing_active_event.is_set() and sentence_buffer:
-                            self._process_sentence_for_tts(sentence_buffer)
-
-                        # Store conversation turn in memory (only if successful response)
-                        if assistant_response_buffer:
-                            full_assistant_response = "".join(assistant_response_buffer).strip()
-                            
-                            # Note: conversation_history is updated by speech_player when EOS is processed
-                            # to ensure it only includes actually spoken content
-                            
-                            # v2.1+: Get user_id from connection context if available
-                            user_id = None
-                            if self.audio_io and hasattr(self.audio_io, 'get_connection_context'):
-                                try:
-                                    conn_context = self.audio_io.get_connection_context()
-                                    if conn_context:
-                                        user_id = conn_context.user_id
-                                except Exception:
-                                    pass  # Connection context not available, continue without user_id
-
-                            # Use combined memory if available (handles both conversation + entity extraction)
-                            if self.combined_memory:
-                                try:
-                                    self.combined_memory.add_exchange(
-                                        user_input=detected_text,
-                                        assistant_response=full_assistant_response,
-                                        user_id=user_id,  # v2.1+: Pass user_id for multi-user isolation
-                                    )
-                                    logger.debug("LLM Processor: Stored exchange in combined memory")
-                                except Exception as e:
-                                    logger.warning(f"LLM Processor: Failed to store in combined memory: {e}")
-                            # Fallback to basic conversation memory
-                            elif self.conversation_memory:
-                                try:
-                                    self.conversation_memory.add_turn(
-                                        user_input=detected_text,
-                                        assistant_response=full_assistant_response,
-                                        conversation_id="default",
-                                        user_id=user_id,  # v2.1+: Pass user_id for multi-user isolation
-                                    )
-                                    logger.debug("LLM Processor: Stored conversation turn in memory")
-                                except Exception as e:
-                                    logger.warning(f"LLM Processor: Failed to store conversation in memory: {e}")
-
-                except CircuitBreakerOpen as e:
-                    logger.error(str(e))
-                    self.tts_input_queue.put(
-                        f"My thinking module is temporarily unavailable. "
-                        f"I'll try again in {int(e.retry_after)} seconds."
-                    )
-                except requests.exceptions.ConnectionError as e:
-                    error = LLMConnectionError(str(self.completion_url), e)
-                    logger.error(str(error))
-                    self.tts_input_queue.put(
-                        "I'm unable to connect to my thinking module. Please check the LLM service connection."
-                    )
-                except requests.exceptions.Timeout as e:
-                    error = LLMTimeoutError(30.0, str(self.completion_url))
-                    logger.error(str(error))
-                    self.tts_input_queue.put("My brain seems to be taking too long to respond. It might be overloaded.")
-                except requests.exceptions.HTTPError as e:
-                    status_code = (
-                        e.response.status_code
-                        if hasattr(e, "response") and hasattr(e.response, "status_code")
-                        else 500
-                    )
-                    response_text = (
-                        e.response.text
-                        if hasattr(e, "response") and hasattr(e.response, "text")
-                        else str(e)
-                    )
-                    error = LLMResponseError(status_code, response_text, str(self.completion_url))
-                    logger.error(str(error))
-                    self.tts_input_queue.put(f"I received an error from my thinking module. HTTP status {status_code}.")
-                except requests.exceptions.RequestException as e:
-                    # Wrap in generic LLM exception
-                    error = LLMConnectionError(str(self.completion_url), e)
-                    logger.error(f"LLM Processor: Request to LLM failed: {error}")
-                    self.tts_input_queue.put("Sorry, I encountered an error trying to reach my brain.")
-                except Exception as e:
-                    logger.exception(f"LLM Processor: Unexpected error during LLM request/streaming: {e}")
-                    self.tts_input_queue.put("I'm having a little trouble thinking right now.")
-                finally:
-                    # Signal that conversation processing is done - resume background extraction
-                    if self.combined_memory:
-                        self.combined_memory.on_conversation_end()
-                    
-                    # Always send EOS if we started processing, unless interrupted early
-                    if self.processing_active_event.is_set():  # Only send EOS if not interrupted
-                        logger.debug("LLM Processor: Sending EOS token to TTS queue.")
-                        self.tts_input_queue.put("<EOS>")
-                    else:
-                        logger.info("LLM Processor: Interrupted, not sending EOS from LLM processing.")
-                        # The AudioPlayer will handle clearing its state.
-                        # If an EOS was already sent by TTS from a *previous* partial sentence,
-                        # this could lead to an early clear of currently_speaking.
-                        # The `processing_active_event` is key to synchronize.
-
-            except queue.Empty:
-                # Idle time - trigger background summarization if available
-                if self.conversation_memory and hasattr(self.conversation_memory, 'trigger_summary_update'):
-                    self.conversation_memory.trigger_summary_update()
-            except Exception as e:
-                logger.exception(f"LLM Processor: Unexpected error in main run loop: {e}")
-                time.sleep(0.1)
+        StageRunner(
+            name="LLM Processor",
+            input_queue=self.llm_input_queue,
+            handler=self._process_input,
+            shutdown_event=self.shutdown_event,
+            on_idle=self._on_idle,
+            wake_interval=self.IDLE_INTERVAL,
+            error_backoff=0.1,
+        ).run()
         logger.info("LanguageModelProcessor thread finished.")
+
+    def _on_idle(self) -> None:
+        """Idle time - trigger background summarization if available."""
+        if self.conversation_memory and hasattr(self.conversation_memory, 'trigger_summary_update'):
+            self.conversation_memory.trigger_summary_update()
+
+    def _memory_context(self) -> list[dict[str, str]]:
+        """Get the memory messages to place between the system prompt and the conversation."""
+        # Combined memory includes entity context + conversation history
+        if self.combined_memory:
+            return self.combined_memory.build_context_messages(max_turns=10)
+        # Fallback to basic conversation memory
+        if self.conversation_memory:
+            return self.conversation_memory.get_context_as_messages(max_turns=10)
+        return []
+
+    def get_prompt_stats(self) -> dict[str, float]:
+        """Get prefix reuse statistics of the prompts sent so far."""
+        return self._prompt.stats()
+
+    def _process_input(self, detected_text: str) -> None:
+        """
+        Send one user input to the LLM and stream the response into the TTS queue.
+
+        Args:
+            detected_text: Transcribed or typed user input taken from the LLM input queue.
+        """
+        self._response_generation = self.generation.current if self.generation else None
+        self._response_trace = self.tracer.current_trace_id if self.tracer else None
+        if not self.processing_active_event.is_set():  # Check if we were interrupted before starting
+            logger.info("LLM Processor: Interruption signal active, discarding LLM request.")
+            # Ensure EOS is sent if a previous stream was cut short by this interruption
+            # This logic might need refinement based on state. For now, assume no prior stream.
+            return
+
+        # Signal that conversation is active (pause background extraction)
+        if self.combined_memory:
+            self.combined_memory.on_conversation_start()
+
+        import time as _time
+        _start_time = _time.time()
+        
+        # Reset duplicate sentence tracker for new conversation turn
+        self._last_sent_sentence = ""
+        
+        logger.success(f"LLM Processor: Received text for LLM: '{detected_text}'")
+        self.conversation_history.add_message("user", detected_text)
+
+        # Get thread-safe snapshot of conversation history
+        all_messages = self.conversation_history.get_messages(as_dict=True)
+
+        # Prepare messages for LLM with conversation context
+        # Separate system/few-shot prompts from actual conversation turns
+        system_fewshot = []
+        conversation_turns = []
+
+        for msg in all_messages:
+            # System messages and early assistant/user examples are kept as prompts
+            if msg["role"] == "system":
+                system_fewshot.append(msg)
+            elif len(conversation_turns) == 0 and len(system_fewshot) > 0:
+                # Few-shot examples following system prompt
+                # Check if this looks like a few-shot example (short, template-like)
+                content_len = len(msg.get("content", ""))
+                if content_len < 200 and any(
+                    q in msg.get("content", "").lower() 
+                    for q in ["how do i", "what should", "what game"]
+                ):
+                    system_fewshot.append(msg)
+                else:
+                    conversation_turns.append(msg)
+            else:
+                conversation_turns.append(msg)
+        
+        messages_for_llm = self._prompt.assemble(system_fewshot, conversation_turns, self._memory_context)
+        reuse = self._prompt.measure_reuse(messages_for_llm)
+        logger.debug(
+            f"LLM Processor: {len(system_fewshot)} system/fewshot + {len(messages_for_llm) - len(system_fewshot)} "
+            f"memory/conversation messages, {reuse:.0%} of the prompt repeats the previous request"
+        )
+
+        data = {
+            "model": self.model_name,
+            "stream": True,
+            "messages": messages_for_llm,
+            "options": {
+                "repeat_penalty": 1.2,  # Discourage repetition
+                "temperature": 0.8,     # Increase creativity slightly
+                "top_k": 40,
+                "top_p": 0.9,
+            },
+            **self._prompt.request_options(),
+        }
+        
+        # Log the context being sent for debugging
+        if len(messages_for_llm) > 0:
+            last_msg = messages_for_llm[-1]
+            logger.debug(f"LLM Context Last Msg: {last_msg.get('role')}: {last_msg.get('content')[:50]}...")
+        
+        logger.success(f"LLM Processor: Memory context built in {(_time.time() - _start_time)*1000:.0f}ms, sending {len(messages_for_llm)} messages (~{self._prompt.last_prompt_tokens} tokens) to LLM")
+
+        self._segmenter.reset()
+        assistant_response_buffer: list[str] = []  # Accumulate full response for memory
+        try:
+            # Execute with circuit breaker protection
+            def make_llm_request():
+                response = self._http.post(
+                    str(self.completion_url),
+                    headers=self.prompt_headers,
+                    json=data,
+                    stream=True,
+                    timeout=30,
+                )
+                response.raise_for_status()
+                return response
+
+            if self.tracer:
+                self.tracer.mark("llm_request_sent", self._response_trace)
+            if self._is_cancelled():
+                logger.info("LLM Processor: Interrupted while building the request, not sending it.")
+                return
+            with self.llm_breaker.call(make_llm_request) as response:
+                self._active_response = response
+                _first_token_time = None
+                parser = LLMStreamParser()
+                logger.debug("LLM Processor: Request to LLM successful, processing stream...")
+                for data in self._iter_stream(response):
+                    if _first_token_time is None:
+                        _first_token_time = _time.time()
+                        logger.success(f"LLM Processor: First token in {(_first_token_time - _start_time)*1000:.0f}ms")
+                        if self.tracer:
+                            self.tracer.mark("llm_first_token", self._response_trace)
+                    
+                    if (
+                        not self.processing_active_event.is_set()
+                        or self.shutdown_event.is_set()
+                        or self._is_cancelled()
+                    ):
+                        logger.info("LLM Processor: Interruption or shutdown detected during LLM stream.")
+                        break  # Stop processing stream
+
+                    for chunk in parser.feed(data):
+                        self._handle_content(chunk, assistant_response_buffer)
+                    if parser.done:  # OpenAI [DONE] or Ollama "done": true
+                        break
+                else:
+                    # The server closed the stream without an end marker, or a barge-in aborted it
+                    # (the partial line of a cancelled response must not reach TTS)
+                    if not self._is_cancelled():
+                        for chunk in parser.flush():
+                            self._handle_content(chunk, assistant_response_buffer)
+
+                # After loop, process any remaining buffer content if not interrupted
+                remainder = self._segmenter.flush()
+                if self.processing_active_event.is_set() and not self._is_cancelled() and remainder:
+                    self._process_sentence_for_tts([remainder])
+
+                # Store conversation turn in memory (only if successful response)
+                if assistant_response_buffer:
+                    full_assistant_response = "".join(assistant_response_buffer).strip()
+                    
+                    # Note: conversation_history is updated by speech_player when EOS is processed
+                    # to ensure it only includes actually spoken content
+                    
+                    # v2.1+: Get user_id from connection context if available
+                    user_id = None
+                    if self.audio_io and hasattr(self.audio_io, 'get_connection_context'):
+                        try:
+                            conn_context = self.audio_io.get_connection_context()
+                            if conn_context:
+                                user_id = conn_context.user_id
+                        except Exception:
+                            pass  # Connection context not available, continue without user_id
+
+                    # Use combined memory if available (handles both conversation + entity extraction)
+                    if self.combined_memory:
+                        try:
+                            self.combined_memory.add_exchange(
+                                user_input=detected_text,
+                                assistant_response=full_assistant_response,
+                                user_id=user_id,  # v2.1+: Pass user_id for multi-user isolation
+                            )
+                            logger.debug("LLM Processor: Stored exchange in combined memory")
+                        except Exception as e:
+                            logger.warning(f"LLM Processor: Failed to store in combined memory: {e}")
+                    # Fallback to basic conversation memory
+                    elif self.conversation_memory:
+                        try:
+                            self.conversation_memory.add_turn(
+                                user_input=detected_text,
+                                assistant_response=full_assistant_response,
+                                conversation_id="default",
+                                user_id=user_id,  # v2.1+: Pass user_id for multi-user isolation
+                            )
+                            logger.debug("LLM Processor: Stored conversation turn in memory")
+                        except Exception as e:
+                            logger.warning(f"LLM Processor: Failed to store conversation in memory: {e}")
+
+        except CircuitBreakerOpen as e:
+            logger.error(str(e))
+            self._queue_for_tts(
+                f"My thinking module is temporarily unavailable. "
+                f"I'll try again in {int(e.retry_after)} seconds."
+            )
+        except requests.exceptions.ConnectionError as e:
+            error = LLMConnectionError(str(self.completion_url), e)
+            logger.error(str(error))
+            self._queue_for_tts(self.CONNECTION_ERROR_REPLY)
+        except requests.exceptions.Timeout as e:
+            error = LLMTimeoutError(30.0, str(self.completion_url))
+            logger.error(str(error))
+            self._queue_for_tts(self.TIMEOUT_REPLY)
+        except requests.exceptions.HTTPError as e:
+            status_code = (
+                e.response.status_code
+                if hasattr(e, "response") and hasattr(e.response, "status_code")
+                else 500
+            )
+            response_text = (
+                e.response.text
+                if hasattr(e, "response") and hasattr(e.response, "text")
+                else str(e)
+            )
+            error = LLMResponseError(status_code, response_text, str(self.completion_url))
+            logger.error(str(error))
+            self._queue_for_tts(f"I received an error from my thinking module. HTTP status {status_code}.")
+        except requests.exceptions.RequestException as e:
+            # Wrap in generic LLM exception
+            error = LLMConnectionError(str(self.completion_url), e)
+            logger.error(f"LLM Processor: Request to LLM failed: {error}")
+            self._queue_for_tts(self.REQUEST_ERROR_REPLY)
+        except Exception as e:
+            logger.exception(f"LLM Processor: Unexpected error during LLM request/streaming: {e}")
+            self._queue_for_tts(self.UNEXPECTED_ERROR_REPLY)
+        finally:
+            # Signal that conversation processing is done - resume background extraction
+            if self.combined_memory:
+                self.combined_memory.on_conversation_end()
+            
+            self._active_response = None
+
+            # Always send EOS if we started processing, unless interrupted early. With generation
+            # tags an interrupted response still gets its (stale) EOS: the AudioPlayer discards it
+            # after recording the sentences that were spoken before the barge-in.
+            if self.processing_active_event.is_set() or self.generation is not None:
+                logger.debug("LLM Processor: Sending EOS token to TTS queue.")
+                self._queue_for_tts("", is_eos=True)
+            else:
+                logger.info("LLM Processor: Interrupted, not sending EOS from LLM processing.")
@@ -0,0 +1,245 @@
+"""
+Bounded queues between the Glados pipeline stages.
+
+Unbounded queues let a fast producer run arbitrarily far ahead of its consumer: a
+long LLM response could pile up many seconds of synthesized float32 audio in RAM.
+A PipelineQueue has a maximum size and a policy for what happens when it is full:
+
+- "block": the producer waits for space (backpressure), so e.g. synthesis never
+  runs more than `maxsize` sentences ahead of playback
+- "drop_oldest": the oldest queued item is discarded to make room
+- "coalesce": the new item is merged into the newest queued one (texts are joined,
+  audio is concatenated); bounds the number of items rather than their size
+
+Control items (the SHUTDOWN sentinel and end-of-response messages or "<EOS>") are
+never dropped, merged or blocked on, so a response always terminates and shutdown
+is always delivered. Once SHUTDOWN has been queued, producers blocked on a full
+queue are released and further items are discarded.
+
+Every queue keeps gauges (current depth, high watermark, drops, merges and time
+producers spent blocked) that can be read at runtime via `stats()`.
+"""
+
+from collections.abc import Callable
+import queue
+import time
+from typing import Any, Literal
+
+from loguru import logger
+import numpy as np
+from pydantic import BaseModel
+
+from .audio_data import AudioMessage, SentenceMessage
+from .stage import SHUTDOWN
+
+QueuePolicy = Literal["block", "drop_oldest", "coalesce"]
+
+
+class QueueConfig(BaseModel):
+    """Bound and overflow policy of one pipeline queue."""
+
+    maxsize: int = 0  # 0 means unbounded
+    policy: QueuePolicy = "block"
+
+    class Config:
+        extra = "ignore"
+
+
+class PipelineQueuesConfig(BaseModel):
+    """Configuration of the queues between the pipeline stages."""
+
+    # Utterances waiting for the LLM; a new utterance is merged into a waiting one
+    llm: QueueConfig = QueueConfig(maxsize=2, policy="coalesce")
+    # Sentences waiting for synthesis; the LLM waits once this many are queued
+    tts: QueueConfig = QueueConfig(maxsize=8, policy="block")
+    # Synthesized audio waiting for playback; synthesis waits once this many are queued
+    audio: QueueConfig = QueueConfig(maxsize=4, policy="block")
+
+    class Config:
+        extra = "ignore"
+
+
+def is_control_item(item: Any) -> bool:
+    """Check whether an item steers the pipeline rather than carrying content."""
+    if item is SHUTDOWN:
+        return True
+    if isinstance(item, str):
+        return item == "<EOS>"
+    return isinstance(item, AudioMessage | SentenceMessage) and item.is_eos
+
+
+def merge_items(older: Any, newer: Any) -> Any | None:
+    """
+    Merge two queued items for the "coalesce" policy.
+
+    Args:
+        older: Newest item currently in the queue
+        newer: Item being put
+
+    Returns:
+        Any | None: The merged item, or None if the items cannot be merged
+    """
+    if isinstance(older, str) and isinstance(newer, str):
+        return f"{older.rstrip()} {newer.lstrip()}"
+    if getattr(older, "generation", None) != getattr(newer, "generation", None):
+        return None  # Never merge across responses
+    if isinstance(older, SentenceMessage) and isinstance(newer, SentenceMessage):
+        return SentenceMessage(
+            text=f"{older.text.rstrip()} {newer.text.lstrip()}",
+            generation=older.generation,
+            trace_id=older.trace_id,
+        )
+    if isinstance(older, AudioMessage) and isinstance(newer, AudioMessage):
+        return AudioMessage(
+            audio=np.concatenate([older.audio, newer.audio]).astype(np.float32, copy=False),
+            text=f"{older.text} {newer.text}",
+            generation=older.generation,
+            trace_id=older.trace_id,
+        )
+    return None
+
+
+class PipelineQueue(queue.Queue):
+    """
+    A queue.Queue with an overflow policy and depth gauges.
+
+    Consumers use it exactly like queue.Queue; only `put` behaves differently when the
+    queue is full.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        policy: QueuePolicy = "block",
+        name: str = "queue",
+        merge: Callable[[Any, Any], Any | None] = merge_items,
+    ) -> None:
+        """
+        Initialize the queue.
+
+        Args:
+            maxsize: Maximum number of content items, 0 for unbounded
+            policy: What a put does when the queue is full: "block", "drop_oldest" or "coalesce"
+            name: Name used in log messages and stats
+            merge: Combines the newest queued item with a new one for "coalesce", None if impossible
+        """
+        super().__init__(maxsize)
+        self.policy = policy
+        self.name = name
+        self.merge = merge
+
+        self.high_watermark = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.blocked_seconds = 0.0
+        self._closed = False
+
+    @classmethod
+    def from_config(cls, config: QueueConfig, name: str) -> "PipelineQueue":
+        """Create a queue from a QueueConfig."""
+        return cls(maxsize=config.maxsize, policy=config.policy, name=name)
+
+    def put(self, item: Any, block: bool = True, timeout: float | None = None) -> None:
+        """
+        Put an item into the queue, applying the overflow policy if it is full.
+
+        Args:
+            item: Item to enqueue
+            block: For the "block" policy, wait for space instead of raising queue.Full
+            timeout: For the "block" policy, longest time to wait before raising queue.Full
+
+        Raises:
+            queue.Full: If the queue is full and blocking is disabled or timed out
+        """
+        with self.not_full:
+            if item is SHUTDOWN:
+                # Release producers blocked on a full queue, the consumer is going away
+                self._closed = True
+                self.not_full.notify_all()
+            elif self._closed:
+                return
+            elif not is_control_item(item) and self._full():
+                if self.policy == "coalesce" and self._coalesce(item):
+                    return
+                if self.policy == "drop_oldest" and self._drop_oldest():
+                    pass
+                elif not self._wait_for_space(block, timeout):
+                    return
+
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.high_watermark = max(self.high_watermark, self._qsize())
+            self.not_empty.notify()
+
+    def _full(self) -> bool:
+        return 0 < self.maxsize <= self._qsize()
+
+    def _coalesce(self, item: Any) -> bool:
+        """Merge the item into the newest queued one; called with the mutex held."""
+        if not self.queue or is_control_item(self.queue[-1]):
+            return False
+        merged = self.merge(self.queue[-1], item)
+        if merged is None:
+            return False
+        self.queue[-1] = merged
+        self.coalesced += 1
+        return True
+
+    def _drop_oldest(self) -> bool:
+        """Discard the oldest content item; called with the mutex held."""
+        for index, queued in enumerate(self.queue):
+            if not is_control_item(queued):
+                del self.queue[index]
+                self.unfinished_tasks -= 1  # It will never be taken, so never marked done
+                self.dropped += 1
+                logger.debug(f"PipelineQueue {self.name}: Full, dropped oldest item.")
+                return True
+        return False
+
+    def _wait_for_space(self, block: bool, timeout: float | None) -> bool:
+        """
+        Wait until the queue has space; called with the mutex held.
+
+        Returns:
+            bool: True if there is space, False if the queue was closed while waiting
+        """
+        if not block:
+            raise queue.Full
+
+        start = time.perf_counter()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            while self._full() and not self._closed:
+                if deadline is None:
+                    self.not_full.wait()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise queue.Full
+                    self.not_full.wait(remaining)
+        finally:
+            self.blocked_seconds += time.perf_counter() - start
+        return not self._closed
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the gauges of this queue.
+
+        Returns:
+            dict: depth, maxsize, policy, high_watermark, dropped, coalesced and blocked_seconds
+        """
+        with self.mutex:
+            return {
+                "depth": self._qsize(),
+                "maxsize": self.maxsize,
+                "policy": self.policy,
+                "high_watermark": self.high_watermark,
+                "dropped": self.dropped,
+                "coalesced": self.coalesced,
+                "blocked_seconds": round(self.blocked_seconds, 3),
+            }
+
+    def reset_high_watermark(self) -> None:
+        """Restart the high watermark from the current depth."""
+        with self.mutex:
+            self.high_watermark = self._qsize()
@@ -0,0 +1,310 @@
+"""
+Assembly of the message list sent to the LLM each turn.
+
+Local servers (Ollama, llama.cpp) keep the KV cache of the previous request and only
+prefill the part of the new prompt after the longest common prefix. Two modes:
+
+- "splice": the original layout. System prompt, then the memory context, then the last
+  N conversation messages. Memory and the trimmed window both slide every turn, so the
+  prompt diverges right after the system prompt and the whole history is prefilled again.
+- "prefix_stable": system prompt and few-shot examples, then a memory block that is only
+  rebuilt when the window is compacted, then the conversation turns appended in order.
+  When the window outgrows its limit it is cut back to half at once, so the prefix
+  breaks once every few turns instead of on every turn.
+
+With a token budget, messages longer than `max_message_tokens` lose their middle and
+the prompt is kept under `max_prompt_tokens` by dropping the oldest content first:
+remembered conversations, then entity facts, then the oldest live turns. The system
+prompt and the new user message are always sent. In prefix_stable mode an over-budget
+prompt triggers a compaction, which leaves the memory block and the window half of the
+remaining budget each, so trimming does not shift the prefix on every turn.
+
+The assembler also measures the share of each prompt that repeats the previous request
+byte for byte, which is the part a prefix cache can reuse, and its token count.
+"""
+
+from collections.abc import Callable
+import json
+from os.path import commonprefix
+from typing import Any, Literal
+
+from loguru import logger
+from pydantic import BaseModel
+
+from .token_budget import TokenCounter
+
+PromptMode = Literal["splice", "prefix_stable"]
+
+
+class PromptConfig(BaseModel):
+    """Prompt layout, token budget and KV-cache friendly request options."""
+
+    mode: PromptMode = "splice"
+    keep_alive: str | None = None  # Ollama: keep the model and its KV cache loaded, e.g. "30m"
+    cache_prompt: bool = False  # llama.cpp server: reuse the KV cache of the common prompt prefix
+    max_prompt_tokens: int | None = None  # Token budget of the whole prompt, None for no limit
+    max_message_tokens: int | None = None  # Longer messages are shortened by cutting out their middle
+    tokenizer: str | None = None  # HuggingFace tokenizer.json of the LLM (needs `tokenizers`), else estimated
+
+    class Config:
+        extra = "ignore"
+
+
+class PromptAssembler:
+    """
+    Builds the messages of each LLM request and tracks prefix reuse between requests.
+
+    Used from the LLM processor thread only; it is not thread-safe.
+    """
+
+    def __init__(
+        self,
+        mode: PromptMode = "splice",
+        max_turn_messages: int = 12,
+        keep_alive: str | None = None,
+        cache_prompt: bool = False,
+        max_prompt_tokens: int | None = None,
+        max_message_tokens: int | None = None,
+        counter: TokenCounter | None = None,
+    ) -> None:
+        """
+        Initialize the assembler.
+
+        Args:
+            mode: "splice" or "prefix_stable", see the module docstring
+            max_turn_messages: Most conversation messages sent; prefix_stable compacts the
+                window to half of this when it is exceeded
+            keep_alive: Ollama keep_alive request field, None to leave it out
+            cache_prompt: Send llama.cpp's cache_prompt request field
+            max_prompt_tokens: Token budget of the prompt, None for no limit
+            max_message_tokens: Token limit of a single memory or conversation message
+            counter: Token counter, defaults to the cached heuristic
+        """
+        self.mode = mode
+        self.max_turn_messages = max_turn_messages
+        self.keep_alive = keep_alive
+        self.cache_prompt = cache_prompt
+        self.max_prompt_tokens = max_prompt_tokens
+        self.max_message_tokens = max_message_tokens
+        self.counter = counter or TokenCounter()
+
+        # prefix_stable window state
+        self._skip = 0  # Conversation messages before the window
+        self._anchor: dict[str, str] | None = None  # First message of the window, detects cleared history
+        self._memory_block: list[dict[str, str]] | None = None
+        self.compactions = 0
+
+        # Prefix reuse against the previous request
+        self._previous: list[str] = []
+        self.requests = 0
+        self.last_reuse = 0.0
+        self._reuse_total = 0.0
+        self.last_prompt_tokens = 0
+        self.max_sent_tokens = 0
+
+    @classmethod
+    def from_config(cls, config: PromptConfig, max_turn_messages: int = 12) -> "PromptAssembler":
+        """Create an assembler from a PromptConfig."""
+        return cls(
+            mode=config.mode,
+            max_turn_messages=max_turn_messages,
+            keep_alive=config.keep_alive,
+            cache_prompt=config.cache_prompt,
+            max_prompt_tokens=config.max_prompt_tokens,
+            max_message_tokens=config.max_message_tokens,
+            counter=TokenCounter.from_tokenizer_file(config.tokenizer),
+        )
+
+    def assemble(
+        self,
+        prompt_messages: list[dict[str, str]],
+        turns: list[dict[str, str]],
+        memory_context: Callable[[], list[dict[str, str]]] | None = None,
+    ) -> list[dict[str, str]]:
+        """
+        Build the messages of the next request.
+
+        Args:
+            prompt_messages: System prompt and few-shot examples, unchanged between turns
+            turns: All conversation messages so far, ending with the new user message
+            memory_context: Returns the memory messages (entities, earlier conversations);
+                called every turn in splice mode and only on compaction in prefix_stable mode
+
+        Returns:
+            list[dict[str, str]]: Messages to send
+        """
+        if self.mode == "prefix_stable":
+            head, memory, window = self._assemble_stable(prompt_messages, turns, memory_context)
+            tail: list[dict[str, str]] = []
+        else:
+            head = [msg for msg in prompt_messages if msg["role"] == "system"]
+            tail = [msg for msg in prompt_messages if msg["role"] != "system"]
+            memory = self._clip(self._fetch_memory(memory_context) or [])
+            window = self._clip(turns[-self.max_turn_messages :] if self.max_turn_messages else [])
+
+        if self.max_prompt_tokens is not None:
+            budget = self.max_prompt_tokens - self.counter.count_messages(head + tail)
+            memory, window = self._drop_oldest(budget, memory, window)
+        return head + memory + tail + window
+
+    def _assemble_stable(
+        self,
+        prompt_messages: list[dict[str, str]],
+        turns: list[dict[str, str]],
+        memory_context: Callable[[], list[dict[str, str]]] | None,
+    ) -> tuple[list[dict[str, str]], list[dict[str, str]], list[dict[str, str]]]:
+        """Append-only window after a frozen memory block."""
+        if self._skip and (len(turns) <= self._skip or turns[self._skip] != self._anchor):
+            logger.debug("PromptAssembler: Conversation history was reset, starting a new window")
+            self._skip = 0
+            self._memory_block = None
+
+        budget = None
+        if self.max_prompt_tokens is not None:
+            budget = max(self.max_prompt_tokens - self.counter.count_messages(prompt_messages), 0)
+        window = self._clip(turns[self._skip :])
+        over_budget = budget is not None and (
+            self.counter.count_messages((self._memory_block or []) + window) > budget
+        )
+        if len(window) > self.max_turn_messages or over_budget:
+            self._compact(turns, budget)
+            window = self._clip(turns[self._skip :])
+        self._anchor = turns[self._skip] if self._skip < len(turns) else None
+
+        if self._memory_block is None:
+            # A failed lookup is retried next turn instead of freezing an empty block
+            memory = self._fetch_memory(memory_context)
+            if memory is not None:
+                memory = self._clip(memory)
+                if budget is not None:
+                    memory, _ = self._drop_oldest(budget // 2, memory, [])
+                self._memory_block = memory
+        return prompt_messages, self._memory_block or [], window
+
+    def _compact(self, turns: list[dict[str, str]], budget: int | None) -> None:
+        """Restart the window with its newest half and schedule a memory refresh."""
+        self._skip = max(len(turns) - self.max_turn_messages // 2, 0)
+        if budget is not None:
+            # Leave the other half of the budget to the refreshed memory block
+            while self._skip < len(turns) - 1 and self.counter.count_messages(
+                self._clip(turns[self._skip :])
+            ) > budget // 2:
+                self._skip += 1
+        # Start the window on a user message so the roles keep alternating
+        while self._skip < len(turns) - 1 and turns[self._skip]["role"] != "user":
+            self._skip += 1
+        self._memory_block = None
+        self.compactions += 1
+        logger.debug(f"PromptAssembler: Compacted the conversation window to {len(turns) - self._skip} messages")
+
+    def _clip(self, messages: list[dict[str, str]]) -> list[dict[str, str]]:
+        """Shorten messages over `max_message_tokens`."""
+        if self.max_message_tokens is None:
+            return messages
+        limit = self.max_message_tokens
+        return [
+            msg if self.counter.count(msg.get("content") or "") <= limit
+            else {**msg, "content": self.counter.truncate(msg["content"], limit)}
+            for msg in messages
+        ]
+
+    def _drop_oldest(
+        self,
+        budget: int,
+        memory: list[dict[str, str]],
+        window: list[dict[str, str]],
+    ) -> tuple[list[dict[str, str]], list[dict[str, str]]]:
+        """
+        Drop the oldest content until memory and window fit the budget.
+
+        Remembered conversation goes first, then the entity facts (system messages of the
+        memory), then live turns from the start of the window; the newest message stays.
+        """
+        memory, window = list(memory), list(window)
+        used = self.counter.count_messages(memory + window)
+        while used > budget and memory:
+            index = next((i for i, msg in enumerate(memory) if msg["role"] != "system"), 0)
+            used -= self.counter.count_messages([memory.pop(index)])
+        while used > budget and len(window) > 1:
+            used -= self.counter.count_messages([window.pop(0)])
+            if len(window) > 1 and window[0]["role"] != "user":
+                used -= self.counter.count_messages([window.pop(0)])
+        if used > budget:
+            logger.warning(f"PromptAssembler: Prompt exceeds its token budget by {used - budget} even when trimmed")
+        return memory, window
+
+    @staticmethod
+    def _fetch_memory(
+        memory_context: Callable[[], list[dict[str, str]]] | None,
+    ) -> list[dict[str, str]] | None:
+        """Call the memory provider, returning None if it failed."""
+        if memory_context is None:
+            return []
+        try:
+            memory = memory_context()
+        except Exception as e:
+            logger.warning(f"PromptAssembler: Failed to retrieve memory context: {e}")
+            return None
+        logger.debug(f"PromptAssembler: Added {len(memory)} memory context messages")
+        return memory
+
+    def request_options(self) -> dict[str, Any]:
+        """
+        Get the top-level request fields that keep the server's prompt cache warm.
+
+        Returns:
+            dict[str, Any]: Fields to merge into the request body
+        """
+        options: dict[str, Any] = {}
+        if self.keep_alive is not None:
+            options["keep_alive"] = self.keep_alive
+        if self.cache_prompt:
+            options["cache_prompt"] = True
+        return options
+
+    def measure_reuse(self, messages: list[dict[str, str]]) -> float:
+        """
+        Record a request: its token count and how much of it repeats the previous one.
+
+        Args:
+            messages: Messages about to be sent
+
+        Returns:
+            float: Serialized length of the common prefix with the previous request
+                divided by the length of this one, between 0 and 1
+        """
+        current = [json.dumps(msg, ensure_ascii=False) for msg in messages]
+        total = sum(len(part) for part in current)
+        reused = 0
+        for new, old in zip(current, self._previous, strict=False):
+            if new == old:
+                reused += len(new)
+            else:
+                reused += len(commonprefix([new, old]))
+                break
+
+        self._previous = current
+        self.last_reuse = reused / total if total else 0.0
+        self.requests += 1
+        self._reuse_total += self.last_reuse
+        self.last_prompt_tokens = self.counter.count_messages(messages)
+        self.max_sent_tokens = max(self.max_sent_tokens, self.last_prompt_tokens)
+        return self.last_reuse
+
+    def stats(self) -> dict[str, float]:
+        """
+        Get prefix reuse and prompt size statistics.
+
+        Returns:
+            dict[str, float]: Requests assembled, reuse of the last request, mean reuse,
+                prefix_stable window compactions, and estimated tokens of the last and
+                the largest prompt
+        """
+        return {
+            "requests": self.requests,
+            "last_reuse": round(self.last_reuse, 4),
+            "mean_reuse": round(self._reuse_total / self.requests, 4) if self.requests else 0.0,
+            "compactions": self.compactions,
+            "last_prompt_tokens": self.last_prompt_tokens,
+            "max_prompt_tokens_sent": self.max_sent_tokens,
+        }
@@ -0,0 +1,187 @@
+"""
+Session management for serving several network clients from one process.
+
+Loading the ASR, TTS and VAD ONNX sessions dominates both start-up time and memory,
+while the per-conversation state (queues, events, history, memory) is small. The
+SessionManager therefore loads the models once and builds a lightweight Glados
+pipeline per connection on top of them.
+"""
+
+import threading
+from typing import Callable, Optional
+
+from loguru import logger
+
+from ..ASR import TranscriberProtocol
+from ..ASR.batching import BatchingTranscriber
+from ..audio_io import VAD
+from ..audio_io.network_io import NetworkAudioIO
+from ..audio_io.network_server import NetworkSessionServer
+from ..audio_io.vad_batching import BatchingVAD
+from ..TTS import SpeechSynthesizerProtocol
+from .engine import Glados, GladosConfig
+from .llm_client import create_llm_session
+from .startup import log_startup_timings, warm_up_models
+
+# Optional authentication support (v2.1+)
+try:
+    from ..auth import AuthenticationMiddleware
+except ImportError:
+    AuthenticationMiddleware = None  # type: ignore
+
+
+class SessionManager:
+    """
+    Runs one Glados pipeline per connected network client with shared, warm models.
+
+    ONNX Runtime sessions support concurrent `run()` calls, so the ASR, TTS and VAD
+    models are shared by all sessions; everything stateful is created per session.
+    """
+
+    def __init__(
+        self,
+        asr_model: TranscriberProtocol,
+        tts_model: SpeechSynthesizerProtocol,
+        config: GladosConfig,
+        max_sessions: int | None = None,
+        vad_model: VAD | None = None,
+        auth_middleware: Optional["AuthenticationMiddleware"] = None,
+    ) -> None:
+        """
+        Initialize the session manager.
+
+        Args:
+            asr_model: Shared ASR model
+            tts_model: Shared TTS model
+            config: Configuration used for every session
+            max_sessions: Maximum concurrent sessions, defaults to `config.network_max_sessions`
+            vad_model: Shared VAD, created if not given
+            auth_middleware: Optional authentication; sessions then get per-user memory
+        """
+        self._tts_model = tts_model
+        self._config = config
+        self.max_sessions = max_sessions if max_sessions is not None else config.network_max_sessions
+
+        # Utterances finishing at the same time in different sessions share one encoder run
+        self._asr_batcher: BatchingTranscriber | None = None
+        if config.asr_batching.enabled and self.max_sessions > 1:
+            if BatchingTranscriber.supports(asr_model):
+                self._asr_batcher = BatchingTranscriber(asr_model, config.asr_batching)
+            else:
+                logger.warning(f"{type(asr_model).__name__} cannot transcribe batches, ASR batching disabled")
+        self._asr_model: TranscriberProtocol = self._asr_batcher or asr_model  # type: ignore[assignment]
+
+        # Chunks arriving at the same time from different sessions share one VAD call
+        self._vad_batcher: BatchingVAD | None = None
+        if config.vad_batching.enabled and self.max_sessions > 1:
+            self._vad_batcher = BatchingVAD(vad_model if vad_model is not None else VAD(), config.vad_batching)
+
+        self._sessions_lock = threading.Lock()
+        self._sessions: dict[str, Glados] = {}
+        self._shutdown_event = threading.Event()
+
+        # All sessions talk to the same LLM endpoint: share one keep-alive pool, sized for a
+        # conversation stream plus a background memory call per session
+        pool_maxsize = max(config.llm_client.pool_maxsize, 2 * self.max_sessions)
+        self._llm_session = create_llm_session(config.llm_client.model_copy(update={"pool_maxsize": pool_maxsize}))
+
+        self.server = NetworkSessionServer(
+            session_factory=self._start_session,
+            host=config.network_host,
+            port=config.network_port,
+            max_sessions=self.max_sessions,
+            auth_middleware=auth_middleware,
+            vad_model=self._vad_batcher or vad_model,
+        )
+
+    @classmethod
+    def from_config(cls, config: GladosConfig) -> "SessionManager":
+        """
+        Load the shared models once and create a session manager.
+
+        Args:
+            config: Configuration object containing Glados initialization parameters
+
+        Returns:
+            SessionManager: Manager ready to `run()`
+        """
+        asr_model, tts_model, vad_model = Glados.load_all_models(config)
+
+        # Warm up once here, sessions are created with warm_up=False
+        if config.startup.warm_up:
+            warm_up_models(asr_model, tts_model, vad_model, parallel=config.startup.parallel_loading)
+        log_startup_timings()
+
+        return cls(asr_model=asr_model, tts_model=tts_model, config=config, vad_model=vad_model)
+
+    def _start_session(self, audio_io: NetworkAudioIO, session_id: str) -> Callable[[], None]:
+        """Build the Glados pipeline for a new connection and return its teardown function."""
+        config = self._config
+        glados = Glados(
+            asr_model=self._asr_model,
+            tts_model=self._tts_model,
+            audio_io=audio_io,
+            completion_url=config.completion_url,
+            llm_model=config.llm_model,
+            api_key=config.api_key,
+            interruptible=config.interruptible,
+            wake_word=config.wake_word,
+            announcement=config.announcement,
+            personality_preprompt=tuple(config.to_chat_messages()),
+            config=config,
+            warm_up=False,
+            session_id=session_id,
+            llm_session=self._llm_session,
+        )
+
+        with self._sessions_lock:
+            self._sessions[session_id] = glados
+        logger.success(f"Session {session_id} started ({len(self._sessions)}/{self.max_sessions} active)")
+
+        def end_session() -> None:
+            with self._sessions_lock:
+                self._sessions.pop(session_id, None)
+            glados.shutdown()
+            logger.info(f"Session {session_id} ended")
+
+        return end_session
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get session statistics.
+
+        Returns:
+            dict: Server connection statistics and number of running pipelines
+        """
+        stats = self.server.get_stats()
+        with self._sessions_lock:
+            stats["running_pipelines"] = len(self._sessions)
+        return stats
+
+    def stop(self) -> None:
+        """Stop accepting clients and shut down every running session."""
+        self._shutdown_event.set()
+        self.server.stop()
+
+        with self._sessions_lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for glados in sessions:
+            glados.shutdown()
+        if self._asr_batcher is not None:
+            self._asr_batcher.close()
+        if self._vad_batcher is not None:
+            self._vad_batcher.close()
+
+    def run(self) -> None:
+        """Serve clients until interrupted."""
+        self.server.start()
+        logger.success(f"Serving up to {self.max_sessions} concurrent sessions")
+
+        try:
+            while not self._shutdown_event.wait(timeout=1.0):
+                pass
+        except KeyboardInterrupt:
+            logger.info("Keyboard interrupt in session manager.")
+        finally:
+            self.stop()
@@ -15,7 +15,11 @@ import numpy as np
 from numpy.typing import NDArray
 
 from ..ASR import TranscriberProtocol
+from ..ASR.streaming import StreamingASRConfig, StreamingTranscription
 from ..audio_io import AudioProtocol
+from .generation import ResponseGeneration
+from .stage import StageRunner
+from .tracing import LatencyTracer
 
 
 class SpeechListener:
@@ -44,6 +48,9 @@ class SpeechListener:
         wake_word: str | None,
         pause_time: float,
         interruptible: bool = True,
+        tracer: LatencyTracer | None = None,
+        generation: ResponseGeneration | None = None,
+        streaming: StreamingASRConfig | None = None,
     ) -> None:
         """
         Initializes the SpeechListener with audio I/O, inter-thread communication, and ASR model.
@@ -57,6 +64,10 @@ class SpeechListener:
             asr_model: An instance conforming to `TranscriberProtocol` for speech recognition.
             wake_word: Optional wake word string to activate the assistant. Defaults to None.
             interruptible: If True, allows new speech input to interrupt ongoing assistant speech.
+            tracer: Optional latency tracer; a trace is started for every detected end of speech.
+            generation: Optional response generation, cancelled when the user barges in.
+            streaming: Optional streaming ASR settings; when enabled, speech is transcribed chunk by chunk
+                while it is recorded and partial transcripts are sent to network clients.
         """
         self.audio_io = audio_io
         self.llm_queue = llm_queue
@@ -64,6 +75,8 @@ class SpeechListener:
         self.wake_word = wake_word.lower() if wake_word else None
         self.pause_time = pause_time
         self.interruptible = interruptible
+        self.tracer = tracer
+        self.generation = generation
 
         # Circular buffer to hold pre-activation samples
         self._buffer: deque[NDArray[np.float32]] = deque(maxlen=self.BUFFER_SIZE // self.VAD_SIZE)
@@ -74,6 +87,14 @@ class SpeechListener:
         self._samples: list[NDArray[np.float32]] = []
         self._gap_counter = 0
 
+        # Incremental transcription of the current utterance, if enabled and supported by the ASR engine
+        self._stream: StreamingTranscription | None = None
+        if streaming is not None and streaming.enabled:
+            if StreamingTranscription.supports(asr_model):
+                self._stream = StreamingTranscription(asr_model, streaming)  # type: ignore[arg-type]
+            else:
+                logger.warning(f"{type(asr_model).__name__} does not support streaming, transcribing after speech")
+
         self.shutdown_event = shutdown_event
         self.currently_speaking_event = currently_speaking_event
         self.processing_active_event = processing_active_event
@@ -82,32 +103,24 @@ class SpeechListener:
         """
         Starts the main listening event loop, continuously processing audio input.
 
-        This method initializes the audio input stream and enters a loop that
-        listens for incoming audio samples and their Voice Activity Detection (VAD) confidence.
-        It retrieves samples from an internal queue and processes them via `_handle_audio_sample`.
-        The loop runs until the `shutdown_event` is set. It also handles brief pauses
-        in audio input using a timeout.
+        This method blocks on the audio sample queue and hands every sample and its Voice Activity
+        Detection (VAD) confidence to `_handle_audio_sample` as soon as it arrives. The loop runs
+        until the shutdown sentinel is received or the `shutdown_event` is set.
 
         Raises:
             Exception: Catches and logs general exceptions encountered during the listening loop,
-                       without stopping the loop unless `shutdown_event` is set.
+                       without stopping the loop unless shutdown is signalled.
         """
         logger.success("Audio Modules Operational")
 
-        # Loop forever, but is 'paused' when new samples are not available
         try:
-            while not self.shutdown_event.is_set():  # Check event BEFORE blocking get
-                try:
-                    # Use a timeout for the queue get
-                    sample, vad_confidence = self._sample_queue.get(timeout=self.pause_time)
-                    self._handle_audio_sample(sample, vad_confidence)
-                except queue.Empty:
-                    # Timeout occurred, loop again to check shutdown_event
-                    continue
-                except (OSError, RuntimeError) as e:  # More specific exceptions
-                    if not self.shutdown_event.is_set():  # Only log if not shutting down
-                        logger.error(f"Error in listen loop ({type(e).__name__}): {e}")
-                    continue
+            StageRunner(
+                name="SpeechListener",
+                input_queue=self._sample_queue,
+                handler=self._on_sample,
+                shutdown_event=self.shutdown_event,
+                error_backoff=0.0,
+            ).run()
 
             logger.info("Shutdown event detected in listen loop, exiting loop.")
 
@@ -117,6 +130,20 @@ class SpeechListener:
 
         logger.info("Speech Listener thread finished.")
 
+    def _on_sample(self, item: tuple[NDArray[np.float32], bool]) -> None:
+        """
+        Handle one item from the sample queue, logging audio errors without stopping the loop.
+
+        Args:
+            item: The audio sample and its VAD confidence.
+        """
+        sample, vad_confidence = item
+        try:
+            self._handle_audio_sample(sample, vad_confidence)
+        except (OSError, RuntimeError) as e:  # More specific exceptions
+            if not self.shutdown_event.is_set():  # Only log if not shutting down
+                logger.error(f"Error in listen loop ({type(e).__name__}): {e}")
+
     def _handle_audio_sample(self, sample: NDArray[np.float32], vad_confidence: bool) -> None:
         """
         Routes the processing of an individual audio sample based on the current recording state.
@@ -141,6 +168,7 @@ class SpeechListener:
         Samples are continuously added to a circular buffer until voice activity is detected.
         Upon VAD detection:
         - It checks for interruptibility if the assistant is currently speaking.
+        - The current response generation is cancelled, so every stage discards its in-flight work.
         - The assistant's speaking is stopped (`audio_io.stop_speaking()`).
         - The `processing_active_event` is cleared, pausing LLM/TTS activity.
         - The buffered samples are moved to `_samples`, and `_recording_started` is set to True.
@@ -156,10 +184,14 @@ class SpeechListener:
                 logger.debug(f"Detected voice activity but interruptibility is disabled: {self.interruptible=}, {self.currently_speaking_event.is_set()=}")
                 return
 
+            if self.generation is not None:
+                self.generation.cancel()
             self.audio_io.stop_speaking()
             self.processing_active_event.clear()
             self._samples = list(self._buffer)  # Clean conversion
             self._recording_started = True
+            if self._stream is not None:
+                self._stream.accept(np.concatenate(self._samples))
 
     def _process_activated_audio(self, sample: NDArray[np.float32], vad_confidence: bool) -> None:
         """
@@ -169,6 +201,8 @@ class SpeechListener:
         `_gap_counter` when no voice activity is detected. If the `_gap_counter`
         exceeds `PAUSE_LIMIT`, it signifies the end of a speech segment, triggering
         `_process_detected_audio`. Otherwise, if voice is detected, the gap counter is reset.
+        With streaming enabled the sample is also fed to the incremental transcription, and a
+        changed partial transcript is sent to the network client.
 
         Args:
             sample: A single audio sample (numpy array) from the input stream.
@@ -176,6 +210,11 @@ class SpeechListener:
         """
         self._samples.append(sample)
 
+        if self._stream is not None:
+            partial = self._stream.accept(sample)
+            if partial and hasattr(self.audio_io, "send_partial_transcription"):
+                self.audio_io.send_partial_transcription(partial)
+
         if not vad_confidence:
             self._gap_counter += 1
             if self._gap_counter >= self.PAUSE_LIMIT // self.VAD_SIZE:
@@ -223,13 +262,16 @@ class SpeechListener:
         self._samples.clear()
         self._gap_counter = 0
         self._buffer.clear()
+        if self._stream is not None:
+            self._stream.reset()
 
     def _process_detected_audio(self) -> None:
         """
         Processes the accumulated audio samples once a speech pause is detected.
 
         This method performs the following steps:
-        1. Transcribes the collected audio samples using the ASR model.
+        1. Transcribes the collected audio samples using the ASR model, or with streaming enabled,
+           finishes the incremental transcription by decoding only the audio after the last chunk.
         2. If transcription is successful:
             a. Checks for the `wake_word` (if configured).
             b. If the wake word is detected (or not required), the transcribed text is
@@ -238,7 +280,12 @@ class SpeechListener:
         """
         logger.debug("Detected pause after speech. Processing...")
 
-        detected_text = self.asr(self._samples)
+        trace_id = self.tracer.start("voice") if self.tracer else None
+
+        detected_text = self._stream.finalize() if self._stream is not None else self.asr(self._samples)
+
+        if self.tracer:
+            self.tracer.mark("asr_done", trace_id)
 
         if detected_text:
             logger.success(f"ASR text: '{detected_text}'")
@@ -249,9 +296,13 @@ class SpeechListener:
 
             if self.wake_word and not self._wakeword_detected(detected_text):
                 logger.info(f"Required wake word {self.wake_word=} not detected.")
+                if self.tracer:
+                    self.tracer.discard(trace_id)
             else:
                 self.llm_queue.put(detected_text)
                 self.processing_active_event.set()
+        elif self.tracer:
+            self.tracer.discard(trace_id)
 
         self.reset()
 
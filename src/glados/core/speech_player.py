@@ -1,18 +1,21 @@
 import queue
 import threading
-import time
 
 from loguru import logger
 
 from ..audio_io import AudioProtocol
 from .audio_data import AudioMessage
+from .generation import ResponseGeneration
+from .stage import StageRunner
+from .tracing import LatencyTracer
 
 
 class SpeechPlayer:
     """
     A thread that plays audio messages from a queue, handling interruptions and end-of-stream tokens.
-    This class is designed to run in a separate thread, continuously checking for audio messages to play
-    until a shutdown event is set. It manages conversation history and handles interruptions gracefully.
+    This class is designed to run in a separate thread, blocking on its queue until audio messages
+    arrive or shutdown is signalled. It manages conversation history and handles interruptions gracefully.
+    Audio of an interrupted (cancelled) response generation is discarded as it is taken from the queue.
     """
 
     def __init__(
@@ -25,6 +28,8 @@ class SpeechPlayer:
         currently_speaking_event: threading.Event,
         processing_active_event: threading.Event,
         pause_time: float,
+        tracer: LatencyTracer | None = None,
+        generation: ResponseGeneration | None = None,
     ) -> None:
         self.audio_io = audio_io
         self.audio_output_queue = audio_output_queue
@@ -34,93 +39,105 @@ class SpeechPlayer:
         self.currently_speaking_event = currently_speaking_event
         self.processing_active_event = processing_active_event
         self.pause_time = pause_time
+        self.tracer = tracer
+        self.generation = generation
+        self._assistant_text_accumulator: list[str] = []
 
     def run(self) -> None:
         """
         Starts the main loop for the AudioPlayer thread.
-        This method continuously checks the audio output queue for messages to process.
+        This method blocks on the audio output queue and plays each message as soon as it arrives.
         It plays audio messages, handles end-of-stream tokens, and manages the conversation history.
         """
-        assistant_text_accumulator: list[str] = []
+        self._assistant_text_accumulator = []
 
         logger.info("AudioPlayer thread started.")
-        while not self.shutdown_event.is_set():
-            try:
-                audio_msg = self.audio_output_queue.get(timeout=self.pause_time)
-
-                audio_len = len(audio_msg.audio) if audio_msg.audio is not None else 0
-
-                if audio_msg.is_eos:
-                    logger.debug("AudioPlayer: Processing end of stream token.")
-                    self.conversation_history.add_message(
-                        "assistant", " ".join(assistant_text_accumulator)
-                    )
-                    assistant_text_accumulator = []
-                    self.currently_speaking_event.clear()
-                    continue
-
-                if audio_len and audio_msg.text:  # Ensure there's audio and text
-                    self.currently_speaking_event.set()  # We are about to speak
-
-                    self.audio_io.start_speaking(audio_msg.audio, self.tts_sample_rate)
-                    logger.success(f"TTS text: {audio_msg.text}")
-                    
-                    # Send text to network client if available
-                    if hasattr(self.audio_io, 'send_text_to_client'):
-                        self.audio_io.send_text_to_client(audio_msg.text)
-
-                    # Wait for the audio to finish playing or be interrupted
-                    interrupted, percentage_played = self.audio_io.measure_percentage_spoken(
-                        audio_len, self.tts_sample_rate
-                    )
-
-                    if interrupted:
-                        clipped_text = self.clip_interrupted_sentence(audio_msg.text, percentage_played)
-                        logger.success(f"TTS interrupted at {percentage_played}%: {clipped_text}")
-
-                        assistant_text_accumulator.append(clipped_text)
-                        self.conversation_history.add_message(
-                            "assistant", " ".join(assistant_text_accumulator)
-                        )
-                        self.conversation_history.add_message(
-                            "user",
-                            f"[SYSTEM: User interrupted mid-response! Full intended output: '{audio_msg.text}']"
-                        )
-                        assistant_text_accumulator = []  # Reset accumulator
-                        self._clear_audio_queue()
-
-                    else:  # Playback completed normally
-                        logger.success(f"AudioPlayer: Playback completed for: '{audio_msg.text}'")
-                        assistant_text_accumulator.append(audio_msg.text)
-                        
-                    self.currently_speaking_event.clear()
-    
-                else:
-                    logger.warning(f"AudioPlayer: Received empty audio message or no text: {audio_len, audio_msg}")
-
-            except queue.Empty:
-                pass  # No audio to play right now
-
-            except Exception as e:
-                logger.exception(f"AudioPlayer: Unexpected error in run loop: {e}")
-                time.sleep(self.pause_time)  # small sleep here to prevent tight loop on persistent error
+        StageRunner(
+            name="AudioPlayer",
+            input_queue=self.audio_output_queue,
+            handler=self._play,
+            shutdown_event=self.shutdown_event,
+            error_backoff=self.pause_time,  # small sleep here to prevent tight loop on persistent error
+        ).run()
         logger.info("AudioPlayer thread finished.")
 
-    def _clear_audio_queue(self) -> None:
-        """Clears the audio output queue and resets the speaking event.
+    def _play(self, audio_msg: AudioMessage) -> None:
+        """
+        Play one audio message, or record the finished response on an end-of-stream token.
 
-        This is called when an interruption occurs to ensure no stale audio messages remain.
+        Args:
+            audio_msg: Message taken from the audio output queue
+        """
+        audio_len = len(audio_msg.audio) if audio_msg.audio is not None else 0
+
+        if self.generation is not None and not self.generation.is_current(audio_msg.generation):
+            self._discard_stale(audio_msg)
+            return
+
+        if audio_msg.is_eos:
+            logger.debug("AudioPlayer: Processing end of stream token.")
+            self.conversation_history.add_message("assistant", " ".join(self._assistant_text_accumulator))
+            self._assistant_text_accumulator = []
+            self.currently_speaking_event.clear()
+            if self.tracer:
+                self.tracer.end("playback_end", audio_msg.trace_id)
+            return
+
+        if audio_len and audio_msg.text:  # Ensure there's audio and text
+            self.currently_speaking_event.set()  # We are about to speak
+            if self.tracer:
+                self.tracer.mark("playback_start", audio_msg.trace_id)
+
+            self.audio_io.start_speaking(audio_msg.audio, self.tts_sample_rate)
+            logger.success(f"TTS text: {audio_msg.text}")
+
+            # Send text to network client if available
+            if hasattr(self.audio_io, 'send_text_to_client'):
+                self.audio_io.send_text_to_client(audio_msg.text)
+
+            # Wait for the audio to finish playing or be interrupted
+            interrupted, percentage_played = self.audio_io.measure_percentage_spoken(
+                audio_len, self.tts_sample_rate
+            )
+
+            if interrupted:
+                clipped_text = self.clip_interrupted_sentence(audio_msg.text, percentage_played)
+                logger.success(f"TTS interrupted at {percentage_played}%: {clipped_text}")
+
+                self._assistant_text_accumulator.append(clipped_text)
+                self.conversation_history.add_message("assistant", " ".join(self._assistant_text_accumulator))
+                self.conversation_history.add_message(
+                    "user",
+                    f"[SYSTEM: User interrupted mid-response! Full intended output: '{audio_msg.text}']"
+                )
+                self._assistant_text_accumulator = []  # Reset accumulator
+                if self.generation is not None and audio_msg.generation is not None:
+                    # Usually already done by the listener; makes the rest of the response stale
+                    self.generation.cancel(audio_msg.generation)
+
+            else:  # Playback completed normally
+                logger.success(f"AudioPlayer: Playback completed for: '{audio_msg.text}'")
+                self._assistant_text_accumulator.append(audio_msg.text)
+
+            self.currently_speaking_event.clear()
+
+        else:
+            logger.warning(f"AudioPlayer: Received empty audio message or no text: {audio_len, audio_msg}")
+
+    def _discard_stale(self, audio_msg: AudioMessage) -> None:
         """
+        Drop a message of an interrupted response.
 
-        logger.debug("AudioPlayer: Clearing audio queue due to interruption.")
-        self.currently_speaking_event.clear()
-        # with self.audio_output_queue.mutex:
-        #     self.audio_output_queue.queue.clear()
-        try:
-            while True:
-                self.audio_output_queue.get_nowait()
-        except queue.Empty:
-            pass
+        If the response was interrupted between sentences, the sentences that were played in
+        full are still recorded once its end-of-stream token comes through.
+
+        Args:
+            audio_msg: Message whose generation has been cancelled
+        """
+        if audio_msg.is_eos and self._assistant_text_accumulator:
+            self.conversation_history.add_message("assistant", " ".join(self._assistant_text_accumulator))
+            self._assistant_text_accumulator = []
+        logger.debug(f"AudioPlayer: Discarding stale message of an interrupted response: '{audio_msg.text}'")
 
     def clip_interrupted_sentence(self, generated_text: str, percentage_played: float) -> str:
         """
@@ -0,0 +1,106 @@
+"""
+Event-driven stage runner for the Glados pipeline.
+
+Each pipeline stage (listener, LLM, TTS, player, text handler) consumes one queue.
+Instead of polling that queue every PAUSE_TIME, a StageRunner blocks on it and
+wakes as soon as an item arrives. Shutdown is delivered through the same queue as
+a SHUTDOWN sentinel, so a blocked stage exits immediately rather than on its next
+poll. Interruption needs no wake-up of its own: it is signalled to the busy stage
+through events it already waits on (e.g. the audio I/O's stop-speaking event).
+"""
+
+from collections.abc import Callable, Iterable
+import queue
+import threading
+import time
+from typing import Any, Final
+
+from loguru import logger
+
+
+class _Shutdown:
+    """Type of the SHUTDOWN sentinel, compare with `is`."""
+
+    def __repr__(self) -> str:
+        return "SHUTDOWN"
+
+
+SHUTDOWN: Final = _Shutdown()
+
+
+def post_shutdown(queues: Iterable[queue.Queue[Any]]) -> None:
+    """
+    Wake every stage blocked on one of the given queues so that it exits.
+
+    Args:
+        queues: Input queues of the stages to stop
+    """
+    for q in queues:
+        q.put(SHUTDOWN)
+
+
+class StageRunner:
+    """
+    Runs a pipeline stage: blocks on its input queue and calls the handler for every item.
+
+    The loop ends when the SHUTDOWN sentinel is received or the shutdown event is set.
+    Blocking gets use `wake_interval` as a safety net only, so a stage still notices a
+    shutdown event set without a sentinel; when `on_idle` is given it is called after
+    `wake_interval` seconds without input.
+    """
+
+    DEFAULT_WAKE_INTERVAL: float = 1.0  # Seconds, fallback check of the shutdown event
+
+    def __init__(
+        self,
+        name: str,
+        input_queue: queue.Queue[Any],
+        handler: Callable[[Any], None],
+        shutdown_event: threading.Event,
+        on_idle: Callable[[], None] | None = None,
+        wake_interval: float = DEFAULT_WAKE_INTERVAL,
+        error_backoff: float = 0.05,
+    ) -> None:
+        """
+        Initialize the stage runner.
+
+        Args:
+            name: Stage name used in log messages
+            input_queue: Queue the stage consumes
+            handler: Called with every item taken from the queue
+            shutdown_event: Event signalling application shutdown
+            on_idle: Optional callback run when no input arrived for `wake_interval` seconds
+            wake_interval: Longest time a get blocks before re-checking shutdown / running `on_idle`
+            error_backoff: Pause after an unexpected handler error, avoids a tight error loop
+        """
+        self.name = name
+        self.input_queue = input_queue
+        self.handler = handler
+        self.shutdown_event = shutdown_event
+        self.on_idle = on_idle
+        self.wake_interval = wake_interval
+        self.error_backoff = error_backoff
+
+    def run(self) -> None:
+        """Process items until shutdown."""
+        while not self.shutdown_event.is_set():
+            try:
+                item = self.input_queue.get(timeout=self.wake_interval)
+            except queue.Empty:
+                if self.on_idle and not self.shutdown_event.is_set():
+                    self._call(self.on_idle)
+                continue
+
+            if item is SHUTDOWN:
+                logger.debug(f"{self.name}: Received shutdown sentinel.")
+                break
+
+            self._call(self.handler, item)
+
+    def _call(self, func: Callable[..., None], *args: Any) -> None:
+        try:
+            func(*args)
+        except Exception as e:
+            if not self.shutdown_event.is_set():
+                logger.exception(f"{self.name}: Unexpected error in run loop: {e}")
+                time.sleep(self.error_backoff)
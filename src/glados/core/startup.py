@@ -0,0 +1,145 @@
+"""
+Concurrent model loading and warm-up at start-up.
+
+Building the ASR, TTS and VAD models is dominated by ONNX Runtime session creation
+and pickle loading, which release the GIL, so the constructors run side by side in
+threads instead of one after another. Afterwards every model is run once at
+representative input shapes: the first inference of a session pays for memory
+arena growth and kernel selection, and with `asr_frame_extraction: numba` the first
+mel spectrogram loads (or, on the very first start, compiles) `_extract_windows_numba`.
+Doing that at start-up keeps those costs out of the first turns of a live conversation.
+
+Load and warm-up times are recorded per model and can be queried with
+`startup_timings()`.
+"""
+
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+from typing import Any, TypeVar
+
+from loguru import logger
+import numpy as np
+from pydantic import BaseModel
+import soundfile as sf  # type: ignore
+
+from ..utils.resources import resource_path
+
+T = TypeVar("T")
+
+WARMUP_AUDIO = "data/0.wav"
+WARMUP_SHORT_SECONDS = 1.0  # Also transcribe a short utterance, the other common input shape
+
+_lock = threading.Lock()
+_timings: dict[str, dict[str, float]] = {}
+
+
+class StartupConfig(BaseModel):
+    """Configuration of model loading and warm-up at start-up."""
+
+    parallel_loading: bool = True  # Construct the models concurrently instead of one after another
+    warm_up: bool = True  # Run every model once before serving the first conversation
+
+    class Config:
+        extra = "ignore"
+
+
+def run_timed(jobs: dict[str, Callable[[], T]], phase: str, parallel: bool = True) -> dict[str, T]:
+    """
+    Run named jobs, concurrently if requested, and record how long each one took.
+
+    Parameters:
+        jobs: Job name (usually the model) -> function to run
+        phase: Name of the timing to record, e.g. "load" records `load_seconds`
+        parallel: Run the jobs in a thread each instead of one after another
+
+    Returns:
+        dict: Job name -> return value of the job
+
+    Raises:
+        Exception: The first exception raised by a job, after all jobs have finished
+    """
+
+    def timed(name: str, job: Callable[[], T]) -> T:
+        start = time.perf_counter()
+        try:
+            return job()
+        finally:
+            with _lock:
+                _timings.setdefault(name, {})[f"{phase}_seconds"] = time.perf_counter() - start
+
+    if not parallel or len(jobs) < 2:
+        return {name: timed(name, job) for name, job in jobs.items()}
+
+    with ThreadPoolExecutor(max_workers=len(jobs), thread_name_prefix=f"startup-{phase}") as executor:
+        futures = {name: executor.submit(timed, name, job) for name, job in jobs.items()}
+    return {name: future.result() for name, future in futures.items()}
+
+
+def warm_up_asr(asr_model: Any) -> None:
+    """
+    Transcribe the bundled sample, whole and as a short utterance.
+
+    This runs the mel spectrogram (loading the numba framing if selected), the acoustic
+    model and the decoder on a long and a short input.
+    """
+    audio_path = resource_path(WARMUP_AUDIO)
+    asr_model.transcribe_file(audio_path)
+    audio, sample_rate = sf.read(audio_path, dtype="float32", always_2d=True)
+    asr_model.transcribe(np.ascontiguousarray(audio[: int(sample_rate * WARMUP_SHORT_SECONDS), 0]))
+
+
+def warm_up_tts(tts_model: Any) -> None:
+    """
+    Run the voice model and its G2P model once.
+
+    Wrappers (audio cache, RVC) are skipped so the warm-up neither fills the cache nor
+    calls the RVC service; the innermost synthesizer is the one holding the ONNX sessions.
+    """
+    while hasattr(tts_model, "base_tts"):
+        tts_model = tts_model.base_tts
+    tts_model.warm_up()
+
+
+def warm_up_models(
+    asr_model: Any | None = None,
+    tts_model: Any | None = None,
+    vad: Any | None = None,
+    parallel: bool = True,
+) -> None:
+    """
+    Warm up the given models and record their warm-up times.
+
+    Parameters:
+        asr_model: ASR model, warmed with `warm_up_asr`
+        tts_model: TTS model, possibly wrapped, warmed with `warm_up_tts`
+        vad: VAD, warmed with its `warm_up` method
+        parallel: Warm the models up concurrently
+    """
+    jobs: dict[str, Callable[[], None]] = {}
+    if asr_model is not None:
+        jobs["asr"] = lambda: warm_up_asr(asr_model)
+    if tts_model is not None:
+        jobs["tts"] = lambda: warm_up_tts(tts_model)
+    if vad is not None:
+        jobs["vad"] = vad.warm_up
+    run_timed(jobs, "warmup", parallel=parallel)
+
+
+def startup_timings() -> dict[str, dict[str, float]]:
+    """
+    Get the load and warm-up time of every model loaded so far.
+
+    Returns:
+        dict: Model name -> `load_seconds` and, once warmed up, `warmup_seconds`
+    """
+    with _lock:
+        return {name: dict(timing) for name, timing in _timings.items()}
+
+
+def log_startup_timings() -> None:
+    """Log the load and warm-up time of every model."""
+    for name, timing in startup_timings().items():
+        parts = [f"{phase.removesuffix('_seconds')} {seconds:.2f}s" for phase, seconds in timing.items()]
+        logger.success(f"Startup {name}: {', '.join(parts)}")
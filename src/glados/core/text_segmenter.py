@@ -0,0 +1,163 @@
+"""
+Incremental segmentation of streamed LLM text into TTS-sized pieces.
+
+LLM tokens rarely line up with sentence punctuation: a chunk may be "world." or
+"?\"" rather than a bare ".", so boundaries have to be searched inside the
+accumulated text. The segmenter also decides *when* a piece is worth sending:
+
+- Before anything of the response has been spoken, latency matters most. The first
+  segment is flushed at the first sentence end, at a comma/dash once the clause has
+  `first_clause_min_words` words, or after `first_segment_max_words` words at the
+  latest.
+- Once audio is playing there is time to spare, so later segments are cut only at
+  sentence ends and short sentences are merged until a segment has at least
+  `min_segment_words` words. This gives the TTS longer, more natural inputs.
+  `max_segment_words` bounds run-on sentences.
+"""
+
+import re
+
+from pydantic import BaseModel
+
+# Sentence ends, optionally followed by closing quotes/brackets
+_HARD_BOUNDARY = re.compile(r"[.!?;:\n]+[\"')\]]*")
+# Clause ends, only used for the first segment
+_SOFT_BOUNDARY = re.compile(r"[,–—]+[\"')\]]*")
+_WORD = re.compile(r"\S+")
+
+
+class SegmentationConfig(BaseModel):
+    """Configuration of the streaming text segmenter."""
+
+    first_clause_min_words: int = 3  # Flush the first clause at a comma once it has this many words
+    first_segment_max_words: int = 10  # Force the first flush after this many words
+    min_segment_words: int = 6  # Later segments merge short sentences up to this length
+    max_segment_words: int = 40  # Cut run-on sentences after this many words
+
+    class Config:
+        extra = "ignore"
+
+
+class TextSegmenter:
+    """
+    Turns a stream of text chunks into segments ready for speech synthesis.
+
+    Call `push` with every chunk and send the returned segments to TTS, then `flush`
+    at the end of the response. `reset` prepares the segmenter for the next response.
+    """
+
+    def __init__(
+        self,
+        first_clause_min_words: int = 3,
+        first_segment_max_words: int = 10,
+        min_segment_words: int = 6,
+        max_segment_words: int = 40,
+    ) -> None:
+        """
+        Initialize the segmenter.
+
+        Args:
+            first_clause_min_words: Minimum words before a comma may end the first segment
+            first_segment_max_words: Word count after which the first segment is flushed regardless
+            min_segment_words: Minimum words of later segments; shorter sentences are merged
+            max_segment_words: Word count after which a later segment is cut regardless
+        """
+        self.first_clause_min_words = first_clause_min_words
+        self.first_segment_max_words = first_segment_max_words
+        self.min_segment_words = min_segment_words
+        self.max_segment_words = max_segment_words
+
+        self._buffer = ""
+        self._segments_emitted = 0
+
+    @classmethod
+    def from_config(cls, config: SegmentationConfig) -> "TextSegmenter":
+        """Create a segmenter from a SegmentationConfig."""
+        return cls(**config.model_dump())
+
+    def reset(self) -> None:
+        """Discard buffered text and start a new response."""
+        self._buffer = ""
+        self._segments_emitted = 0
+
+    def push(self, chunk: str) -> list[str]:
+        """
+        Add a chunk of streamed text.
+
+        Args:
+            chunk: Next piece of the LLM response
+
+        Returns:
+            list[str]: Segments completed by this chunk, possibly empty
+        """
+        self._buffer += chunk
+
+        segments = []
+        while (cut := self._next_cut()) is not None:
+            segment, self._buffer = self._buffer[:cut], self._buffer[cut:]
+            if segment.strip():
+                segments.append(segment)
+                self._segments_emitted += 1
+        return segments
+
+    def flush(self) -> str | None:
+        """
+        Return whatever text is left at the end of the response.
+
+        Returns:
+            str | None: The remaining text, or None if nothing but whitespace is buffered
+        """
+        remainder, self._buffer = self._buffer, ""
+        if not remainder.strip():
+            return None
+        self._segments_emitted += 1
+        return remainder
+
+    def _next_cut(self) -> int | None:
+        """Find where the next segment ends in the buffer, if it is complete yet."""
+        buffer = self._buffer
+        first = self._segments_emitted == 0
+        candidates: list[int] = []
+
+        for match in _HARD_BOUNDARY.finditer(buffer):
+            if not self._is_boundary(match):
+                continue
+            if first or len(_WORD.findall(buffer, 0, match.end())) >= self.min_segment_words:
+                candidates.append(match.end())
+                break
+
+        if first:
+            for match in _SOFT_BOUNDARY.finditer(buffer):
+                if (
+                    self._is_boundary(match)
+                    and len(_WORD.findall(buffer, 0, match.start())) >= self.first_clause_min_words
+                ):
+                    candidates.append(match.end())
+                    break
+
+        limit = self.first_segment_max_words if first else self.max_segment_words
+        forced = self._cut_after_words(limit)
+        if forced is not None:
+            candidates.append(forced)
+
+        return min(candidates) if candidates else None
+
+    def _is_boundary(self, match: re.Match[str]) -> bool:
+        """
+        Check that punctuation really ends a sentence or clause.
+
+        The punctuation must be followed by whitespace. At the end of the buffer it counts
+        as well, unless it follows a digit ("3." may become "3.5", "10:" may become "10:30").
+        """
+        end = match.end()
+        if end < len(self._buffer):
+            return self._buffer[end].isspace()
+        start = match.start()
+        return not (start > 0 and self._buffer[start - 1].isdigit() and match.group()[0] in ".:,")
+
+    def _cut_after_words(self, count: int) -> int | None:
+        """Position right after the `count`-th word, once that word is known to be complete."""
+        for index, match in enumerate(_WORD.finditer(self._buffer), start=1):
+            if index == count:
+                return match.end() if match.end() < len(self._buffer) else None
+        return None
@@ -0,0 +1,125 @@
+"""
+Token counting for LLM prompt budgets.
+
+Prefill time of a local LLM grows with the number of prompt tokens, not messages, so the
+prompt assembler limits what it sends by tokens. Counting uses the model's tokenizer when
+a HuggingFace `tokenizer.json` is configured and the optional `tokenizers` package is
+installed, otherwise a heuristic that slightly overestimates typical English text.
+Counts are cached per string: the same system prompt and history messages are counted
+again on every turn.
+"""
+
+from collections.abc import Callable
+from functools import lru_cache
+import math
+from pathlib import Path
+import re
+from typing import Any
+
+from loguru import logger
+
+try:
+    from tokenizers import Tokenizer  # type: ignore
+
+    TOKENIZERS_AVAILABLE = True
+except ImportError:
+    Tokenizer = None  # type: ignore
+    TOKENIZERS_AVAILABLE = False
+
+_PIECES = re.compile(r"\w+|[^\w\s]")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens of a text without a tokenizer.
+
+    Every punctuation mark counts as one token and every word as one token per four
+    UTF-8 bytes, rounded up; BPE vocabularies usually encode common words in one token,
+    so the estimate errs on the high side.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        int: Estimated token count
+    """
+    return sum(math.ceil(len(piece.encode("utf-8")) / 4) for piece in _PIECES.findall(text))
+
+
+class TokenCounter:
+    """Cached token counts of texts and chat messages."""
+
+    MESSAGE_OVERHEAD = 4  # Role markers and separators the chat template adds per message
+    ELISION = " [...] "
+
+    def __init__(self, tokenize: Callable[[str], int] | None = None, cache_size: int = 4096) -> None:
+        """
+        Initialize the counter.
+
+        Args:
+            tokenize: Returns the token count of a text, defaults to `estimate_tokens`
+            cache_size: Distinct texts whose counts are kept
+        """
+        self._count = lru_cache(maxsize=cache_size)(tokenize or estimate_tokens)
+
+    @classmethod
+    def from_tokenizer_file(cls, path: str | Path | None) -> "TokenCounter":
+        """
+        Create a counter that uses a HuggingFace tokenizer.json, if possible.
+
+        Args:
+            path: Path to tokenizer.json, or None for the heuristic
+
+        Returns:
+            TokenCounter: Exact counter, or the heuristic one if the file or the
+                `tokenizers` package is missing
+        """
+        if path is None:
+            return cls()
+        if not TOKENIZERS_AVAILABLE:
+            logger.warning("TokenCounter: 'tokenizers' is not installed, estimating prompt tokens heuristically")
+            return cls()
+        try:
+            tokenizer: Any = Tokenizer.from_file(str(path))
+        except Exception as e:
+            logger.warning(f"TokenCounter: Failed to load tokenizer {path}, estimating heuristically: {e}")
+            return cls()
+        return cls(lambda text: len(tokenizer.encode(text, add_special_tokens=False).ids))
+
+    def count(self, text: str) -> int:
+        """Get the token count of a text."""
+        return self._count(text)
+
+    def count_messages(self, messages: list[dict[str, str]]) -> int:
+        """Get the token count of chat messages, including the per-message template overhead."""
+        return sum(self.count(msg.get("content") or "") + self.MESSAGE_OVERHEAD for msg in messages)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """
+        Shorten a text to about `max_tokens` by cutting out its middle.
+
+        The start and the end of a long message usually carry the question and its
+        context, so two thirds of the budget go to the head and one third to the tail.
+
+        Args:
+            text: Text to shorten
+            max_tokens: Token budget of the result
+
+        Returns:
+            str: The text itself if it fits, otherwise head + " [...] " + tail
+        """
+        tokens = self.count(text)
+        if tokens <= max_tokens:
+            return text
+        keep = len(text) * max_tokens / tokens
+        while keep >= 1:
+            head, tail = int(keep * 2 / 3), int(keep / 3)
+            shortened = text[:head].rstrip() + self.ELISION + (text[-tail:].lstrip() if tail else "")
+            if self.count(shortened) <= max_tokens:
+                return shortened
+            keep *= 0.9
+        return self.ELISION.strip()
+
+    def cache_info(self) -> Any:
+        """Hit and miss statistics of the count cache."""
+        return self._count.cache_info()
@@ -0,0 +1,255 @@
+"""
+Per-utterance latency tracing for the Glados pipeline.
+
+A trace is started when the SpeechListener detects the end of speech (or when a
+text message arrives) and collects the time at which the utterance passes each
+pipeline milestone:
+
+    vad_endpoint -> asr_done -> llm_request_sent -> llm_first_token
+    -> first_sentence_flushed -> tts_first_audio -> playback_start -> playback_end
+
+The LLM processor tags the sentences it queues with the ID of the trace its request
+belongs to, and the TTS and audio stages pass the ID on with the audio. Marks carrying
+an ID that is no longer current are ignored, so a cancelled response still draining
+through the queues after a barge-in cannot record its milestones on the new utterance.
+Starting a new trace while one is still open (the user barged in) closes the old one
+as interrupted.
+
+Completed traces feed rolling p50/p95/p99 statistics that can be queried at runtime
+and can be appended to a JSONL file for offline analysis.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+import threading
+import time
+from typing import Any, ClassVar
+import uuid
+
+from loguru import logger
+import numpy as np
+from pydantic import BaseModel
+
+SPANS: tuple[str, ...] = (
+    "vad_endpoint",
+    "text_received",
+    "asr_done",
+    "llm_request_sent",
+    "llm_first_token",
+    "first_sentence_flushed",
+    "tts_first_audio",
+    "playback_start",
+    "playback_end",
+)
+
+
+class TracingConfig(BaseModel):
+    """Configuration for per-utterance latency tracing."""
+
+    enabled: bool = True
+    window: int = 1000  # Completed traces kept for percentile statistics
+    jsonl_path: str | None = None  # Append every completed trace to this file
+
+    class Config:
+        extra = "ignore"
+
+
+@dataclass
+class Trace:
+    """Milestones of one utterance, as milliseconds since the trace started."""
+
+    trace_id: str
+    origin: str  # "voice" or "text"
+    started_at: float  # Wall clock, seconds since epoch
+    _t0: float = field(repr=False)
+    spans: dict[str, float] = field(default_factory=dict)
+    interrupted: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the trace to a JSON-serializable dictionary."""
+        return {
+            "trace_id": self.trace_id,
+            "origin": self.origin,
+            "started_at": self.started_at,
+            "interrupted": self.interrupted,
+            "spans_ms": self.spans,
+        }
+
+
+class LatencyTracer:
+    """
+    Mints traces, records span marks and aggregates completed traces.
+
+    All methods are thread-safe; marks on a span that was already recorded for the current
+    trace are ignored, so stages can call `mark` for every sentence and only the first counts.
+    """
+
+    PERCENTILES: ClassVar[tuple[int, ...]] = (50, 95, 99)
+
+    def __init__(self, window: int = 1000, jsonl_path: str | Path | None = None, enabled: bool = True) -> None:
+        """
+        Initialize the tracer.
+
+        Args:
+            window: Number of completed traces kept for statistics and `dump_jsonl`
+            jsonl_path: Optional file every completed trace is appended to
+            enabled: If False all calls are no-ops
+        """
+        self.enabled = enabled
+        self.jsonl_path = Path(jsonl_path) if jsonl_path else None
+        self._lock = threading.Lock()
+        self._current: Trace | None = None
+        self._completed: deque[Trace] = deque(maxlen=window)
+
+    @classmethod
+    def from_config(cls, config: TracingConfig) -> "LatencyTracer":
+        """Create a tracer from a TracingConfig."""
+        return cls(window=config.window, jsonl_path=config.jsonl_path, enabled=config.enabled)
+
+    @property
+    def current_trace_id(self) -> str | None:
+        """ID of the trace currently in flight, if any."""
+        with self._lock:
+            return self._current.trace_id if self._current else None
+
+    def start(self, origin: str = "voice") -> str | None:
+        """
+        Start a trace for a new utterance, closing any open trace as interrupted.
+
+        Args:
+            origin: "voice" (starts at the VAD endpoint) or "text" (starts when the message arrives)
+
+        Returns:
+            str | None: The new trace ID, or None when tracing is disabled
+        """
+        if not self.enabled:
+            return None
+
+        trace = Trace(
+            trace_id=uuid.uuid4().hex[:12],
+            origin=origin,
+            started_at=time.time(),
+            _t0=time.perf_counter(),
+        )
+        trace.spans["vad_endpoint" if origin == "voice" else "text_received"] = 0.0
+
+        with self._lock:
+            previous, self._current = self._current, trace
+        if previous is not None:
+            previous.interrupted = True
+            self._complete(previous)
+        return trace.trace_id
+
+    def mark(self, span: str, trace_id: str | None = None) -> None:
+        """
+        Record that the current utterance reached a milestone.
+
+        Args:
+            span: One of SPANS; only the first mark per trace is kept
+            trace_id: Trace the milestone belongs to; ignored unless it is the current trace.
+                None marks the current trace.
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        with self._lock:
+            trace = self._current
+            if trace is not None and span not in trace.spans and trace_id in (None, trace.trace_id):
+                trace.spans[span] = round((now - trace._t0) * 1000, 2)
+
+    def end(self, span: str | None = "playback_end", trace_id: str | None = None) -> None:
+        """
+        Close the current trace, optionally marking a final span first.
+
+        Args:
+            span: Final milestone to record, or None to close without a mark
+            trace_id: Trace to close; nothing happens unless it is the current trace.
+                None closes the current trace.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            trace = self._current
+            if trace is None or trace_id not in (None, trace.trace_id):
+                return
+            if span and span not in trace.spans:
+                trace.spans[span] = round((time.perf_counter() - trace._t0) * 1000, 2)
+            self._current = None
+        self._complete(trace)
+
+    def discard(self, trace_id: str | None = None) -> None:
+        """
+        Drop the current trace without recording it, e.g. when the wake word was missing.
+
+        Args:
+            trace_id: Trace to drop; nothing happens unless it is the current trace.
+                None drops the current trace.
+        """
+        with self._lock:
+            if self._current is not None and trace_id in (None, self._current.trace_id):
+                self._current = None
+
+    def _complete(self, trace: Trace) -> None:
+        """Store a finished trace and append it to the JSONL file if configured."""
+        with self._lock:
+            self._completed.append(trace)
+
+        summary = ", ".join(f"{name}={ms:.0f}ms" for name, ms in trace.spans.items() if ms)
+        logger.info(f"Trace {trace.trace_id}{' (interrupted)' if trace.interrupted else ''}: {summary}")
+
+        if self.jsonl_path:
+            try:
+                self.jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.jsonl_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(trace.to_dict()) + "\n")
+            except OSError as e:
+                logger.warning(f"Failed to append trace to {self.jsonl_path}: {e}")
+
+    def get_stats(self, include_interrupted: bool = False) -> dict[str, dict[str, float]]:
+        """
+        Get latency percentiles of every milestone over the completed traces.
+
+        Values are milliseconds since the start of the utterance, so `playback_start`
+        is the time to first audio.
+
+        Args:
+            include_interrupted: Also count traces cut short by a barge-in
+
+        Returns:
+            dict: Span name -> {"count", "p50", "p95", "p99"}
+        """
+        with self._lock:
+            traces = [t for t in self._completed if include_interrupted or not t.interrupted]
+
+        stats: dict[str, dict[str, float]] = {}
+        for span in SPANS:
+            values = [t.spans[span] for t in traces if span in t.spans]
+            if not values:
+                continue
+            percentiles = np.percentile(values, self.PERCENTILES)
+            stats[span] = {"count": len(values)}
+            for p, value in zip(self.PERCENTILES, percentiles, strict=True):
+                stats[span][f"p{p}"] = round(float(value), 2)
+        return stats
+
+    def dump_jsonl(self, path: str | Path) -> int:
+        """
+        Write the completed traces in the window to a JSONL file.
+
+        Args:
+            path: Destination file, overwritten
+
+        Returns:
+            int: Number of traces written
+        """
+        with self._lock:
+            traces = list(self._completed)
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            for trace in traces:
+                f.write(json.dumps(trace.to_dict()) + "\n")
+        return len(traces)
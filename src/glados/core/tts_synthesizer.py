@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 import queue
 import threading
 import time
@@ -7,25 +8,41 @@ import numpy as np
 
 from ..TTS import SpeechSynthesizerProtocol
 from ..utils import spoken_text_converter as stc
-from .audio_data import AudioMessage
+from .audio_data import AudioMessage, SentenceMessage
+from .generation import ResponseGeneration
+from .stage import StageRunner
+from .tracing import LatencyTracer
 
 
 class TextToSpeechSynthesizer:
     """
     A thread that synthesizes text to speech using a TTS model and a spoken text converter.
     It reads text from a queue, processes it, generates audio, and puts the audio messages into an output queue.
-    This class is designed to run in a separate thread, continuously checking for new text to
-    synthesize until a shutdown event is set.
+    This class is designed to run in a separate thread, blocking on its input queue until
+    new text arrives or shutdown is signalled.
+
+    With `num_workers` > 1, upcoming sentences are synthesized concurrently by a pool of
+    workers. Every item taken from the input queue gets a sequence number and results are
+    released to the output queue strictly in that order, so sentences and "<EOS>" tokens
+    reach the player exactly as they were queued.
+
+    Sentences carry the response generation they belong to. Sentences of a cancelled
+    (interrupted) response are skipped without synthesis, and results that finish after
+    the interruption are dropped; the generation is copied onto every AudioMessage so the
+    player can discard stale audio too.
     """
 
     def __init__(
         self,
-        tts_input_queue: queue.Queue[str],
+        tts_input_queue: queue.Queue[SentenceMessage | str],
         audio_output_queue: queue.Queue[AudioMessage],
         tts_model: SpeechSynthesizerProtocol,
         stc_instance: stc.SpokenTextConverter,
         shutdown_event: threading.Event,
         pause_time: float,
+        tracer: LatencyTracer | None = None,
+        num_workers: int = 1,
+        generation: ResponseGeneration | None = None,
     ) -> None:
         self.tts_input_queue = tts_input_queue
         self.audio_output_queue = audio_output_queue
@@ -33,52 +50,163 @@ class TextToSpeechSynthesizer:
         self.stc = stc_instance
         self.shutdown_event = shutdown_event
         self.pause_time = pause_time
+        self.tracer = tracer
+        self.num_workers = max(1, num_workers)
+        self.generation = generation
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._free_workers = threading.BoundedSemaphore(self.num_workers)
+        self._next_sequence = 0  # Assigned by the dispatching thread only
+        self._reorder_lock = threading.Lock()
+        self._completed: dict[int, AudioMessage | None] = {}  # Finished out of order, keyed by sequence
+        self._next_to_emit = 0
 
     def run(self) -> None:
         """
         Starts the main loop for the TTS Synthesizer thread.
 
-        This method continuously checks the TTS input queue for text to synthesize.
-        It processes the text, generates speech audio using the TTS model, and puts the audio messages
-        into the audio output queue. It handles end-of-stream tokens and logs processing times.
-        If an empty or whitespace-only string is received, it logs a warning without processing it.
+        This method blocks on the TTS input queue and synthesizes every text as soon as it arrives,
+        putting the audio messages into the audio output queue. It handles end-of-stream tokens and
+        logs processing times. If an empty or whitespace-only string is received, it logs a warning
+        without processing it.
 
-        The thread will run until the shutdown event is set, at which point it will exit gracefully.
+        The thread will run until the shutdown sentinel is received or the shutdown event is set.
         """
-        logger.info("TextToSpeechSynthesizer thread started.")
-        while not self.shutdown_event.is_set():
-            try:
-                text_to_speak = self.tts_input_queue.get(timeout=self.pause_time)
-
-                if text_to_speak == "<EOS>":
-                    logger.debug("TTS Synthesizer: Received EOS token.")
-                    self.audio_output_queue.put(
-                        AudioMessage(audio=np.array([], dtype=np.float32), text="", is_eos=True)
-                    )
-
-                elif not text_to_speak.strip():  # Check for empty or whitespace-only strings
-                    logger.warning(f"TTS Synthesizer: Received empty or whitespace string: '{text_to_speak}'")
-                else:
-                    logger.info(f"LLM text: {text_to_speak}")
-
-                    start_time = time.time()
-                    spoken_text_variant = self.stc.text_to_spoken(text_to_speak)
-                    audio_data = self.tts_model.generate_speech_audio(spoken_text_variant)
-                    processing_time = time.time() - start_time
-
-                    audio_duration = len(audio_data) / self.tts_model.sample_rate
-                    logger.info(
-                        f"TTS Synthesizer: TTS Complete. Inference: {processing_time:.2f}s, "
-                        f"Audio length: {audio_duration:.2f}s for text: '{spoken_text_variant}'"
-                    )
-
-                    # Even if audio_data is empty, send the message so AudioPlayer can log/handle it
-                    self.audio_output_queue.put(AudioMessage(audio=audio_data, text=spoken_text_variant, is_eos=False))
-            except queue.Empty:
-                pass  # Normal, no text to process
-            except Exception as e:
-                logger.exception(f"TextToSpeechSynthesizer: Unexpected error in run loop: {e}")
-                # Potentially add a small sleep here
-                time.sleep(self.pause_time)
-
+        logger.info(f"TextToSpeechSynthesizer thread started with {self.num_workers} worker(s).")
+        if self.num_workers > 1:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.num_workers,
+                thread_name_prefix=f"{threading.current_thread().name}-worker",
+            )
+        try:
+            StageRunner(
+                name="TextToSpeechSynthesizer",
+                input_queue=self.tts_input_queue,
+                handler=self._dispatch,
+                shutdown_event=self.shutdown_event,
+                error_backoff=self.pause_time,
+            ).run()
+        finally:
+            if self._executor:
+                self._executor.shutdown(wait=False, cancel_futures=True)
         logger.info("TextToSpeechSynthesizer thread finished.")
+
+    def _dispatch(self, item: SentenceMessage | str) -> None:
+        """
+        Assign the next sequence number to one item from the input queue and synthesize it.
+
+        With a single worker the item is synthesized on the calling thread. Otherwise this blocks
+        until a pool worker is free, so unclaimed sentences stay in the input queue.
+
+        Args:
+            item: Sentence to synthesize, or an end-of-response message; plain strings are
+                untagged sentences and "<EOS>"
+        """
+        if isinstance(item, str):
+            item = SentenceMessage(text=item, is_eos=item == "<EOS>")
+
+        sequence = self._next_sequence
+        self._next_sequence += 1
+
+        if item.is_eos:
+            logger.debug("TTS Synthesizer: Received EOS token.")
+            eos = AudioMessage(
+                audio=np.array([], dtype=np.float32),
+                text="",
+                is_eos=True,
+                generation=item.generation,
+                trace_id=item.trace_id,
+            )
+            self._complete(sequence, eos)
+        elif not item.text.strip():  # Check for empty or whitespace-only strings
+            logger.warning(f"TTS Synthesizer: Received empty or whitespace string: '{item.text}'")
+            self._complete(sequence, None)
+        elif self._is_stale(item.generation):
+            logger.debug(f"TTS Synthesizer: Skipping sentence of an interrupted response: '{item.text}'")
+            self._complete(sequence, None)
+        elif self._executor is None:
+            self._synthesize_slot(sequence, item)
+        else:
+            while not self._free_workers.acquire(timeout=StageRunner.DEFAULT_WAKE_INTERVAL):
+                if self.shutdown_event.is_set():
+                    return
+            self._executor.submit(self._synthesize_in_worker, sequence, item)
+
+    def _synthesize_in_worker(self, sequence: int, item: SentenceMessage) -> None:
+        """Pool worker: synthesize one sentence, then free the worker slot."""
+        try:
+            self._synthesize_slot(sequence, item)
+        finally:
+            self._free_workers.release()
+
+    def _synthesize_slot(self, sequence: int, item: SentenceMessage) -> None:
+        """Synthesize one sentence and hand the result to the reorder buffer."""
+        message = None
+        try:
+            message = self._synthesize(item)
+        except Exception as e:
+            if not self.shutdown_event.is_set():
+                logger.exception(f"TTS Synthesizer: Failed to synthesize '{item.text}': {e}")
+        finally:
+            # A failed sentence must still fill its slot, or every later one would be held back
+            self._complete(sequence, message)
+
+    def _synthesize(self, item: SentenceMessage) -> AudioMessage | None:
+        """
+        Synthesize one sentence.
+
+        Args:
+            item: Sentence to synthesize
+
+        Returns:
+            AudioMessage | None: The synthesized audio, or None if the response was interrupted
+        """
+        # A pool worker may pick the sentence up well after it was dispatched
+        if self._is_stale(item.generation):
+            logger.debug(f"TTS Synthesizer: Skipping sentence of an interrupted response: '{item.text}'")
+            return None
+
+        logger.info(f"LLM text: {item.text}")
+
+        start_time = time.time()
+        spoken_text_variant = self.stc.text_to_spoken(item.text)
+        audio_data = self.tts_model.generate_speech_audio(spoken_text_variant)
+        processing_time = time.time() - start_time
+
+        audio_duration = len(audio_data) / self.tts_model.sample_rate
+        logger.info(
+            f"TTS Synthesizer: TTS Complete. Inference: {processing_time:.2f}s, "
+            f"Audio length: {audio_duration:.2f}s for text: '{spoken_text_variant}'"
+        )
+
+        if self._is_stale(item.generation):
+            logger.debug(f"TTS Synthesizer: Dropping synthesized sentence after interruption: '{item.text}'")
+            return None
+
+        # Even if audio_data is empty, send the message so AudioPlayer can log/handle it
+        return AudioMessage(
+            audio=audio_data, text=spoken_text_variant, is_eos=False, generation=item.generation, trace_id=item.trace_id
+        )
+
+    def _is_stale(self, generation: int | None) -> bool:
+        """Check whether an item belongs to a response that was interrupted."""
+        return self.generation is not None and not self.generation.is_current(generation)
+
+    def _complete(self, sequence: int, message: AudioMessage | None) -> None:
+        """
+        Record a finished item and release every item that is now next in sequence.
+
+        Args:
+            sequence: Sequence number assigned by `_dispatch`
+            message: Audio to forward, or None if the item produced nothing to play
+        """
+        with self._reorder_lock:
+            self._completed[sequence] = message
+            while self._next_to_emit in self._completed:
+                ready = self._completed.pop(self._next_to_emit)
+                self._next_to_emit += 1
+                if ready is None:
+                    continue
+                if not ready.is_eos and self.tracer:
+                    self.tracer.mark("tts_first_audio", ready.trace_id)
+                self.audio_output_queue.put(ready)
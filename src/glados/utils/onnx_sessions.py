@@ -0,0 +1,449 @@
+"""
+Creation of all ONNX Runtime sessions from per-model tuning profiles.
+
+Every model (VAD, ASR, G2P, VITS/Kokoro) runs in its own InferenceSession, and by default
+each session starts thread pools as large as the machine. With five or more sessions in
+one process that oversubscribes the CPU, and small models like Silero VAD pay thread
+wake-up costs for every 32 ms chunk. Sessions are therefore created through
+`create_session`, which applies the profile configured for the model: thread counts,
+execution mode, graph optimization level, memory arena/pattern and allowed providers.
+
+Profiles are resolved from the built-in defaults of a model, then the configured
+`default` profile, then the configured profile of the model; only fields that are set
+override. `session_profiles()` reports what each session actually ended up with.
+
+With `graph_cache_dir` set, the graph ONNX Runtime optimizes for a session is saved there
+(`optimized_model_filepath`) and later sessions load it with optimization disabled, which
+skips the graph transformations on every start. Cached graphs are keyed by the model's
+content hash, the ONNX Runtime version, the providers, the optimization level and the CPU
+architecture, so updated models or runtimes never load a stale graph. `glados warm-cache`
+fills the cache ahead of time.
+
+Small models that run many times in a row with the same shapes (the VAD every 32 ms, the
+TDT decoder and joiner once per token) spend a large part of each `session.run` on
+converting the inputs and allocating the outputs. With `io_binding` set in their profile
+they run through an `IOBoundSession` instead: numpy buffers allocated once and bound to
+the session with IOBinding, written in place by the caller and by ONNX Runtime.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import platform
+import threading
+import time
+from typing import Any, Literal
+
+from loguru import logger
+import numpy as np
+from numpy.typing import NDArray
+import onnxruntime as ort  # type: ignore
+from pydantic import BaseModel
+
+# Default OnnxRuntime is way to verbose, only show fatal errors
+ort.set_default_logger_severity(4)
+
+GRAPH_OPTIMIZATION_LEVELS = {
+    "disabled": ort.GraphOptimizationLevel.ORT_DISABLE_ALL,
+    "basic": ort.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+    "extended": ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+    "all": ort.GraphOptimizationLevel.ORT_ENABLE_ALL,
+}
+EXECUTION_MODES = {
+    "sequential": ort.ExecutionMode.ORT_SEQUENTIAL,
+    "parallel": ort.ExecutionMode.ORT_PARALLEL,
+}
+
+
+class OnnxProfile(BaseModel):
+    """Session options of one model; None leaves the ONNX Runtime default."""
+
+    intra_op_threads: int | None = None  # Threads inside an operator, 0 for one per physical core
+    inter_op_threads: int | None = None  # Threads running independent operators, only for "parallel" mode
+    execution_mode: Literal["sequential", "parallel"] | None = None
+    graph_optimization: Literal["disabled", "basic", "extended", "all"] | None = None
+    allow_spinning: bool | None = None  # Busy-wait for work between runs: lower latency, burns idle CPU
+    enable_cpu_mem_arena: bool | None = None  # Keep freed CPU buffers for reuse by later runs
+    enable_mem_pattern: bool | None = None  # Preallocate buffers from the shapes of previous runs
+    providers: list[str] | None = None  # Allowed execution providers in priority order, None for all available
+    exclude_providers: list[str] | None = None  # Providers never used
+    io_binding: bool | None = None  # Fixed-shape calls reuse bound buffers (vad, asr_tdt_decoder, asr_tdt_joiner)
+
+    class Config:
+        extra = "ignore"
+
+
+class OnnxRuntimeConfig(BaseModel):
+    """ONNX Runtime session profiles: `default` applies to every model, `models` per model name."""
+
+    default: OnnxProfile = OnnxProfile()
+    models: dict[str, OnnxProfile] = {}  # Keys: vad, phonemizer, tts_glados, tts_kokoro, asr_ctc, asr_tdt_*
+    graph_cache_dir: str | None = None  # Directory of optimized graphs reused across starts, None to disable
+
+    class Config:
+        extra = "ignore"
+
+
+# Sessions use every available provider except these, unless a profile says otherwise
+DEFAULT_EXCLUDED_PROVIDERS = ["TensorrtExecutionProvider", "CoreMLExecutionProvider"]
+_ASR_PROVIDERS = ["CUDAExecutionProvider", "CPUExecutionProvider"]
+
+# Built-in profiles of the models, below any configuration
+BUILTIN_PROFILES: dict[str, OnnxProfile] = {
+    # Tiny recurrent model run every 32 ms: more threads only add wake-up latency
+    "vad": OnnxProfile(intra_op_threads=1, inter_op_threads=1, allow_spinning=False, io_binding=True),
+    # Short character sequences
+    "phonemizer": OnnxProfile(intra_op_threads=1, inter_op_threads=1),
+    "asr_ctc": OnnxProfile(graph_optimization="all", enable_mem_pattern=True, providers=_ASR_PROVIDERS),
+    "asr_tdt_encoder": OnnxProfile(graph_optimization="all", enable_mem_pattern=True, providers=_ASR_PROVIDERS),
+    # Run once per emitted token (decoder) or per window of frames (joiner) on tiny tensors
+    "asr_tdt_decoder": OnnxProfile(
+        graph_optimization="all", enable_mem_pattern=True, providers=_ASR_PROVIDERS, io_binding=True
+    ),
+    "asr_tdt_joiner": OnnxProfile(
+        graph_optimization="all", enable_mem_pattern=True, providers=_ASR_PROVIDERS, io_binding=True
+    ),
+}
+
+# Initializers of cached graphs go to a side file from this size, so graphs over 2 GB can be saved
+EXTERNAL_INITIALIZER_MIN_BYTES = 1024
+_DIGEST_INDEX = "digests.json"
+
+_config = OnnxRuntimeConfig()
+_sessions: dict[str, dict[str, Any]] = {}
+_lock = threading.Lock()
+_cache_lock = threading.Lock()
+
+
+def configure_sessions(config: OnnxRuntimeConfig) -> None:
+    """
+    Set the profiles used by sessions created from now on.
+
+    Args:
+        config: Session profiles, usually GladosConfig.onnx
+    """
+    global _config
+    with _lock:
+        _config = config
+
+
+def resolve_profile(model: str) -> OnnxProfile:
+    """
+    Get the effective profile of a model.
+
+    Args:
+        model: Model name, e.g. "vad" or "asr_tdt_encoder"
+
+    Returns:
+        OnnxProfile: Built-in profile, overridden by the configured default and model profiles
+    """
+    with _lock:
+        layers = [BUILTIN_PROFILES.get(model), _config.default, _config.models.get(model)]
+    fields: dict[str, Any] = {}
+    for layer in layers:
+        if layer is not None:
+            fields.update({name: getattr(layer, name) for name in layer.model_fields_set})
+    return OnnxProfile(**fields)
+
+
+def select_providers(profile: OnnxProfile) -> list[str]:
+    """
+    Get the execution providers a profile allows on this machine.
+
+    Args:
+        profile: Effective session profile
+
+    Returns:
+        list[str]: Available providers in priority order, CPU as the last resort
+    """
+    available = ort.get_available_providers()
+    excluded = set(profile.exclude_providers if profile.exclude_providers is not None else DEFAULT_EXCLUDED_PROVIDERS)
+    candidates = profile.providers if profile.providers is not None else available
+    providers = [p for p in candidates if p in available and p not in excluded]
+    return providers or ["CPUExecutionProvider"]
+
+
+def build_session_options(profile: OnnxProfile) -> ort.SessionOptions:
+    """
+    Translate a profile into ONNX Runtime session options.
+
+    Args:
+        profile: Effective session profile
+
+    Returns:
+        ort.SessionOptions: Options with every field set by the profile applied
+    """
+    options = ort.SessionOptions()
+    if profile.intra_op_threads is not None:
+        options.intra_op_num_threads = profile.intra_op_threads
+    if profile.inter_op_threads is not None:
+        options.inter_op_num_threads = profile.inter_op_threads
+    if profile.execution_mode is not None:
+        options.execution_mode = EXECUTION_MODES[profile.execution_mode]
+    if profile.graph_optimization is not None:
+        options.graph_optimization_level = GRAPH_OPTIMIZATION_LEVELS[profile.graph_optimization]
+    if profile.allow_spinning is not None:
+        value = "1" if profile.allow_spinning else "0"
+        options.add_session_config_entry("session.intra_op.allow_spinning", value)
+        options.add_session_config_entry("session.inter_op.allow_spinning", value)
+    if profile.enable_cpu_mem_arena is not None:
+        options.enable_cpu_mem_arena = profile.enable_cpu_mem_arena
+    if profile.enable_mem_pattern is not None:
+        options.enable_mem_pattern = profile.enable_mem_pattern
+    return options
+
+
+def model_digest(model_path: Path | str | bytes, cache_dir: Path | None = None) -> str:
+    """
+    Hash the content of a model.
+
+    Hashing the 2.4 GB TDT encoder takes seconds, so digests of files are remembered in
+    the cache directory by path, size and modification time.
+
+    Args:
+        model_path: ONNX model file, or the serialized model
+        cache_dir: Graph cache directory holding the digest index, None to always hash
+
+    Returns:
+        str: Hex BLAKE2b digest of the model
+    """
+    if isinstance(model_path, bytes):
+        return hashlib.blake2b(model_path, digest_size=16).hexdigest()
+
+    path = Path(model_path).resolve()
+    stat = path.stat()
+    stamp = f"{stat.st_size}:{stat.st_mtime_ns}"
+    index_path = cache_dir / _DIGEST_INDEX if cache_dir is not None else None
+    with _cache_lock:
+        index: dict[str, dict[str, str]] = {}
+        if index_path is not None and index_path.exists():
+            try:
+                index = json.loads(index_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                logger.warning(f"Ignoring unreadable ONNX digest index {index_path}")
+        entry = index.get(str(path))
+        if entry is not None and entry.get("stamp") == stamp:
+            return entry["digest"]
+
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as f:
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+
+    if index_path is not None:
+        with _cache_lock:
+            # Re-read so digests recorded by other sessions in the meantime are kept
+            if index_path.exists():
+                try:
+                    index = json.loads(index_path.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    index = {}
+            index[str(path)] = {"stamp": stamp, "digest": digest.hexdigest()}
+            tmp_path = index_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(index, indent=1), encoding="utf-8")
+            os.replace(tmp_path, index_path)
+    return digest.hexdigest()
+
+
+def graph_cache_key(digest: str, profile: OnnxProfile, providers: list[str]) -> str:
+    """
+    Get the key of an optimized graph.
+
+    Optimized graphs contain provider- and version-specific fused operators and, for the
+    CPU, layouts chosen for the instruction set, so all of these are part of the key.
+
+    Args:
+        digest: Content hash of the source model
+        profile: Effective session profile
+        providers: Providers the session is created with
+
+    Returns:
+        str: Short hex key
+    """
+    parts = {
+        "model": digest,
+        "ort": ort.__version__,
+        "providers": providers,
+        "optimization": profile.graph_optimization or "all",
+        "machine": platform.machine(),
+    }
+    return hashlib.blake2b(json.dumps(parts, sort_keys=True).encode(), digest_size=8).hexdigest()
+
+
+def create_session(model: str, model_path: Path | str | bytes) -> ort.InferenceSession:
+    """
+    Create the InferenceSession of a model with its profile.
+
+    With a graph cache directory configured, a previously optimized graph of the same model,
+    runtime and providers is loaded instead of optimizing the model again; on a miss the
+    optimized graph is saved for the next start.
+
+    Args:
+        model: Model name selecting the profile, see OnnxRuntimeConfig.models
+        model_path: ONNX model file, or the serialized model
+
+    Returns:
+        ort.InferenceSession: The session, also recorded for `session_profiles()`
+    """
+    profile = resolve_profile(model)
+    providers = select_providers(profile)
+    with _lock:
+        cache_dir = Path(_config.graph_cache_dir) if _config.graph_cache_dir else None
+    source: str | bytes = model_path if isinstance(model_path, bytes) else str(model_path)
+    options = build_session_options(profile)
+
+    start = time.perf_counter()
+    graph_cache = "off"
+    if cache_dir is not None and profile.graph_optimization != "disabled":
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        key = graph_cache_key(model_digest(model_path, cache_dir), profile, providers)
+        cached_path = cache_dir / f"{model}-{key}.onnx"
+        session = _load_cached_graph(cached_path, profile, providers) if cached_path.exists() else None
+        if session is not None:
+            graph_cache = "hit"
+        else:
+            graph_cache = "miss"
+            tmp_path = cached_path.with_suffix(".tmp")
+            options.optimized_model_filepath = str(tmp_path)
+            options.add_session_config_entry(
+                "session.optimized_model_external_initializers_file_name", f"{cached_path.stem}.data"
+            )
+            options.add_session_config_entry(
+                "session.optimized_model_external_initializers_min_size_in_bytes",
+                str(EXTERNAL_INITIALIZER_MIN_BYTES),
+            )
+            session = ort.InferenceSession(source, sess_options=options, providers=providers)
+            if tmp_path.exists():
+                os.replace(tmp_path, cached_path)
+            else:
+                logger.warning(f"ONNX Runtime did not save the optimized graph of '{model}'")
+    else:
+        session = ort.InferenceSession(source, sess_options=options, providers=providers)
+
+    info = {
+        "model_path": "<bytes>" if isinstance(model_path, bytes) else str(model_path),
+        "profile": profile.model_dump(exclude_none=True),
+        "providers": session.get_providers(),
+        "graph_cache": graph_cache,
+        "load_seconds": round(time.perf_counter() - start, 3),
+    }
+    with _lock:
+        _sessions[model] = info
+    logger.debug(f"ONNX session '{model}': {info['profile']} on {info['providers']}, graph cache {graph_cache}")
+    return session
+
+
+def _load_cached_graph(path: Path, profile: OnnxProfile, providers: list[str]) -> ort.InferenceSession | None:
+    """
+    Load an optimized graph from the cache without optimizing it again.
+
+    Args:
+        path: Cached optimized graph
+        profile: Effective session profile
+        providers: Providers the graph was optimized for
+
+    Returns:
+        ort.InferenceSession | None: The session, or None if the cached graph is unusable
+            (it is then removed and rebuilt by the caller)
+    """
+    options = build_session_options(profile)
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+    try:
+        return ort.InferenceSession(str(path), sess_options=options, providers=providers)
+    except Exception as e:
+        logger.warning(f"Discarding unusable optimized graph {path}: {e}")
+        path.unlink(missing_ok=True)
+        path.with_suffix(".data").unlink(missing_ok=True)
+        return None
+
+
+def session_profiles() -> dict[str, dict[str, Any]]:
+    """
+    Get the profile and providers each model's session was created with.
+
+    Returns:
+        dict[str, dict[str, Any]]: Model name -> model path, effective profile (set fields only),
+            the providers the session actually uses, the graph cache outcome ("hit", "miss" or
+            "off") and the session creation time
+    """
+    with _lock:
+        return {model: dict(info) for model, info in _sessions.items()}
+
+
+class IOBoundSession:
+    """
+    Persistent input and output buffers of a session, bound once with IOBinding.
+
+    Callers write the next inputs into the arrays of `inputs` in place and call `run`, which
+    makes ONNX Runtime read them and write the outputs straight into preallocated arrays:
+    no input conversion and no output allocation per call. The shapes are fixed; a call
+    with other shapes needs another bound session (or `session.run`).
+
+    With `buffers=n` the outputs rotate through n sets of arrays, so the outputs of a run
+    stay valid for the next n-1 runs, e.g. a recurrent state that is fed back in later.
+    A bound session is not thread-safe: use one per thread or per stream.
+    """
+
+    def __init__(
+        self,
+        session: ort.InferenceSession,
+        inputs: dict[str, NDArray[Any]],
+        output_shapes: dict[str, tuple[tuple[int, ...], np.dtype[Any]]],
+        buffers: int = 1,
+    ) -> None:
+        """
+        Args:
+            session: Session to run
+            inputs: Initial value of every input; copied into the bound input buffers
+            output_shapes: Shape and dtype of every output, in the session's output order
+            buffers: Output sets to rotate through
+        """
+        self.session = session
+        self.inputs = {name: np.array(value, order="C") for name, value in inputs.items()}
+        self._bindings: list[tuple[Any, list[NDArray[Any]]]] = []
+        self._values: list[Any] = []  # OrtValues share the memory of the arrays, keep them alive
+        for _ in range(buffers):
+            binding = session.io_binding()
+            for name, array in self.inputs.items():
+                self._values.append(ort.OrtValue.ortvalue_from_numpy(array))
+                binding.bind_ortvalue_input(name, self._values[-1])
+            outputs = [np.empty(shape, dtype=dtype) for shape, dtype in output_shapes.values()]
+            for name, array in zip(output_shapes, outputs, strict=True):
+                self._values.append(ort.OrtValue.ortvalue_from_numpy(array))
+                binding.bind_ortvalue_output(name, self._values[-1])
+            self._bindings.append((binding, outputs))
+        self._next = 0
+
+    @classmethod
+    def from_example(
+        cls, session: ort.InferenceSession, inputs: dict[str, NDArray[Any]], buffers: int = 1
+    ) -> "IOBoundSession":
+        """
+        Bind buffers for the shapes of example inputs; the output shapes come from one regular run.
+
+        Args:
+            session: Session to run
+            inputs: Example value of every input
+            buffers: Output sets to rotate through
+
+        Returns:
+            IOBoundSession: Bound session, its inputs initialized from the example
+        """
+        names = [output.name for output in session.get_outputs()]
+        outputs = session.run(names, inputs)
+        shapes = {name: (output.shape, output.dtype) for name, output in zip(names, outputs, strict=True)}
+        return cls(session, inputs, shapes, buffers)
+
+    def run(self) -> list[NDArray[Any]]:
+        """
+        Run the session on the current contents of `inputs`.
+
+        Returns:
+            list[NDArray[Any]]: The outputs in the session's output order; the arrays are
+                overwritten by a later run (see `buffers`)
+        """
+        binding, outputs = self._bindings[self._next]
+        self._next = (self._next + 1) % len(self._bindings)
+        self.session.run_with_iobinding(binding)
+        return outputs
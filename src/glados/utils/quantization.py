@@ -0,0 +1,204 @@
+"""
+INT8 variants of the ONNX models for CPU-only deployments.
+
+`quantize_model` writes a quantized copy next to a model, named after its variant
+(`glados.onnx` -> `glados.int8_dynamic.onnx`), and copies the model's JSON sidecar so
+loaders that read `<model>.json` keep working. Two variants are supported:
+
+- "int8_dynamic": weights quantized ahead of time, activations quantized per run from their
+  observed range; no calibration data, works for any input length
+- "int8_static": weights and activations quantized with ranges calibrated on recorded
+  model inputs (QDQ format), cheaper per run but only as good as the calibration data
+
+Loaders select a variant with `resolve_variant`, which falls back to the original model
+when the variant has not been produced on this machine. Producing variants needs the
+`onnx` package used by `onnxruntime.quantization`; loading them does not.
+"""
+
+from collections.abc import Callable, Iterable
+from pathlib import Path
+import shutil
+from typing import Any
+
+from loguru import logger
+import numpy as np
+from numpy.typing import NDArray
+
+try:
+    from onnxruntime.quantization import (  # type: ignore
+        CalibrationDataReader,
+        CalibrationMethod,
+        QuantFormat,
+        QuantType,
+        quantize_dynamic,
+        quantize_static,
+    )
+
+    QUANTIZATION_AVAILABLE = True
+except ImportError:
+    CalibrationDataReader = object
+    QUANTIZATION_AVAILABLE = False
+
+QUANTIZATION_VARIANTS = ("int8_dynamic", "int8_static")
+
+# Models over 2 GB (the TDT encoder with its initializers) exceed the protobuf limit
+EXTERNAL_DATA_MIN_BYTES = 2 * 1024**3 - 64 * 1024**2
+
+
+def variant_path(model_path: Path, variant: str) -> Path:
+    """
+    Get the file of a quantized variant of a model.
+
+    Args:
+        model_path: Original ONNX model file
+        variant: One of QUANTIZATION_VARIANTS
+
+    Returns:
+        Path: Variant file next to the original model
+
+    Raises:
+        ValueError: If the variant is unknown
+    """
+    if variant not in QUANTIZATION_VARIANTS:
+        raise ValueError(f"Unknown quantization variant '{variant}', expected one of {QUANTIZATION_VARIANTS}")
+    return model_path.with_name(f"{model_path.stem}.{variant}{model_path.suffix}")
+
+
+def resolve_variant(model_path: Path, variant: str | None) -> Path:
+    """
+    Get the model file to load for a requested quantization variant.
+
+    Args:
+        model_path: Original ONNX model file
+        variant: One of QUANTIZATION_VARIANTS, or None for the original model
+
+    Returns:
+        Path: The variant if it exists, otherwise the original model
+    """
+    if variant is None:
+        return model_path
+    path = variant_path(model_path, variant)
+    if not path.exists():
+        logger.warning(f"{path.name} not found, loading {model_path.name}; create it with `glados quantize`")
+        return model_path
+    logger.info(f"Loading {variant} variant {path.name}")
+    return path
+
+
+class FeedCalibrationReader(CalibrationDataReader):  # type: ignore[misc,valid-type]
+    """Calibration data reader over recorded model inputs."""
+
+    def __init__(self, feeds: list[dict[str, NDArray[Any]]]) -> None:
+        self.feeds = feeds
+        self._iterator = iter(self.feeds)
+
+    def get_next(self) -> dict[str, NDArray[Any]] | None:
+        return next(self._iterator, None)
+
+    def rewind(self) -> None:
+        self._iterator = iter(self.feeds)
+
+
+class FeedRecorder:
+    """
+    Session proxy recording the inputs of every run, used to collect calibration data.
+
+    Replace a model's session with a recorder, run the model on representative inputs,
+    and pass `feeds` to `quantize_model`.
+    """
+
+    def __init__(self, session: Any) -> None:
+        self.session = session
+        self.feeds: list[dict[str, NDArray[Any]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.session, name)
+
+    def run(self, output_names: list[str] | None, input_feed: dict[str, Any], *args: Any, **kwargs: Any) -> Any:
+        self.feeds.append({name: np.asarray(value) for name, value in input_feed.items() if value is not None})
+        return self.session.run(output_names, input_feed, *args, **kwargs)
+
+
+def record_feeds(owner: Any, attribute: str, run: Callable[[], Iterable[Any]]) -> list[dict[str, NDArray[Any]]]:
+    """
+    Record the inputs a model session receives while running representative work.
+
+    Args:
+        owner: Object holding the session, e.g. a transcriber
+        attribute: Name of the session attribute on `owner`
+        run: Callable doing the work; iterables it returns are consumed
+
+    Returns:
+        list[dict[str, NDArray[Any]]]: The recorded feeds, one per session run
+    """
+    session = getattr(owner, attribute)
+    recorder = FeedRecorder(session)
+    setattr(owner, attribute, recorder)
+    try:
+        for _ in run() or ():
+            pass
+    finally:
+        setattr(owner, attribute, session)
+    return recorder.feeds
+
+
+def quantize_model(
+    model_path: Path,
+    variant: str,
+    calibration_feeds: list[dict[str, NDArray[Any]]] | None = None,
+    op_types: list[str] | None = None,
+) -> Path:
+    """
+    Write an INT8 variant of a model.
+
+    Args:
+        model_path: Original ONNX model file
+        variant: "int8_dynamic" or "int8_static"
+        calibration_feeds: Recorded model inputs, required for "int8_static"
+        op_types: Operator types to quantize, None for the quantizer's defaults
+
+    Returns:
+        Path: The written variant
+
+    Raises:
+        RuntimeError: If onnxruntime.quantization cannot be imported
+        ValueError: If a static variant is requested without calibration data
+    """
+    if not QUANTIZATION_AVAILABLE:
+        raise RuntimeError("Quantization needs the 'onnx' package: pip install onnx")
+    output_path = variant_path(model_path, variant)
+    external_data = model_path.stat().st_size >= EXTERNAL_DATA_MIN_BYTES
+
+    if variant == "int8_dynamic":
+        quantize_dynamic(
+            model_path,
+            output_path,
+            op_types_to_quantize=op_types,
+            per_channel=True,
+            weight_type=QuantType.QInt8,
+            use_external_data_format=external_data,
+        )
+    else:
+        if not calibration_feeds:
+            raise ValueError("int8_static quantization needs calibration data")
+        quantize_static(
+            model_path,
+            output_path,
+            FeedCalibrationReader(calibration_feeds),
+            quant_format=QuantFormat.QDQ,
+            op_types_to_quantize=op_types,
+            per_channel=True,
+            activation_type=QuantType.QUInt8,
+            weight_type=QuantType.QInt8,
+            calibrate_method=CalibrationMethod.MinMax,
+            use_external_data_format=external_data,
+        )
+
+    sidecar = model_path.with_suffix(".json")
+    if sidecar.exists():
+        shutil.copyfile(sidecar, output_path.with_suffix(".json"))
+    logger.info(
+        f"Wrote {output_path.name}: {output_path.stat().st_size / 1e6:.1f} MB "
+        f"(from {model_path.stat().st_size / 1e6:.1f} MB)"
+    )
+    return output_path
@@ -0,0 +1,173 @@
+"""Unit tests for batched TDT decoding and the batching transcriber."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from glados.ASR.batching import ASRBatchingConfig, BatchingTranscriber
+from glados.ASR.tdt_asr import AudioTranscriber as TDTTranscriber
+
+BLANK = 3
+
+
+class FakeTDTModel:
+    """
+    Batch-capable decoder/joiner: the token is the frame's token shifted by the last emitted
+    one, so every utterance's result depends on its own decoder state.
+    """
+
+    joiner_max_frames = None
+
+    def __init__(self):
+        self.joiner_batches = []
+
+    def get_decoder_initial_state(self, batch_size=1):
+        return np.zeros((1, batch_size, 1), dtype=np.float32), np.zeros((1, batch_size, 1), dtype=np.float32)
+
+    def run_decoder(self, token, state0, state1):
+        tokens = np.asarray(token, dtype=np.float32).reshape(-1, 1)
+        return tokens, state0 + 1, state1
+
+    def run_joiner(self, encoder_out_t, decoder_out):
+        self.joiner_batches.append(len(encoder_out_t))
+        frame_token, duration = encoder_out_t.astype(int).transpose(1, 0, 2)  # (batch, frames) each
+        last = np.asarray(decoder_out).reshape(-1, 1).astype(int)
+        token = np.where(frame_token == BLANK, BLANK, (frame_token + (last != BLANK) * last) % BLANK)
+        rows, frames = np.indices(token.shape)
+        logits = np.zeros((*token.shape, BLANK + 1 + 3), dtype=np.float32)
+        logits[rows, frames, token] = 1
+        logits[rows, frames, BLANK + 1 + duration] = 1
+        return logits[:, :, None, :]
+
+
+def transcriber():
+    tdt = TDTTranscriber.__new__(TDTTranscriber)
+    tdt.model = FakeTDTModel()
+    tdt._initial_decoder = None
+    tdt.blank_id = BLANK
+    tdt.tdt_durations = [0, 1, 2]
+    return tdt
+
+
+def test_batched_decoding_matches_one_by_one():
+    """Test that per-utterance time pointers and decoder states reproduce single-utterance decoding."""
+    rng = np.random.default_rng(0)
+    lengths = np.array([7, 12, 1, 9])
+    frames = np.stack([rng.integers(0, 4, 12), rng.integers(1, 3, 12)])  # (token, duration bin)
+    encoder_out = np.repeat(frames[None].astype(np.float32), len(lengths), axis=0)
+    encoder_out[:, 0] = rng.integers(0, 4, (len(lengths), 12))  # Different tokens per utterance
+    tdt = transcriber()
+
+    batched = tdt._decode_tdt_batch(encoder_out, lengths)
+    single = [tdt._decode_tdt(encoder_out[i : i + 1, :, :length]) for i, length in enumerate(lengths)]
+
+    assert batched == single
+    assert any(token_ids for token_ids in batched)
+
+
+def test_batched_decoding_runs_one_joiner_call_per_step():
+    """Test that the joiner runs once per step for all utterances still being decoded."""
+    encoder_out = np.zeros((3, 2, 4), dtype=np.float32)
+    encoder_out[:, 0] = BLANK
+    encoder_out[:, 1] = 1  # Blank, one frame each step
+    tdt = transcriber()
+
+    tdt._decode_tdt_batch(encoder_out, np.array([4, 2, 3]))
+
+    assert tdt.model.joiner_batches == [3, 3, 2, 1]
+
+
+class FakeBatchASR:
+    def __init__(self):
+        self.batches = []
+        self.release = threading.Event()
+        self.sample_rate = 16000
+
+    def transcribe(self, audio):
+        self.release.wait(5)  # Hold the worker so the other requests queue up
+        self.batches.append(1)
+        return f"single {len(audio)}"
+
+    def transcribe_batch(self, audios):
+        self.batches.append(len(audios))
+        if any(len(a) == 0 for a in audios):
+            raise ValueError("empty audio")
+        return [f"batch {len(a)}" for a in audios]
+
+
+def test_batching_transcriber_batches_concurrent_requests():
+    """Test that requests arriving while the worker is busy are transcribed together, results in order."""
+    asr = FakeBatchASR()
+    batcher = BatchingTranscriber(asr, ASRBatchingConfig(enabled=True, max_batch_size=4))
+    results = {}
+
+    def call(n):
+        results[n] = batcher.transcribe(np.zeros(n, dtype=np.float32))
+
+    first = threading.Thread(target=call, args=(1,))
+    first.start()
+    while batcher._requests.qsize():  # Wait until the worker holds the first request
+        pass
+    others = [threading.Thread(target=call, args=(n,)) for n in (2, 3, 4)]
+    for thread in others:
+        thread.start()
+    while batcher._requests.qsize() < 3:
+        pass
+    asr.release.set()
+    for thread in [first, *others]:
+        thread.join(5)
+    batcher.close()
+
+    assert asr.batches == [1, 3]
+    assert results == {1: "single 1", 2: "batch 2", 3: "batch 3", 4: "batch 4"}
+    assert batcher.sample_rate == 16000  # Other attributes are forwarded
+
+
+def test_batching_transcriber_propagates_errors():
+    """Test that a failing batch raises in every waiting caller and the worker keeps running."""
+    asr = FakeBatchASR()
+    asr.release.set()
+    batcher = BatchingTranscriber(asr, ASRBatchingConfig(enabled=True, max_wait_ms=200))
+    errors = []
+
+    def call(n):
+        try:
+            batcher.transcribe(np.zeros(n, dtype=np.float32))
+        except ValueError as e:
+            errors.append(str(e))
+
+    threads = [threading.Thread(target=call, args=(n,)) for n in (0, 5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert errors == ["empty audio", "empty audio"]
+    assert batcher.transcribe(np.zeros(2, dtype=np.float32)) == "single 2"
+    batcher.close()
+
+
+def test_batching_transcriber_runs_directly_after_close():
+    """Test that a transcribe call after close is answered directly instead of waiting forever."""
+    asr = FakeBatchASR()
+    asr.release.set()
+    batcher = BatchingTranscriber(asr, ASRBatchingConfig(enabled=True))
+    batcher.close()
+    batcher.close()  # Closing twice is harmless
+    results = []
+
+    late = threading.Thread(target=lambda: results.append(batcher.transcribe(np.zeros(3, dtype=np.float32))))
+    late.start()
+    late.join(5)
+
+    assert results == ["single 3"]
+    assert not batcher._worker.is_alive()
+
+
+def test_batching_requires_transcribe_batch():
+    """Test that only transcribers with transcribe_batch are reported as batchable."""
+    assert BatchingTranscriber.supports(FakeBatchASR())
+    assert not BatchingTranscriber.supports(object())
+    with pytest.raises(AttributeError):
+        BatchingTranscriber.__new__(BatchingTranscriber).transcribe_file  # noqa: B018
@@ -0,0 +1,127 @@
+"""Unit tests for the synthesized speech cache."""
+
+import threading
+
+import numpy as np
+
+from glados.TTS.audio_cache import CachedSpeechSynthesizer, DiskAudioCache, cache_key
+
+
+class CountingTTS:
+    sample_rate = 1000
+
+    def __init__(self):
+        self.calls = []
+
+    def generate_speech_audio(self, text):
+        self.calls.append(text)
+        rng = np.random.default_rng(len(text))
+        return rng.uniform(-0.5, 0.5, len(text) * 10).astype(np.float32)
+
+
+def test_memory_tier_serves_repeats():
+    """Test that a repeated phrase is synthesized once and whitespace does not matter."""
+    tts = CountingTTS()
+    cached = CachedSpeechSynthesizer(tts, "glados")
+
+    first = cached.generate_speech_audio("Hello there.")
+    second = cached.generate_speech_audio("  Hello   there. ")
+
+    assert tts.calls == ["Hello there."]
+    np.testing.assert_array_equal(first, second)
+    second[:] = 0  # Callers get copies
+    assert cached.generate_speech_audio("Hello there.").any()
+    assert cached.stats()["memory_hits"] == 2
+    assert cached.stats()["hit_rate"] == round(2 / 3, 4)
+
+
+def test_voice_is_part_of_the_key():
+    """Test that different voices or RVC settings never share audio."""
+    assert cache_key("glados", "Hi.") != cache_key("glados|rvc:service:model:None:rmvpe:2:0.5:0.33", "Hi.")
+    assert cache_key("glados", "Hi.") != cache_key("glados", "hi.")
+
+
+def test_memory_tier_evicts_least_recently_used():
+    """Test that the memory tier stays within its byte budget."""
+    tts = CountingTTS()
+    cached = CachedSpeechSynthesizer(tts, "glados", memory_max_mb=3 * 400 * 4 / 1024 / 1024)
+
+    for text in ["a" * 40, "b" * 40, "c" * 40]:
+        cached.generate_speech_audio(text)
+    cached.generate_speech_audio("a" * 40)  # Refresh "a"
+    cached.generate_speech_audio("d" * 40)  # Evicts "b"
+    cached.generate_speech_audio("b" * 40)
+
+    assert tts.calls.count("b" * 40) == 2
+    assert tts.calls.count("a" * 40) == 1
+    assert cached.stats()["memory_bytes"] <= 3 * 400 * 4
+
+
+def test_long_text_and_fallback_audio_are_not_cached():
+    """Test the bypass for long sentences and for outputs the synthesizer marks uncacheable."""
+    tts = CountingTTS()
+    cached = CachedSpeechSynthesizer(tts, "glados", max_text_chars=20)
+    cached.generate_speech_audio("x" * 21)
+    cached.generate_speech_audio("x" * 21)
+    assert len(tts.calls) == 2 and cached.stats()["bypassed"] == 2
+
+    tts.last_output_cacheable = False
+    cached.generate_speech_audio("RVC was down.")
+    cached.generate_speech_audio("RVC was down.")
+    assert tts.calls.count("RVC was down.") == 2
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    """Test that int16 audio written by one instance is served by the next."""
+    tts = CountingTTS()
+    cached = CachedSpeechSynthesizer(tts, "glados", disk_path=tmp_path)
+    original = cached.generate_speech_audio("Persistent phrase.")
+    cached.close()
+
+    tts = CountingTTS()
+    reopened = CachedSpeechSynthesizer(tts, "glados", disk_path=tmp_path)
+    restored = reopened.generate_speech_audio("Persistent phrase.")
+
+    assert tts.calls == []
+    assert reopened.stats()["disk_hits"] == 1
+    np.testing.assert_allclose(restored, original, atol=1 / 32767)
+
+
+def test_disk_tier_evicts_least_recently_used(tmp_path):
+    """Test that the data file is compacted to the most recently used entries."""
+    disk = DiskAudioCache(tmp_path, max_bytes=9_000, max_entries=8)
+    pcm = {i: np.full(1000, i, dtype=np.int16) for i in range(10)}  # 2000 bytes each
+    for i in range(4):
+        disk.put(bytes([i]) * 16, pcm[i])
+    disk.get(bytes([0]) * 16)  # Most recently used
+    disk.put(bytes([4]) * 16, pcm[4])  # 10000 bytes > limit: compact
+
+    assert disk.size_bytes <= 9_000
+    np.testing.assert_array_equal(disk.get(bytes([0]) * 16), pcm[0])
+    np.testing.assert_array_equal(disk.get(bytes([4]) * 16), pcm[4])
+    assert disk.get(bytes([1]) * 16) is None
+    disk.close()
+
+    reopened = DiskAudioCache(tmp_path, max_bytes=9_000, max_entries=8)
+    np.testing.assert_array_equal(reopened.get(bytes([4]) * 16), pcm[4])
+    assert len(reopened) == len(disk)
+
+
+def test_concurrent_workers(tmp_path):
+    """Test that concurrent TTS workers can share the cache."""
+    tts = CountingTTS()
+    cached = CachedSpeechSynthesizer(tts, "glados", disk_path=tmp_path)
+    phrases = [f"Phrase number {i}." for i in range(20)]
+
+    def work():
+        for phrase in phrases * 3:
+            assert len(cached.generate_speech_audio(phrase)) == len(phrase) * 10
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert set(tts.calls) == set(phrases)
+    assert cached.stats()["disk_entries"] == 20
@@ -0,0 +1,213 @@
+"""Unit tests for generation-ID cancellation on barge-in."""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import queue
+import threading
+import time
+
+import numpy as np
+
+from glados.core.audio_data import AudioMessage
+from glados.core.generation import ResponseGeneration
+from glados.core.llm_processor import LanguageModelProcessor
+from glados.core.speech_player import SpeechPlayer
+from glados.core.state import ThreadSafeConversationState
+from glados.core.tracing import LatencyTracer
+
+
+class SlowStreamHandler(BaseHTTPRequestHandler):
+    """OpenAI-style streaming endpoint sending one sentence, then stalling for seconds."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for token in ["Hello there.", " This", " never", " arrives."]:
+                payload = json.dumps({"choices": [{"delta": {"content": token}}]})
+                data = f"data: {payload}\n\n".encode()
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+                self.wfile.flush()
+                time.sleep(3.0)
+        except OSError:
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+class PartialLineHandler(SlowStreamHandler):
+    """Sends one sentence, then half of the next line, and stalls before its line break."""
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for data in (
+                b'data: {"choices": [{"delta": {"content": "Hello there."}}]}\n\n',
+                b'data: {"choices": [{"delta": {"content": " Cut off mid-line."}}]}',
+            ):
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+                self.wfile.flush()
+                time.sleep(1.0)
+            time.sleep(3.0)
+        except OSError:
+            pass
+
+
+class FakeAudioIO:
+    def __init__(self):
+        self.played = []
+
+    def start_speaking(self, audio, sample_rate):
+        self.played.append(len(audio))
+
+    def measure_percentage_spoken(self, total_samples, sample_rate):
+        return False, 100
+
+    def stop_speaking(self):
+        pass
+
+
+def test_cancel_advances_and_notifies():
+    """Test that cancelling makes older tags stale and runs the listeners."""
+    generation = ResponseGeneration()
+    cancelled = []
+    generation.add_cancel_listener(cancelled.append)
+    tag = generation.current
+
+    assert generation.cancel()
+    assert not generation.is_current(tag)
+    assert generation.is_current(generation.current)
+    assert generation.is_current(None)
+    assert cancelled == [tag]
+
+
+def test_cancel_of_stale_generation_is_noop():
+    """Test that cancelling an already cancelled generation does not cancel the newer one."""
+    generation = ResponseGeneration()
+    old = generation.current
+    generation.cancel()
+    new = generation.current
+
+    assert not generation.cancel(old)
+    assert generation.current == new
+
+
+def make_player(generation, history):
+    audio_io = FakeAudioIO()
+    player = SpeechPlayer(
+        audio_io=audio_io,
+        audio_output_queue=queue.Queue(),
+        conversation_history=history,
+        tts_sample_rate=1000,
+        shutdown_event=threading.Event(),
+        currently_speaking_event=threading.Event(),
+        processing_active_event=threading.Event(),
+        pause_time=0.01,
+        generation=generation,
+    )
+    return player, audio_io
+
+
+def test_player_discards_stale_audio():
+    """Test that audio of a cancelled response is never played."""
+    generation = ResponseGeneration()
+    history = ThreadSafeConversationState()
+    player, audio_io = make_player(generation, history)
+    tag = generation.current
+
+    player._play(AudioMessage(audio=np.zeros(10, dtype=np.float32), text="Played.", generation=tag))
+    generation.cancel()
+    player._play(AudioMessage(audio=np.zeros(10, dtype=np.float32), text="Stale.", generation=tag))
+    player._play(AudioMessage(audio=np.array([], dtype=np.float32), text="", is_eos=True, generation=tag))
+
+    assert audio_io.played == [10]
+    # The sentence spoken before the barge-in is still recorded
+    assert history.get_messages(as_dict=True)[-1] == {"role": "assistant", "content": "Played."}
+
+
+def test_barge_in_aborts_llm_stream():
+    """Test that cancelling the generation unblocks a stalled LLM stream immediately."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowStreamHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    generation = ResponseGeneration()
+    tracer = LatencyTracer()
+    trace_id = tracer.start("text")
+    processing_active = threading.Event()
+    processing_active.set()
+    tts_queue = queue.Queue()
+    processor = LanguageModelProcessor(
+        llm_input_queue=queue.Queue(),
+        tts_input_queue=tts_queue,
+        conversation_history=ThreadSafeConversationState(),
+        completion_url=f"http://127.0.0.1:{server.server_port}/v1/chat/completions",
+        model_name="test",
+        api_key=None,
+        processing_active_event=processing_active,
+        shutdown_event=threading.Event(),
+        generation=generation,
+        tracer=tracer,
+    )
+    worker = threading.Thread(target=processor._process_input, args=("hi",), daemon=True)
+    worker.start()
+
+    first = tts_queue.get(timeout=5.0)
+    assert first.text == "Hello there." and first.trace_id == trace_id
+    start = time.perf_counter()
+    new_trace_id = tracer.start("voice")
+    generation.cancel()
+    worker.join(timeout=2.0)
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+
+    assert not worker.is_alive()
+    assert elapsed < 1.0  # The next token would only arrive after 3s
+    eos = tts_queue.get(timeout=1.0)
+    assert eos.is_eos and not generation.is_current(eos.generation)
+    assert eos.trace_id == trace_id  # Marks made while it drains stay off the new trace
+    assert tts_queue.empty()
+    assert tracer.current_trace_id == new_trace_id and set(tracer._current.spans) == {"vad_endpoint"}
+
+
+def test_aborted_stream_does_not_flush_partial_line():
+    """Test that the half-received line of a stream aborted by a barge-in never reaches TTS."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PartialLineHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    generation = ResponseGeneration()
+    processing_active = threading.Event()
+    processing_active.set()
+    tts_queue = queue.Queue()
+    processor = LanguageModelProcessor(
+        llm_input_queue=queue.Queue(),
+        tts_input_queue=tts_queue,
+        conversation_history=ThreadSafeConversationState(),
+        completion_url=f"http://127.0.0.1:{server.server_port}/v1/chat/completions",
+        model_name="test",
+        api_key=None,
+        processing_active_event=processing_active,
+        shutdown_event=threading.Event(),
+        generation=generation,
+    )
+    worker = threading.Thread(target=processor._process_input, args=("hi",), daemon=True)
+    worker.start()
+
+    assert tts_queue.get(timeout=5.0).text == "Hello there."
+    time.sleep(1.5)  # The partial line has arrived
+    generation.cancel()
+    worker.join(timeout=2.0)
+    server.shutdown()
+
+    assert not worker.is_alive()
+    remaining = []
+    while not tts_queue.empty():
+        remaining.append(tts_queue.get())
+    assert [message.is_eos for message in remaining] == [True]
@@ -0,0 +1,63 @@
+"""Regression tests for the import cost of the CLI and other lightweight entry points."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative `python -X importtime` budget of `import glados.cli`; it took ~950 ms while the
+# CLI imported the engine eagerly and takes ~10 ms with deferred imports
+CLI_IMPORT_BUDGET_MS = 250
+
+HEAVY_MODULES = ("onnxruntime", "numba", "sounddevice", "httpx", "requests", "yaml", "glados.core.engine")
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess[str]:
+    """Run a fresh interpreter that finds the same glados package as the test session."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, check=True, env=env)
+
+
+def imported_modules(statement: str) -> set[str]:
+    """Run an import statement in a fresh interpreter and return the modules it loaded."""
+    code = f"import json, sys; {statement}; print(json.dumps(sorted(sys.modules)))"
+    result = run_python("-c", code)
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+
+def cumulative_import_ms(module: str) -> float:
+    """Cumulative import time of a module as reported by `python -X importtime`."""
+    result = run_python("-X", "importtime", "-c", f"import {module}")
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, _, cumulative, name = (part.strip() for part in line.replace(":", "|", 1).split("|"))
+        if name == module:
+            return int(cumulative) / 1000
+    raise AssertionError(f"{module} not found in importtime output")
+
+
+@pytest.mark.parametrize("statement", ["import glados", "import glados.cli", "from glados.core import exceptions"])
+def test_lightweight_imports_skip_heavy_modules(statement):
+    """Test that the package, the CLI and the exceptions load none of the model/runtime dependencies."""
+    loaded = imported_modules(statement)
+    assert not loaded.intersection(HEAVY_MODULES)
+
+
+def test_say_path_skips_engine_and_asr():
+    """Test that `glados say` loads the voice without the engine, numba or the network stack."""
+    loaded = imported_modules("import glados.cli; from glados.TTS import tts_glados")
+    assert not loaded.intersection({"numba", "glados.core.engine", "requests", "yaml", "httpx"})
+
+
+def test_package_attributes_are_loaded_on_first_use():
+    """Test that `glados.Glados` still resolves, importing the engine only then."""
+    loaded = imported_modules("import glados; glados.GladosConfig")
+    assert "glados.core.engine" in loaded
+
+
+def test_cli_import_time_budget():
+    """Test that importing the CLI stays within its import time budget."""
+    assert cumulative_import_ms("glados.cli") < CLI_IMPORT_BUDGET_MS
@@ -0,0 +1,149 @@
+"""Unit tests for the IOBinding fast path of the VAD and the TDT decoder/joiner."""
+
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+
+from glados.ASR.tdt_asr import AudioTranscriber as TDTTranscriber, _OnnxTDTModel
+from glados.audio_io import vad as vad_module
+from glados.audio_io.vad import VAD
+from glados.utils.onnx_sessions import IOBoundSession
+
+
+class FakeBinding:
+    def __init__(self):
+        self.inputs, self.outputs = {}, {}
+
+    def bind_ortvalue_input(self, name, value):
+        self.inputs[name] = value
+
+    def bind_ortvalue_output(self, name, value):
+        self.outputs[name] = value
+
+
+class FakeSession:
+    """Session computing `forward` of its inputs, on `run` and on `run_with_iobinding` into the bound outputs."""
+
+    def __init__(self, output_names):
+        self.output_names = output_names
+        self.bound_runs = 0
+
+    def get_outputs(self):
+        return [SimpleNamespace(name=name) for name in self.output_names]
+
+    def run(self, names, inputs):
+        outputs = dict(zip(self.output_names, self.forward(*inputs.values()), strict=True))
+        return [outputs[name] for name in names or self.output_names]
+
+    def io_binding(self):
+        return FakeBinding()
+
+    def run_with_iobinding(self, binding):
+        self.bound_runs += 1
+        outputs = self.run(None, {name: value.numpy() for name, value in binding.inputs.items()})
+        for value, output in zip(binding.outputs.values(), outputs, strict=True):
+            value.update_inplace(np.ascontiguousarray(output))
+
+
+class FakeVADSession(FakeSession):
+    def __init__(self):
+        super().__init__(["output", "stateN"])
+
+    def forward(self, input, state, sr):
+        level = np.abs(input).mean(axis=1)
+        state_n = np.tanh(0.5 * state + level[None, :, None])
+        return (state_n[1, :, :1] + input[:, :1]).astype(np.float32), state_n.astype(np.float32)
+
+
+def test_bound_session_outputs_rotate():
+    """Test that with two output buffers the previous run's outputs stay valid."""
+    session = FakeVADSession()
+    inputs = {"input": np.ones((1, 4), np.float32), "state": np.zeros((2, 1, 3), np.float32), "sr": np.array(16000)}
+    bound = IOBoundSession.from_example(session, inputs, buffers=2)
+
+    first = bound.run()
+    first_state = first[1].copy()
+    bound.inputs["state"][...] = first[1]
+    second = bound.run()
+
+    assert np.array_equal(first[1], first_state)
+    assert np.array_equal(second[1], session.run(None, {**inputs, "state": first_state})[1])
+    assert session.bound_runs == 2
+
+
+def test_vad_bound_buffers_match_session_run(monkeypatch):
+    """Test that the bound VAD gives the outputs of session.run, also after resets and for forks."""
+    monkeypatch.setattr(vad_module, "create_session", lambda profile, path: FakeVADSession())
+    audio = np.random.default_rng(0).standard_normal((1, 512 * 20)).astype(np.float32)
+    plain = VAD()
+    plain.io_binding = False
+    bound = VAD()
+    assert bound.io_binding  # On in the built-in "vad" profile
+
+    expected = plain.audio_forward(audio)
+    assert np.array_equal(bound.audio_forward(audio), expected)
+    assert np.array_equal(bound.audio_forward(audio), expected)  # audio_forward resets the stream
+    assert bound.ort_sess.bound_runs == 2 * 20
+
+    fork = bound.fork()
+    for i in range(0, audio.shape[1], 512):
+        assert fork(audio[:, i : i + 512]) == expected[i // 512]
+    assert fork._bound is not bound._bound
+
+
+class FakeDecoderSession(FakeSession):
+    def __init__(self):
+        super().__init__(["outputs", "prednet_lengths", "states", "162"])
+
+    def forward(self, targets, target_length, state0, state1):
+        next0 = np.tanh(state0 + targets[None, :, :].astype(np.float32) / 7)
+        return np.transpose(next0[-1:], (1, 2, 0)), target_length, next0, state1 + 1
+
+
+class FakeJoinerSession(FakeSession):
+    def __init__(self):
+        super().__init__(["outputs"])
+        self.weights = np.random.default_rng(1).standard_normal((4, 10)).astype(np.float32)
+
+    def forward(self, encoder_outputs, decoder_outputs):
+        joint = np.transpose(encoder_outputs, (0, 2, 1)) + np.transpose(decoder_outputs, (0, 2, 1))
+        logits = joint @ self.weights
+        logits[..., 5] += 0.5  # Blank
+        return (logits[:, :, None, :],)
+
+
+def tdt_transcriber(io_binding):
+    model = _OnnxTDTModel.__new__(_OnnxTDTModel)
+    model.encoder, model.decoder, model.joiner = None, FakeDecoderSession(), FakeJoinerSession()
+    model.decoder_in_names = ["targets", "target_length", "states.1", "onnx::Slice_3"]
+    model.decoder_out_names = model.decoder.output_names
+    model.joiner_in_names = ["encoder_outputs", "decoder_outputs"]
+    model.joiner_out_names = ["outputs"]
+    model.pred_rnn_layers, model.pred_hidden = 2, 4
+    model.joiner_max_frames = None
+    model.decoder_io_binding = model.joiner_io_binding = io_binding
+    model._bound = threading.local()
+    tdt = TDTTranscriber.__new__(TDTTranscriber)
+    tdt.model = model
+    tdt._initial_decoder = None
+    tdt.blank_id = 5
+    tdt.tdt_durations = [1, 2, 3, 4]
+    return tdt
+
+
+def test_tdt_bound_decoding_matches_session_run():
+    """Test that bound decoder and joiner buffers give the tokens of session.run, in one go and in chunks."""
+    encoder_out = np.random.default_rng(2).standard_normal((1, 4, 300)).astype(np.float32)
+    expected = tdt_transcriber(False)._decode_tdt(encoder_out)
+    tdt = tdt_transcriber(True)
+
+    assert tdt._decode_tdt(encoder_out) == expected
+    assert tdt.model.decoder.bound_runs and tdt.model.joiner.bound_runs
+
+    state = None
+    for start in range(0, 300, 37):
+        state = tdt.decode_frames(encoder_out[..., start : start + 37], state)
+        for token in (1, 2):  # Other decoding in between overwrites both sets of bound outputs
+            tdt.model.run_decoder(token, state.state0, state.state1)
+    assert state.token_ids == expected
@@ -0,0 +1,114 @@
+"""Unit tests for the pooled LLM HTTP session and the streaming parser."""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+
+from glados.core.llm_client import LLMClientConfig, LLMStreamParser, create_llm_session
+
+
+def openai_line(content, **delta):
+    if content is not None:
+        delta["content"] = content
+    return ("data: " + json.dumps({"id": "x", "choices": [{"index": 0, "delta": delta}]}) + "\n\n").encode()
+
+
+def ollama_line(content, done=False):
+    payload = {"model": "m", "message": {"role": "assistant", "content": content}, "done": done}
+    return (json.dumps(payload) + "\n").encode()
+
+
+def parse_in_pieces(body, size):
+    parser = LLMStreamParser()
+    contents = []
+    for i in range(0, len(body), size):
+        contents.extend(parser.feed(body[i : i + size]))
+    contents.extend(parser.flush())
+    return contents, parser.done
+
+
+def test_openai_sse_stream():
+    """Test that SSE deltas are extracted and [DONE] ends the stream."""
+    body = openai_line("", role="assistant") + openai_line("Hello") + openai_line(" world.") + b"data: [DONE]\n\n"
+    contents, done = parse_in_pieces(body, len(body))
+
+    assert contents == ["Hello", " world."]
+    assert done
+
+
+def test_ollama_ndjson_stream():
+    """Test that NDJSON messages are extracted and "done": true ends the stream."""
+    body = ollama_line("Hi") + ollama_line(" there") + ollama_line("", done=True) + ollama_line("ignored")
+    contents, done = parse_in_pieces(body, len(body))
+
+    assert contents == ["Hi", " there"]
+    assert done
+
+
+def test_lines_split_across_network_reads():
+    """Test that lines and multi-byte characters split between reads are reassembled."""
+    body = openai_line("Café ☕", role="assistant") + openai_line(" ok") + b"data: [DONE]\n\n"
+    for size in (1, 3, 7, 64):
+        assert parse_in_pieces(body, size) == (["Café ☕", " ok"], True)
+
+
+def test_escapes_decoded():
+    """Test that JSON escapes in the content are decoded like json.loads does."""
+    text = 'He said "hi"\nthen \\ left é\t\U0001f600'
+    contents, _ = parse_in_pieces(openai_line(text), 5)
+
+    assert contents == [text]
+
+
+def test_fast_path_matches_json_loads():
+    """Test that the fast path agrees with a full parse on a variety of lines."""
+    lines = [
+        openai_line("plain"),
+        openai_line(None, role="assistant"),
+        b'data: {"choices":[{"delta":{"content":null}}]}\n',
+        b'data: {"choices":[{"delta":{"reasoning_content":"think","content":"say"}}]}\n',
+        b'data: {"choices": [{"delta": {"content" : "spaced"}}]}\n',
+        b'data: {"choices":[],"usage":{"total_tokens":3}}\n',
+        ollama_line('quote " inside'),
+    ]
+    for line in lines:
+        parser = LLMStreamParser()
+        payload = line.strip().removeprefix(b"data:").strip()
+        assert parser.feed(line) == ([c] if (c := LLMStreamParser._parse_json_content(payload.decode())) else [])
+
+
+def test_comments_and_noise_ignored():
+    """Test that SSE comments, other fields and non-JSON lines produce no content."""
+    body = b": keep-alive\nevent: message\nid: 3\nnot json\ndata: {broken\n" + openai_line("ok")
+    assert parse_in_pieces(body, 4) == (["ok"], False)
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    client_ports = []
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        KeepAliveHandler.client_ports.append(self.client_address[1])
+        body = b'{"message": {"content": "ok"}}'
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_session_reuses_connection():
+    """Test that consecutive requests through the shared session reuse one TCP connection."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    session = create_llm_session(LLMClientConfig(pool_maxsize=2))
+    url = f"http://127.0.0.1:{server.server_port}/api/chat"
+
+    for _ in range(3):
+        assert session.post(url, json={}, timeout=5).json()["message"]["content"] == "ok"
+    server.shutdown()
+
+    assert len(set(KeepAliveHandler.client_ports)) == 1
@@ -0,0 +1,94 @@
+"""Unit tests for the mel spectrogram framing and the incremental (streaming) mel spectrogram."""
+
+import numpy as np
+import pytest
+
+from glados.ASR.mel_spectrogram import (
+    MelSpectrogramCalculator,
+    MelSpectrogramConfig,
+    _extract_windows_numba,
+    _extract_windows_strided,
+)
+
+
+def blocks(audio, seed=0):
+    """Cut audio into blocks of random sizes, including empty and single-sample ones."""
+    rng = np.random.default_rng(seed)
+    cuts = np.sort(rng.integers(0, len(audio), 40))
+    return np.split(audio, cuts)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"preemph": 0.97},
+        {"exact_pad": True, "preemph": 0.97},
+        {"frame_splicing": 3, "pad_to": 16, "normalize": "all_features"},
+        {"normalize": None, "log_zero_guard_type": "clamp"},
+    ],
+)
+def test_streaming_matches_compute(options):
+    """Test that block-by-block frames plus finalize give the batch spectrogram."""
+    calculator = MelSpectrogramCalculator(features=128, dither=0.0, **options)
+    audio = np.random.default_rng(1).standard_normal(16000 * 2 + 123).astype(np.float32) * 0.1
+    stream = calculator.stream()
+
+    emitted = sum(stream.accept(block).shape[1] for block in blocks(audio))
+    result = stream.finalize()
+
+    expected = calculator.compute(audio)
+    assert emitted > 0.9 * stream.num_frames  # Only the last frames wait for finalize
+    assert result.shape == expected.shape
+    np.testing.assert_allclose(result, expected, atol=1e-4)
+
+
+@pytest.mark.parametrize("length", [0, 1, 100, 256, 257, 600])
+def test_streaming_short_utterances_match_compute(length):
+    """Test utterances around the reflect padding length, fed in two blocks."""
+    calculator = MelSpectrogramCalculator(features=80, dither=0.0, preemph=0.97)
+    audio = np.random.default_rng(length).standard_normal(length).astype(np.float32)
+    stream = calculator.stream()
+    stream.accept(audio[: length // 2])
+    stream.accept(audio[length // 2 :])
+
+    np.testing.assert_allclose(stream.finalize(), calculator.compute(audio), atol=1e-4)
+
+
+def test_streaming_keeps_a_bounded_buffer():
+    """Test that only the overlap of the next frame is kept, and that reset starts a new utterance."""
+    calculator = MelSpectrogramCalculator(features=80, dither=0.0)
+    stream = calculator.stream()
+    audio = np.random.default_rng(2).standard_normal(16000).astype(np.float32)
+    for block in np.split(audio, 50):
+        stream.accept(block)
+        assert len(stream._padded) <= calculator.n_fft + len(block)
+
+    stream.reset()
+    stream.accept(audio[:8000])
+    np.testing.assert_allclose(stream.finalize(), calculator.compute(audio[:8000]), atol=1e-4)
+
+
+@pytest.mark.parametrize("n_frames", [0, 1, 97])
+def test_strided_frames_match_numba(n_frames):
+    """Test that the strided window view gives the frames of the numba loop."""
+    audio = np.random.default_rng(3).standard_normal(512 + 160 * 100).astype(np.float32)
+    window = np.hanning(512).astype(np.float32)
+
+    strided = _extract_windows_strided(audio, window, 512, 160, n_frames)
+
+    np.testing.assert_array_equal(strided, _extract_windows_numba(audio, window, 512, 160, n_frames))
+    assert strided.dtype == np.float32 and strided.shape == (n_frames, 512)
+
+
+def test_frame_extraction_is_selected_by_config():
+    """Test that both framing variants can be configured and compute the same spectrogram."""
+    audio = np.random.default_rng(4).standard_normal(16000).astype(np.float32)
+    config = MelSpectrogramConfig(dither=0.0)
+    numba = MelSpectrogramCalculator.from_config(config.model_copy(update={"frame_extraction": "numba"}))
+    strided = MelSpectrogramCalculator.from_config(config)
+
+    assert strided.frame_extraction == "strided" and numba.frame_extraction == "numba"
+    np.testing.assert_allclose(numba.compute(audio), strided.compute(audio), atol=1e-5)
+    with pytest.raises(ValueError):
+        MelSpectrogramCalculator(frame_extraction="torch")
@@ -0,0 +1,159 @@
+"""Unit tests for the multi-session network server."""
+
+import socket
+import struct
+import time
+
+import numpy as np
+import pytest
+
+from glados.audio_io.network_io import TEXT_MESSAGE_FROM_CLIENT, TEXT_MESSAGE_TO_CLIENT
+from glados.audio_io.network_server import NetworkSessionServer
+
+
+class FakeVAD:
+    """VAD stand-in that never detects speech."""
+
+    def __init__(self):
+        self.forks = 0
+
+    def __call__(self, x):
+        return np.array(0.0, dtype=np.float32)
+
+    def fork(self):
+        self.forks += 1
+        return self
+
+
+def wait_until(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def make_server(max_sessions):
+    started = []
+    ended = []
+
+    def factory(audio_io, session_id):
+        started.append((session_id, audio_io))
+        return lambda: ended.append(session_id)
+
+    vad = FakeVAD()
+    server = NetworkSessionServer(
+        session_factory=factory, host="127.0.0.1", port=0, max_sessions=max_sessions, vad_model=vad
+    )
+    server.start()
+    return server, vad, started, ended
+
+
+def test_each_connection_gets_own_session():
+    """Test that concurrent clients get separate audio I/O instances and forked VAD state."""
+    server, vad, started, _ = make_server(max_sessions=2)
+    clients = [socket.create_connection(("127.0.0.1", server.port)) for _ in range(2)]
+    try:
+        assert wait_until(lambda: len(started) == 2)
+        assert started[0][1] is not started[1][1]
+        assert started[0][1].get_sample_queue() is not started[1][1].get_sample_queue()
+        assert vad.forks == 2
+        assert server.active_sessions == 2
+    finally:
+        for client in clients:
+            client.close()
+        server.stop()
+
+
+def test_text_messages_routed_to_own_session():
+    """Test that a text message only reaches the session of the sending client."""
+    server, _, started, _ = make_server(max_sessions=2)
+    first = socket.create_connection(("127.0.0.1", server.port))
+    assert wait_until(lambda: len(started) == 1)
+    second = socket.create_connection(("127.0.0.1", server.port))
+    try:
+        assert wait_until(lambda: len(started) == 2)
+        text = "hello".encode("utf-8")
+        second.sendall(struct.pack("<II", TEXT_MESSAGE_FROM_CLIENT, len(text)) + text)
+
+        assert started[1][1].get_text_message_queue().get(timeout=2.0) == "hello"
+        assert started[0][1].get_text_message_queue().empty()
+    finally:
+        first.close()
+        second.close()
+        server.stop()
+
+
+def test_connections_over_cap_are_rejected():
+    """Test that clients beyond max_sessions get a busy message and are closed."""
+    server, vad, started, _ = make_server(max_sessions=1)
+    accepted = socket.create_connection(("127.0.0.1", server.port))
+    try:
+        assert wait_until(lambda: len(started) == 1)
+
+        rejected = socket.create_connection(("127.0.0.1", server.port))
+        rejected.settimeout(2.0)
+        marker, length = struct.unpack("<II", rejected.recv(8))
+        assert marker == TEXT_MESSAGE_TO_CLIENT
+        assert "busy" in rejected.recv(length).decode("utf-8")
+        rejected.close()
+
+        assert len(started) == 1
+        assert server.get_stats()["rejected_connections"] == 1
+        assert vad.forks == 1  # Rejected connections get no VAD stream
+    finally:
+        accepted.close()
+        server.stop()
+
+
+def test_disconnect_releases_slot_and_ends_session():
+    """Test that a disconnecting client frees its slot for the next one."""
+    server, _, started, ended = make_server(max_sessions=1)
+    try:
+        first = socket.create_connection(("127.0.0.1", server.port))
+        assert wait_until(lambda: len(started) == 1)
+        first.close()
+
+        assert wait_until(lambda: ended == ["0"])
+        assert wait_until(lambda: server.active_sessions == 0)
+
+        second = socket.create_connection(("127.0.0.1", server.port))
+        assert wait_until(lambda: len(started) == 2)
+        second.close()
+    finally:
+        server.stop()
+
+
+def test_max_sessions_must_be_positive():
+    """Test that a session cap below one is refused."""
+    with pytest.raises(ValueError):
+        NetworkSessionServer(session_factory=lambda audio_io, session_id: None, max_sessions=0, vad_model=FakeVAD())
+
+
+def test_clients_persist_memory_to_separate_files(tmp_path):
+    """Test that unauthenticated clients get their own memory files, the same ones on every connection."""
+    from glados.core.engine import Glados, MemoryConfig
+
+    memory = MemoryConfig(persist_path=str(tmp_path / "conversation.json"))
+    first = Glados._memory_persist_paths(memory, user_id=None, client_host="192.168.1.20")
+    second = Glados._memory_persist_paths(memory, user_id=None, client_host="192.168.1.21")
+
+    assert set(first).isdisjoint(second)
+    assert first == Glados._memory_persist_paths(memory, user_id=None, client_host="192.168.1.20")
+    assert first[0] == tmp_path / "conversation.client-192_168_1_20.json"
+    authenticated = Glados._memory_persist_paths(memory, user_id="alice", client_host="10.0.0.1")
+    assert authenticated[0].name == "conversation.alice.json"
+    assert Glados._memory_persist_paths(memory, user_id=None, client_host=None)[0] == tmp_path / "conversation.json"
+
+
+def test_session_reports_client_host():
+    """Test that a session exposes its client's address as a stable identity."""
+    server, _, started, _ = make_server(max_sessions=1)
+    client = socket.create_connection(("127.0.0.1", server.port))
+    try:
+        assert wait_until(lambda: len(started) == 1)
+        assert started[0][1].get_client_host() == "127.0.0.1"
+    finally:
+        client.close()
+        server.stop()
@@ -0,0 +1,174 @@
+"""Unit tests for the ONNX Runtime session factory and its profiles."""
+
+from pathlib import Path
+
+import onnxruntime as ort
+import pytest
+
+from glados.utils import onnx_sessions
+from glados.utils.onnx_sessions import (
+    OnnxProfile,
+    OnnxRuntimeConfig,
+    build_session_options,
+    configure_sessions,
+    create_session,
+    model_digest,
+    resolve_profile,
+    select_providers,
+    session_profiles,
+)
+
+
+class FakeSession:
+    def __init__(self, path, sess_options=None, providers=None):
+        self.path = path
+        self.sess_options = sess_options
+        self.providers = providers
+
+    def get_providers(self):
+        return self.providers
+
+
+class OptimizingSession(FakeSession):
+    """Fake session that saves its "optimized graph" like ONNX Runtime does."""
+
+    created = []
+
+    def __init__(self, path, sess_options=None, providers=None):
+        super().__init__(path, sess_options, providers)
+        self.created.append(self)
+        if sess_options.optimized_model_filepath:
+            Path(sess_options.optimized_model_filepath).write_bytes(b"optimized " + Path(path).read_bytes())
+
+
+@pytest.fixture(autouse=True)
+def reset_config():
+    yield
+    configure_sessions(OnnxRuntimeConfig())
+
+
+def test_profiles_layer_builtin_default_and_model():
+    """Test that configured fields override the built-in profile and unset fields do not."""
+    configure_sessions(
+        OnnxRuntimeConfig(
+            default=OnnxProfile(intra_op_threads=4, allow_spinning=False),
+            models={"vad": OnnxProfile(allow_spinning=True), "tts_glados": OnnxProfile(intra_op_threads=2)},
+        )
+    )
+
+    vad = resolve_profile("vad")
+    assert vad.intra_op_threads == 4  # The configured default beats the built-in 1
+    assert vad.inter_op_threads == 1  # Built-in, not configured anywhere
+    assert vad.allow_spinning is True
+    assert resolve_profile("tts_glados").intra_op_threads == 2
+    assert resolve_profile("unknown").model_dump(exclude_none=True) == {"intra_op_threads": 4, "allow_spinning": False}
+
+
+def test_session_options_apply_the_profile():
+    """Test that every profile field reaches the SessionOptions."""
+    profile = OnnxProfile(
+        intra_op_threads=2,
+        inter_op_threads=1,
+        execution_mode="parallel",
+        graph_optimization="basic",
+        allow_spinning=False,
+        enable_cpu_mem_arena=False,
+        enable_mem_pattern=False,
+    )
+
+    options = build_session_options(profile)
+
+    assert options.intra_op_num_threads == 2
+    assert options.inter_op_num_threads == 1
+    assert options.execution_mode == ort.ExecutionMode.ORT_PARALLEL
+    assert options.graph_optimization_level == ort.GraphOptimizationLevel.ORT_ENABLE_BASIC
+    assert options.get_session_config_entry("session.intra_op.allow_spinning") == "0"
+    assert options.enable_cpu_mem_arena is False
+    assert options.enable_mem_pattern is False
+
+
+def test_providers_are_filtered_by_availability(monkeypatch):
+    """Test that profiles only select available providers and fall back to the CPU."""
+    available = ["TensorrtExecutionProvider", "CUDAExecutionProvider", "CPUExecutionProvider"]
+    monkeypatch.setattr(onnx_sessions.ort, "get_available_providers", lambda: list(available))
+
+    assert select_providers(OnnxProfile()) == ["CUDAExecutionProvider", "CPUExecutionProvider"]
+    assert select_providers(OnnxProfile(exclude_providers=[])) == available
+    assert select_providers(OnnxProfile(providers=["ROCMExecutionProvider"])) == ["CPUExecutionProvider"]
+    assert select_providers(OnnxProfile(providers=["CPUExecutionProvider", "CUDAExecutionProvider"])) == [
+        "CPUExecutionProvider",
+        "CUDAExecutionProvider",
+    ]
+
+
+def test_created_sessions_report_their_profile(monkeypatch, tmp_path):
+    """Test that create_session uses the model's profile and records it."""
+    monkeypatch.setattr(onnx_sessions.ort, "InferenceSession", FakeSession)
+    configure_sessions(OnnxRuntimeConfig(models={"phonemizer": OnnxProfile(providers=["CPUExecutionProvider"])}))
+
+    session = create_session("phonemizer", tmp_path / "g2p.onnx")
+
+    assert session.sess_options.intra_op_num_threads == 1
+    info = session_profiles()["phonemizer"]
+    assert info["model_path"] == str(tmp_path / "g2p.onnx")
+    assert info["profile"] == {"intra_op_threads": 1, "inter_op_threads": 1, "providers": ["CPUExecutionProvider"]}
+    assert info["providers"] == ["CPUExecutionProvider"]
+    assert info["graph_cache"] == "off"
+
+
+def test_optimized_graphs_are_cached(monkeypatch, tmp_path):
+    """Test that the second session of a model loads the saved graph without optimizing it."""
+    monkeypatch.setattr(onnx_sessions.ort, "InferenceSession", OptimizingSession)
+    OptimizingSession.created = []
+    configure_sessions(OnnxRuntimeConfig(graph_cache_dir=str(tmp_path / "cache")))
+    model_path = tmp_path / "voice.onnx"
+    model_path.write_bytes(b"graph")
+
+    create_session("tts_glados", model_path)
+    assert session_profiles()["tts_glados"]["graph_cache"] == "miss"
+    cached = OptimizingSession.created[0].sess_options.optimized_model_filepath
+    assert not Path(cached).exists()  # Saved to a temporary name, then moved into place
+
+    create_session("tts_glados", model_path)
+    assert session_profiles()["tts_glados"]["graph_cache"] == "hit"
+    second = OptimizingSession.created[1]
+    assert Path(second.path).read_bytes() == b"optimized graph"
+    assert second.sess_options.graph_optimization_level == ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+
+    model_path.write_bytes(b"retrained graph")  # New content, new key
+    create_session("tts_glados", model_path)
+    assert session_profiles()["tts_glados"]["graph_cache"] == "miss"
+
+
+def test_unusable_cached_graphs_are_rebuilt(monkeypatch, tmp_path):
+    """Test that a cached graph the runtime cannot load is replaced by a fresh one."""
+    configure_sessions(OnnxRuntimeConfig(graph_cache_dir=str(tmp_path / "cache")))
+    model_path = tmp_path / "vad.onnx"
+    model_path.write_bytes(b"graph")
+    monkeypatch.setattr(onnx_sessions.ort, "InferenceSession", OptimizingSession)
+    create_session("vad", model_path)
+
+    def reject_cached(path, sess_options=None, providers=None):
+        if Path(path).parent.name == "cache":
+            raise RuntimeError("invalid model")
+        return OptimizingSession(path, sess_options, providers)
+
+    monkeypatch.setattr(onnx_sessions.ort, "InferenceSession", reject_cached)
+    create_session("vad", model_path)
+
+    assert session_profiles()["vad"]["graph_cache"] == "miss"
+    assert len(list((tmp_path / "cache").glob("vad-*.onnx"))) == 1
+
+
+def test_model_digests_are_remembered(monkeypatch, tmp_path):
+    """Test that unchanged model files are not hashed again."""
+    model_path = tmp_path / "encoder.onnx"
+    model_path.write_bytes(b"weights")
+    digest = model_digest(model_path, tmp_path)
+
+    monkeypatch.setattr(onnx_sessions.hashlib, "blake2b", None)  # Any rehash would fail
+    assert model_digest(model_path, tmp_path) == digest
+    monkeypatch.undo()
+
+    model_path.write_bytes(b"new weights")
+    assert model_digest(model_path, tmp_path) != digest
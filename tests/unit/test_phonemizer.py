@@ -0,0 +1,152 @@
+"""Unit tests for the phonemizer's word cache and batched G2P inference."""
+
+import pickle
+import string
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from glados.TTS import phonemizer as phonemizer_module
+from glados.TTS.phonemizer import ModelConfig, Phonemizer, WordPhonemeCache
+
+SPECIAL = ["_", "<start>", "<end>", "<en_us>"]
+
+
+class FakeG2PSession:
+    """Stand-in G2P model that "predicts" each input letter as its uppercase phoneme."""
+
+    def __init__(self, *args, input_length="seq", **kwargs):
+        self.input_length = input_length
+        self.batch_shapes = []
+
+    def get_inputs(self):
+        return [SimpleNamespace(name="input", shape=["batch", self.input_length])]
+
+    def get_providers(self):
+        return ["CPUExecutionProvider"]
+
+    def run(self, output_names, inputs):
+        batch = inputs["input"]
+        self.batch_shapes.append(batch.shape)
+        ids = np.where(batch == 1, 3, batch)  # The start token comes out as a language token
+        logits = np.zeros((*batch.shape, len(SPECIAL) + 26), dtype=np.float32)
+        np.put_along_axis(logits, ids[..., None], 1.0, axis=2)
+        return [logits]
+
+
+@pytest.fixture
+def make_phonemizer(tmp_path, monkeypatch):
+    token_to_idx = {token: i for i, token in enumerate(SPECIAL + list(string.ascii_lowercase))}
+    idx_to_token = {i: token for i, token in enumerate(SPECIAL + list(string.ascii_uppercase))}
+    files = {"dict.pkl": {"hello": "həlˈoʊ"}, "t2i.pkl": token_to_idx, "i2t.pkl": idx_to_token}
+    for name, data in files.items():
+        (tmp_path / name).write_bytes(pickle.dumps(data))
+
+    def make(input_length="seq", word_cache_path=None):
+        monkeypatch.setattr(
+            phonemizer_module.ort,
+            "InferenceSession",
+            lambda *args, **kwargs: FakeG2PSession(input_length=input_length),
+        )
+        config = ModelConfig(
+            model_path=tmp_path / "g2p.onnx",
+            phoneme_dict_path=tmp_path / "dict.pkl",
+            token_to_idx_path=tmp_path / "t2i.pkl",
+            idx_to_token_path=tmp_path / "i2t.pkl",
+            word_cache_path=word_cache_path,
+        )
+        return Phonemizer(config)
+
+    return make
+
+
+def test_predictions_are_cached_across_calls(make_phonemizer):
+    """Test that an out-of-dictionary word runs through the model once, whatever its case."""
+    phonemizer = make_phonemizer()
+
+    first = phonemizer.convert_to_phonemes(["hello Wheatley, Wheatley!"])
+    second = phonemizer.convert_to_phonemes(["WHEATLEY says hello"])
+
+    assert first == ["həlˈoʊ WHEATLEY, WHEATLEY!"]
+    assert second == ["WHEATLEY SAYS həlˈoʊ"]
+    assert phonemizer.model_runs == 2  # "wheatley", then "says"
+    assert phonemizer.word_cache.stats() == {"entries": 2, "hits": 1, "misses": 2}
+
+
+def test_words_are_batched_by_length(make_phonemizer):
+    """Test that words are padded to their length bucket instead of the model input length."""
+    phonemizer = make_phonemizer()
+    session = phonemizer.ort_session
+
+    result = phonemizer.convert_to_phonemes(["cat dog aperture laboratories"])
+
+    assert result == ["CAT DOG APERTURE LABORATORIES"]
+    # 3 letters -> 11 tokens, 8 -> 26, 12 -> 38 (truncated words still fit the input length)
+    assert sorted(session.batch_shapes) == [(1, 32), (1, 48), (2, 16)]
+
+
+def test_fixed_length_models_keep_their_input_length(make_phonemizer):
+    """Test that a model exported with a fixed sequence length gets it for every batch."""
+    phonemizer = make_phonemizer(input_length=64)
+    session = phonemizer.ort_session
+
+    assert phonemizer.convert_to_phonemes(["cat aperture"]) == ["CAT APERTURE"]
+    assert session.batch_shapes == [(2, 64)]
+
+
+def test_batches_are_split_at_max_batch_size(make_phonemizer):
+    """Test that a bucket with many words is predicted in several runs."""
+    phonemizer = make_phonemizer()
+    phonemizer.config.MAX_BATCH_SIZE = 2
+
+    words = ["cat", "dog", "cow", "pig", "elk"]
+    assert phonemizer.convert_to_phonemes([" ".join(words)]) == [" ".join(w.upper() for w in words)]
+    assert sorted(phonemizer.ort_session.batch_shapes) == [(1, 16), (2, 16), (2, 16)]
+
+
+def test_word_cache_persists_across_restarts(make_phonemizer, tmp_path):
+    """Test that predictions are loaded from the cache file by a new phonemizer."""
+    path = tmp_path / "cache" / "phonemes.tsv"
+    make_phonemizer(word_cache_path=path).convert_to_phonemes(["Wheatley"])
+
+    restarted = make_phonemizer(word_cache_path=path)
+    assert restarted.convert_to_phonemes(["wheatley"]) == ["WHEATLEY"]
+    assert restarted.model_runs == 0
+
+
+def test_word_cache_file_of_another_model_is_discarded(tmp_path):
+    """Test that a cache file written for a different G2P model is not used."""
+    path = tmp_path / "phonemes.tsv"
+    old = WordPhonemeCache(path=path, model_tag="old.onnx:100")
+    old.put_many({"glados": "GLADOS"})
+
+    assert len(WordPhonemeCache(path=path, model_tag="old.onnx:100")) == 1
+    assert len(WordPhonemeCache(path=path, model_tag="new.onnx:200")) == 0
+    assert len(WordPhonemeCache(path=path, model_tag="old.onnx:100")) == 0
+
+
+def test_word_cache_evicts_and_compacts(tmp_path):
+    """Test that the cache keeps its newest entries and rewrites an overgrown file."""
+    path = tmp_path / "phonemes.tsv"
+    cache = WordPhonemeCache(max_entries=2, path=path)
+    cache.put_many({"a": "A", "b": "B"})
+    cache.get_many(["a"])
+    cache.put_many({"c": "C"})
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": "A", "c": "C"}
+    cache.put_many({"d": "D", "e": "E"})  # 5 lines would exceed twice the capacity
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 1 + 2
+
+    reloaded = WordPhonemeCache(max_entries=2, path=path)
+    assert reloaded.get_many(["d", "e"]) == {"d": "D", "e": "E"}
+
+
+def test_warm_up_runs_every_bucket_length_without_caching(make_phonemizer):
+    """Test that warming up runs each input length once and leaves the word cache empty."""
+    phonemizer = make_phonemizer()
+    phonemizer.warm_up()
+
+    assert phonemizer.ort_session.batch_shapes == [(1, 16), (1, 32), (1, 48), (1, 64)]
+    assert len(phonemizer.word_cache) == 0
+    assert phonemizer.model_runs == 0
@@ -0,0 +1,128 @@
+"""Unit tests for bounded pipeline queues."""
+
+import queue
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from glados.core.audio_data import AudioMessage
+from glados.core.pipeline_queue import PipelineQueue, PipelineQueuesConfig, QueueConfig
+from glados.core.stage import SHUTDOWN
+
+
+def drain(q):
+    items = []
+    while not q.empty():
+        items.append(q.get_nowait())
+    return items
+
+
+def test_block_policy_applies_backpressure():
+    """Test that a producer waits on a full queue until the consumer takes an item."""
+    q = PipelineQueue(maxsize=2, policy="block")
+    q.put("a")
+    q.put("b")
+
+    threading.Timer(0.05, q.get).start()
+    start = time.perf_counter()
+    q.put("c")
+
+    assert time.perf_counter() - start >= 0.04
+    assert drain(q) == ["b", "c"]
+    assert q.stats()["blocked_seconds"] > 0
+
+
+def test_block_policy_timeout_and_nonblocking():
+    """Test that a full queue raises queue.Full like queue.Queue does."""
+    q = PipelineQueue(maxsize=1, policy="block")
+    q.put("a")
+
+    with pytest.raises(queue.Full):
+        q.put("b", block=False)
+    with pytest.raises(queue.Full):
+        q.put("b", timeout=0.01)
+
+
+def test_drop_oldest_policy():
+    """Test that the oldest content item is discarded but control items are kept."""
+    q = PipelineQueue(maxsize=3, policy="drop_oldest")
+    for item in ("<EOS>", "a", "b", "c"):
+        q.put(item)
+
+    assert drain(q) == ["<EOS>", "b", "c"]
+    assert q.stats()["dropped"] == 1
+
+
+def test_coalesce_policy_merges_text():
+    """Test that a new text is merged into the newest queued one when full."""
+    q = PipelineQueue(maxsize=1, policy="coalesce")
+    q.put("turn the lights")
+    q.put("off please")
+
+    assert drain(q) == ["turn the lights off please"]
+    assert q.stats()["coalesced"] == 1
+
+
+def test_coalesce_policy_concatenates_audio():
+    """Test that queued audio messages are concatenated when full."""
+    q = PipelineQueue(maxsize=1, policy="coalesce")
+    q.put(AudioMessage(audio=np.ones(3, dtype=np.float32), text="Hello."))
+    q.put(AudioMessage(audio=np.zeros(2, dtype=np.float32), text="World."))
+
+    (merged,) = drain(q)
+    assert merged.text == "Hello. World."
+    assert len(merged.audio) == 5
+    assert merged.audio.dtype == np.float32
+
+
+def test_control_items_bypass_bound():
+    """Test that end-of-stream tokens are queued even when the queue is full."""
+    q = PipelineQueue(maxsize=1, policy="block")
+    q.put(AudioMessage(audio=np.zeros(1, dtype=np.float32), text="x"))
+    q.put(AudioMessage(audio=np.array([], dtype=np.float32), text="", is_eos=True), block=False)
+    q.put("<EOS>", block=False)
+
+    assert q.qsize() == 3
+
+
+def test_shutdown_releases_blocked_producer():
+    """Test that SHUTDOWN wakes a producer blocked on a full queue and later items are discarded."""
+    q = PipelineQueue(maxsize=1, policy="block")
+    q.put("a")
+    producer = threading.Thread(target=q.put, args=("b",), daemon=True)
+    producer.start()
+    time.sleep(0.05)
+
+    q.put(SHUTDOWN)
+    producer.join(timeout=1.0)
+    q.put("c")
+
+    assert not producer.is_alive()
+    assert drain(q) == ["a", SHUTDOWN]
+
+
+def test_high_watermark_gauge():
+    """Test that the high watermark tracks the deepest the queue has been."""
+    q = PipelineQueue(maxsize=0, name="tts")
+    for i in range(5):
+        q.put(i)
+    drain(q)
+    q.put("x")
+
+    stats = q.stats()
+    assert stats["depth"] == 1
+    assert stats["high_watermark"] == 5
+
+    q.reset_high_watermark()
+    assert q.stats()["high_watermark"] == 1
+
+
+def test_from_config():
+    """Test that queues are created from the pipeline configuration."""
+    config = PipelineQueuesConfig(audio=QueueConfig(maxsize=2, policy="drop_oldest"))
+    q = PipelineQueue.from_config(config.audio, "audio")
+
+    assert (q.maxsize, q.policy, q.name) == (2, "drop_oldest", "audio")
+    assert config.tts.policy == "block"
@@ -0,0 +1,151 @@
+"""Unit tests for prompt assembly and prefix reuse measurement."""
+
+from glados.core.prompt_assembly import PromptAssembler, PromptConfig
+from glados.core.token_budget import TokenCounter
+
+SYSTEM = [{"role": "system", "content": "You are GLaDOS."}]
+
+
+def conversation(n):
+    """n user/assistant exchanges followed by a new user message."""
+    turns = []
+    for i in range(n):
+        turns.append({"role": "user", "content": f"question {i}"})
+        turns.append({"role": "assistant", "content": f"answer {i}"})
+    turns.append({"role": "user", "content": f"question {n}"})
+    return turns
+
+
+def test_splice_mode_matches_previous_layout():
+    """Test that splice mode puts memory after the system prompt and trims the window."""
+    assembler = PromptAssembler(mode="splice", max_turn_messages=4)
+    fewshot = {"role": "user", "content": "how do i test?"}
+    memory = [{"role": "system", "content": "What you know about the user: likes cake"}]
+
+    messages = assembler.assemble([*SYSTEM, fewshot], conversation(3), lambda: memory)
+
+    assert messages == [*SYSTEM, *memory, fewshot, *conversation(3)[-4:]]
+
+
+def test_prefix_stable_prompt_grows_append_only():
+    """Test that consecutive prefix_stable prompts extend the previous one."""
+    assembler = PromptAssembler(mode="prefix_stable", max_turn_messages=12)
+    calls = []
+
+    def memory():
+        calls.append(1)
+        return [{"role": "system", "content": f"memory version {len(calls)}"}]
+
+    previous = assembler.assemble(SYSTEM, conversation(0), memory)
+    for n in range(1, 6):
+        messages = assembler.assemble(SYSTEM, conversation(n), memory)
+        assert messages[: len(previous) - 1] == previous[:-1]
+        assert messages[len(previous) - 1] == previous[-1]
+        previous = messages
+    assert len(calls) == 1  # Memory is only read when the window starts
+
+
+def test_prefix_stable_compacts_to_half_and_refreshes_memory():
+    """Test that an overflowing window is cut back to half, starting on a user message."""
+    assembler = PromptAssembler(mode="prefix_stable", max_turn_messages=8)
+    memory_versions = iter(range(10))
+
+    def memory():
+        return [{"role": "system", "content": f"memory {next(memory_versions)}"}]
+
+    for n in range(4):
+        messages = assembler.assemble(SYSTEM, conversation(n), memory)
+    assert messages[1]["content"] == "memory 0"
+    assert len(messages) == 2 + 7
+
+    messages = assembler.assemble(SYSTEM, conversation(4), memory)  # 9 messages > 8
+    assert assembler.compactions == 1
+    assert messages[1]["content"] == "memory 1"
+    assert messages[2]["role"] == "user"
+    assert messages[2:] == conversation(4)[-3:]
+
+
+def test_prefix_stable_restarts_after_history_clear():
+    """Test that a cleared conversation history starts a fresh window."""
+    assembler = PromptAssembler(mode="prefix_stable", max_turn_messages=4)
+    for n in range(4):
+        assembler.assemble(SYSTEM, conversation(n))
+
+    fresh = [{"role": "user", "content": "new topic"}]
+    assert assembler.assemble(SYSTEM, fresh) == [*SYSTEM, *fresh]
+
+
+def test_failed_memory_lookup_is_retried():
+    """Test that a memory error is not frozen into the prefix_stable block."""
+    assembler = PromptAssembler(mode="prefix_stable")
+    attempts = []
+
+    def memory():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("database busy")
+        return [{"role": "system", "content": "memory"}]
+
+    assert assembler.assemble(SYSTEM, conversation(0), memory) == [*SYSTEM, *conversation(0)]
+    assert assembler.assemble(SYSTEM, conversation(1), memory)[1]["content"] == "memory"
+
+
+def test_measure_reuse():
+    """Test the reused-prefix ratio of identical, extended and diverging prompts."""
+    assembler = PromptAssembler()
+    first = [*SYSTEM, {"role": "user", "content": "hello"}]
+
+    assert assembler.measure_reuse(first) == 0.0
+    assert assembler.measure_reuse(first) == 1.0
+    assert 0.5 < assembler.measure_reuse([*first, {"role": "assistant", "content": "hi"}]) < 1.0
+    assert assembler.measure_reuse([{"role": "user", "content": "A different prompt altogether."}]) < 0.2
+    assert assembler.stats()["requests"] == 4
+
+
+def test_request_options():
+    """Test that cache options are only sent when configured."""
+    assert PromptAssembler().request_options() == {}
+    config = PromptConfig(mode="prefix_stable", keep_alive="30m", cache_prompt=True)
+    assert PromptAssembler.from_config(config).request_options() == {"keep_alive": "30m", "cache_prompt": True}
+
+
+def test_budget_drops_oldest_content_first():
+    """Test that memory conversation goes before entity facts and live turns."""
+    counter = TokenCounter(lambda text: len(text.split()))
+    assembler = PromptAssembler(mode="splice", max_turn_messages=12, max_prompt_tokens=70, counter=counter)
+    facts = {"role": "system", "content": "What you know about the user: likes cake"}
+    remembered = [{"role": "user", "content": "old " * 10}, {"role": "assistant", "content": "old " * 10}]
+
+    messages = assembler.assemble(SYSTEM, conversation(3), lambda: [facts, *remembered])
+
+    assert counter.count_messages(messages) <= 70
+    assert facts in messages
+    assert not any("old" in msg["content"] for msg in messages)
+    assert messages[-1] == conversation(3)[-1]
+
+
+def test_budget_shortens_long_pasted_message():
+    """Test that a huge new message is cut down but still sent."""
+    assembler = PromptAssembler(max_prompt_tokens=200, max_message_tokens=100)
+    pasted = {"role": "user", "content": "Please read this: " + "lorem ipsum dolor " * 2000 + "What is it?"}
+
+    messages = assembler.assemble(SYSTEM, [*conversation(2)[:-1], pasted])
+    assembler.measure_reuse(messages)
+
+    assert messages[-1]["content"].endswith("What is it?")
+    assert assembler.stats()["last_prompt_tokens"] <= 200
+
+
+def test_prefix_stable_budget_compacts_instead_of_sliding():
+    """Test that prefix_stable keeps appending under a token budget and compacts when it runs out."""
+    counter = TokenCounter(lambda text: len(text.split()))
+    assembler = PromptAssembler(mode="prefix_stable", max_turn_messages=100, max_prompt_tokens=80, counter=counter)
+
+    previous = None
+    for n in range(12):
+        messages = assembler.assemble(SYSTEM, conversation(n))
+        assert counter.count_messages(messages) <= 80
+        if previous is not None and assembler.compactions == compactions:
+            assert messages[: len(previous)] == previous  # Append-only between compactions
+        previous, compactions = messages, assembler.compactions
+    assert 0 < assembler.compactions < 12
@@ -0,0 +1,69 @@
+"""Unit tests for INT8 model variants: naming, selection and calibration data recording."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from glados.utils import quantization
+from glados.utils.quantization import FeedCalibrationReader, record_feeds, resolve_variant, variant_path
+
+
+class FakeSession:
+    def __init__(self):
+        self.name = "fake"
+
+    def run(self, output_names, input_feed):
+        return [input_feed["input"] * 2]
+
+
+def test_variants_are_named_after_the_model():
+    """Test that variant files sit next to the model and unknown variants are rejected."""
+    assert variant_path(Path("models/TTS/glados.onnx"), "int8_dynamic") == Path("models/TTS/glados.int8_dynamic.onnx")
+    assert variant_path(Path("encoder.onnx"), "int8_static").with_suffix(".json") == Path("encoder.int8_static.json")
+    with pytest.raises(ValueError):
+        variant_path(Path("glados.onnx"), "int4")
+
+
+def test_missing_variants_fall_back_to_the_original(tmp_path):
+    """Test that a requested variant is loaded only when it has been produced."""
+    model_path = tmp_path / "glados.onnx"
+
+    assert resolve_variant(model_path, None) == model_path
+    assert resolve_variant(model_path, "int8_dynamic") == model_path
+    (tmp_path / "glados.int8_dynamic.onnx").write_bytes(b"int8")
+    assert resolve_variant(model_path, "int8_dynamic") == tmp_path / "glados.int8_dynamic.onnx"
+
+
+def test_model_inputs_are_recorded_for_calibration():
+    """Test that record_feeds captures every run and restores the session."""
+
+    class Model:
+        def __init__(self):
+            self.session = FakeSession()
+
+        def infer(self, value):
+            return self.session.run(None, {"input": np.array([value]), "sid": None})[0]
+
+    model = Model()
+    session = model.session
+
+    feeds = record_feeds(model, "session", lambda: [model.infer(v) for v in (1, 2, 3)])
+
+    assert model.session is session
+    assert [feed["input"].tolist() for feed in feeds] == [[1], [2], [3]]
+    assert all("sid" not in feed for feed in feeds)  # Optional inputs left out are not calibrated
+
+    reader = FeedCalibrationReader(feeds)
+    assert [reader.get_next()["input"][0] for _ in range(3)] == [1, 2, 3]
+    assert reader.get_next() is None
+    reader.rewind()
+    assert reader.get_next()["input"][0] == 1
+
+
+def test_quantizing_without_onnx_fails_clearly(monkeypatch, tmp_path):
+    """Test that quantize_model explains the missing dependency."""
+    monkeypatch.setattr(quantization, "QUANTIZATION_AVAILABLE", False)
+
+    with pytest.raises(RuntimeError, match="onnx"):
+        quantization.quantize_model(tmp_path / "glados.onnx", "int8_dynamic")
@@ -0,0 +1,95 @@
+"""Unit tests for the event-driven pipeline stage runner."""
+
+import queue
+import threading
+import time
+
+from glados.core.stage import SHUTDOWN, StageRunner, post_shutdown
+
+
+def start_stage(handler, **kwargs):
+    input_queue = queue.Queue()
+    shutdown_event = threading.Event()
+    runner = StageRunner("TestStage", input_queue, handler, shutdown_event, **kwargs)
+    thread = threading.Thread(target=runner.run, daemon=True)
+    thread.start()
+    return input_queue, shutdown_event, thread
+
+
+def test_items_processed_in_order():
+    """Test that every item is handed to the handler in FIFO order."""
+    received = []
+    input_queue, _, thread = start_stage(received.append)
+
+    for i in range(5):
+        input_queue.put(i)
+    input_queue.put(SHUTDOWN)
+    thread.join(timeout=2.0)
+
+    assert received == [0, 1, 2, 3, 4]
+
+
+def test_wakes_immediately_on_item():
+    """Test that a blocked stage handles new input without waiting for a poll interval."""
+    handled = threading.Event()
+    input_queue, _, thread = start_stage(lambda item: handled.set(), wake_interval=10.0)
+
+    time.sleep(0.05)  # Let the stage block on the empty queue
+    start = time.perf_counter()
+    input_queue.put("hello")
+    assert handled.wait(timeout=2.0)
+    assert time.perf_counter() - start < 0.5
+
+    post_shutdown([input_queue])
+    thread.join(timeout=2.0)
+
+
+def test_shutdown_sentinel_stops_blocked_stage():
+    """Test that the sentinel ends the loop even with a long wake interval."""
+    input_queue, _, thread = start_stage(lambda item: None, wake_interval=10.0)
+
+    time.sleep(0.05)
+    post_shutdown([input_queue])
+    thread.join(timeout=1.0)
+
+    assert not thread.is_alive()
+
+
+def test_shutdown_event_without_sentinel():
+    """Test that setting only the shutdown event still stops the stage within the wake interval."""
+    _, shutdown_event, thread = start_stage(lambda item: None, wake_interval=0.05)
+
+    shutdown_event.set()
+    thread.join(timeout=1.0)
+
+    assert not thread.is_alive()
+
+
+def test_on_idle_called_without_input():
+    """Test that the idle callback runs after the wake interval passes without input."""
+    idle = threading.Event()
+    input_queue, _, thread = start_stage(lambda item: None, on_idle=idle.set, wake_interval=0.05)
+
+    assert idle.wait(timeout=1.0)
+
+    post_shutdown([input_queue])
+    thread.join(timeout=2.0)
+
+
+def test_handler_error_does_not_stop_stage():
+    """Test that an exception in the handler is logged and the next item is still processed."""
+    received = []
+
+    def handler(item):
+        if item == "bad":
+            raise RuntimeError("boom")
+        received.append(item)
+
+    input_queue, _, thread = start_stage(handler, error_backoff=0.0)
+
+    input_queue.put("bad")
+    input_queue.put("good")
+    input_queue.put(SHUTDOWN)
+    thread.join(timeout=2.0)
+
+    assert received == ["good"]
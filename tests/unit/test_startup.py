@@ -0,0 +1,72 @@
+"""Unit tests for concurrent model loading and warm-up."""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from glados.core import startup
+from glados.core.startup import run_timed, startup_timings, warm_up_models, warm_up_tts
+
+
+def test_jobs_run_concurrently_and_are_timed():
+    """Test that parallel jobs overlap and each records its duration."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    def job(name):
+        barrier.wait()  # Only passes if all three jobs run at the same time
+        return name
+
+    results = run_timed({name: (lambda n=name: job(n)) for name in ("m1", "m2", "m3")}, "load")
+
+    assert results == {"m1": "m1", "m2": "m2", "m3": "m3"}
+    timings = startup_timings()
+    assert all(timings[name]["load_seconds"] >= 0 for name in results)
+
+
+def test_sequential_jobs_run_in_order():
+    """Test that disabling parallel loading runs the jobs one after another in the calling thread."""
+    order = []
+    jobs = {name: (lambda n=name: order.append((n, threading.current_thread().name))) for name in ("a", "b")}
+
+    run_timed(jobs, "load", parallel=False)
+
+    assert order == [("a", threading.current_thread().name), ("b", threading.current_thread().name)]
+
+
+def test_job_errors_are_raised_after_all_jobs_finish():
+    """Test that a failing loader surfaces its exception and the other loaders still complete."""
+    done = threading.Event()
+
+    def fail():
+        raise FileNotFoundError("missing.onnx")
+
+    with pytest.raises(FileNotFoundError):
+        run_timed({"broken": fail, "ok": done.set}, "load")
+    assert done.is_set()
+    assert "load_seconds" in startup_timings()["broken"]
+
+
+def test_warm_up_skips_cache_and_rvc_wrappers():
+    """Test that the innermost synthesizer is warmed, not the wrappers around it."""
+    calls = []
+    base = SimpleNamespace(warm_up=lambda: calls.append("base"))
+    wrapped = SimpleNamespace(base_tts=SimpleNamespace(base_tts=base), warm_up=lambda: calls.append("wrapper"))
+
+    warm_up_tts(wrapped)
+
+    assert calls == ["base"]
+
+
+def test_warm_up_models_records_warmup_times(monkeypatch):
+    """Test that every given model is warmed up and gets a warm-up time."""
+    calls = []
+    monkeypatch.setattr(startup, "warm_up_asr", lambda model: calls.append("asr"))
+    vad = SimpleNamespace(warm_up=lambda: calls.append("vad"))
+    tts = SimpleNamespace(warm_up=lambda: calls.append("tts"))
+
+    warm_up_models(asr_model=object(), tts_model=tts, vad=vad)
+
+    assert sorted(calls) == ["asr", "tts", "vad"]
+    timings = startup_timings()
+    assert all("warmup_seconds" in timings[name] for name in ("asr", "tts", "vad"))
@@ -0,0 +1,218 @@
+"""Unit tests for streaming (chunk by chunk) transcription."""
+
+import queue
+import threading
+
+import numpy as np
+
+from glados.ASR.ctc_asr import AudioTranscriber as CTCTranscriber
+from glados.ASR.streaming import StreamingASRConfig, StreamingTranscription
+from glados.ASR.tdt_asr import AudioTranscriber as TDTTranscriber
+from glados.core.speech_listener import SpeechListener
+
+FRAME = 1280  # 80 ms at 16 kHz
+
+
+class FrameTokenTranscriber:
+    """Fake transcriber whose encoder emits one frame per FRAME samples, holding the frame's median level in percent."""
+
+    frame_samples = FRAME
+
+    def __init__(self):
+        self.windows = []
+
+    def encode(self, audio):
+        self.windows.append(len(audio))
+        frames = -(-len(audio) // FRAME)
+        padded = np.pad(audio, (0, frames * FRAME - len(audio)))
+        return 100 * np.median(padded.reshape(frames, FRAME), axis=1)[None, None, :]
+
+    def decode_frames(self, frames, state=None):
+        return (state or []) + [round(float(v)) for v in frames[0, 0]]
+
+    def hypothesis_text(self, state):
+        return " ".join(str(token) for token in state)
+
+    def transcribe(self, audio):
+        return self.hypothesis_text(self.decode_frames(self.encode(audio)))
+
+
+def utterance(tokens, peak=1.0):
+    """Audio whose frames hold the tokens as levels in percent of the peak, which is its very first sample."""
+    audio = np.repeat(np.asarray(tokens, dtype=np.float32), FRAME) * (peak / 100)
+    audio[0] = peak
+    return audio
+
+
+def pieces(audio, size=512):
+    return np.split(audio, range(size, len(audio), size))
+
+
+def stream_config(**overrides):
+    values = {"enabled": True, "chunk_seconds": 0.32, "left_context_seconds": 0.16, "right_context_seconds": 0.16}
+    return StreamingASRConfig(**(values | overrides))
+
+
+def test_streaming_matches_batch_transcription():
+    """Test that feeding audio in 32 ms pieces gives the batch transcript, with partials along the way."""
+    asr = FrameTokenTranscriber()
+    stream = StreamingTranscription(asr, stream_config())
+    audio = utterance(range(1, 24))
+
+    partials = [p for piece in pieces(audio) if (p := stream.accept(piece)) is not None]
+
+    expected = asr.transcribe(audio)
+    assert len(partials) > 2 and all(expected.startswith(partial) for partial in partials)
+    assert stream.finalize() == expected
+
+
+def test_finalize_encodes_only_the_tail():
+    """Test that every encoder window is bounded by left context + chunk + right context."""
+    asr = FrameTokenTranscriber()
+    stream = StreamingTranscription(asr, stream_config())
+    stream.accept(utterance(range(1, 60)))
+    stream.finalize()
+
+    assert len(asr.windows) > 1
+    assert max(asr.windows) <= (2 + 4 + 2) * FRAME
+    assert asr.windows[-1] < 59 * FRAME
+
+
+def test_short_utterance_is_transcribed_in_one_piece():
+    """Test that audio shorter than one chunk plus right context is encoded once, at finalize."""
+    asr = FrameTokenTranscriber()
+    stream = StreamingTranscription(asr, stream_config())
+
+    assert stream.accept(utterance([1, 2, 3])) is None
+    assert stream.finalize() == "1 2 3"
+    assert asr.windows == [3 * FRAME]
+
+
+def test_windows_are_normalized_like_the_batch_path():
+    """Test that quiet audio is scaled to full range in chunks and in one piece, as the batch path does."""
+    for tokens in (range(1, 24), [1, 2, 3]):
+        asr = FrameTokenTranscriber()
+        stream = StreamingTranscription(asr, stream_config())
+        stream.accept(utterance(tokens, peak=0.25))
+        assert stream.finalize() == " ".join(str(token) for token in tokens)
+
+
+def test_silent_utterance_gives_empty_transcript_and_reset_clears():
+    """Test that silence is not transcribed and reset starts a new utterance."""
+    asr = FrameTokenTranscriber()
+    stream = StreamingTranscription(asr, stream_config())
+    stream.accept(np.zeros(20 * FRAME, dtype=np.float32))
+    assert stream.finalize() == ""
+
+    stream.reset()
+    stream.accept(utterance([4, 5]))
+    assert stream.finalize() == "4 5"
+
+
+def test_ctc_chunked_decoding_collapses_across_chunks():
+    """Test that CTC repeats spanning a chunk boundary are merged exactly as in one-piece decoding."""
+    ctc = CTCTranscriber.__new__(CTCTranscriber)
+    ctc.blank_idx = 3
+    ctc.idx2token = {0: "▁a", 1: "b", 2: "▁c", 3: "<blank>"}
+    indices = [0, 0, 3, 1, 1, 1, 3, 3, 2, 2, 0]
+    logits = np.eye(4, dtype=np.float32)[indices].T[None]  # (1, num_tokens, time)
+
+    whole = ctc.decode_frames(logits)
+    state = None
+    for start in range(0, len(indices), 2):
+        state = ctc.decode_frames(logits[..., start : start + 2], state)
+
+    assert state.token_ids == whole.token_ids == [0, 1, 2, 0]
+    assert ctc.hypothesis_text(state) == ctc.decode_output(logits.transpose(0, 2, 1))[0] == "ab c a"
+
+
+class FakeTDTModel:
+    """Joiner whose token/duration prediction is encoded in the encoder frame itself."""
+
+    vocab = 4  # Tokens 0-2 plus blank
+    joiner_max_frames = None
+
+    def get_decoder_initial_state(self, batch_size=1):
+        return np.zeros(1, dtype=np.float32), np.zeros(1, dtype=np.float32)
+
+    def run_decoder(self, token, state0, state1):
+        return np.array([token], dtype=np.float32), state0 + 1, state1
+
+    def run_joiner(self, encoder_out_t, decoder_out):
+        token, duration = encoder_out_t[0].astype(int)
+        frames = np.arange(len(token))
+        logits = np.zeros((len(token), self.vocab + 3), dtype=np.float32)
+        logits[frames, token] = 1
+        logits[frames, self.vocab + duration] = 1
+        return logits[None, :, None, :]
+
+
+def test_tdt_chunked_decoding_carries_durations_across_chunks():
+    """Test that a duration skipping past the end of a chunk continues in the next chunk."""
+    tdt = TDTTranscriber.__new__(TDTTranscriber)
+    tdt.model = FakeTDTModel()
+    tdt._initial_decoder = None
+    tdt.blank_id = 3
+    tdt.tdt_durations = [0, 1, 2]
+    tdt.idx2token = {0: "▁a", 1: "b", 2: "▁c", 3: "<blank>"}
+    # (token, duration bin) per frame; the durations of 2 at frames 2 and 4 skip frames 3 and 5,
+    # carrying 1 and 0 frames over the boundaries of the chunks of 3 frames
+    frames = [(0, 1), (1, 1), (3, 2), (2, 1), (0, 2), (3, 1), (1, 1), (2, 1)]
+    encoder_out = np.array(frames, dtype=np.float32).T[None]  # (1, 2, time)
+
+    whole = tdt.decode_frames(encoder_out)
+    state = None
+    for start in range(0, len(frames), 3):
+        state = tdt.decode_frames(encoder_out[..., start : start + 3], state)
+
+    assert whole.token_ids == [0, 1, 0, 1, 2]
+    assert state.token_ids == whole.token_ids
+    assert tdt._decode_tdt(encoder_out) == whole.token_ids
+    assert tdt.hypothesis_text(state) == "ab ab c"
+
+
+class FakeAudioIO:
+    def __init__(self):
+        self.partials = []
+        self.final = []
+
+    def get_sample_queue(self):
+        return queue.Queue()
+
+    def stop_speaking(self):
+        pass
+
+    def send_partial_transcription(self, text):
+        self.partials.append(text)
+
+    def send_user_transcription(self, text):
+        self.final.append(text)
+
+
+def test_speech_listener_streams_partials_and_finalizes():
+    """Test that the listener feeds the stream while recording and queues the finalized transcript."""
+    audio_io = FakeAudioIO()
+    llm_queue = queue.Queue()
+    listener = SpeechListener(
+        audio_io=audio_io,
+        llm_queue=llm_queue,
+        shutdown_event=threading.Event(),
+        currently_speaking_event=threading.Event(),
+        processing_active_event=threading.Event(),
+        asr_model=FrameTokenTranscriber(),
+        wake_word=None,
+        pause_time=0.0,
+        streaming=stream_config(),
+    )
+    speech = utterance(range(1, 20))
+    silence = np.zeros(512 * (SpeechListener.PAUSE_LIMIT // SpeechListener.VAD_SIZE), dtype=np.float32)
+
+    for piece in pieces(speech):
+        listener._handle_audio_sample(piece, True)
+    for piece in pieces(silence):
+        listener._handle_audio_sample(piece, False)
+
+    expected = " ".join(str(t) for t in range(1, 20)) + " 0" * (len(silence) // FRAME)
+    assert audio_io.partials and expected.startswith(audio_io.partials[-1])
+    assert audio_io.final == [expected]
+    assert llm_queue.get_nowait() == expected
@@ -0,0 +1,102 @@
+"""Unit tests for the label-looping TDT greedy decoder."""
+
+import numpy as np
+
+from glados.ASR.tdt_asr import AudioTranscriber as TDTTranscriber
+
+VOCAB = 6  # Tokens 0-4 plus blank
+BLANK = 5
+DURATIONS = [0, 1, 2, 3, 4]
+
+
+class RandomJoinerModel:
+    """Joiner with random logits per (frame, decoder output); the decoder output is the emitted token count."""
+
+    joiner_max_frames = None
+
+    def __init__(self, frames, seed=0):
+        rng = np.random.default_rng(seed)
+        self.logits = rng.standard_normal((64, frames, VOCAB + len(DURATIONS))).astype(np.float32)
+        self.logits[:, :, BLANK] += 1.0  # Mostly blanks, like speech
+        self.joiner_calls = 0
+
+    def get_decoder_initial_state(self, batch_size=1):
+        return np.zeros((1, batch_size, 1), dtype=np.float32), np.zeros((1, batch_size, 1), dtype=np.float32)
+
+    def run_decoder(self, token, state0, state1):
+        return state0.reshape(-1, 1, 1).copy(), state0 + 1, state1
+
+    def run_joiner(self, encoder_out_t, decoder_out):
+        self.joiner_calls += 1
+        frames = encoder_out_t[0, 0].astype(int)
+        return self.logits[int(decoder_out.reshape(-1)[0]) % 64, frames][None, :, None, :]
+
+
+def transcriber(model):
+    tdt = TDTTranscriber.__new__(TDTTranscriber)
+    tdt.model = model
+    tdt._initial_decoder = None
+    tdt.blank_id = BLANK
+    tdt.tdt_durations = DURATIONS
+    return tdt
+
+
+def frame_by_frame(model, frames):
+    """Reference: one joiner call per visited frame."""
+    state0, state1 = model.get_decoder_initial_state()
+    decoder_out, next0, next1 = model.run_decoder(BLANK, state0, state1)
+    tokens, t = [], 0
+    while t < frames:
+        logits = model.run_joiner(np.array([[[t]]], dtype=np.float32), decoder_out).reshape(-1)
+        token, skip = int(np.argmax(logits[:VOCAB])), DURATIONS[int(np.argmax(logits[VOCAB:]))]
+        if token == BLANK:
+            t += max(skip, 1)
+            continue
+        tokens.append(token)
+        state0, state1 = next0, next1
+        decoder_out, next0, next1 = model.run_decoder(token, state0, state1)
+        t += skip
+    return tokens
+
+
+def test_label_looping_matches_frame_by_frame_with_fewer_joiner_calls():
+    """Test that windowed joiner calls give the frame-by-frame result."""
+    frames = 300
+    encoder_out = np.arange(frames, dtype=np.float32)[None, None, :]
+
+    for seed in range(5):
+        reference_model = RandomJoinerModel(frames, seed)
+        expected = frame_by_frame(reference_model, frames)
+        model = RandomJoinerModel(frames, seed)
+
+        assert transcriber(model)._decode_tdt(encoder_out) == expected
+        assert model.joiner_calls < reference_model.joiner_calls
+
+
+def test_label_looping_in_chunks_matches_whole_utterance():
+    """Test that windows never reach past a chunk and durations carry into the next chunk."""
+    frames = 200
+    encoder_out = np.arange(frames, dtype=np.float32)[None, None, :]
+    expected = transcriber(RandomJoinerModel(frames))._decode_tdt(encoder_out)
+
+    tdt = transcriber(RandomJoinerModel(frames))
+    state = None
+    for start in range(0, frames, 13):
+        state = tdt.decode_frames(encoder_out[..., start : start + 13], state)
+
+    assert state.token_ids == expected
+
+
+def test_fixed_size_joiner_decodes_frame_by_frame():
+    """Test that a joiner exported for a single frame is called with one frame at a time."""
+    frames = 50
+    model = RandomJoinerModel(frames)
+    model.joiner_max_frames = 1
+    calls = []
+    run_joiner = model.run_joiner
+    model.run_joiner = lambda enc, dec: calls.append(enc.shape[2]) or run_joiner(enc, dec)
+
+    tokens = transcriber(model)._decode_tdt(np.arange(frames, dtype=np.float32)[None, None, :])
+
+    assert set(calls) == {1}
+    assert tokens == frame_by_frame(RandomJoinerModel(frames), frames)
@@ -0,0 +1,109 @@
+"""Unit tests for the streaming TTS text segmenter."""
+
+import re
+
+from glados.core.text_segmenter import SegmentationConfig, TextSegmenter
+
+
+def segment(text, segmenter=None, token_pattern=r"\s*\S+"):
+    """Stream text through a segmenter as word-sized tokens and collect all segments."""
+    segmenter = segmenter or TextSegmenter()
+    segments = []
+    for token in re.findall(token_pattern, text):
+        segments.extend(segmenter.push(token))
+    remainder = segmenter.flush()
+    if remainder:
+        segments.append(remainder)
+    return [s.strip() for s in segments]
+
+
+def test_boundary_inside_token():
+    """Test that punctuation attached to a word ("world.") ends the sentence."""
+    segmenter = TextSegmenter()
+    assert segmenter.push("Hello") == []
+    assert segmenter.push(" world.") == ["Hello world."]
+
+
+def test_separate_punctuation_tokens():
+    """Test that punctuation streamed as its own token also ends the sentence."""
+    segmenter = TextSegmenter()
+    for token in ["Hi", " there"]:
+        assert segmenter.push(token) == []
+    assert segmenter.push("!") == ["Hi there!"]
+
+
+def test_first_clause_flushed_at_comma():
+    """Test that the first segment is cut at a comma once the clause is long enough."""
+    segments = segment("Well now my friend, that is a long story to tell you today.")
+    assert segments[0] == "Well now my friend,"
+
+
+def test_short_first_clause_not_flushed():
+    """Test that a comma after too few words does not end the first segment."""
+    segments = segment("Sure thing, let me explain how this works.")
+    assert segments == ["Sure thing, let me explain how this works."]
+
+
+def test_first_segment_forced_after_word_limit():
+    """Test that a long first sentence without punctuation is flushed after the word limit."""
+    segmenter = TextSegmenter(first_segment_max_words=5)
+    segments = segment("one two three four five six seven eight", segmenter)
+    assert segments == ["one two three four five", "six seven eight"]
+
+
+def test_later_segments_merge_short_sentences():
+    """Test that once audio is playing, short sentences are merged into longer segments."""
+    segments = segment("Hello there. Yes. No. Maybe. This one is long enough on its own. Done.")
+    assert segments == ["Hello there.", "Yes. No. Maybe. This one is long enough on its own.", "Done."]
+
+
+def test_decimal_number_not_split():
+    """Test that a period after a digit waits for the next character."""
+    segmenter = TextSegmenter()
+    assert segmenter.push("Pi is 3.") == []
+    assert segmenter.push("14 exactly.") == ["Pi is 3.14 exactly."]
+
+
+def test_closing_quote_stays_with_sentence():
+    """Test that closing quotes after the punctuation belong to the sentence."""
+    segments = segment('She said "go away!" and then left the room quietly. Done.')
+    assert segments[0] == 'She said "go away!"'
+
+
+def test_newline_is_boundary():
+    """Test that newlines end segments."""
+    segmenter = TextSegmenter()
+    assert segmenter.push("First line\n") == ["First line\n"]
+
+
+def test_run_on_sentence_bounded():
+    """Test that later segments are cut at max_segment_words without punctuation."""
+    segmenter = TextSegmenter(max_segment_words=4)
+    segments = segment("Start. a b c d e f g h", segmenter)
+    assert segments == ["Start.", "a b c d", "e f g h"]
+
+
+def test_reset_starts_new_response():
+    """Test that reset drops buffered text and re-enables the early first flush."""
+    segmenter = TextSegmenter()
+    segmenter.push("Hello there. Partial")
+    segmenter.reset()
+    assert segmenter.flush() is None
+    assert segmenter.push("Ok.") == ["Ok."]
+
+
+def test_text_preserved():
+    """Test that concatenating all segments reproduces the input."""
+    text = "Hello world, how are you doing today? I am fine. Thanks for asking, friend.\nBye."
+    segmenter = TextSegmenter()
+    segments = []
+    for token in re.findall(r"\s*\S+", text):
+        segments.extend(segmenter.push(token))
+    segments.append(segmenter.flush() or "")
+    assert "".join(segments) == text
+
+
+def test_from_config():
+    """Test that the segmenter is configured from SegmentationConfig."""
+    segmenter = TextSegmenter.from_config(SegmentationConfig(first_segment_max_words=2))
+    assert segmenter.first_segment_max_words == 2
@@ -0,0 +1,45 @@
+"""Unit tests for prompt token counting."""
+
+from glados.core.token_budget import TokenCounter, estimate_tokens
+
+
+def test_estimate_tokens():
+    """Test that the heuristic counts words by length and punctuation separately."""
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("Hello, world!") == 2 + 1 + 2 + 1
+    assert estimate_tokens("a " * 100) == 100
+
+
+def test_counter_caches_and_counts_messages():
+    """Test that repeated texts are counted once and messages include the template overhead."""
+    calls = []
+
+    def tokenize(text):
+        calls.append(text)
+        return len(text.split())
+
+    counter = TokenCounter(tokenize)
+    messages = [{"role": "system", "content": "one two three"}, {"role": "user", "content": "four"}]
+
+    assert counter.count_messages(messages) == 4 + 2 * TokenCounter.MESSAGE_OVERHEAD
+    assert counter.count_messages(messages) == 4 + 2 * TokenCounter.MESSAGE_OVERHEAD
+    assert calls == ["one two three", "four"]
+
+
+def test_truncate_keeps_head_and_tail():
+    """Test that an oversized text keeps its start and end within the budget."""
+    counter = TokenCounter()
+    text = "START " + "filler words here " * 500 + "END"
+
+    shortened = counter.truncate(text, 100)
+
+    assert counter.count(shortened) <= 100
+    assert shortened.startswith("START") and shortened.endswith("END")
+    assert TokenCounter.ELISION in shortened
+    assert counter.truncate("short", 100) == "short"
+
+
+def test_missing_tokenizer_falls_back_to_heuristic():
+    """Test that an unusable tokenizer file still gives a working counter."""
+    counter = TokenCounter.from_tokenizer_file("/nonexistent/tokenizer.json")
+    assert counter.count("Hello, world!") == estimate_tokens("Hello, world!")
@@ -0,0 +1,131 @@
+"""Unit tests for per-utterance latency tracing."""
+
+import json
+import time
+
+from glados.core.tracing import LatencyTracer, TracingConfig
+
+
+def run_trace(tracer, origin="voice"):
+    tracer.start(origin)
+    for span in ("asr_done", "llm_request_sent", "llm_first_token", "first_sentence_flushed"):
+        tracer.mark(span)
+    tracer.mark("tts_first_audio")
+    tracer.mark("playback_start")
+    tracer.end()
+
+
+def test_trace_records_spans_in_order():
+    """Test that a completed trace has monotonically increasing span offsets."""
+    tracer = LatencyTracer()
+    tracer.start("voice")
+    time.sleep(0.01)
+    tracer.mark("asr_done")
+    tracer.mark("playback_start")
+    tracer.end()
+
+    stats = tracer.get_stats()
+    assert stats["vad_endpoint"]["p50"] == 0.0
+    assert stats["asr_done"]["p50"] >= 10.0
+    assert stats["playback_end"]["p50"] >= stats["playback_start"]["p50"] >= stats["asr_done"]["p50"]
+
+
+def test_only_first_mark_counts():
+    """Test that repeated marks (e.g. one per sentence) keep the first timestamp."""
+    tracer = LatencyTracer()
+    tracer.start("text")
+    tracer.mark("tts_first_audio")
+    first = tracer._current.spans["tts_first_audio"]
+    time.sleep(0.01)
+    tracer.mark("tts_first_audio")
+
+    assert tracer._current.spans["tts_first_audio"] == first
+    assert "text_received" in tracer._current.spans
+
+
+def test_new_trace_closes_open_one_as_interrupted():
+    """Test that barging in closes the previous trace as interrupted."""
+    tracer = LatencyTracer()
+    first_id = tracer.start("voice")
+    tracer.mark("playback_start")
+    second_id = tracer.start("voice")
+
+    assert first_id != second_id
+    assert tracer.current_trace_id == second_id
+    assert tracer.get_stats() == {}
+    assert tracer.get_stats(include_interrupted=True)["playback_start"]["count"] == 1
+
+
+def test_marks_without_trace_are_ignored():
+    """Test that stages can mark spans when no utterance is in flight."""
+    tracer = LatencyTracer()
+    tracer.mark("playback_start")
+    tracer.end()
+
+    assert tracer.get_stats() == {}
+
+
+def test_marks_of_a_replaced_trace_are_ignored():
+    """Test that a cancelled response draining after a barge-in cannot mark or close the new trace."""
+    tracer = LatencyTracer()
+    old_id = tracer.start("voice")
+    new_id = tracer.start("voice")  # Barge-in
+
+    tracer.mark("llm_first_token", old_id)
+    tracer.mark("first_sentence_flushed", old_id)
+    tracer.end("playback_end", old_id)
+    tracer.discard(old_id)
+    assert tracer.current_trace_id == new_id
+    assert set(tracer._current.spans) == {"vad_endpoint"}
+
+    tracer.mark("llm_first_token", new_id)
+    tracer.end("playback_end", new_id)
+    assert tracer.get_stats()["llm_first_token"]["count"] == 1
+    assert tracer.current_trace_id is None
+
+
+def test_discard_drops_trace():
+    """Test that a discarded trace is not recorded."""
+    tracer = LatencyTracer()
+    tracer.start("voice")
+    tracer.discard()
+    tracer.end()
+
+    assert tracer.get_stats() == {}
+
+
+def test_percentiles_over_window():
+    """Test that statistics include count and p50/p95/p99 for every span and respect the window."""
+    tracer = LatencyTracer(window=5)
+    for _ in range(8):
+        run_trace(tracer)
+
+    stats = tracer.get_stats()
+    assert set(stats["playback_start"]) == {"count", "p50", "p95", "p99"}
+    assert stats["playback_start"]["count"] == 5
+
+
+def test_jsonl_append_and_dump(tmp_path):
+    """Test that completed traces are appended live and can be dumped on demand."""
+    live_path = tmp_path / "traces.jsonl"
+    tracer = LatencyTracer.from_config(TracingConfig(jsonl_path=str(live_path)))
+    run_trace(tracer)
+    run_trace(tracer, origin="text")
+
+    lines = [json.loads(line) for line in live_path.read_text().splitlines()]
+    assert [line["origin"] for line in lines] == ["voice", "text"]
+    assert "playback_end" in lines[0]["spans_ms"]
+
+    dump_path = tmp_path / "dump.jsonl"
+    assert tracer.dump_jsonl(dump_path) == 2
+    assert len(dump_path.read_text().splitlines()) == 2
+
+
+def test_disabled_tracer_is_noop():
+    """Test that a disabled tracer records nothing."""
+    tracer = LatencyTracer(enabled=False)
+    assert tracer.start("voice") is None
+    tracer.mark("asr_done")
+    tracer.end()
+
+    assert tracer.get_stats() == {}
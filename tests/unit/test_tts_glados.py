@@ -0,0 +1,155 @@
+"""Unit tests for batched multi-sentence synthesis in the VITS synthesizer."""
+
+import json
+import pickle
+import string
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from glados.TTS import tts_glados
+
+HOP = 10  # Samples per phoneme ID of the fake model
+SYMBOLS = ["_", "^", "$", " ", ".", ",", "!", "?"] + list(string.ascii_lowercase)  # Phoneme ID = index
+
+
+class FakeVITSSession:
+    """
+    Stand-in Piper model: every valid phoneme ID becomes HOP samples of its own level, IDs in
+    `long_ids` 5 * HOP. A batch is padded to its longest item's duration, like VITS.
+    """
+
+    def __init__(self, lengths_output=True, batch_dim="batch", long_ids=()):
+        self.lengths_output = lengths_output
+        self.batch_dim = batch_dim
+        self.long_ids = set(long_ids)
+        self.batch_sizes = []
+
+    def get_inputs(self):
+        return [SimpleNamespace(name="input", shape=[self.batch_dim, "phonemes"])]
+
+    def get_providers(self):
+        return ["CPUExecutionProvider"]
+
+    def get_outputs(self):
+        outputs = [SimpleNamespace(name="output")]
+        if self.lengths_output:
+            outputs.append(SimpleNamespace(name="lengths"))
+        return outputs
+
+    def run(self, output_names, inputs):
+        ids, lengths = inputs["input"], inputs["input_lengths"]
+        self.batch_sizes.append(len(ids))
+        items = []
+        for row, length in enumerate(lengths):
+            durations = [5 * HOP if i in self.long_ids else HOP for i in ids[row, :length]]
+            items.append(np.repeat(0.5 + ids[row, :length] / 100, durations).astype(np.float32))
+        samples = np.array([len(item) for item in items], dtype=np.int64)
+        audio = np.zeros((len(ids), 1, 1, samples.max()), dtype=np.float32)
+        for row, item in enumerate(items):
+            audio[row, 0, 0, : len(item)] = item
+        return [audio, samples] if self.lengths_output else [audio]
+
+
+class LowercasePhonemizer:
+    def convert_to_phonemes(self, texts, lang="en_us"):
+        return [text.lower() for text in texts]
+
+
+@pytest.fixture
+def make_synthesizer(tmp_path, monkeypatch):
+    id_map = {symbol: [i] for i, symbol in enumerate(SYMBOLS)}
+    (tmp_path / "phonemes.pkl").write_bytes(pickle.dumps(id_map))
+    config = {
+        "num_symbols": len(SYMBOLS),
+        "num_speakers": 1,
+        "audio": {"sample_rate": 100},
+        "espeak": {"voice": "en-us"},
+        "phoneme_id_map": id_map,
+    }
+    (tmp_path / "voice.json").write_text(json.dumps(config))
+    monkeypatch.setattr(tts_glados, "Phonemizer", lambda config: LowercasePhonemizer())
+
+    def make(**session_options):
+        session = FakeVITSSession(**session_options)
+        monkeypatch.setattr(tts_glados.ort, "InferenceSession", lambda *args, **kwargs: session)
+        return tts_glados.SpeechSynthesizer(tmp_path / "voice.onnx", tmp_path / "phonemes.pkl"), session
+
+    return make
+
+
+PARAGRAPH = "Hello. This is a test! Are you still there? Good, science continues. Bye."
+
+
+def sentence_audio(synthesizer, text):
+    ids = synthesizer._phonemes_to_ids(text.lower())
+    return synthesizer._synthesize_ids_to_audio(ids)
+
+
+def test_sentences_are_synthesized_in_one_batch(make_synthesizer):
+    """Test that a paragraph takes one model run and matches per-sentence synthesis."""
+    synthesizer, session = make_synthesizer()
+    synthesizer.MAX_PADDING = 10.0
+
+    audio = synthesizer.generate_speech_audio(PARAGRAPH)
+
+    sentences = ["Hello.", "This is a test!", "Are you still there?", "Good, science continues.", "Bye."]
+    expected = np.concatenate([sentence_audio(synthesizer, s) for s in sentences], axis=1).T
+    assert session.batch_sizes[0] == 5
+    np.testing.assert_array_equal(audio, expected)
+
+
+def test_batches_are_split_at_max_batch_size(make_synthesizer):
+    """Test that long texts are run in batches of at most MAX_BATCH_SIZE sentences."""
+    synthesizer, session = make_synthesizer()
+    synthesizer.MAX_BATCH_SIZE = 2
+    synthesizer.MAX_PADDING = 10.0
+
+    synthesizer.generate_speech_audio(PARAGRAPH)
+
+    assert session.batch_sizes == [2, 2, 1]
+
+
+def test_items_are_cut_to_their_model_lengths(make_synthesizer):
+    """Test that the item with the most phonemes is cut to its own audio when another item is longer."""
+    synthesizer, session = make_synthesizer(long_ids=[SYMBOLS.index("o")])
+    synthesizer.MAX_PADDING = 10.0
+    ids = [synthesizer._phonemes_to_ids(s) for s in ["ooooooo.", "this is it."]]
+
+    chunks = synthesizer._synthesize_batch_to_audio(ids)
+
+    assert session.batch_sizes[0] == 2
+    assert len(ids[1]) > len(ids[0]) and chunks[0].shape[-1] > chunks[1].shape[-1]
+    for phoneme_ids, chunk in zip(ids, chunks, strict=True):
+        assert chunk.tobytes() == synthesizer._synthesize_ids_to_audio(phoneme_ids).tobytes()
+
+
+def test_models_without_lengths_output_run_texts_whole(make_synthesizer):
+    """Test that without per-item lengths the padded batch audio is never cut by guesswork."""
+    synthesizer, session = make_synthesizer(lengths_output=False)
+
+    audio = synthesizer.generate_speech_audio(PARAGRAPH)
+
+    assert session.batch_sizes == [1]
+    np.testing.assert_array_equal(audio, sentence_audio(synthesizer, PARAGRAPH).T)
+
+
+def test_sentences_of_different_length_are_not_batched_together(make_synthesizer):
+    """Test that batches stop growing once they would need more padding than MAX_PADDING."""
+    synthesizer, session = make_synthesizer()
+    synthesizer.MAX_PADDING = 0.25
+
+    synthesizer.generate_speech_audio("Yes. No. This one is a lot longer than the others. Okay.")
+
+    assert session.batch_sizes == [3, 1]
+
+
+def test_fixed_batch_size_models_run_texts_whole(make_synthesizer):
+    """Test that a model exported for batch size 1 keeps one run per text."""
+    synthesizer, session = make_synthesizer(batch_dim=1)
+
+    audio = synthesizer.generate_speech_audio(PARAGRAPH)
+
+    assert session.batch_sizes == [1]
+    np.testing.assert_array_equal(audio, sentence_audio(synthesizer, PARAGRAPH).T)
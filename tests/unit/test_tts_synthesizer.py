@@ -0,0 +1,135 @@
+"""Unit tests for the ordered TTS worker pool."""
+
+import queue
+import threading
+import time
+
+import numpy as np
+
+from glados.core.audio_data import SentenceMessage
+from glados.core.generation import ResponseGeneration
+from glados.core.stage import SHUTDOWN
+from glados.core.tts_synthesizer import TextToSpeechSynthesizer
+
+
+class FakeTTS:
+    """Synthesizer whose inference time is given by a "<seconds>:" prefix of the text."""
+
+    sample_rate = 1000
+
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def generate_speech_audio(self, text):
+        if text == self.fail_on:
+            raise RuntimeError("synthesis failed")
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        delay, _, _ = text.partition(":")
+        time.sleep(float(delay))
+        with self._lock:
+            self.active -= 1
+        return np.zeros(10, dtype=np.float32)
+
+
+class IdentityConverter:
+    def text_to_spoken(self, text):
+        return text
+
+
+def run_synthesizer(texts, num_workers, tts=None, generation=None):
+    tts_queue, audio_queue = queue.Queue(), queue.Queue()
+    synthesizer = TextToSpeechSynthesizer(
+        tts_input_queue=tts_queue,
+        audio_output_queue=audio_queue,
+        tts_model=tts or FakeTTS(),
+        stc_instance=IdentityConverter(),
+        shutdown_event=threading.Event(),
+        pause_time=0.01,
+        num_workers=num_workers,
+        generation=generation,
+    )
+    thread = threading.Thread(target=synthesizer.run, daemon=True)
+    thread.start()
+    for text in texts:
+        tts_queue.put(text)
+    return synthesizer, tts_queue, audio_queue, thread
+
+
+def collect(audio_queue, count, timeout=2.0):
+    return [audio_queue.get(timeout=timeout) for _ in range(count)]
+
+
+def test_results_emitted_in_sequence_order():
+    """Test that a slow first sentence holds back faster later ones until it is done."""
+    texts = ["0.2:first", "0.0:second", "0.05:third", "<EOS>", "0.0:next response"]
+    _, tts_queue, audio_queue, thread = run_synthesizer(texts, num_workers=4)
+
+    messages = collect(audio_queue, 5)
+    assert [m.text for m in messages] == ["0.2:first", "0.0:second", "0.05:third", "", "0.0:next response"]
+    assert [m.is_eos for m in messages] == [False, False, False, True, False]
+
+    tts_queue.put(SHUTDOWN)
+    thread.join(timeout=2.0)
+    assert not thread.is_alive()
+
+
+def test_workers_synthesize_concurrently():
+    """Test that the pool renders several sentences at once but never more than num_workers."""
+    tts = FakeTTS()
+    start = time.perf_counter()
+    _, tts_queue, audio_queue, _ = run_synthesizer([f"0.1:s{i}" for i in range(6)], num_workers=3, tts=tts)
+    collect(audio_queue, 6)
+    elapsed = time.perf_counter() - start
+    tts_queue.put(SHUTDOWN)
+
+    assert tts.max_active == 3
+    assert elapsed < 0.5  # Serial synthesis would take 0.6s
+
+
+def test_single_worker_is_serial():
+    """Test that the default configuration synthesizes one sentence at a time."""
+    tts = FakeTTS()
+    _, tts_queue, audio_queue, _ = run_synthesizer(["0.02:a", "0.02:b", "<EOS>"], num_workers=1, tts=tts)
+    assert [m.text for m in collect(audio_queue, 3)] == ["0.02:a", "0.02:b", ""]
+    tts_queue.put(SHUTDOWN)
+
+    assert tts.max_active == 1
+
+
+def test_cancelled_generation_drops_in_flight_sentences():
+    """Test that sentences of a cancelled response are dropped while its EOS still arrives tagged."""
+    generation = ResponseGeneration()
+    tag = generation.current
+    _, tts_queue, audio_queue, _ = run_synthesizer(
+        [SentenceMessage(text, generation=tag) for text in ("0.0:spoken", "0.2:in flight", "0.2:also in flight")],
+        num_workers=2,
+        generation=generation,
+    )
+    first = audio_queue.get(timeout=2.0)
+    assert (first.text, first.generation) == ("0.0:spoken", tag)
+
+    generation.cancel()  # The user barges in
+    tts_queue.put(SentenceMessage("0.0:queued after barge-in", generation=tag))
+    tts_queue.put(SentenceMessage("", is_eos=True, generation=tag))
+
+    eos = audio_queue.get(timeout=2.0)
+    assert eos.is_eos and eos.generation == tag
+    time.sleep(0.3)
+    assert audio_queue.empty()
+    tts_queue.put(SentenceMessage("0.0:new response", generation=generation.current))
+    assert audio_queue.get(timeout=2.0).text == "0.0:new response"
+    tts_queue.put(SHUTDOWN)
+
+
+def test_failed_sentence_does_not_block_later_ones():
+    """Test that a synthesis error fills its slot so later sentences are still released."""
+    tts = FakeTTS(fail_on="0.0:broken")
+    _, tts_queue, audio_queue, _ = run_synthesizer(["0.0:broken", "0.0:fine", "<EOS>"], num_workers=2, tts=tts)
+
+    assert [m.text for m in collect(audio_queue, 2)] == ["0.0:fine", ""]
+    tts_queue.put(SHUTDOWN)
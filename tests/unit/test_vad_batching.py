@@ -0,0 +1,131 @@
+"""Unit tests for batched voice activity detection of several streams."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from glados.audio_io import vad as vad_module
+from glados.audio_io.vad import VAD
+from glados.audio_io.vad_batching import BatchingVAD, VADBatchingConfig
+
+
+class FakeVADSession:
+    """Silero-shaped session whose output depends on each row's context, chunk and state."""
+
+    def __init__(self):
+        self.batches = []
+
+    def run(self, names, inputs):
+        audio, state = inputs["input"], inputs["state"]
+        self.batches.append(len(audio))
+        level = np.abs(audio[:, 64:]).mean(axis=1) + 0.5 * audio[:, :64].mean(axis=1)
+        state_n = np.tanh(0.5 * state + level[None, :, None])
+        return [(state_n[1, :, :1] + audio[:, -1:]).astype(np.float32), state_n.astype(np.float32)]
+
+
+@pytest.fixture
+def shared_vad(monkeypatch):
+    monkeypatch.setattr(vad_module, "create_session", lambda profile, path: FakeVADSession())
+    vad = VAD()
+    vad.io_binding = False
+    return vad
+
+
+def streams_audio(count, chunks=12):
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal((count, chunks, 1, 512)) * rng.uniform(0.01, 1.0, (count, 1, 1, 1))).astype(np.float32)
+
+
+def forked_results(vad, audio):
+    """Probabilities of every stream run on its own forked VAD, one call per chunk."""
+    results = []
+    for stream_audio in audio:
+        fork = vad.fork()
+        results.append([float(fork(chunk)) for chunk in stream_audio])
+    return results
+
+
+def test_batch_matches_forked_vads(shared_vad):
+    """Test that one call for all streams gives each stream the probabilities of its own forked VAD."""
+    audio = streams_audio(5)
+    expected = forked_results(shared_vad, audio)
+    batcher = BatchingVAD(shared_vad, VADBatchingConfig())
+    streams = [batcher.fork() for _ in audio]
+    shared_vad.ort_sess.batches.clear()
+
+    results = [batcher.process(streams, list(audio[:, i])) for i in range(audio.shape[1])]
+
+    np.testing.assert_allclose(np.array(results, dtype=np.float32).T, expected, rtol=1e-6)
+    assert shared_vad.ort_sess.batches == [5] * audio.shape[1]
+    batcher.close()
+
+
+def test_concurrent_streams_share_model_calls(shared_vad):
+    """Test that streams calling from their own threads get their own results in fewer model calls."""
+    audio = streams_audio(4, chunks=20)
+    expected = forked_results(shared_vad, audio)
+    batcher = BatchingVAD(shared_vad, VADBatchingConfig(max_wait_ms=20))
+    shared_vad.ort_sess.batches.clear()
+    results = [[] for _ in audio]
+    barrier = threading.Barrier(len(audio))
+
+    def receive(index):
+        stream = batcher.fork()
+        for chunk in audio[index]:
+            barrier.wait()
+            results[index].append(float(stream(chunk)))
+
+    threads = [threading.Thread(target=receive, args=(i,)) for i in range(len(audio))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    batcher.close()
+
+    np.testing.assert_allclose(results, expected, rtol=1e-6)
+    assert sum(shared_vad.ort_sess.batches) == audio.shape[0] * audio.shape[1]
+    assert len(shared_vad.ort_sess.batches) < audio.shape[1] * 2
+
+
+def test_stream_reset_and_validation(shared_vad):
+    """Test that resetting one stream leaves the others alone and that bad chunks are rejected."""
+    audio = streams_audio(2)
+    batcher = BatchingVAD(shared_vad, VADBatchingConfig())
+    first, second = batcher.fork(), batcher.fork()
+    for chunk_a, chunk_b in zip(audio[0], audio[1], strict=True):
+        batcher.process([first, second], [chunk_a, chunk_b])
+    second_state = second._state.copy()
+
+    first.reset_states()
+    fresh = batcher.fork()
+    assert batcher.process([first], [audio[0, 0]])[0] == batcher.process([fresh], [audio[0, 0]])[0]
+    np.testing.assert_array_equal(second._state, second_state)
+
+    with pytest.raises(ValueError):
+        first(np.zeros((1, 480), dtype=np.float32))
+    batcher.close()
+    assert float(first(audio[0, 1])) == float(fresh(audio[0, 1]))  # Run directly once closed
+
+
+def test_close_while_streams_submit(shared_vad):
+    """Test that chunks submitted while the batcher closes are all answered, none waits forever."""
+    audio = streams_audio(4, chunks=200)
+    batcher = BatchingVAD(shared_vad, VADBatchingConfig())
+    answered = [0] * len(audio)
+
+    def receive(index):
+        stream = batcher.fork()
+        for chunk in audio[index]:
+            stream(chunk)
+            answered[index] += 1
+
+    threads = [threading.Thread(target=receive, args=(i,), daemon=True) for i in range(len(audio))]
+    for thread in threads:
+        thread.start()
+    batcher.close()
+    for thread in threads:
+        thread.join(10)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert answered == [audio.shape[1]] * len(audio)